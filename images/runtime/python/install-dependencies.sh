@@ -22,6 +22,8 @@ apt-get update \
         libexpat1 \
         curl \
         zstd \
+        squashfuse \
+        squashfs-tools \
         gnupg \
         libpq-dev \
         default-libmysqlclient-dev \
@@ -14,6 +14,8 @@ apt-get update \
         curl \
         xz-utils \
         zstd \
+        squashfuse \
+        squashfs-tools \
         gnupg \
         libpq-dev \
         default-libmysqlclient-dev \
@@ -0,0 +1,232 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Linq;
+using Newtonsoft.Json;
+
+namespace Microsoft.Oryx.BuildScriptGenerator.Common
+{
+    /// <summary>
+    /// Records the timed spans of a build and writes them as a Chrome trace event file, which can be opened in
+    /// chrome://tracing or https://ui.perfetto.dev.
+    /// </summary>
+    public class BuildTrace
+    {
+        /// <summary>
+        /// Thread id under which the phases of the build script are recorded, so that they appear on their own row.
+        /// </summary>
+        public const int ScriptPhasesThreadId = 0;
+
+        private const int ProcessId = 1;
+        private const long TicksPerMicrosecond = TimeSpan.TicksPerMillisecond / 1000;
+
+        private readonly object eventsLock = new object();
+        private readonly List<TraceEvent> events = new List<TraceEvent>();
+        private readonly Stopwatch stopwatch;
+        private readonly long startTimeInMicroseconds;
+
+        public BuildTrace()
+        {
+            // In microseconds since the unix epoch, as the timestamps of the phases of the build script.
+            this.startTimeInMicroseconds =
+                (DateTimeOffset.UtcNow - DateTimeOffset.UnixEpoch).Ticks / TicksPerMicrosecond;
+            this.stopwatch = Stopwatch.StartNew();
+        }
+
+        /// <summary>
+        /// Gets or sets the trace of the build being run, or null if no trace is being recorded.
+        /// </summary>
+        public static BuildTrace Current { get; set; }
+
+        /// <summary>
+        /// Gets the time elapsed since the trace was started.
+        /// </summary>
+        public TimeSpan Elapsed => this.stopwatch.Elapsed;
+
+        /// <summary>
+        /// Gets the number of events recorded so far.
+        /// </summary>
+        public int EventCount
+        {
+            get
+            {
+                lock (this.eventsLock)
+                {
+                    return this.events.Count;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Gets the path of the file the build script writes its phases to when the trace is written to
+        /// <paramref name="traceFilePath"/>.
+        /// </summary>
+        public static string GetScriptEventsFilePath(string traceFilePath)
+        {
+            return traceFilePath + ".events";
+        }
+
+        /// <summary>
+        /// Records a span which started <paramref name="start"/> after the trace was started, on the row of
+        /// <paramref name="threadId"/> or, if not given, of the current thread.
+        /// </summary>
+        public void AddEvent(
+            string name,
+            string category,
+            TimeSpan start,
+            TimeSpan duration,
+            IDictionary<string, string> args = null,
+            int? threadId = null)
+        {
+            this.AddEventInMicroseconds(
+                name,
+                category,
+                this.startTimeInMicroseconds + (start.Ticks / TicksPerMicrosecond),
+                duration.Ticks / TicksPerMicrosecond,
+                args,
+                threadId ?? Environment.CurrentManagedThreadId);
+        }
+
+        /// <summary>
+        /// Records the phases of the build script, from lines of the form 'B|name|timestamp' and
+        /// 'E|name|timestamp' where the timestamp is in microseconds since the unix epoch. A phase which was
+        /// begun but not ended, e.g. because the script failed, ends at the time this method is called.
+        /// </summary>
+        public void AddScriptPhases(IEnumerable<string> lines)
+        {
+            var openPhases = new List<KeyValuePair<string, long>>();
+            foreach (var line in lines)
+            {
+                var parts = line.Split('|');
+                if (parts.Length != 3 || !long.TryParse(parts[2].Trim(), out var timestamp))
+                {
+                    continue;
+                }
+
+                var name = parts[1];
+                if (parts[0] == "B")
+                {
+                    openPhases.Add(new KeyValuePair<string, long>(name, timestamp));
+                }
+                else if (parts[0] == "E")
+                {
+                    var index = openPhases.FindLastIndex(phase => phase.Key == name);
+                    if (index >= 0)
+                    {
+                        var begin = openPhases[index].Value;
+                        openPhases.RemoveAt(index);
+                        this.AddScriptPhase(name, begin, timestamp - begin);
+                    }
+                }
+            }
+
+            var now = this.startTimeInMicroseconds + (this.Elapsed.Ticks / TicksPerMicrosecond);
+            foreach (var phase in openPhases)
+            {
+                this.AddScriptPhase(phase.Key, phase.Value, Math.Max(0, now - phase.Value));
+            }
+        }
+
+        /// <summary>
+        /// Writes the recorded events to <paramref name="path"/> in the Chrome trace event format.
+        /// </summary>
+        public void WriteTo(string path)
+        {
+            List<TraceEvent> events;
+            lock (this.eventsLock)
+            {
+                events = this.events.OrderBy(e => e.Timestamp).ToList();
+            }
+
+            var directory = Path.GetDirectoryName(path);
+            if (!string.IsNullOrEmpty(directory))
+            {
+                Directory.CreateDirectory(directory);
+            }
+
+            var trace = new TraceFile { TraceEvents = events };
+            File.WriteAllText(
+                path,
+                JsonConvert.SerializeObject(
+                    trace,
+                    new JsonSerializerSettings { NullValueHandling = NullValueHandling.Ignore }));
+        }
+
+        private void AddScriptPhase(string name, long timestampInMicroseconds, long durationInMicroseconds)
+        {
+            this.AddEventInMicroseconds(
+                name,
+                "script",
+                timestampInMicroseconds,
+                durationInMicroseconds,
+                args: null,
+                ScriptPhasesThreadId);
+        }
+
+        private void AddEventInMicroseconds(
+            string name,
+            string category,
+            long timestampInMicroseconds,
+            long durationInMicroseconds,
+            IDictionary<string, string> args,
+            int threadId)
+        {
+            var traceEvent = new TraceEvent
+            {
+                Name = name,
+                Category = category,
+                Timestamp = timestampInMicroseconds,
+                Duration = durationInMicroseconds,
+                ThreadId = threadId,
+                Args = args != null && args.Count > 0 ? new Dictionary<string, string>(args) : null,
+            };
+
+            lock (this.eventsLock)
+            {
+                this.events.Add(traceEvent);
+            }
+        }
+
+        private class TraceFile
+        {
+            [JsonProperty("traceEvents")]
+            public List<TraceEvent> TraceEvents { get; set; }
+
+            [JsonProperty("displayTimeUnit")]
+            public string DisplayTimeUnit { get; set; } = "ms";
+        }
+
+        private class TraceEvent
+        {
+            [JsonProperty("name")]
+            public string Name { get; set; }
+
+            [JsonProperty("cat")]
+            public string Category { get; set; }
+
+            [JsonProperty("ph")]
+            public string Phase { get; set; } = "X";
+
+            [JsonProperty("ts")]
+            public long Timestamp { get; set; }
+
+            [JsonProperty("dur")]
+            public long Duration { get; set; }
+
+            [JsonProperty("pid")]
+            public int ProcessId { get; set; } = BuildTrace.ProcessId;
+
+            [JsonProperty("tid")]
+            public int ThreadId { get; set; }
+
+            [JsonProperty("args")]
+            public Dictionary<string, string> Args { get; set; }
+        }
+    }
+}
@@ -14,6 +14,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Common
         private readonly TelemetryClient client;
         private readonly string eventName;
         private readonly Stopwatch stopwatch;
+        private readonly BuildTrace trace;
+        private readonly TimeSpan traceStart;
+        private readonly int threadId;
         private IDictionary<string, string> eventProps;
 
         public EventStopwatch(
@@ -24,6 +27,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Common
             this.client = telemetryClient;
             this.eventName = eventName;
             this.eventProps = eventProperties ?? new Dictionary<string, string>();
+            this.trace = BuildTrace.Current;
+            this.traceStart = this.trace?.Elapsed ?? TimeSpan.Zero;
+            this.threadId = Environment.CurrentManagedThreadId;
             this.stopwatch = Stopwatch.StartNew();
         }
 
@@ -44,6 +50,13 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Common
                 this.eventName,
                 this.eventProps,
                 new Dictionary<string, double> { { "processingTime", this.stopwatch.Elapsed.TotalMilliseconds } });
+            this.trace?.AddEvent(
+                this.eventName,
+                "oryx",
+                this.traceStart,
+                this.stopwatch.Elapsed,
+                this.eventProps,
+                this.threadId);
         }
     }
 }
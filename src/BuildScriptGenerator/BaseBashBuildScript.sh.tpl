@@ -10,6 +10,154 @@ if [ -f {{ LoggerPath }} ]; then
 	source {{ LoggerPath }}
 fi
 
+{{ ## Files are synced by size and modification time rather than by checksum, which reads every file on both
+ sides. The destination directory could be on a file system (ex: NFS) where setting modification times results
+ in errors, in which case the affected directory is synced again comparing checksums. ## }}
+SYNC_TREE_VERIFY="{{ CopyVerify }}"
+SYNC_TREE_LINK_MODE="{{ CopyLinkMode }}"
+SYNC_TREE_PARALLELISM="{{ CopyParallelism }}"
+if [ -z "$SYNC_TREE_PARALLELISM" ] || [ "$SYNC_TREE_PARALLELISM" -lt 1 ]; then
+	SYNC_TREE_PARALLELISM=$(nproc 2>/dev/null || echo 1)
+fi
+
+{{ ## The start and end of every phase is appended to BUILD_TRACE_EVENTS_FILE in microseconds since the unix epoch,
+ from which 'oryx build' adds the phases to the trace of the build. ## }}
+BUILD_TRACE_EVENTS_FILE="{{ BuildTraceEventsFile }}"
+if [ -n "$BUILD_TRACE_EVENTS_FILE" ]; then
+	mkdir -p "$(dirname "$BUILD_TRACE_EVENTS_FILE")"
+	: > "$BUILD_TRACE_EVENTS_FILE"
+fi
+
+# Records the beginning (B) or end (E) of a phase of the build.
+# Usage: trace_phase <B|E> <phase name>
+trace_phase() {
+	if [ -n "$BUILD_TRACE_EVENTS_FILE" ]; then
+		local timestamp="${EPOCHREALTIME/[.,]/}"
+		if [ -z "$timestamp" ]; then
+			timestamp=$(date +%s%6N)
+		fi
+		echo "$1|$2|$timestamp" >> "$BUILD_TRACE_EVENTS_FILE"
+	fi
+}
+
+# Runs rsync with the given arguments and prints the size of every file it copies. If the modification times
+# of the copied files could not be preserved, the files are compared by checksum instead.
+sync_tree_rsync() {
+	local compareOption="--times"
+	if [ "$SYNC_TREE_VERIFY" == "true" ]; then
+		compareOption="--checksum"
+	fi
+
+	local exitCode=0
+	rsync -E $compareOption --out-format="%i %l" "$@" || exitCode=$?
+	if [ $exitCode -eq 23 ] && [ "$compareOption" == "--times" ]; then
+		echo "Could not preserve modification times, comparing files by checksum instead..." 1>&2
+		exitCode=0
+		rsync -E --checksum --out-format="%i %l" "$@" || exitCode=$?
+	fi
+	return $exitCode
+}
+
+# Reflinks the files which rsync would copy for the given arguments so that the data blocks are shared with
+# the source until either of them is modified, and prints the size of every reflinked file. Anything which cannot
+# be reflinked is copied by rsync afterwards.
+sync_tree_reflink() {
+	local sourceDir="$1"
+	local destinationDir="$2"
+	shift 2
+	local item size file
+	rsync -E --times --dry-run --out-format="%i %l %n" "$@" | while read -r item size file; do
+		if [[ "$item" == ">f"* ]]; then
+			mkdir -p "$(dirname "$destinationDir/$file")"
+			if cp --reflink=always --preserve=mode,timestamps "$sourceDir/$file" "$destinationDir/$file" 2>/dev/null
+			then
+				echo "$item $size"
+			fi
+		fi
+	done
+}
+
+# Syncs the content of a directory to another directory, which is created if it does not exist, and logs the
+# number of files and bytes copied. The top-level entries are synced first and every top-level directory is then
+# synced in parallel, up to SYNC_TREE_PARALLELISM at a time.
+# Usage: sync_tree <source directory> <destination directory> [rsync options, ex: --delete, --exclude, --links]
+sync_tree() {
+	local sourceDir=$(cd "$1" && pwd -P)
+	local destinationDir="$2"
+	shift 2
+	mkdir -p "$destinationDir"
+	destinationDir=$(cd "$destinationDir" && pwd -P)
+
+	local startTime=$(date +%s%N)
+	local workDir=$(mktemp -d)
+	local linkMode="$SYNC_TREE_LINK_MODE"
+	local linkOptions=()
+	if [ "$linkMode" == "hardlink" ]; then
+		linkOptions+=("--link-dest=$sourceDir")
+	elif [ "$linkMode" == "reflink" ]; then
+		local probeFile=$(find "$sourceDir" -type f -print -quit)
+		local probeCopy="$destinationDir/.oryx-reflink-probe"
+		if [ -n "$probeFile" ] && ! cp --reflink=always "$probeFile" "$probeCopy" 2>/dev/null; then
+			echo "Reflinks are not supported between '$sourceDir' and '$destinationDir', copying files instead."
+			linkMode=""
+		fi
+		rm -f "$probeCopy"
+	fi
+
+	# Sync the top-level files and create the top-level directories, deleting the extraneous ones if requested
+	local exitCode=0
+	sync_tree_rsync --dirs "${linkOptions[@]}" "$@" "$sourceDir/" "$destinationDir/" > "$workDir/0.out" \
+		|| exitCode=$?
+
+	local jobCount=0
+	local entry
+	while [ $exitCode -eq 0 ] && IFS= read -r -d '' entry; do
+		entry="${entry#"$sourceDir"/}"
+		if [ ! -d "$destinationDir/$entry" ]; then
+			# The directory was excluded
+			continue
+		fi
+
+		while [ $(jobs -rp | wc -l) -ge $SYNC_TREE_PARALLELISM ]; do
+			wait -n || true
+		done
+
+		jobCount=$(($jobCount + 1))
+		(
+			if [ "$linkMode" == "reflink" ]; then
+				sync_tree_reflink "$sourceDir" "$destinationDir" --recursive --relative "$@" \
+					"$sourceDir/./$entry" "$destinationDir/"
+			fi
+			jobExitCode=0
+			sync_tree_rsync --recursive --relative "${linkOptions[@]}" "$@" \
+				"$sourceDir/./$entry" "$destinationDir/" || jobExitCode=$?
+			echo $jobExitCode > "$workDir/$jobCount.status"
+		) > "$workDir/$jobCount.out" &
+	done < <(find "$sourceDir" -mindepth 1 -maxdepth 1 -type d -print0)
+	wait
+
+	local statusFile
+	for statusFile in "$workDir"/*.status; do
+		if [ -f "$statusFile" ] && [ "$(cat "$statusFile")" != "0" ]; then
+			exitCode=$(cat "$statusFile")
+		fi
+	done
+
+	local elapsedMs=$(( ($(date +%s%N) - $startTime) / 1000000 ))
+	cat "$workDir"/*.out | awk -v elapsedMs=$elapsedMs -v verify="$SYNC_TREE_VERIFY" -v linkMode="$linkMode" '
+		$1 ~ /^>f/ { files++; bytes += $2 }
+		END {
+			mb = bytes / 1048576
+			seconds = elapsedMs / 1000
+			rate = seconds > 0 ? mb / seconds : mb
+			mode = verify == "true" ? "checksum" : "size and modification time"
+			if (linkMode != "") { mode = mode ", " linkMode }
+			printf "Copied %d file(s), %.1f MB in %.1f sec(s) (%.1f MB/s, compared by %s).\n", files, mb, seconds, rate, mode
+		}'
+	rm -rf "$workDir"
+	return $exitCode
+}
+
 if [ ! -d "$SOURCE_DIR" ]; then
     echo "Source directory '$SOURCE_DIR' does not exist." 1>&2
     exit 1
@@ -51,20 +199,18 @@ then
 	cd "$SOURCE_DIR"
 	echo
 	echo "Copying files to the intermediate directory..."
+	trace_phase B "Copy to intermediate directory"
 	BASE_START_TIME=$SECONDS
 	excludedDirectories=""
 	{{ for excludedDir in DirectoriesToExcludeFromCopyToIntermediateDir }}
 	excludedDirectories+=" --exclude {{ excludedDir }}"
 	{{ end }}
 
-	{{ ## We use checksum and not the '--times' because the destination directory could be from
-	 a different file system (ex: NFS) where setting modification times results in errors.
-	 Even though checksum is slower compared to the '--times' option, it is more reliable
-	 which is important for us. ## }}
-	rsync -rcE --delete $excludedDirectories . "$INTERMEDIATE_DIR"
+	sync_tree "$SOURCE_DIR" "$INTERMEDIATE_DIR" --delete $excludedDirectories
 
 	ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 	echo "Copying files to intermediate directory done in $ELAPSED_TIME sec(s)."
+	trace_phase E "Copy to intermediate directory"
 	SOURCE_DIR="$INTERMEDIATE_DIR"
 fi
 
@@ -75,10 +221,12 @@ echo
 
 {{ if PlatformInstallationScript | IsNotBlank }}
 echo "Installing platform..."
+trace_phase B "Platform installation"
 BASE_START_TIME=$SECONDS
 {{ PlatformInstallationScript }}
 ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 echo "Platform installation done in $ELAPSED_TIME sec(s)."
+trace_phase E "Platform installation"
 {{ end }}
 
 cd "$SOURCE_DIR"
@@ -91,10 +239,12 @@ fi
 
 {{ if !OsPackagesToInstall.empty? }}
 echo "Installing OS packages..."
+trace_phase B "OS packages installation"
 BASE_START_TIME=$SECONDS
 apt-get update && apt-get install --yes --no-install-recommends {{ for PackageName in OsPackagesToInstall }}{{ PackageName }} {{ end }}
 ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 echo "OS packages installation done in $ELAPSED_TIME sec(s)."
+trace_phase E "OS packages installation"
 {{ end }}
 
 {{ # Export these variables so that they are available for the pre and post build scripts. }}
@@ -109,14 +259,129 @@ mkdir -p "$DESTINATION_DIR"
 {{ # Make sure to cd to the source directory so that the pre-build script runs from there }}
 cd "$SOURCE_DIR"
 echo "{{ PreBuildCommandPrologue }}"
+trace_phase B "Pre-build command"
 BASE_START_TIME=$SECONDS
 {{ PreBuildCommand }}
 ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 echo "{{ PreBuildCommandEpilogue }}"
 echo "Pre-build command done in $ELAPSED_TIME sec(s)."
+trace_phase E "Pre-build command"
+{{ end }}
+
+{{ if DependencyCacheDir | IsNotBlank }}
+{{ ## The caches of the package managers are kept in DEPENDENCY_CACHE_DIR across builds. A cache is hit when the
+ lock files of the build are the same as in the previous build which used the cache, and the bytes the caches
+ grow by during the build are the bytes which were fetched. ## }}
+DEPENDENCY_CACHE_DIR="{{ DependencyCacheDir }}"
+DEPENDENCY_CACHE_KEY_FILE_NAME=".oryx-lockfile-hash"
+declare -A DEPENDENCY_CACHE_SIZES
+declare -A DEPENDENCY_CACHE_KEYS
+DEPENDENCY_CACHE_HITS=0
+
+# Prints the size in bytes of the files in the given directory.
+dependency_cache_size() {
+	local size
+	size=$(du -sb "$1" 2>/dev/null | cut -f1)
+	echo "${size:-0}"
+}
+
+# Prints a hash of the given lock files of the source directory, or nothing if none of them exists.
+dependency_cache_key() {
+	local lockFiles=()
+	local lockFile
+	for lockFile in "$@"; do
+		if [ -f "$SOURCE_DIR/$lockFile" ]; then
+			lockFiles+=("$SOURCE_DIR/$lockFile")
+		fi
+	done
+	if [ ${#lockFiles[@]} -gt 0 ]; then
+		cat "${lockFiles[@]}" | sha256sum | cut -d ' ' -f 1
+	fi
+}
+
+{{ for cache in DependencyCaches }}
+dependencyCacheDir="$DEPENDENCY_CACHE_DIR/{{ cache.Name }}"
+mkdir -p "$dependencyCacheDir"
+{{ for variable in cache.EnvironmentVariables }}
+export {{ variable.Key }}="{{ variable.Value }}"
+{{ end }}
+DEPENDENCY_CACHE_SIZES[{{ cache.Name }}]=$(dependency_cache_size "$dependencyCacheDir")
+DEPENDENCY_CACHE_KEYS[{{ cache.Name }}]=$(dependency_cache_key{{ for lockFile in cache.LockFiles }} "{{ lockFile }}"{{ end }})
+if [ -n "${DEPENDENCY_CACHE_KEYS[{{ cache.Name }}]}" ] && [ "${DEPENDENCY_CACHE_KEYS[{{ cache.Name }}]}" == "$(cat "$dependencyCacheDir/$DEPENDENCY_CACHE_KEY_FILE_NAME" 2>/dev/null)" ]; then
+	echo "Using dependency cache '$dependencyCacheDir', the lock files did not change since it was last used."
+	DEPENDENCY_CACHE_HITS=$(($DEPENDENCY_CACHE_HITS + 1))
+else
+	echo "Using dependency cache '$dependencyCacheDir'."
+fi
+{{ end }}
+{{ end }}
+
+{{ if DependencyLayerCacheDir | IsNotBlank }}
+{{ ## The snippets archive the dependencies they install in DEPENDENCY_LAYER_CACHE_DIR, keyed by the runtime, the
+ OS and the lock files, and restore them instead of running the package manager when the key was seen before.
+ Layers not used for DEPENDENCY_LAYER_MAX_AGE_IN_DAYS are removed. ## }}
+DEPENDENCY_LAYER_CACHE_DIR="{{ DependencyLayerCacheDir }}"
+DEPENDENCY_LAYER_MAX_AGE_IN_DAYS=30
+mkdir -p "$DEPENDENCY_LAYER_CACHE_DIR"
+
+# Prints the key of the dependencies installed from the given files of the current directory by the runtime
+# described by the first argument.
+dependency_layer_key() {
+	local description=$1
+	shift
+	local file
+	{
+		echo "$description"
+		echo "$(uname -m) $DEBIAN_FLAVOR $OS_FLAVOR"
+		for file in "$@"; do
+			if [ -f "$file" ]; then
+				echo "$file"
+				cat "$file"
+			fi
+		done
+	} | sha256sum | cut -d ' ' -f 1
+}
+
+# Replaces the given directory with the dependency layer of the given key. Fails if there is no such layer.
+restore_dependency_layer() {
+	local layerFile="$DEPENDENCY_LAYER_CACHE_DIR/$1.tar"
+	if [ ! -f "$layerFile" ]; then
+		return 1
+	fi
+	echo "Restoring '$2' from dependency layer '$layerFile'..."
+	local startTime=$SECONDS
+	rm -rf "$2"
+	mkdir -p "$2"
+	if ! tar -xf "$layerFile" -C "$2"; then
+		echo "Could not restore dependency layer '$layerFile', installing the dependencies instead."
+		rm -rf "$2"
+		return 1
+	fi
+	touch "$layerFile"
+	echo "Restoring '$2' done in $(($SECONDS - $startTime)) sec(s), skipping the installation of the dependencies."
+}
+
+# Archives the given directory as the dependency layer of the given key.
+save_dependency_layer() {
+	if [ ! -d "$2" ]; then
+		return 0
+	fi
+	local layerFile="$DEPENDENCY_LAYER_CACHE_DIR/$1.tar"
+	echo "Saving '$2' as dependency layer '$layerFile'..."
+	local startTime=$SECONDS
+	# Write to a temporary file first so that concurrent builds never restore a partial layer
+	if tar -cf "$layerFile.$$" -C "$2" .; then
+		mv -f "$layerFile.$$" "$layerFile"
+	else
+		rm -f "$layerFile.$$"
+	fi
+	find "$DEPENDENCY_LAYER_CACHE_DIR" -maxdepth 1 -name '*.tar' -mtime +$DEPENDENCY_LAYER_MAX_AGE_IN_DAYS -delete || true
+	echo "Saving '$2' done in $(($SECONDS - $startTime)) sec(s)."
+}
 {{ end }}
 
 echo "Running build script snippets..."
+trace_phase B "Build script snippets"
 BASE_START_TIME=$SECONDS
 {{ for Snippet in BuildScriptSnippets }}
 {{ # Makes sure every snippet starts in the context of the source directory. }}
@@ -125,22 +390,42 @@ cd "$SOURCE_DIR"
 {{ end }}
 ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 echo "Build script snippets done in $ELAPSED_TIME sec(s)."
+trace_phase E "Build script snippets"
+
+{{ if DependencyCacheDir | IsNotBlank }}
+DEPENDENCY_CACHE_BYTES_FETCHED=0
+for cacheName in "${!DEPENDENCY_CACHE_SIZES[@]}"; do
+	dependencyCacheDir="$DEPENDENCY_CACHE_DIR/$cacheName"
+	fetchedBytes=$(($(dependency_cache_size "$dependencyCacheDir") - ${DEPENDENCY_CACHE_SIZES[$cacheName]}))
+	if [ $fetchedBytes -gt 0 ]; then
+		DEPENDENCY_CACHE_BYTES_FETCHED=$(($DEPENDENCY_CACHE_BYTES_FETCHED + $fetchedBytes))
+	fi
+	if [ -n "${DEPENDENCY_CACHE_KEYS[$cacheName]}" ]; then
+		echo "${DEPENDENCY_CACHE_KEYS[$cacheName]}" > "$dependencyCacheDir/$DEPENDENCY_CACHE_KEY_FILE_NAME"
+	fi
+done
+DEPENDENCY_CACHE_HIT_RATE=$(($DEPENDENCY_CACHE_HITS * 100 / ${#DEPENDENCY_CACHE_SIZES[@]}))
+echo "Dependency caches: $DEPENDENCY_CACHE_HITS of ${#DEPENDENCY_CACHE_SIZES[@]} hit, $DEPENDENCY_CACHE_BYTES_FETCHED bytes fetched."
+{{ end }}
 
 {{ if PostBuildCommand | IsNotBlank }}
 {{ # Make sure to cd to the source directory so that the post-build script runs from there }}
 cd $SOURCE_DIR
 echo
 echo "{{ PostBuildCommandPrologue }}"
+trace_phase B "Post-build command"
 BASE_START_TIME=$SECONDS
 {{ PostBuildCommand }}
 ELAPSED_TIME=$(($SECONDS - $BASE_START_TIME))
 echo "{{ PostBuildCommandEpilogue }}"
 echo "Post-build command done in $ELAPSED_TIME sec(s)."
+trace_phase E "Post-build command"
 {{ end }}
 
 if [ "$SOURCE_DIR" != "$DESTINATION_DIR" ]
 then
 	echo "Preparing output..."
+	trace_phase B "Output preparation"
 
 	{{ ## Determine if direct tar compression can be used based on build configuration ## }}
 	CAN_USE_DIRECT_COMPRESSION_TO_DEST=false
@@ -221,19 +506,15 @@ then
 				echo "Copying existing destination directory to temporary location..."
 				TEMP_START_TIME=$SECONDS
 				mkdir -p "$tmpDestinationDir"
-				rsync -rcE --links "$DESTINATION_DIR/" "$tmpDestinationDir"
+				sync_tree "$DESTINATION_DIR" "$tmpDestinationDir" --links
 				TEMP_ELAPSED_TIME=$(($SECONDS - $TEMP_START_TIME))
 				echo "Copying to temporary location done in $TEMP_ELAPSED_TIME sec(s)."
 				rm -rf "$DESTINATION_DIR"
 			fi
 			{{ end }}
 
-			{{ ## We use checksum and not the '--times' because the destination directory could be from
-			 a different file system (ex: NFS) where setting modification times results in errors.
-			 Even though checksum is slower compared to the '--times' option, it is more reliable
-			 which is important for us. ## }}
 			MAIN_RSYNC_START_TIME=$SECONDS
-			rsync -rcE --links $excludedDirectories . "$DESTINATION_DIR"
+			sync_tree "$SOURCE_DIR" "$DESTINATION_DIR" --links $excludedDirectories
 			MAIN_RSYNC_ELAPSED_TIME=$(($SECONDS - $MAIN_RSYNC_START_TIME))
 			echo "Copying to destination directory done in $MAIN_RSYNC_ELAPSED_TIME sec(s)."
 
@@ -242,7 +523,7 @@ then
 				echo "Copying back temporary destination directory contents..."
 				TEMP_START_TIME=$SECONDS
 				{{ # Do not overwrite files in destination directory }}
-				rsync -rcE --links "$tmpDestinationDir/" "$DESTINATION_DIR"
+				sync_tree "$tmpDestinationDir" "$DESTINATION_DIR" --links
 				TEMP_ELAPSED_TIME=$(($SECONDS - $TEMP_START_TIME))
 				echo "Copying back from temporary location done in $TEMP_ELAPSED_TIME sec(s)."
 				rm -rf "$tmpDestinationDir"
@@ -307,6 +588,7 @@ then
 		fi
 		{{ end }}
 	fi
+	trace_phase E "Output preparation"
 fi
 
 {{ if ManifestFileName | IsNotBlank }}
@@ -328,6 +610,10 @@ echo "{{ prop.Key }}=\"{{ prop.Value }}\"" >> "$MANIFEST_DIR/$MANIFEST_FILE"
 {{ end }}
 echo "Manifest file created."
 {{ end }}
+{{ if DependencyCacheDir | IsNotBlank }}
+echo "{{ DependencyCacheHitRateManifestKey }}=\"$DEPENDENCY_CACHE_HIT_RATE\"" >> "$MANIFEST_DIR/$MANIFEST_FILE"
+echo "{{ DependencyCacheBytesFetchedManifestKey }}=\"$DEPENDENCY_CACHE_BYTES_FETCHED\"" >> "$MANIFEST_DIR/$MANIFEST_FILE"
+{{ end }}
 {{ end }}
 
 if [ -z "$DEBIAN_FLAVOR" ] && [ -n "$OS_FLAVOR" ]
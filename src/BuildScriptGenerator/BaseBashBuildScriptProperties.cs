@@ -19,6 +19,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator
 
         public string PostBuildCommandEpilogue { get; set; } = Constants.PostBuildCommandEpilogue;
 
+        public string DependencyCacheHitRateManifestKey { get; } = ManifestFilePropertyKeys.DependencyCacheHitRate;
+
+        public string DependencyCacheBytesFetchedManifestKey { get; }
+            = ManifestFilePropertyKeys.DependencyCacheBytesFetched;
+
         /// <summary>
         /// Gets or sets the collection of build script snippets.
         /// </summary>
@@ -103,5 +108,46 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         /// to be compressed.
         /// </summary>
         public bool CompressDestinationDir { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether copied files are compared by checksum instead of by size and
+        /// modification time.
+        /// </summary>
+        public bool CopyVerify { get; set; }
+
+        /// <summary>
+        /// Gets or sets how copied files share their content with the source files: 'reflink', 'hardlink', or
+        /// null to copy the content.
+        /// </summary>
+        public string CopyLinkMode { get; set; }
+
+        /// <summary>
+        /// Gets or sets the maximum number of directories copied concurrently, or 0 to use the number of
+        /// processors.
+        /// </summary>
+        public int CopyParallelism { get; set; }
+
+        /// <summary>
+        /// Gets or sets the path of the file the script records the start and end of its phases in, or null to
+        /// not record them.
+        /// </summary>
+        public string BuildTraceEventsFile { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory in which the <see cref="DependencyCaches"/> are kept across builds, or null
+        /// to not keep them.
+        /// </summary>
+        public string DependencyCacheDir { get; set; }
+
+        /// <summary>
+        /// Gets or sets the caches of the package managers used by the build script snippets.
+        /// </summary>
+        public IEnumerable<DependencyCache> DependencyCaches { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory in which the build script snippets archive the dependencies they install,
+        /// keyed by their lock files, or null to always install them.
+        /// </summary>
+        public string DependencyLayerCacheDir { get; set; }
     }
 }
@@ -33,5 +33,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         public bool IsFullScript { get; set; }
 
         public bool CopySourceDirectoryContentToDestinationDirectory { get; set; } = true;
+
+        /// <summary>
+        /// Gets or sets the caches of the package managers used by the snippet, which are kept across builds when
+        /// a dependency cache directory is configured.
+        /// </summary>
+        public IEnumerable<DependencyCache> DependencyCaches { get; set; }
     }
 }
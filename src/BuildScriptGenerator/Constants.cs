@@ -25,6 +25,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         public const string BuildCommandsFileName = "buildcommands-file";
         public const string FunctionApplications = "functions";
         public const string StaticSiteApplications = "static-sites";
+        public const string CopyLinkModeReflink = "reflink";
+        public const string CopyLinkModeHardlink = "hardlink";
 
         /// <summary>
         /// The name of the key used by benv script to identify the dynamic install root directory so that it can set
@@ -326,6 +326,13 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             buildProperties[ManifestFilePropertyKeys.CompressDestinationDir] =
                 this.cliOptions.CompressDestinationDir.ToString().ToLower();
 
+            string buildTraceEventsFile = null;
+            if (!string.IsNullOrEmpty(this.cliOptions.BuildTraceFile))
+            {
+                buildProperties[ManifestFilePropertyKeys.BuildTraceFile] = this.cliOptions.BuildTraceFile;
+                buildTraceEventsFile = BuildTrace.GetScriptEventsFilePath(this.cliOptions.BuildTraceFile);
+            }
+
             // Workaround for bug in TestSourceRepo class in validation tests
             // Should be using context.SourceRepo.FileExists
             string filePathForAppYaml = Path.Combine(context.SourceRepo.RootPath, "appsvc.yaml");
@@ -415,8 +422,25 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 OutputDirectoryIsNested = outputIsSubDirOfSourceDir,
                 CopySourceDirectoryContentToDestinationDirectory = copySourceDirectoryContentToDestinationDirectory,
                 CompressDestinationDir = this.cliOptions.CompressDestinationDir,
+                CopyVerify = this.cliOptions.CopyVerify,
+                CopyLinkMode = this.cliOptions.CopyLinkMode,
+                CopyParallelism = this.cliOptions.CopyParallelism,
+                BuildTraceEventsFile = buildTraceEventsFile,
+                DependencyLayerCacheDir = this.cliOptions.DependencyLayerCacheDir,
             };
 
+            var dependencyCaches = buildScriptSnippets
+                .Where(s => s.DependencyCaches != null)
+                .SelectMany(s => s.DependencyCaches)
+                .GroupBy(c => c.Name)
+                .Select(g => g.First())
+                .ToList();
+            if (!string.IsNullOrEmpty(this.cliOptions.DependencyCacheDir) && dependencyCaches.Any())
+            {
+                buildScriptProps.DependencyCacheDir = this.cliOptions.DependencyCacheDir;
+                buildScriptProps.DependencyCaches = dependencyCaches;
+            }
+
             this.LogScriptIfGiven("pre-build", buildScriptProps.PreBuildCommand);
             this.LogScriptIfGiven("post-build", buildScriptProps.PostBuildCommand);
 
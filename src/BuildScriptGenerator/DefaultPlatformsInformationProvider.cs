@@ -5,8 +5,12 @@
 
 using System.Collections.Generic;
 using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.ApplicationInsights;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
+using Microsoft.Oryx.BuildScriptGenerator.Common.Extensions;
+using Microsoft.Oryx.Detector;
 
 namespace Microsoft.Oryx.BuildScriptGenerator
 {
@@ -19,17 +23,29 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         private readonly IStandardOutputWriter outputWriter;
         private readonly ILogger<DefaultPlatformsInformationProvider> logger;
         private readonly BuildScriptGeneratorOptions commonOptions;
+        private readonly TelemetryClient telemetryClient;
 
         public DefaultPlatformsInformationProvider(
             IEnumerable<IProgrammingPlatform> platforms,
             IStandardOutputWriter outputWriter,
             ILogger<DefaultPlatformsInformationProvider> logger,
             IOptions<BuildScriptGeneratorOptions> commonOptions)
+            : this(platforms, outputWriter, logger, commonOptions, telemetryClient: null)
+        {
+        }
+
+        public DefaultPlatformsInformationProvider(
+            IEnumerable<IProgrammingPlatform> platforms,
+            IStandardOutputWriter outputWriter,
+            ILogger<DefaultPlatformsInformationProvider> logger,
+            IOptions<BuildScriptGeneratorOptions> commonOptions,
+            TelemetryClient telemetryClient)
         {
             this.platforms = platforms;
             this.outputWriter = outputWriter;
             this.logger = logger;
             this.commonOptions = commonOptions.Value;
+            this.telemetryClient = telemetryClient;
         }
 
         /// <summary>
@@ -64,14 +80,17 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             // build environment is setup with detected platforms' sdks.
             this.outputWriter.WriteLine("Detecting platforms...");
 
-            foreach (var platform in this.platforms)
-            {
-                if (!this.ShouldDetectPlatform(platform, context))
-                {
-                    continue;
-                }
+            var platformsToDetect = this.platforms
+                .Where(platform => this.ShouldDetectPlatform(platform, context))
+                .ToList();
+            var detectionResults = this.commonOptions.EnableParallelDetection
+                ? this.DetectInParallel(platformsToDetect, context)
+                : platformsToDetect.Select(platform => this.Detect(platform, context)).ToList();
 
-                var detectionResult = platform.Detect(context);
+            for (var i = 0; i < platformsToDetect.Count; i++)
+            {
+                var platform = platformsToDetect[i];
+                var detectionResult = detectionResults[i];
 
                 if (detectionResult != null)
                 {
@@ -102,6 +121,35 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             return platformInfos;
         }
 
+        private IList<PlatformDetectorResult> DetectInParallel(
+            IList<IProgrammingPlatform> platformsToDetect,
+            RepositoryContext context)
+        {
+            var detectionTasks = platformsToDetect
+                .Select(platform => Task.Run(() => this.Detect(platform, context)))
+                .ToList();
+
+            // Results are collected in the same order as the platforms, and the exception of the first failing
+            // platform, if any, is rethrown as is so that callers see the same behavior as with serial detection.
+            return detectionTasks.Select(task => task.GetAwaiter().GetResult()).ToList();
+        }
+
+        private PlatformDetectorResult Detect(IProgrammingPlatform platform, RepositoryContext context)
+        {
+            var props = new Dictionary<string, string> { { "platformName", platform.Name } };
+            using (var timedEvent = this.telemetryClient.LogTimedEvent("DetectPlatform", props))
+            {
+                var detectionResult = platform.Detect(context);
+                timedEvent.AddProperty("detected", (detectionResult != null).ToString());
+                if (!string.IsNullOrEmpty(detectionResult?.PlatformVersion))
+                {
+                    timedEvent.AddProperty("platformVersion", detectionResult.PlatformVersion);
+                }
+
+                return detectionResult;
+            }
+        }
+
         private bool ShouldDetectPlatform(IProgrammingPlatform platform, RepositoryContext context)
         {
             // Check if a platform is enabled or not
@@ -0,0 +1,42 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.Collections.Generic;
+
+namespace Microsoft.Oryx.BuildScriptGenerator
+{
+    /// <summary>
+    /// A directory in which a package manager keeps the packages it downloads. When a dependency cache directory
+    /// is configured, the directory is kept there across builds so that the packages are not downloaded again.
+    /// </summary>
+    public class DependencyCache
+    {
+        /// <summary>
+        /// The shell variable holding the path of the cache directory, for use in
+        /// <see cref="EnvironmentVariables"/>.
+        /// </summary>
+        public const string DirectoryVariable = "$dependencyCacheDir";
+
+        /// <summary>
+        /// Gets or sets the name of the cache, ex: 'composer', which is also the name of its directory in the
+        /// dependency cache directory.
+        /// </summary>
+        public string Name { get; set; }
+
+        /// <summary>
+        /// Gets or sets the environment variables which point the package manager to the cache directory, ex:
+        /// 'COMPOSER_CACHE_DIR'. The values are expanded by the shell, and <see cref="DirectoryVariable"/> is the
+        /// path of the cache directory.
+        /// </summary>
+        public IDictionary<string, string> EnvironmentVariables { get; set; }
+
+        /// <summary>
+        /// Gets or sets the files, relative to the source directory, which pin the packages that are installed,
+        /// ex: 'composer.lock'. A build is a cache hit if these files are the same as in the previous build which
+        /// used the cache.
+        /// </summary>
+        public IEnumerable<string> LockFiles { get; set; }
+    }
+}
@@ -26,10 +26,35 @@ doc="https://docs.microsoft.com/en-us/azure/app-service/configure-language-dotne
 suggestion="Please build your app locally before publishing." 
 msg="${suggestion} | ${doc}"
 
+# Cache directory for the NuGet packages, kept across builds like the pip cache of Python builds. NuGet stores
+# the packages by id and version, so builds of different apps share the packages they have in common.
+export NUGET_PACKAGES="${NUGET_PACKAGES:-/usr/local/share/nuget-packages}"
+mkdir -p "$NUGET_PACKAGES"
+
+# The project is restored once: publish does not evaluate the restore graph again, except with .NET Core 1.x
+# SDKs which do not support '--no-restore'. Restore gets the same properties as publish so that the assets it
+# generates match what publish expects.
+restoreArgs="-p:Configuration={{ Configuration }}"
+publishArgs="--no-restore"
+case "$dotnetCoreVersion" in
+    1.*) publishArgs="" ;;
+esac
+
+{{ if PublishReadyToRun }}
+case "$(uname -m)" in
+    aarch64|arm64) runtimeIdentifier="linux-arm64" ;;
+    *) runtimeIdentifier="linux-x64" ;;
+esac
+echo "Publishing ReadyToRun code for runtime '$runtimeIdentifier', with tiered PGO enabled"
+readyToRunArgs="-r $runtimeIdentifier -p:SelfContained=false -p:PublishReadyToRun=true -p:TieredPGO=true"
+restoreArgs="$restoreArgs $readyToRunArgs"
+publishArgs="$publishArgs $readyToRunArgs"
+{{ end }}
+
 {{ # .NET Core 1.1 based projects require restore to be run before publish }}
 echo "Restoring..."
 START_TIME=$SECONDS
-cmd="dotnet restore \"{{ ProjectFile }}\""
+cmd="dotnet restore \"{{ ProjectFile }}\" $restoreArgs"
 LogErrorWithTryCatch "$cmd" "$msg"
 ELAPSED_TIME=$(($SECONDS - $START_TIME))
 echo "dotnet restore done in $ELAPSED_TIME sec(s)."
@@ -38,7 +63,7 @@ if [ "$SOURCE_DIR" == "$DESTINATION_DIR" ]
 then
     echo "Publishing..."
     START_TIME=$SECONDS
-    cmd="dotnet publish \"{{ ProjectFile }}\" -c {{ Configuration }}"
+    cmd="dotnet publish \"{{ ProjectFile }}\" -c {{ Configuration }} $publishArgs"
     LogErrorWithTryCatch "$cmd" "$msg"
     ELAPSED_TIME=$(($SECONDS - $START_TIME))
     echo "dotnet publish done in $ELAPSED_TIME sec(s)."
@@ -47,7 +72,7 @@ else
     echo "Publishing to directory $DESTINATION_DIR..."
     echo    
     START_TIME=$SECONDS
-    cmd="dotnet publish \"{{ ProjectFile }}\" -c {{ Configuration }} -o $DESTINATION_DIR"
+    cmd="dotnet publish \"{{ ProjectFile }}\" -c {{ Configuration }} $publishArgs -o $DESTINATION_DIR"
     LogErrorWithTryCatch "$cmd" "$msg"
     ELAPSED_TIME=$(($SECONDS - $START_TIME))
     echo "dotnet publish done in $ELAPSED_TIME sec(s)."
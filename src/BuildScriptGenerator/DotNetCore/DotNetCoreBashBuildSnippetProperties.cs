@@ -17,5 +17,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
         public string InstallBlazorWebAssemblyAOTWorkloadCommand { get; set; }
 
         public string CustomBuildCommand { get; set; }
+
+        public bool PublishReadyToRun { get; set; }
     }
 }
\ No newline at end of file
@@ -8,5 +8,6 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
     internal static class DotNetCoreManifestFilePropertyKeys
     {
         internal const string StartupDllFileName = nameof(StartupDllFileName);
+        internal const string PublishReadyToRun = nameof(PublishReadyToRun);
     }
 }
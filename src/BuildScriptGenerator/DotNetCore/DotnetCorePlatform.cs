@@ -101,10 +101,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
         {
             try
             {
-                var detectionResult = this.detector.Detect(new DetectorContext
-                {
-                    SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-                });
+                var detectionResult = this.detector.Detect(context);
                 if (detectionResult == null)
                 {
                     return null;
@@ -162,12 +159,19 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
                 this.outputWriter.WriteLine("Detected the following frameworks: blazor");
             }
 
+            var publishReadyToRun = this.ShouldPublishReadyToRun(dotNetCorePlatformDetectorResult);
+            if (publishReadyToRun)
+            {
+                manifestFileProperties[DotNetCoreManifestFilePropertyKeys.PublishReadyToRun] = "true";
+            }
+
             var templateProperties = new DotNetCoreBashBuildSnippetProperties
             {
                 ProjectFile = projectFile,
                 Configuration = this.GetBuildConfiguration(),
                 InstallBlazorWebAssemblyAOTWorkloadCommand = installBlazorWebAssemblyAOTWorkloadCommand,
                 CustomBuildCommand = this.dotNetCoreScriptGeneratorOptions.CustomBuildCommand,
+                PublishReadyToRun = publishReadyToRun,
             };
 
             var script = TemplateHelper.Render(
@@ -178,10 +182,24 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
 
             SetStartupFileNameInfoInManifestFile(context, projectFile, manifestFileProperties);
 
+            var nuGetDependencyCache = new DependencyCache
+            {
+                Name = "nuget",
+                EnvironmentVariables = new Dictionary<string, string>
+                {
+                    ["NUGET_PACKAGES"] = DependencyCache.DirectoryVariable,
+                },
+                LockFiles = new[]
+                {
+                    Path.Combine(Path.GetDirectoryName(projectFile), DotNetCoreConstants.NuGetLockFileName),
+                },
+            };
+
             return new BuildScriptSnippet
             {
                 BashBuildScriptSnippet = script,
                 BuildProperties = manifestFileProperties,
+                DependencyCaches = new[] { nuGetDependencyCache },
 
                 // Always false for .NET: the custom build command (or default dotnet publish)
                 // must place output in $DESTINATION_DIR directly. Auto-copying source files
@@ -568,6 +586,41 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
             return configuration;
         }
 
+        private bool ShouldPublishReadyToRun(DotNetCorePlatformDetectorResult detectorResult)
+        {
+            if (!this.dotNetCoreScriptGeneratorOptions.PublishReadyToRun)
+            {
+                return false;
+            }
+
+            if (!string.IsNullOrEmpty(this.dotNetCoreScriptGeneratorOptions.CustomBuildCommand))
+            {
+                this.logger.LogWarning("Not publishing ReadyToRun code as a custom build command is used");
+                return false;
+            }
+
+            // Blazor WebAssembly apps run on the 'browser-wasm' runtime, which has no ReadyToRun code.
+            if (detectorResult.InstallAOTWorkloads)
+            {
+                this.logger.LogWarning("Not publishing ReadyToRun code as the project is a Blazor WebAssembly app");
+                return false;
+            }
+
+            // The 'PublishReadyToRun' MSBuild property was added in .NET Core 3.0.
+            var runtimeVersion = detectorResult.PlatformVersion;
+            if (string.IsNullOrEmpty(runtimeVersion)
+                || !SemanticVersioning.Version.TryParse(runtimeVersion, loose: true, out var version)
+                || version < new SemanticVersioning.Version(3, 0, 0))
+            {
+                this.logger.LogWarning(
+                    "Not publishing ReadyToRun code as it requires .NET Core 3.0 or later, and the version is {version}",
+                    runtimeVersion);
+                return false;
+            }
+
+            return true;
+        }
+
         private string GetMaxSatisfyingRuntimeVersionAndVerify(string runtimeVersion)
         {
             var versionMap = this.versionProvider.GetSupportedVersions();
@@ -21,5 +21,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
         public string DotNetCoreRuntimeVersion { get; set; }
 
         public string DefaultRuntimeVersion { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the app is published with ReadyToRun code and tiered PGO, so
+        /// that less code has to be compiled by the JIT compiler when the app starts.
+        /// </summary>
+        public bool PublishReadyToRun { get; set; }
     }
 }
\ No newline at end of file
@@ -64,7 +64,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
 
                 try
                 {
-                    xdoc = ListBlobsHelper.GetAllBlobs(sdkStorageBaseUrl, DotNetCoreConstants.PlatformName, httpClient);
+                    xdoc = this.GetAllBlobs(sdkStorageBaseUrl, DotNetCoreConstants.PlatformName, httpClient);
                 }
                 catch (AggregateException ex)
                 {
@@ -72,7 +72,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.DotNetCore
                     var sdkStorageBackupBaseUrl = this.GetPlatformBinariesBackupStorageBaseUrl();
                     if (sdkStorageBackupBaseUrl != null)
                     {
-                        xdoc = ListBlobsHelper.GetAllBlobs(sdkStorageBackupBaseUrl, DotNetCoreConstants.PlatformName, httpClient);
+                        xdoc = this.GetAllBlobs(sdkStorageBackupBaseUrl, DotNetCoreConstants.PlatformName, httpClient);
                     }
                     else
                     {
@@ -4,6 +4,7 @@
 // --------------------------------------------------------------------------------------------
 
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
@@ -13,6 +14,7 @@ using System.Threading.Tasks;
 using System.Xml.Linq;
 using System.Xml.XPath;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 using Microsoft.Oryx.Common.Extensions;
 
 namespace Microsoft.Oryx.BuildScriptGenerator
@@ -27,13 +29,20 @@ namespace Microsoft.Oryx.BuildScriptGenerator
     private const int MaxTimeoutForSocketOperationInSeconds = 100;
     private readonly ILogger<ExternalSdkProvider> logger;
     private readonly IStandardOutputWriter outputWriter;
+    private readonly BuildScriptGeneratorOptions commonOptions;
+
+    // Metadata already loaded by this process keyed by platform name, along with the last write time of its file
+    private readonly ConcurrentDictionary<string, Tuple<DateTime, XDocument>> loadedMetadata
+      = new ConcurrentDictionary<string, Tuple<DateTime, XDocument>>(StringComparer.OrdinalIgnoreCase);
 
     public ExternalSdkProvider(
     IStandardOutputWriter outputWriter,
-    ILogger<ExternalSdkProvider> logger)
+    ILogger<ExternalSdkProvider> logger,
+    IOptions<BuildScriptGeneratorOptions> commonOptions)
     {
       this.logger = logger;
       this.outputWriter = outputWriter;
+      this.commonOptions = commonOptions.Value;
     }
 
     /// <inheritdoc />
@@ -54,6 +63,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         };
 
         var filePath = Path.Combine(ExternalSdksStorageDir, platformName, platformName);
+        if (this.TryGetLoadedMetadata(platformName, filePath, out var metadata))
+        {
+          return metadata;
+        }
+
         this.logger.LogInformation("Requesting metadata for platform {} from external SDK provider, expected filepath: {filePath}", platformName, filePath);
         this.outputWriter.WriteLine($"Requesting metadata for platform {platformName} from external SDK provider");
         var response = await this.SendRequestAsync(request);
@@ -63,7 +77,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
           this.logger.LogInformation("Successfully got metadata for platform {platformName}, available at filePath: {filePath}", platformName, filePath);
           try
           {
-            return XDocument.Load(filePath);
+            return this.LoadMetadata(platformName, filePath);
           }
           catch (Exception ex)
           {
@@ -202,6 +216,55 @@ namespace Microsoft.Oryx.BuildScriptGenerator
       }
     }
 
+    /// <summary>
+    /// Gets the metadata of the platform without requesting it again if it was already loaded by this process,
+    /// or if the metadata file written for an earlier build is still fresh according to the SDK metadata cache
+    /// settings.
+    /// </summary>
+    private bool TryGetLoadedMetadata(string platformName, string filePath, out XDocument metadata)
+    {
+      metadata = null;
+      if (!File.Exists(filePath))
+      {
+        return false;
+      }
+
+      var lastWriteTime = File.GetLastWriteTimeUtc(filePath);
+      if (this.loadedMetadata.TryGetValue(platformName, out var loaded) && loaded.Item1 == lastWriteTime)
+      {
+        metadata = loaded.Item2;
+        return true;
+      }
+
+      var age = DateTime.UtcNow - lastWriteTime;
+      var isFresh = !string.IsNullOrEmpty(this.commonOptions.SdkMetadataCacheDir)
+        && age < TimeSpan.FromMinutes(this.commonOptions.SdkMetadataCacheTtlInMinutes);
+      if (!this.commonOptions.SdkMetadataOffline && !isFresh)
+      {
+        return false;
+      }
+
+      try
+      {
+        metadata = this.LoadMetadata(platformName, filePath);
+        this.logger.LogInformation("Using cached metadata for platform {platformName} at {filePath}", platformName, filePath);
+        return true;
+      }
+      catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException || ex is System.Xml.XmlException)
+      {
+        this.logger.LogWarning(ex, "Could not load cached metadata for platform {platformName} at {filePath}", platformName, filePath);
+        return false;
+      }
+    }
+
+    private XDocument LoadMetadata(string platformName, string filePath)
+    {
+      var lastWriteTime = File.GetLastWriteTimeUtc(filePath);
+      var metadata = XDocument.Load(filePath);
+      this.loadedMetadata[platformName] = Tuple.Create(lastWriteTime, metadata);
+      return metadata;
+    }
+
     private async Task<bool> SendRequestAsync(SdkProviderRequest request)
     {
       try
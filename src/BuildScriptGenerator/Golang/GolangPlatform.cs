@@ -63,10 +63,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Golang
 
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -40,7 +40,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
 
             // if <NextMarker> element's value is not empty, we iterate through every page by appending marker value to the url
             // and consolidate blobs from all the pages.
-            do
+            while (!string.IsNullOrEmpty(marker))
             {
                 url = string.Format(SdkStorageConstants.ContainerMetadataUrlFormat, sdkStorageBaseUrl, platform, marker);
                 var blobListFromNextMarker = httpClient.GetStringAsync(url).Result;
@@ -48,7 +48,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 marker = xdocFromNextMarker.Root.Element("NextMarker").Value;
                 xdoc.Descendants("Blobs").LastOrDefault().AddAfterSelf(xdocFromNextMarker.Descendants("Blobs"));
             }
-            while (!string.IsNullOrEmpty(marker));
+
             return xdoc;
         }
     }
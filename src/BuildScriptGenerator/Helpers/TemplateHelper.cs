@@ -5,6 +5,7 @@
 
 namespace Microsoft.Oryx.BuildScriptGenerator
 {
+    using System.Collections.Concurrent;
     using System.Collections.Generic;
     using System.IO;
     using JetBrains.Annotations;
@@ -18,50 +19,82 @@ namespace Microsoft.Oryx.BuildScriptGenerator
     {
         private static readonly MemberRenamerDelegate NoOpRenamer = member => member.Name;
 
+        // Templates are embedded resources, so they are parsed once per process. A parsed template is immutable and
+        // can be rendered concurrently with different contexts.
+        private static readonly ConcurrentDictionary<string, Template> ParsedTemplates =
+            new ConcurrentDictionary<string, Template>();
+
+        // The builtin functions of Scriban and the TemplateFunctions, shared by all the renders. Models are pushed
+        // as a separate global for each render, so that rendering never changes this object.
+        private static readonly ScriptObject BuiltinObject = CreateBuiltinObject();
+
         public static string Render(TemplateResource templateResource, [CanBeNull] object model, ILogger logger = null, TelemetryClient telemetryClient = null)
+        {
+            var template = GetTemplate(templateResource, logger);
+            using (telemetryClient?.LogTimedEvent(
+                "RenderTemplate",
+                new Dictionary<string, string> { { "templateName", templateResource.Name } }))
+            {
+                return Render(template, model);
+            }
+        }
+
+        public static string RenderString(string templateBody, object model)
+        {
+            return Render(Template.Parse(templateBody), model);
+        }
+
+        internal static Template GetTemplate(TemplateResource templateResource, ILogger logger = null)
+        {
+            return ParsedTemplates.GetOrAdd(templateResource.Name, name => ParseResource(name, logger));
+        }
+
+        internal static Template ParseResource(string resourceName, ILogger logger = null)
         {
             var assembly = typeof(IBuildScriptGenerator).Assembly;
-            using (var stream = assembly.GetManifestResourceStream(templateResource.Name))
+            using (var stream = assembly.GetManifestResourceStream(resourceName))
             {
                 if (stream == null)
                 {
                     logger?.LogError(
                         "Could not get resource {resourceName}. Available resources: {availableResourceNames}",
-                        templateResource.Name,
+                        resourceName,
                         string.Join("|", assembly.GetManifestResourceNames()));
                 }
 
                 using (TextReader tplReader = new StreamReader(stream))
-                using (telemetryClient?.LogTimedEvent(
-                    "RenderTemplate",
-                    new Dictionary<string, string> { { "templateName", templateResource.Name } }))
                 {
-                    return RenderString(tplReader.ReadToEnd(), model);
+                    return Template.Parse(tplReader.ReadToEnd());
                 }
             }
         }
 
-        public static string RenderString(string templateBody, object model)
+        private static string Render(Template template, object model)
         {
-            var ctx = new TemplateContext
+            var ctx = new TemplateContext(BuiltinObject)
             {
                 MemberRenamer = NoOpRenamer,
                 StrictVariables = true,
             };
 
+            var modelObj = new ScriptObject();
             if (model != null)
             {
-                var modelObj = new ScriptObject();
                 modelObj.Import(model, renamer: NoOpRenamer);
-                ctx.PushGlobal(modelObj);
             }
 
-            // Injects the function IsNullOrWhiteSpace so that it's available for use in templates.
+            ctx.PushGlobal(modelObj);
+            return template.Render(ctx).Replace("\r\n", "\n");
+        }
+
+        private static ScriptObject CreateBuiltinObject()
+        {
+            // Injects the function IsNotBlank so that it's available for use in templates.
             // Further reading:
             // https://github.com/lunet-io/scriban/blob/master/doc/runtime.md#the-stack-of-scriptobject
-            ctx.BuiltinObject.Import(typeof(TemplateFunctions), renamer: NoOpRenamer);
-
-            return Template.Parse(templateBody).Render(ctx).Replace("\r\n", "\n");
+            var builtinObject = TemplateContext.GetDefaultBuiltinObject();
+            builtinObject.Import(typeof(TemplateFunctions), renamer: NoOpRenamer);
+            return builtinObject;
         }
 
         public static class TemplateFunctions
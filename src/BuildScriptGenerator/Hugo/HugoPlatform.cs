@@ -23,6 +23,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Hugo
         private readonly HugoScriptGeneratorOptions hugoScriptGeneratorOptions;
         private readonly IHugoPlatformDetector detector;
         private readonly TelemetryClient telemetryClient;
+        private readonly IStandardOutputWriter outputWriter;
 
         public HugoPlatform(
             IOptions<BuildScriptGeneratorOptions> commonOptions,
@@ -30,7 +31,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Hugo
             ILogger<HugoPlatform> logger,
             HugoPlatformInstaller platformInstaller,
             IHugoPlatformDetector detector,
-            TelemetryClient telemetryClient)
+            TelemetryClient telemetryClient,
+            IStandardOutputWriter outputWriter)
         {
             this.logger = logger;
             this.platformInstaller = platformInstaller;
@@ -38,6 +40,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Hugo
             this.hugoScriptGeneratorOptions = hugoScriptGeneratorOptions.Value;
             this.detector = detector;
             this.telemetryClient = telemetryClient;
+            this.outputWriter = outputWriter;
         }
 
         /// <inheritdoc/>
@@ -58,10 +61,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Hugo
 
             try
             {
-                detectionResult = this.detector.Detect(new DetectorContext
-                {
-                    SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-                });
+                detectionResult = this.detector.Detect(context);
             }
             catch (FailedToParseFileException ex)
             {
@@ -90,7 +90,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Hugo
             manifestFileProperties[ManifestFilePropertyKeys.HugoVersion] = detectorResult.PlatformVersion;
             manifestFileProperties[ManifestFilePropertyKeys.Frameworks] = "hugo";
             this.logger.LogInformation("Detected the following frameworks: hugo");
-            Console.WriteLine("Detected the following frameworks: hugo");
+            this.outputWriter.WriteLine("Detected the following frameworks: hugo");
 
             string script = TemplateHelper.Render(
                 TemplateHelper.TemplateResource.HugoSnippet,
@@ -82,10 +82,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Java
         /// <inheritdoc/>
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -160,10 +157,26 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Java
                 this.logger,
                 this.telemetryClient);
 
+            var dependencyCaches = new List<DependencyCache>();
+            if (javaPlatformDetectorResult.UsesMaven || javaPlatformDetectorResult.UsesMavenWrapperTool)
+            {
+                // Maven has no lock file, the dependencies are declared in the POM
+                dependencyCaches.Add(new DependencyCache
+                {
+                    Name = "maven",
+                    EnvironmentVariables = new Dictionary<string, string>
+                    {
+                        ["MAVEN_OPTS"] = $"$MAVEN_OPTS -Dmaven.repo.local={DependencyCache.DirectoryVariable}",
+                    },
+                    LockFiles = new[] { MavenConstants.PomXmlFileName },
+                });
+            }
+
             return new BuildScriptSnippet
             {
                 BashBuildScriptSnippet = script,
                 BuildProperties = manifestFileProperties,
+                DependencyCaches = dependencyCaches,
             };
         }
 
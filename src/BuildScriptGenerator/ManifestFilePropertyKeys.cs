@@ -34,5 +34,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         internal const string CompressDestinationDir = nameof(CompressDestinationDir);
 
         internal const string Frameworks = nameof(Frameworks);
+
+        internal const string BuildTraceFile = nameof(BuildTraceFile);
+
+        internal const string DependencyCacheHitRate = nameof(DependencyCacheHitRate);
+
+        internal const string DependencyCacheBytesFetched = nameof(DependencyCacheBytesFetched);
     }
 }
\ No newline at end of file
@@ -62,18 +62,101 @@ HasProdDependencies={{ HasProdDependencies }}
 HasDevDependencies={{ HasDevDependencies }}
 packageDirName={{ PackageDirectory }}
 
+{{ if LinkProdDependencies }}
+# Prints the paths, relative to node_modules, of the packages in the given package-lock.json which are not
+# dev dependencies. Packages nested in another printed package are not printed.
+list_prod_node_modules() {
+	node -e '
+		const lock = JSON.parse(require("fs").readFileSync(process.argv[1], "utf8"));
+		const paths = [];
+		if (lock.packages) {
+			for (const [key, pkg] of Object.entries(lock.packages)) {
+				if (key.startsWith("node_modules/") && !pkg.dev) {
+					paths.push(key.substring("node_modules/".length));
+				}
+			}
+		} else {
+			const walk = (dependencies, prefix) => {
+				for (const [name, pkg] of Object.entries(dependencies || {})) {
+					if (!pkg.dev) {
+						paths.push(prefix + name);
+						walk(pkg.dependencies, prefix + name + "/node_modules/");
+					}
+				}
+			};
+			walk(lock.dependencies, "");
+		}
+		const selected = new Set(paths);
+		for (const path of paths) {
+			const parts = path.split("/node_modules/");
+			let isNested = false;
+			for (let i = 1; i < parts.length && !isNested; i++) {
+				isNested = selected.has(parts.slice(0, i).join("/node_modules/"));
+			}
+			if (!isNested) {
+				process.stdout.write(path + "\0");
+			}
+		}' "$1"
+}
+
+# Moves 'node_modules' to '$allModulesDirName' and re-creates 'node_modules' with hard links to only the
+# production dependencies listed in package-lock.json, so that no file content is copied.
+link_prod_node_modules() {
+	local prodPackagesFile=$(mktemp)
+	if ! list_prod_node_modules "$SOURCE_DIR/package-lock.json" > "$prodPackagesFile"; then
+		echo "Could not read the production dependencies from 'package-lock.json', keeping all dependencies."
+		rm -f "$prodPackagesFile"
+		return 0
+	fi
+
+	rm -rf "$allModulesDirName"
+	mv node_modules "$allModulesDirName"
+	mkdir node_modules
+
+	local packageCount=0
+	local package
+	while IFS= read -r -d '' package; do
+		# Optional dependencies which are not supported on this platform are listed but not installed
+		if [ -e "$allModulesDirName/$package" ] || [ -L "$allModulesDirName/$package" ]; then
+			mkdir -p "$(dirname "node_modules/$package")"
+			cp -al "$allModulesDirName/$package" "node_modules/$package"
+			packageCount=$(($packageCount + 1))
+		fi
+	done < "$prodPackagesFile"
+	rm -f "$prodPackagesFile"
+
+	if [ -d "$allModulesDirName/.bin" ]; then
+		cp -a "$allModulesDirName/.bin" node_modules/
+		# Remove the links to the executables of the dev dependencies
+		find node_modules/.bin -xtype l -delete
+	fi
+
+	echo "Linked $packageCount production package(s) into '$SOURCE_DIR/node_modules'."
+}
+{{ end }}
+
 # if node modules exist separately for dev & prod (like from an earlier build),
 # rename the folders back appropriately for the current build
 if [ -d "$allModulesDirName" ]
 then
 	echo
 	echo "Found existing folder '$SOURCE_DIR/$allModulesDirName'."
-	echo "Copying modules from '$SOURCE_DIR/$allModulesDirName' to '$SOURCE_DIR/node_modules'..."
 	cd "$SOURCE_DIR"
+	{{ if LinkProdDependencies }}
+	{{ ## 'node_modules' only contains hard links to a subset of the files in this folder ## }}
+	echo "Moving modules from '$SOURCE_DIR/$allModulesDirName' to '$SOURCE_DIR/node_modules'..."
+	rm -rf node_modules
+	mv "$allModulesDirName" node_modules
+	{{ else }}
+	echo "Copying modules from '$SOURCE_DIR/$allModulesDirName' to '$SOURCE_DIR/node_modules'..."
 	mkdir -p node_modules
-	rsync -rcE --links "$allModulesDirName/" node_modules
+	sync_tree "$allModulesDirName" node_modules --links
+	{{ end }}
 fi
 
+{{ ## When linking the production dependencies, they are selected from the full install instead of being
+installed separately ## }}
+{{ if !LinkProdDependencies }}
 if [ "$PruneDevDependencies" == "true" ] && [ "$HasProdDependencies" == "true" ]
 then
 	# Delete existing prod modules folder so that we do not publish
@@ -132,11 +215,12 @@ then
 		echo
 		echo "Copying production dependencies from '$SOURCE_DIR/$prodModulesDirName' to '$SOURCE_DIR/node_modules'..."
 		START_TIME=$SECONDS
-		rsync -rcE --links "node_modules/" "$SOURCE_DIR/node_modules"
+		sync_tree node_modules "$SOURCE_DIR/node_modules" --links
 		ELAPSED_TIME=$(($SECONDS - $START_TIME))
 		echo "Copying production dependencies done in $ELAPSED_TIME sec(s)."
 	fi
 fi
+{{ end }}
 
 # ensure that if the current user is root, that the root user also owns
 # the application directory. This ensures that when npm install runs, it 
@@ -213,6 +297,13 @@ cd "$SOURCE_DIR"
 	ELAPSED_TIME=$(($SECONDS - $START_TIME))
 	echo "Lage run build command done in $ELAPSED_TIME sec(s)."
 {{ else }}
+	{{ if UseDependencyLayerCache }}
+	dependencyLayerKey=$(dependency_layer_key "node $(node --version) {{ PackageInstallCommand }}" \
+		package.json package-lock.json yarn.lock .npmrc .yarnrc)
+	if restore_dependency_layer "$dependencyLayerKey" node_modules; then
+		printf %s ", restore_dependency_layer $dependencyLayerKey node_modules" >> "$COMMAND_MANIFEST_FILE"
+	else
+	{{ end }}
 	echo
 	echo "Running '{{ PackageInstallCommand }}'..."
 	echo
@@ -221,6 +312,11 @@ cd "$SOURCE_DIR"
 	{{ PackageInstallCommand }}
 	ELAPSED_TIME=$(($SECONDS - $START_TIME))
 	echo "Package install done in $ELAPSED_TIME sec(s)."
+	{{ if UseDependencyLayerCache }}
+	{{ ## Saved before the build, which may write caches to 'node_modules' ## }}
+	save_dependency_layer "$dependencyLayerKey" node_modules
+	fi
+	{{ end }}
 	{{ if NpmRunBuildCommand | IsNotBlank }}
 	echo
 	echo "Running '{{ NpmRunBuildCommand }}'..."
@@ -286,19 +382,30 @@ cd "$SOURCE_DIR"
 
 if [ "$PruneDevDependencies" == "true" ] && [ "$HasDevDependencies" == "true" ]
 then
+	{{ if LinkProdDependencies }}
+	if [ -d "node_modules" ]; then
+		echo
+		echo "Linking production dependencies from '$SOURCE_DIR/$allModulesDirName' to '$SOURCE_DIR/node_modules'..."
+		START_TIME=$SECONDS
+		link_prod_node_modules
+		ELAPSED_TIME=$(($SECONDS - $START_TIME))
+		echo "Linking production dependencies done in $ELAPSED_TIME sec(s)."
+	fi
+	{{ else }}
 	if [ -d "node_modules" ]; then
 		echo
 		echo "Copy '$SOURCE_DIR/node_modules' with all dependencies to '$SOURCE_DIR/$allModulesDirName'..."
-		rsync -rcE --links "node_modules/" "$allModulesDirName" --delete
+		sync_tree node_modules "$allModulesDirName" --links --delete
 	fi
 
 	if [ "$HasProdDependencies" == "true" ] && [ -d "$prodModulesDirName/node_modules/" ]; then
 		echo
 		echo "Copying production dependencies from '$SOURCE_DIR/$prodModulesDirName/node_modules' to '$SOURCE_DIR/node_modules'..."
-		rsync -rcE --links "$prodModulesDirName/node_modules/" node_modules --delete
+		sync_tree "$prodModulesDirName/node_modules" node_modules --links --delete
 	else
 		rm -rf "node_modules/"
 	fi
+	{{ end }}
 fi
 
 {{ if CompressNodeModulesCommand | IsNotBlank }}
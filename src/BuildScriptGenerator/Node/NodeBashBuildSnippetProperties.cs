@@ -40,6 +40,18 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
 
         public bool PruneDevDependencies { get; set; }
 
+        /// <summary>
+        /// Gets or sets a value indicating whether the production dependencies are hard linked into
+        /// 'node_modules' from the full install, based on package-lock.json, when pruning dev dependencies.
+        /// </summary>
+        public bool LinkProdDependencies { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether 'node_modules' is restored from the dependency layer cache when
+        /// the package manifest and lock files did not change since a previous build, and saved to it otherwise.
+        /// </summary>
+        public bool UseDependencyLayerCache { get; set; }
+
         public string AppInsightsInjectCommand { get; set; }
 
         public string AppInsightsPackageName { get; set; }
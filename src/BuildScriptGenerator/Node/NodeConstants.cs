@@ -70,5 +70,13 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             { "noble", "24" },
             { "stretch", "16" },
         };
+
+        /// <summary>
+        /// Scripts of package.json which the package manager runs for the app itself when installing packages.
+        /// </summary>
+        public static readonly string[] InstallLifecycleScriptNames =
+        {
+            "preinstall", "install", "postinstall", "prepare",
+        };
     }
 }
\ No newline at end of file
@@ -30,7 +30,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
 
         public IEnumerable<ICheckerMessage> CheckSourceRepo(ISourceRepo repo)
         {
-            dynamic packageJson = NodePlatform.GetPackageJsonObject(repo, this.logger);
+            var packageJson = NodePlatform.GetPackageJson(repo, this.logger);
             if (packageJson == null)
             {
                 this.logger.LogDebug(
@@ -39,8 +39,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             }
 
             var result = new List<ICheckerMessage>();
-            CheckPackageJsonDependencyObject(packageJson.dependencies, "dependencies", result);
-            CheckPackageJsonDependencyObject(packageJson.devDependencies, "devDependencies", result);
+            CheckPackageJsonDependencyObject(packageJson.Dependencies, "dependencies", result);
+            CheckPackageJsonDependencyObject(packageJson.DevDependencies, "devDependencies", result);
             return result;
         }
 
@@ -48,7 +48,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             Enumerable.Empty<ICheckerMessage>();
 
         private static void CheckPackageJsonDependencyObject(
-            dynamic packageJsonChildObj,
+            IReadOnlyDictionary<string, string> packageJsonChildObj,
             string childObjKey,
             List<ICheckerMessage> result)
         {
@@ -57,8 +57,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
                 return;
             }
 
-            Newtonsoft.Json.Linq.JObject depsObj = packageJsonChildObj;
-            foreach (string packageName in depsObj.ToObject<IDictionary<string, string>>().Keys)
+            foreach (string packageName in packageJsonChildObj.Keys)
             {
                 if (SupersededPackages.ContainsKey(packageName))
                 {
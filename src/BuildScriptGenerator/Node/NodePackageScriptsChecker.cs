@@ -24,7 +24,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
 
         [NotNull]
         public static IEnumerable<ICheckerMessage> CheckScriptsForGlobalInstallationAttempts(
-            [CanBeNull] IDictionary<string, string> scripts)
+            [CanBeNull] IReadOnlyDictionary<string, string> scripts)
         {
             if (scripts == null || scripts.Count == 0)
             {
@@ -43,11 +43,10 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             // Installing packages globally is problematic only in the App Service envelope
             if (this.env?.Type == Common.EnvironmentType.AzureAppService)
             {
-                dynamic packageJson = NodePlatform.GetPackageJsonObject(repo, logger: null);
+                var packageJson = NodePlatform.GetPackageJson(repo, logger: null);
                 if (packageJson != null)
                 {
-                    return CheckScriptsForGlobalInstallationAttempts(
-                        packageJson.scripts?.ToObject<IDictionary<string, string>>());
+                    return CheckScriptsForGlobalInstallationAttempts(packageJson.Scripts);
                 }
             }
 
@@ -57,7 +56,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
         public IEnumerable<ICheckerMessage> CheckToolVersions(IDictionary<string, string> tools) =>
             Enumerable.Empty<ICheckerMessage>();
 
-        private static void CheckScript(IDictionary<string, string> scripts, string scriptKey, List<ICheckerMessage> result)
+        private static void CheckScript(IReadOnlyDictionary<string, string> scripts, string scriptKey, List<ICheckerMessage> result)
         {
             scripts.TryGetValue(scriptKey, out var script);
             if (script != null && NpmGlobalPattern.IsMatch(script))
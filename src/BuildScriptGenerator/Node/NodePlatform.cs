@@ -13,11 +13,9 @@ using Microsoft.Extensions.Options;
 using Microsoft.Oryx.BuildScriptGenerator.Common;
 using Microsoft.Oryx.BuildScriptGenerator.Common.Extensions;
 using Microsoft.Oryx.BuildScriptGenerator.Exceptions;
-using Microsoft.Oryx.BuildScriptGenerator.SourceRepo;
 using Microsoft.Oryx.Common.Extensions;
 using Microsoft.Oryx.Detector;
 using Microsoft.Oryx.Detector.Node;
-using Newtonsoft.Json.Linq;
 
 namespace Microsoft.Oryx.BuildScriptGenerator.Node
 {
@@ -146,10 +144,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
         /// <inheritdoc/>
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -185,7 +180,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             manifestFileProperties[ManifestFilePropertyKeys.NodeVersion] = nodePlatformDetectorResult.PlatformVersion;
             manifestFileProperties[nameof(nodeBuildCommandsFile)] = nodeBuildCommandsFile;
             nodeCommandManifestFileProperties["PlatformWithVersion"] = "Node.js " + nodePlatformDetectorResult.PlatformVersion;
-            var packageJson = GetPackageJsonObject(ctx.SourceRepo, this.logger);
+            var packageJson = GetPackageJson(ctx.SourceRepo, this.logger);
             string runBuildCommand = null;
             string runBuildAzureCommand = null;
             string runBuildLernaCommand = null;
@@ -205,7 +200,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
                 throw new InvalidUsageException("Multiple monorepo package management tools are found, please choose to use either Lerna or Lage.");
             }
 
-            string yarnVersionSpec = packageJson?.engines?.yarn;
+            var yarnVersionSpec = packageJson?.Engines?.GetValueOrDefault("yarn");
             if (ctx.SourceRepo.FileExists(NodeConstants.YarnLockFileName) || yarnVersionSpec != null)
             {
                 packageManagerCmd = NodeConstants.YarnCommand;
@@ -267,19 +262,19 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             this.logger.LogInformation("Using {packageManager}", packageManagerCmd);
 
             var hasProdDependencies = false;
-            if (packageJson?.dependencies != null)
+            if (packageJson?.Dependencies != null)
             {
                 hasProdDependencies = true;
             }
 
             var hasDevDependencies = false;
-            if (packageJson?.devDependencies != null)
+            if (packageJson?.DevDependencies != null)
             {
                 // If development time dependencies are present we want to avoid copying them to improve performance
                 hasDevDependencies = true;
             }
 
-            var npmVersionSpec = packageJson?.engines?.npm?.Value as string;
+            var npmVersionSpec = packageJson?.Engines?.GetValueOrDefault("npm");
 
             var productionOnlyPackageInstallCommand = string.Format(
                 NodeConstants.ProductionOnlyPackageInstallCommandTemplate, packageInstallCommand);
@@ -289,15 +284,15 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
                 && string.IsNullOrEmpty(runBuildLernaCommand)
                 && string.IsNullOrEmpty(runBuildLageCommand))
             {
-                var scriptsNode = packageJson?.scripts;
+                var scriptsNode = packageJson?.Scripts;
                 if (scriptsNode != null)
                 {
-                    if (scriptsNode.build != null)
+                    if (scriptsNode.ContainsKey("build"))
                     {
                         runBuildCommand = string.Format(NodeConstants.PkgMgrRunBuildCommandTemplate, packageManagerCmd);
                     }
 
-                    if (scriptsNode["build:azure"] != null && !this.commonOptions.ShouldPackage)
+                    if (scriptsNode.ContainsKey("build:azure") && !this.commonOptions.ShouldPackage)
                     {
                         runBuildAzureCommand = string.Format(
                             NodeConstants.PkgMgrRunBuildAzureCommandTemplate,
@@ -321,18 +316,18 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
                     "Could not find tools for building monorepos, no 'lerna.json' or 'lage.config.js' files found.");
             }
 
-            if (packageJson?.dependencies != null)
+            if (packageJson?.Dependencies != null)
             {
-                var depSpecs = ((JObject)packageJson.dependencies).ToObject<IDictionary<string, string>>();
+                var depSpecs = packageJson.Dependencies;
                 this.telemetryClient.LogDependencies(
                     this.commonOptions.PlatformName,
                     nodePlatformDetectorResult.PlatformVersion,
                     depSpecs.Select(d => d.Key + d.Value));
             }
 
-            if (packageJson?.devDependencies != null)
+            if (packageJson?.DevDependencies != null)
             {
-                var depSpecs = ((JObject)packageJson.devDependencies).ToObject<IDictionary<string, string>>();
+                var depSpecs = packageJson.DevDependencies;
                 this.telemetryClient.LogDependencies(
                     this.commonOptions.PlatformName,
                     nodePlatformDetectorResult.PlatformVersion,
@@ -360,8 +355,27 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             }
 
             bool pruneDevDependencies = ShouldPruneDevDependencies(ctx);
+
+            // The production dependencies can only be selected from the full install using the npm lock file
+            bool linkProdDependencies = pruneDevDependencies
+                && this.nodeScriptGeneratorOptions.PruneDevDependenciesWithHardlinks
+                && packageManagerCmd == NodeConstants.NpmCommand
+                && ctx.SourceRepo.FileExists(NodeConstants.PackageLockJsonFileName);
             string appInsightsInjectCommand = string.Empty;
 
+            // 'node_modules' is only archived when it is fully determined by a lock file and installed by the
+            // default build. Yarn 2+ may not create it at all. A restored 'node_modules' skips the install, so the
+            // install scripts of the app itself would not run.
+            bool useDependencyLayerCache = !string.IsNullOrEmpty(this.commonOptions.DependencyLayerCacheDir)
+                && string.IsNullOrEmpty(this.nodeScriptGeneratorOptions.CustomBuildCommand)
+                && string.IsNullOrEmpty(this.nodeScriptGeneratorOptions.CustomRunBuildCommand)
+                && string.IsNullOrEmpty(runBuildLernaCommand)
+                && string.IsNullOrEmpty(runBuildLageCommand)
+                && !nodePlatformDetectorResult.HasYarnrcYmlFile
+                && !NodeConstants.InstallLifecycleScriptNames.Any(name => packageJson?.Scripts?.ContainsKey(name) == true)
+                && (ctx.SourceRepo.FileExists(NodeConstants.PackageLockJsonFileName)
+                    || ctx.SourceRepo.FileExists(NodeConstants.YarnLockFileName));
+
             GetAppOutputDirPath(packageJson, manifestFileProperties);
 
             string customRegistryUrl = null;
@@ -401,6 +415,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
                 ConfigureYarnCache = configureYarnCache,
                 YarnTimeOutConfig = this.nodeScriptGeneratorOptions.YarnTimeOutConfig,
                 PruneDevDependencies = pruneDevDependencies,
+                LinkProdDependencies = linkProdDependencies,
+                UseDependencyLayerCache = useDependencyLayerCache,
                 AppInsightsInjectCommand = appInsightsInjectCommand,
                 AppInsightsPackageName = NodeConstants.NodeAppInsightsPackageName,
                 AppInsightsLoaderFileName = NodeAppInsightsLoader.NodeAppInsightsLoaderFileName,
@@ -580,33 +596,26 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
         }
 
         /// <summary>
-        /// Gets the package json object.
+        /// Gets the package json model, which is parsed only once per source repo.
         /// </summary>
         /// <param name="sourceRepo">The source repository.</param>
         /// <param name="logger">The logger of Node.js platform.</param>
-        /// <returns>Package json Object.</returns>
-        internal static dynamic GetPackageJsonObject(ISourceRepo sourceRepo, ILogger logger)
+        /// <returns>Package json model, or null if the file does not exist or is malformed.</returns>
+        internal static PackageJson GetPackageJson(ISourceRepo sourceRepo, ILogger logger)
         {
             if (!sourceRepo.FileExists(NodeConstants.PackageJsonFileName))
             {
                 return null;
             }
 
-            dynamic packageJson = null;
-            try
-            {
-                packageJson = sourceRepo.ReadJsonObjectFromFile(NodeConstants.PackageJsonFileName);
-            }
-            catch (Exception exc)
-            {
-                // Leave malformed package.json files for Node.js to handle.
-                // This prevents Oryx from erroring out when Node.js itself might be able to tolerate the file.
-                logger.LogWarning(
-                    exc,
-                    $"Exception caught while trying to deserialize {NodeConstants.PackageJsonFileName.Hash()}");
-            }
-
-            return packageJson;
+            // Leave malformed package.json files for Node.js to handle.
+            // This prevents Oryx from erroring out when Node.js itself might be able to tolerate the file.
+            return ManifestFileCache.GetOrAdd(
+                sourceRepo,
+                NodeConstants.PackageJsonFileName,
+                () => sourceRepo.ReadFile(NodeConstants.PackageJsonFileName),
+                PackageJson.Parse,
+                logger);
         }
 
         private static bool ShouldPruneDevDependencies(BuildScriptGeneratorContext context)
@@ -619,19 +628,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             return BuildPropertiesHelper.IsTrue(RequireBuildPropertyKey, context, valueIsRequired: false);
         }
 
-        private static bool DoesPackageDependencyExist(dynamic packageJson, string packageName)
+        private static bool DoesPackageDependencyExist(PackageJson packageJson, string packageName)
         {
-            if (packageJson?.dependencies != null)
-            {
-                JObject deps = packageJson.dependencies;
-                var pkgDependencies = deps.ToObject<IDictionary<string, string>>();
-                if (pkgDependencies.ContainsKey(packageName))
-                {
-                    return true;
-                }
-            }
-
-            return false;
+            return packageJson?.Dependencies?.ContainsKey(packageName) == true;
         }
 
         private static bool GetNodeModulesPackOptions(
@@ -677,15 +676,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
             return isNodeModulesPackaged;
         }
 
-        private static void GetAppOutputDirPath(dynamic packageJson, Dictionary<string, string> buildProperties)
+        private static void GetAppOutputDirPath(PackageJson packageJson, Dictionary<string, string> buildProperties)
         {
-            if (packageJson == null || packageJson.scripts == null || packageJson.scripts["build"] == null)
-            {
-                return;
-            }
-
-            var buildNode = packageJson.scripts["build"] as JValue;
-            var buildCommand = buildNode.Value as string;
+            var buildCommand = packageJson?.Scripts?.GetValueOrDefault("build");
 
             if (string.IsNullOrEmpty(buildCommand))
             {
@@ -21,6 +21,13 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Node
 
         public bool PruneDevDependencies { get; set; }
 
+        /// <summary>
+        /// Gets or sets a value indicating whether, when pruning dev dependencies of an npm app with a
+        /// package-lock.json, the production dependencies are hard linked from the full install instead of
+        /// being installed and copied separately.
+        /// </summary>
+        public bool PruneDevDependenciesWithHardlinks { get; set; }
+
         public string NpmRegistryUrl { get; set; }
 
         public string NodeVersion { get; set; }
@@ -45,6 +45,42 @@ namespace Microsoft.Oryx.BuildScriptGenerator
 
         public string DynamicInstallRootDir { get; set; }
 
+        /// <summary>
+        /// Gets or sets the maximum number of platform SDKs which are installed concurrently when more than one
+        /// platform needs to be installed. Values less than 2 install them one after another.
+        /// </summary>
+        public int DynamicInstallParallelism { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory where SDK version listings and metadata are cached across builds. If not set,
+        /// they are downloaded on every build.
+        /// </summary>
+        public string SdkMetadataCacheDir { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory where the package managers (ex: composer, bundler, Maven) keep the packages
+        /// they download, so that they are not downloaded again by later builds. If not set, the package managers
+        /// use their default cache directories.
+        /// </summary>
+        public string DependencyCacheDir { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory where the installed dependencies of an app (ex: its virtual environment or
+        /// 'node_modules') are archived, so that later builds with the same lock files restore them instead of
+        /// running the package manager. If not set, the dependencies are always installed.
+        /// </summary>
+        public string DependencyLayerCacheDir { get; set; }
+
+        /// <summary>
+        /// Gets or sets how long cached SDK metadata is used without revalidating it.
+        /// </summary>
+        public int SdkMetadataCacheTtlInMinutes { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether only cached SDK metadata is used, without any network request.
+        /// </summary>
+        public bool SdkMetadataOffline { get; set; }
+
         public bool EnableCheckers { get; set; }
 
         public bool EnableDotNetCoreBuild { get; set; }
@@ -85,6 +121,30 @@ namespace Microsoft.Oryx.BuildScriptGenerator
 
         public bool CompressDestinationDir { get; set; }
 
+        /// <summary>
+        /// Gets or sets a value indicating whether files are compared by checksum rather than by size and
+        /// modification time when copying the source to the intermediate and destination directories.
+        /// </summary>
+        public bool CopyVerify { get; set; }
+
+        /// <summary>
+        /// Gets or sets how copied files share their content with the source files: 'reflink', 'hardlink',
+        /// or null to copy the content.
+        /// </summary>
+        public string CopyLinkMode { get; set; }
+
+        /// <summary>
+        /// Gets or sets the maximum number of directories copied concurrently. If not set, the number of
+        /// processors is used.
+        /// </summary>
+        public int CopyParallelism { get; set; }
+
+        /// <summary>
+        /// Gets or sets the full path of the file a Chrome trace of the build is written to, or null to not trace
+        /// the build.
+        /// </summary>
+        public string BuildTraceFile { get; set; }
+
         public string CustomRequirementsTxtPath { get; set; }
 
         public string OsType { get; set; }
@@ -111,6 +171,12 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         /// </summary>
         public bool SkipDetection { get; set; }
 
+        /// <summary>
+        /// Gets or sets a value indicating whether the platforms should be detected concurrently.
+        /// The detected platforms are returned in the same order regardless of this setting.
+        /// </summary>
+        public bool EnableParallelDetection { get; set; }
+
         /// <summary>
         /// Gets or sets a value indicating whether the direct ACR SDK provider is enabled.
         /// When true, Oryx will discover and download SDKs directly from an OCI-compliant container registry.
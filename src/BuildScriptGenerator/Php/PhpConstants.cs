@@ -13,6 +13,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Php
         public const string PhpFileNamePattern = "*.php";
         public const string PhpComposerName = "php-composer";
         public const string ComposerFileName = "composer.json";
+        public const string ComposerLockFileName = "composer.lock";
         public const string PhpRuntimeVersionEnvVarName = "PHP_VERSION";
         public const string DefaultPhpRuntimeVersion = Common.PhpVersions.Php73Version;
         public const string InstalledPhpVersionsDir = "/opt/php/"; // TODO: consolidate with Dockerfile to yaml?
@@ -13,7 +13,6 @@ using Microsoft.Extensions.Options;
 using Microsoft.Oryx.BuildScriptGenerator.Common;
 using Microsoft.Oryx.BuildScriptGenerator.Common.Extensions;
 using Microsoft.Oryx.BuildScriptGenerator.Exceptions;
-using Microsoft.Oryx.BuildScriptGenerator.SourceRepo;
 using Microsoft.Oryx.Common.Extensions;
 using Microsoft.Oryx.Detector;
 using Microsoft.Oryx.Detector.Php;
@@ -104,10 +103,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Php
         /// <returns>The results of language detector operations.</returns>
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -143,24 +139,20 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Php
             {
                 composerFileExists = true;
 
-                try
-                {
-                    dynamic composerFile = ctx.SourceRepo.ReadJsonObjectFromFile(PhpConstants.ComposerFileName);
-                    if (composerFile?.require != null)
-                    {
-                        Newtonsoft.Json.Linq.JObject deps = composerFile?.require;
-                        var depSpecs = deps.ToObject<IDictionary<string, string>>();
-                        this.telemetryClient.LogDependencies(
-                            this.Name,
-                            phpPlatformDetectorResult.PlatformVersion,
-                            depSpecs.Select(kv => kv.Key + kv.Value));
-                    }
-                }
-                catch (Exception exc)
+                // Leave malformed composer.json files for Composer to handle.
+                // This prevents Oryx from erroring out when Composer itself might be able to tolerate the file.
+                var composerFile = ManifestFileCache.GetOrAdd(
+                    ctx.SourceRepo,
+                    PhpConstants.ComposerFileName,
+                    () => ctx.SourceRepo.ReadFile(PhpConstants.ComposerFileName),
+                    ComposerJson.Parse,
+                    this.logger);
+                if (composerFile?.Require != null)
                 {
-                    // Leave malformed composer.json files for Composer to handle.
-                    // This prevents Oryx from erroring out when Composer itself might be able to tolerate the file.
-                    this.logger.LogWarning(exc, $"Exception caught while trying to deserialize {PhpConstants.ComposerFileName.Hash()}");
+                    this.telemetryClient.LogDependencies(
+                        this.Name,
+                        phpPlatformDetectorResult.PlatformVersion,
+                        composerFile.Require.Select(kv => kv.Key + kv.Value));
                 }
             }
 
@@ -170,7 +162,26 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Php
                 CustomBuildCommand = this.phpScriptGeneratorOptions.CustomBuildCommand,
             };
             string snippet = TemplateHelper.Render(TemplateHelper.TemplateResource.PhpBuildSnippet, props, this.logger, this.telemetryClient);
-            return new BuildScriptSnippet { BashBuildScriptSnippet = snippet, BuildProperties = buildProperties };
+            var dependencyCaches = new List<DependencyCache>();
+            if (composerFileExists)
+            {
+                dependencyCaches.Add(new DependencyCache
+                {
+                    Name = "composer",
+                    EnvironmentVariables = new Dictionary<string, string>
+                    {
+                        ["COMPOSER_CACHE_DIR"] = DependencyCache.DirectoryVariable,
+                    },
+                    LockFiles = new[] { PhpConstants.ComposerLockFileName },
+                });
+            }
+
+            return new BuildScriptSnippet
+            {
+                BashBuildScriptSnippet = snippet,
+                BuildProperties = buildProperties,
+                DependencyCaches = dependencyCaches,
+            };
         }
 
         /// <inheritdoc/>
@@ -0,0 +1,31 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using Microsoft.Oryx.Detector;
+
+namespace Microsoft.Oryx.BuildScriptGenerator
+{
+    public static class PlatformDetectorExtensions
+    {
+        /// <summary>
+        /// Runs the <paramref name="detector"/> against the <see cref="RepositoryContext.DetectorSourceRepo"/>,
+        /// going through the <see cref="RepositoryContext.DetectionResultCache"/> when one is configured.
+        /// </summary>
+        public static PlatformDetectorResult Detect(this IPlatformDetector detector, RepositoryContext context)
+        {
+            var detectorContext = new DetectorContext
+            {
+                SourceRepo = context.DetectorSourceRepo,
+            };
+
+            if (context.DetectionResultCache == null)
+            {
+                return detector.Detect(detectorContext);
+            }
+
+            return context.DetectionResultCache.Detect(detector, detectorContext);
+        }
+    }
+}
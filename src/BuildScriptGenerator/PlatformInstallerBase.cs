@@ -11,6 +11,7 @@ using System.Text;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
 using Microsoft.Oryx.BuildScriptGenerator.Common;
+using Microsoft.Oryx.BuildScriptGenerator.Golang;
 
 namespace Microsoft.Oryx.BuildScriptGenerator
 {
@@ -122,7 +123,6 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 versionDirInTemp = Path.Combine(this.CommonOptions.DynamicInstallRootDir, platformName, version);
             }
 
-            var tarFile = $"{version}.tar.gz";
             var snippet = new StringBuilder();
             snippet
                 .AppendLine()
@@ -181,12 +181,59 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 {
                 var sdkStorageBaseUrl = this.GetPlatformBinariesStorageBaseUrl();
                 var sdkStorageBackupBaseUrl = this.GetPlatformBinariesBackupStorageBaseUrl();
-                snippet.AppendLine("PLATFORM_BINARY_DOWNLOAD_START=$SECONDS")
+
+                // The tarball is streamed once through the checksum and tar in parallel and is never written to
+                // disk. It is extracted into a staging directory next to the version directory (on the same file
+                // system) which is only renamed into place once the checksum matches, so a corrupt or partial
+                // download is never visible in the version directory.
+                var stagingDir = Path.Combine(Path.GetDirectoryName(versionDirInTemp), $".{version}.download");
+
+                // use sha256 for golang and sha512 for all other platforms
+                var checksumCommand = platformName == GolangConstants.PlatformName ? "sha256sum" : "sha512sum";
+                snippet.AppendLine($"sdkStagingDir=\"{stagingDir}\"")
+                .AppendLine("sdkDownloadWorkDir=$(mktemp -d)")
+                .AppendLine("download_and_extract_sdk() {")
+                .AppendLine("  local url=\"$1\"")
+                .AppendLine("  local headersFile=\"$sdkDownloadWorkDir/headers.txt\"")
+                .AppendLine("  local checksumFifo=\"$sdkDownloadWorkDir/checksum.fifo\"")
+                .AppendLine("  local checksumFile=\"$sdkDownloadWorkDir/checksum.txt\"")
+                .AppendLine("  rm -rf \"$sdkStagingDir\" \"$headersFile\" \"$checksumFifo\" \"$checksumFile\"")
+                .AppendLine("  mkdir -p \"$sdkStagingDir\"")
+                .AppendLine("  mkfifo \"$checksumFifo\"")
+                .AppendLine($"  {checksumCommand} < \"$checksumFifo\" > \"$checksumFile\" &")
+                .AppendLine("  local checksumPid=$!")
+                .AppendLine("  curl --connect-timeout 10 --fail -D \"$headersFile\" -sSL \"$url\" 2>/dev/null \\")
+                .AppendLine("    | tee \"$checksumFifo\" \\")
+                .AppendLine("    | tar -xzf - -C \"$sdkStagingDir\"")
+                .AppendLine("  local pipeStatus=(\"${PIPESTATUS[@]}\")")
+                .AppendLine("  wait $checksumPid")
+                .AppendLine("  local checksumStatus=$?")
+                .AppendLine("  if [ ${pipeStatus[0]} -ne 0 ] || [ ${pipeStatus[2]} -ne 0 ] || [ $checksumStatus -ne 0 ]; then")
+                .AppendLine("    rm -rf \"$sdkStagingDir\"")
+                .AppendLine("    return 1")
+                .AppendLine("  fi")
+
+                // Search header name ignoring case
+                .AppendLine("  echo Verifying checksum...")
+                .AppendLine("  local headerName=\"x-ms-meta-checksum\"")
+                .AppendLine("  local checksumHeader=$(grep -i \"$headerName:\" \"$headersFile\" | tail -n 1 | tr -d '\\r')")
+
+                // Change header and value to lowercase
+                .AppendLine("  checksumHeader=$(echo $checksumHeader | tr '[A-Z]' '[a-z]')")
+                .AppendLine("  local checksumValue=${checksumHeader#\"$headerName: \"}")
+                .AppendLine("  local actualChecksum=$(cut -d ' ' -f 1 \"$checksumFile\")")
+                .AppendLine("  if [ -z \"$checksumValue\" ] || [ \"$checksumValue\" != \"$actualChecksum\" ]; then")
+                .AppendLine("    echo \"Checksum verification of '$url' failed.\"")
+                .AppendLine("    rm -rf \"$sdkStagingDir\"")
+                .AppendLine("    return 1")
+                .AppendLine("  fi")
+                .AppendLine("}")
+                .AppendLine("PLATFORM_BINARY_DOWNLOAD_START=$SECONDS")
                 .AppendLine("downloaded=1")
                 .AppendLine($"if [ \"$DEBIAN_FLAVOR\" == \"{OsTypes.DebianStretch}\" ]; then")
-                .AppendLine($"curl --connect-timeout 10 -D headers.txt -SL \"{sdkStorageBaseUrl}/{platformName}/{platformName}-{version}.tar.gz\" --output {tarFile} >/dev/null 2>&1 || downloaded=0")
+                .AppendLine($"download_and_extract_sdk \"{sdkStorageBaseUrl}/{platformName}/{platformName}-{version}.tar.gz\" || downloaded=0")
                 .AppendLine("else")
-                .AppendLine($"curl --connect-timeout 10 -D headers.txt -SL \"{sdkStorageBaseUrl}/{platformName}/{platformName}-$DEBIAN_FLAVOR-{version}.tar.gz\" --output {tarFile} >/dev/null 2>&1 || downloaded=0")
+                .AppendLine($"download_and_extract_sdk \"{sdkStorageBaseUrl}/{platformName}/{platformName}-$DEBIAN_FLAVOR-{version}.tar.gz\" || downloaded=0")
                 .AppendLine("fi")
                 .AppendLine($"if [ $downloaded -eq 0 ]; then")
                 .AppendLine($"  if [ -z \"{sdkStorageBackupBaseUrl}\" ]; then")
@@ -194,39 +241,24 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 .AppendLine("    exit 1")
                 .AppendLine("  fi")
                 .AppendLine("  echo \"Download using primary SDK storage URL failed, trying backup storage URL...\"")
+                .AppendLine("  downloaded=1")
                 .AppendLine($"  if [ \"$DEBIAN_FLAVOR\" == \"{OsTypes.DebianStretch}\" ]; then")
-                .AppendLine($"    curl --connect-timeout 10 -D headers.txt -SL \"{sdkStorageBackupBaseUrl}/{platformName}/{platformName}-{version}.tar.gz\" --output {tarFile} >/dev/null 2>&1")
+                .AppendLine($"    download_and_extract_sdk \"{sdkStorageBackupBaseUrl}/{platformName}/{platformName}-{version}.tar.gz\" || downloaded=0")
                 .AppendLine("  else")
-                .AppendLine($"    curl --connect-timeout 10 -D headers.txt -SL \"{sdkStorageBackupBaseUrl}/{platformName}/{platformName}-$DEBIAN_FLAVOR-{version}.tar.gz\" --output {tarFile} >/dev/null 2>&1")
+                .AppendLine($"    download_and_extract_sdk \"{sdkStorageBackupBaseUrl}/{platformName}/{platformName}-$DEBIAN_FLAVOR-{version}.tar.gz\" || downloaded=0")
+                .AppendLine("  fi")
+                .AppendLine("  if [ $downloaded -eq 0 ]; then")
+                .AppendLine("    echo \"Download using backup SDK storage URL failed, exiting.\"")
+                .AppendLine("    exit 1")
                 .AppendLine("  fi")
                 .AppendLine("fi")
-                .AppendLine("PLATFORM_BINARY_DOWNLOAD_ELAPSED_TIME=$(($SECONDS - $PLATFORM_BINARY_DOWNLOAD_START))")
-                .AppendLine("echo \"Binaries download done in $PLATFORM_BINARY_DOWNLOAD_ELAPSED_TIME sec(s).\"");
-
-                // Search header name ignoring case
-                snippet.AppendLine("echo Verifying checksum...")
-                .AppendLine("headerName=\"x-ms-meta-checksum\"")
-                .AppendLine("checksumHeader=$(cat headers.txt | grep -i $headerName: | tr -d '\\r')")
-
-                // Change header and value to lowercase
-                .AppendLine("checksumHeader=$(echo $checksumHeader | tr '[A-Z]' '[a-z]')")
-                .AppendLine("checksumValue=${checksumHeader#\"$headerName: \"}")
-                .AppendLine("rm -f headers.txt")
-                .AppendLine("echo Extracting contents...")
-                .AppendLine($"tar -xzf {tarFile} -C .")
+                .AppendLine("rm -rf \"$sdkDownloadWorkDir\"")
 
-                // use sha256 for golang and sha512 for all other platforms
-                .AppendLine("CHECKSUM_VERIFICATION_START=$SECONDS")
-                .AppendLine($"if [ \"$platformName\" = \"golang\" ]; then")
-                .AppendLine($"echo \"performing sha256sum for : {platformName}...\"")
-                .AppendLine($"echo \"$checksumValue {version}.tar.gz\" | sha256sum -c - >/dev/null 2>&1")
-                .AppendLine("else")
-                .AppendLine($"echo \"performing sha512 checksum for: {platformName}...\"")
-                .AppendLine($"echo \"$checksumValue {version}.tar.gz\" | sha512sum -c - >/dev/null 2>&1")
-                .AppendLine("fi")
-                .AppendLine($"rm -f {tarFile}")
-                .AppendLine("CHECKSUM_VERIFICATION_ELAPSED_TIME=$(($SECONDS - $CHECKSUM_VERIFICATION_START))")
-                .AppendLine("echo \"Checksum verification done in $CHECKSUM_VERIFICATION_ELAPSED_TIME sec(s).\"");
+                // rename(2) atomically replaces the empty version directory created above
+                .AppendLine($"mv -T \"$sdkStagingDir\" {versionDirInTemp}")
+                .AppendLine($"cd {versionDirInTemp}")
+                .AppendLine("PLATFORM_BINARY_DOWNLOAD_ELAPSED_TIME=$(($SECONDS - $PLATFORM_BINARY_DOWNLOAD_START))")
+                .AppendLine("echo \"Binaries downloaded, verified and extracted in $PLATFORM_BINARY_DOWNLOAD_ELAPSED_TIME sec(s).\"");
                 }
 
             snippet
@@ -6,6 +6,7 @@
 using System.Collections.Generic;
 using System.Linq;
 using System.Text;
+using Microsoft.Extensions.Options;
 using Microsoft.Oryx.Common.Extensions;
 using Microsoft.Oryx.Detector;
 
@@ -19,15 +20,18 @@ namespace Microsoft.Oryx.BuildScriptGenerator
         private readonly IEnumerable<IProgrammingPlatform> platforms;
         private readonly DefaultPlatformsInformationProvider platformDetector;
         private readonly IStandardOutputWriter outputWriter;
+        private readonly BuildScriptGeneratorOptions commonOptions;
 
         public PlatformsInstallationScriptProvider(
             IEnumerable<IProgrammingPlatform> platforms,
             DefaultPlatformsInformationProvider platformDetector,
-            IStandardOutputWriter outputWriter)
+            IStandardOutputWriter outputWriter,
+            IOptions<BuildScriptGeneratorOptions> commonOptions)
         {
             this.platforms = platforms;
             this.platformDetector = platformDetector;
             this.outputWriter = outputWriter;
+            this.commonOptions = commonOptions.Value;
         }
 
         /// <summary>
@@ -53,20 +57,114 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             }
 
             var snippets = this.GetInstallationScriptSnippets(detectionResults, context);
+            if (snippets.Count > 1 && this.commonOptions.DynamicInstallParallelism > 1)
+            {
+                AppendParallelInstallationScript(scriptBuilder, snippets, this.commonOptions.DynamicInstallParallelism);
+                return scriptBuilder.ToString();
+            }
+
             foreach (var snippet in snippets)
             {
-                scriptBuilder.AppendLine(snippet);
+                scriptBuilder.AppendLine(snippet.Value);
                 scriptBuilder.AppendLine();
             }
 
             return scriptBuilder.ToString();
         }
 
-        private IEnumerable<string> GetInstallationScriptSnippets(
+        /// <summary>
+        /// Appends a script which runs every installation snippet in a background sub-shell, at most
+        /// <paramref name="parallelism"/> at a time. The output of each snippet is buffered and printed once all of
+        /// them completed, followed by how long each installation took.
+        /// </summary>
+        private static void AppendParallelInstallationScript(
+            StringBuilder scriptBuilder,
+            IList<KeyValuePair<string, string>> snippets,
+            int parallelism)
+        {
+            // Wrap every snippet in a function so that it can be run both in the background and in the current shell
+            for (var i = 0; i < snippets.Count; i++)
+            {
+                scriptBuilder
+                    .AppendLine($"install_platform_{i}() {{")
+                    .AppendLine(snippets[i].Value)
+                    .AppendLine("}")
+                    .AppendLine();
+            }
+
+            var installationIds = string.Join(" ", Enumerable.Range(0, snippets.Count));
+            scriptBuilder
+                .AppendLine($"PLATFORM_INSTALLATION_PARALLELISM={parallelism}")
+
+                // The skeleton dependencies of these images are installed with apt-get, which holds a lock on the
+                // package database and so cannot run concurrently.
+                .AppendLine("if grep -q -e '^cli$' -e '^jamstack$' \"/opt/oryx/.imagetype\" 2>/dev/null; then")
+                .AppendLine("  PLATFORM_INSTALLATION_PARALLELISM=1")
+                .AppendLine("fi")
+                .AppendLine("if [ $PLATFORM_INSTALLATION_PARALLELISM -le 1 ]; then")
+                .AppendLine($"  for installationId in {installationIds}; do")
+                .AppendLine("    install_platform_$installationId")
+                .AppendLine("  done")
+                .AppendLine("else")
+                .AppendLine("  platformInstallationDir=$(mktemp -d)")
+                .AppendLine("  run_platform_installation() {")
+
+                // 'set -e' is ignored in sub-shells which are part of a '||' list, so the exit code of the
+                // sub-shell is captured with 'set +e' instead.
+                .AppendLine("    set +e")
+                .AppendLine("    local installationId=\"$1\"")
+                .AppendLine("    local startTime=$SECONDS")
+                .AppendLine("    ( set -e; install_platform_$installationId ) > \"$platformInstallationDir/$installationId.log\" 2>&1")
+                .AppendLine("    echo \"$? $(($SECONDS - $startTime))\" > \"$platformInstallationDir/$installationId.status\"")
+                .AppendLine("  }")
+                .AppendLine("  echo \"Installing platforms with up to $PLATFORM_INSTALLATION_PARALLELISM installations in parallel...\"")
+                .AppendLine($"  for installationId in {installationIds}; do")
+                .AppendLine("    while [ $(jobs -rp | wc -l) -ge $PLATFORM_INSTALLATION_PARALLELISM ]; do")
+                .AppendLine("      wait -n || true")
+                .AppendLine("    done")
+                .AppendLine("    run_platform_installation $installationId &")
+                .AppendLine("  done")
+                .AppendLine("  wait")
+                .AppendLine("  platformInstallationFailed=0")
+                .AppendLine("  platformInstallationSummary=\"\"")
+                .AppendLine("  platformInstallationNames=(");
+            foreach (var snippet in snippets)
+            {
+                scriptBuilder.AppendLine($"    \"{snippet.Key}\"");
+            }
+
+            scriptBuilder
+                .AppendLine("  )")
+                .AppendLine($"  for installationId in {installationIds}; do")
+                .AppendLine("    cat \"$platformInstallationDir/$installationId.log\"")
+                .AppendLine("    installationExitCode=1")
+                .AppendLine("    installationElapsedTime=0")
+                .AppendLine("    if [ -f \"$platformInstallationDir/$installationId.status\" ]; then")
+                .AppendLine("      read installationExitCode installationElapsedTime < \"$platformInstallationDir/$installationId.status\"")
+                .AppendLine("    fi")
+                .AppendLine("    if [ \"$installationExitCode\" != \"0\" ]; then")
+                .AppendLine("      platformInstallationFailed=1")
+                .AppendLine("    fi")
+                .AppendLine("    platformInstallationSummary+=\"${platformInstallationNames[$installationId]}: $installationElapsedTime sec(s), exit code $installationExitCode\"$'\\n'")
+                .AppendLine("  done")
+                .AppendLine("  rm -rf \"$platformInstallationDir\"")
+                .AppendLine("  echo")
+                .AppendLine("  echo \"Platform installation summary:\"")
+                .AppendLine("  echo -n \"$platformInstallationSummary\"")
+                .AppendLine("  if [ $platformInstallationFailed -ne 0 ]; then")
+                .AppendLine("    echo \"Installing one or more platforms failed.\"")
+                .AppendLine("    exit 1")
+                .AppendLine("  fi")
+                .AppendLine("fi")
+                .AppendLine();
+        }
+
+        private IList<KeyValuePair<string, string>> GetInstallationScriptSnippets(
             IEnumerable<PlatformDetectorResult> detectionResults,
             BuildScriptGeneratorContext context)
         {
-            var installationScriptSnippets = new List<string>();
+            // Keyed by a description of the platform and version that a snippet installs
+            var installationScriptSnippets = new List<KeyValuePair<string, string>>();
 
             foreach (var detectionResult in detectionResults)
             {
@@ -80,7 +178,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                     this.outputWriter.WriteLine(
                         $"Version '{detectionResult.PlatformVersion}' of platform '{detectionResult.Platform}' " +
                         $"is not installed. Generating script to install it...");
-                    installationScriptSnippets.Add(snippet);
+                    installationScriptSnippets.Add(new KeyValuePair<string, string>(
+                        $"{detectionResult.Platform} {detectionResult.PlatformVersion}",
+                        snippet));
                 }
             }
 
@@ -33,6 +33,88 @@ fi
     REQUIREMENTS_TXT_FILE="requirements.txt"
 {{ end }}
 
+{{ if StreamInstallOutput }}
+INSTALL_OUTPUT_TAIL_LINES=${PYTHON_INSTALL_OUTPUT_TAIL_LINES:-100}
+if ! [[ "$INSTALL_OUTPUT_TAIL_LINES" =~ ^[0-9]+$ ]] || [ $((10#$INSTALL_OUTPUT_TAIL_LINES)) -eq 0 ]; then
+    echo "Ignoring invalid value '$INSTALL_OUTPUT_TAIL_LINES' for 'PYTHON_INSTALL_OUTPUT_TAIL_LINES', using 100."
+    INSTALL_OUTPUT_TAIL_LINES=100
+fi
+INSTALL_OUTPUT_TAIL_LINES=$((10#$INSTALL_OUTPUT_TAIL_LINES))
+INSTALL_LOG_FILE=${PYTHON_INSTALL_LOG_FILE:-/tmp/oryx-python-install.log}
+INSTALL_LOG_MAX_MB=${PYTHON_INSTALL_LOG_MAX_MB:-10}
+if ! [[ "$INSTALL_LOG_MAX_MB" =~ ^[0-9]+$ ]] || [ $((10#$INSTALL_LOG_MAX_MB)) -eq 0 ]; then
+    echo "Ignoring invalid value '$INSTALL_LOG_MAX_MB' for 'PYTHON_INSTALL_LOG_MAX_MB', using 10."
+    INSTALL_LOG_MAX_MB=10
+fi
+INSTALL_LOG_MAX_BYTES=$((10#$INSTALL_LOG_MAX_MB * 1024 * 1024))
+mkdir -p "$(dirname "$INSTALL_LOG_FILE")"
+rm -f "$INSTALL_LOG_FILE" "$INSTALL_LOG_FILE.1"
+echo "Streaming package installation output to '$INSTALL_LOG_FILE'"
+
+# Copies its input line by line to the console and to the install log, moving the log to '<log file>.1'
+# once it grows beyond INSTALL_LOG_MAX_BYTES. Only the last INSTALL_OUTPUT_TAIL_LINES lines are kept in
+# memory, and they are written to the file given as the first argument once the input ends.
+stream_install_output() {
+    local tail_file=$1
+    local -a tail_lines=()
+    local line_count=0
+    local log_bytes=0
+    local log_fd
+    local line
+    if [ -f "$INSTALL_LOG_FILE" ]; then
+        log_bytes=$(stat -c %s "$INSTALL_LOG_FILE")
+    fi
+    exec {log_fd}>>"$INSTALL_LOG_FILE"
+    while IFS= read -r line || [ -n "$line" ]; do
+        printf '%s\n' "$line"
+        printf '%s\n' "$line" >&$log_fd
+        log_bytes=$(($log_bytes + ${#line} + 1))
+        if [ $log_bytes -ge $INSTALL_LOG_MAX_BYTES ]; then
+            exec {log_fd}>&-
+            mv -f "$INSTALL_LOG_FILE" "$INSTALL_LOG_FILE.1"
+            exec {log_fd}>>"$INSTALL_LOG_FILE"
+            log_bytes=0
+        fi
+        tail_lines[$(($line_count % $INSTALL_OUTPUT_TAIL_LINES))]=$line
+        line_count=$(($line_count + 1))
+    done
+    exec {log_fd}>&-
+
+    local first_line=0
+    if [ $line_count -gt $INSTALL_OUTPUT_TAIL_LINES ]; then
+        first_line=$(($line_count - $INSTALL_OUTPUT_TAIL_LINES))
+    fi
+    local i
+    for ((i = $first_line; i < $line_count; i++)); do
+        printf '%s\n' "${tail_lines[$(($i % $INSTALL_OUTPUT_TAIL_LINES))]}"
+    done > "$tail_file"
+}
+{{ end }}
+
+# Runs the given command, prefixing every line of its standard output with a timestamp.
+timestamp_output() {
+    "$@" | ts $TS_FMT
+    return ${PIPESTATUS[0]}
+}
+
+# Runs the given package installation command with its standard error redirected to its standard output
+# and returns its exit code. The output to report if the command fails is stored in 'output'.
+run_install_command() {
+{{ if StreamInstallOutput }}
+    # Stream the output as it is written instead of holding all of it in memory, and only keep its tail
+    local tail_file=$(mktemp)
+    ( "$@" ) 2>&1 | stream_install_output "$tail_file"
+    local exit_code=${PIPESTATUS[0]}
+    output=$(cat "$tail_file")
+    rm -f "$tail_file"
+{{ else }}
+    output=$( ( "$@" ) 2>&1 )
+    local exit_code=$?
+    echo "${output}"
+{{ end }}
+    return $exit_code
+}
+
 # Function to install packages via uv
 install_via_uv() {
     # Create UV cache directory if it doesn't exist
@@ -82,9 +164,8 @@ install_via_uv() {
     printf %s " , $uv_cmd" >> "$COMMAND_MANIFEST_FILE"
     
     # Execute uv pip install (uv manages its own cache)
-    output=$( ( $base_cmd | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} ) 
-    local exit_code=${PIPESTATUS[0]}
-    echo "${output}"
+    run_install_command timestamp_output $base_cmd
+    local exit_code=$?
     ELAPSED_TIME=$(($SECONDS - $START_TIME))
     echo "uv pip install done in $ELAPSED_TIME sec(s)."
     return $exit_code
@@ -121,9 +202,8 @@ install_via_pip() {
     printf %s " , $pip_cmd" >> "$COMMAND_MANIFEST_FILE"
     
     # Execute pip install
-    output=$( ( $base_cmd | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} ) 
-    local exit_code=${PIPESTATUS[0]}
-    echo "${output}"
+    run_install_command timestamp_output $base_cmd
+    local exit_code=$?
     ELAPSED_TIME=$(($SECONDS - $START_TIME))
     echo "pip install done in $ELAPSED_TIME sec(s)."
     return $exit_code
@@ -191,7 +271,34 @@ install_python_packages_impl() {
         fi
         CreateVenvCommand="$python -m $VIRTUALENVIRONMENTMODULE $VIRTUALENVIRONMENTNAME $VIRTUALENVIRONMENTOPTIONS"
     fi
-    
+
+    {{ if UseDependencyLayerCache }}
+    # The virtual environment refers to the Python binary and to the directory it is created in, so they are
+    # part of the key. The key follows the order in which the dependencies are installed below. Requirements
+    # which refer to other files or to local paths, and apps installed from setup.py, can change without the
+    # files of the key changing, so they are always installed.
+    dependencyLayerDescription="python {{ PythonVersion }} $python $(pwd) $CreateVenvCommand"
+    dependencyLayerKey=""
+    dependencyLayerRestored=false
+    if [ -e "$REQUIREMENTS_TXT_FILE" ]; then
+        if grep -qE '^[[:space:]]*(-r|-c|-e|--requirement|--constraint|--editable|\.|/|file:)' "$REQUIREMENTS_TXT_FILE"; then
+            echo "Not using the dependency layer cache as '$REQUIREMENTS_TXT_FILE' refers to other files or to local paths."
+        else
+            dependencyLayerKey=$(dependency_layer_key "$dependencyLayerDescription" "$REQUIREMENTS_TXT_FILE")
+        fi
+    elif [ -e "setup.py" ]; then
+        echo "Not using the dependency layer cache as the app is installed from setup.py."
+    elif [ -e "pyproject.toml" ] && [ -e "uv.lock" ]; then
+        dependencyLayerKey=$(dependency_layer_key "$dependencyLayerDescription" pyproject.toml uv.lock)
+    fi
+    if [ -n "$dependencyLayerKey" ] && restore_dependency_layer "$dependencyLayerKey" "$VIRTUALENVIRONMENTNAME"; then
+        dependencyLayerRestored=true
+    fi
+
+    if [ "$dependencyLayerRestored" == "true" ]; then
+        echo "BuildCommands=restore_dependency_layer $dependencyLayerKey $VIRTUALENVIRONMENTNAME" >> "$COMMAND_MANIFEST_FILE"
+    else
+    {{ end }}
     echo Creating virtual environment...
 
     echo "BuildCommands=$CreateVenvCommand" >> "$COMMAND_MANIFEST_FILE"
@@ -199,6 +306,9 @@ install_python_packages_impl() {
     # Execute the resolved CreateVenvCommand
     echo "Executing: $CreateVenvCommand"
     $CreateVenvCommand
+    {{ if UseDependencyLayerCache }}
+    fi
+    {{ end }}
     
     echo Activating virtual environment...
     printf %s " , $ActivateVenvCommand" >> "$COMMAND_MANIFEST_FILE"
@@ -212,7 +322,14 @@ install_python_packages_impl() {
         echo
         {{ CustomBuildCommand }}
     {{ else }}
+        {{ if UseDependencyLayerCache }}
+        if [ "$dependencyLayerRestored" == "true" ]
+        then
+            echo "Dependencies were restored from the dependency layer cache."
+        elif [ -e "$REQUIREMENTS_TXT_FILE" ]
+        {{ else }}
         if [ -e "$REQUIREMENTS_TXT_FILE" ]
+        {{ end }}
         then
             if [ "$PYTHON_FAST_BUILD_ENABLED" = "true" ]; then
                 set +e
@@ -238,12 +355,11 @@ install_python_packages_impl() {
                 fi
                 
                 printf %s " , $InstallCommand | ts $TS_FMT" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( $InstallCommand | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} )
-                pipInstallExitCode=${PIPESTATUS[0]}
+                run_install_command timestamp_output $InstallCommand
+                pipInstallExitCode=$?
 
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 set -e
-                echo "${output}"
                 echo "pip install done in $ELAPSED_TIME sec(s)."
                 if [[ $pipInstallExitCode != 0 ]]
                 then
@@ -265,11 +381,10 @@ install_python_packages_impl() {
             START_TIME=$SECONDS
             InstallCommand="pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary | ts $TS_FMT"
             printf %s " , $InstallCommand" >> "$COMMAND_MANIFEST_FILE"
-            output=$( ( pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} )
-            pythonBuildExitCode=${PIPESTATUS[0]}
+            run_install_command timestamp_output pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary
+            pythonBuildExitCode=$?
             ELAPSED_TIME=$(($SECONDS - $START_TIME))
             set -e
-            echo "${output}"
             echo "pip install done in $ELAPSED_TIME sec(s)."
             if [[ $pythonBuildExitCode != 0 ]]
             then
@@ -286,12 +401,11 @@ install_python_packages_impl() {
                 START_TIME=$SECONDS
                 InstallUvCommand="uv sync --active --link-mode copy"
                 printf %s " , $InstallUvCommand" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( $InstallUvCommand; exit ${PIPESTATUS[0]} ) 2>&1 )
-                uvExitCode=${PIPESTATUS[0]}
+                run_install_command $InstallUvCommand
+                uvExitCode=$?
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 echo "uv sync done in $ELAPSED_TIME sec(s)."
                 set -e
-                echo "${output}"
                 if [[ $uvExitCode != 0 ]]; then
                     LogError "${output} | Exit code: ${uvExitCode} | Please review your uv.lock | ${moreInformation}"
                     exit $uvExitCode
@@ -310,8 +424,8 @@ install_python_packages_impl() {
                 # Try with --only main flag as --no-dev option is depreciated in latest poetry versions
                 InstallPoetryCommand="poetry install --only main"
                 printf %s " , $InstallPoetryCommand" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( $InstallPoetryCommand; exit ${PIPESTATUS[0]} ) 2>&1)
-                pythonBuildExitCode=${PIPESTATUS[0]}
+                run_install_command $InstallPoetryCommand
+                pythonBuildExitCode=$?
 
                 # Fallback to --no-dev flag
                 if [[ $pythonBuildExitCode != 0 ]]; then
@@ -319,13 +433,12 @@ install_python_packages_impl() {
                     pip install poetry==1.8.5
                     InstallPoetryCommand="poetry install --no-dev"
                     printf %s " , $InstallPoetryCommand" >> "$COMMAND_MANIFEST_FILE"
-                    output=$( ( $InstallPoetryCommand; exit ${PIPESTATUS[0]} ) 2>&1)
-                    pythonBuildExitCode=${PIPESTATUS[0]}
+                    run_install_command $InstallPoetryCommand
+                    pythonBuildExitCode=$?
                     
                     # Final check after fallback
                     if [[ $pythonBuildExitCode != 0 ]]; then
                         set -e
-                        echo "${output}"
                         LogWarning "${output} | Exit code: ${pythonBuildExitCode} | Please review message | ${moreInformation}"
                         exit $pythonBuildExitCode
                     fi
@@ -334,13 +447,18 @@ install_python_packages_impl() {
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 echo "poetry install done in $ELAPSED_TIME sec(s)."
                 set -e
-                echo "${output}"
             fi
         else
             echo $REQS_NOT_FOUND_MSG
         fi
     {{ end }}
 
+    {{ if UseDependencyLayerCache }}
+    if [ -n "$dependencyLayerKey" ] && [ "$dependencyLayerRestored" != "true" ]; then
+        save_dependency_layer "$dependencyLayerKey" "$VIRTUALENVIRONMENTNAME"
+    fi
+    {{ end }}
+
     # For virtual environment, we use the actual 'python' alias that as setup by the venv,
     python_bin=python
 {{ else }}
@@ -378,12 +496,11 @@ install_python_packages_impl() {
                 fi
 
                 printf %s " , $InstallCommand | ts $TS_FMT" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( $InstallCommand | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} )
-                pipInstallExitCode=${PIPESTATUS[0]}
+                run_install_command timestamp_output $InstallCommand
+                pipInstallExitCode=$?
 
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 set -e
-                echo "${output}"
                 echo "pip install done in $ELAPSED_TIME sec(s)."
                 if [[ $pipInstallExitCode != 0 ]]
                 then
@@ -413,11 +530,10 @@ install_python_packages_impl() {
             START_TIME=$SECONDS
             InstallCommand="$python -m pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary --target=\"{{ PackagesDirectory }}\" {{ PipUpgradeFlag }} | ts $TS_FMT"
             printf %s " , $InstallCommand" >> "$COMMAND_MANIFEST_FILE"
-            output=$( ( $python -m pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary --target="{{ PackagesDirectory }}" {{ PipUpgradeFlag }} | ts $TS_FMT; exit ${PIPESTATUS[0]} ) 2>&1; exit ${PIPESTATUS[0]} )
-            pythonBuildExitCode=${PIPESTATUS[0]}
+            run_install_command timestamp_output $python -m pip install . --cache-dir $PIP_CACHE_DIR --prefer-binary --target="{{ PackagesDirectory }}" {{ PipUpgradeFlag }}
+            pythonBuildExitCode=$?
             ELAPSED_TIME=$(($SECONDS - $START_TIME))
             set -e
-            echo "${output}"
             echo "pip install done in $ELAPSED_TIME sec(s)."
             if [[ $pythonBuildExitCode != 0 ]]
             then
@@ -445,11 +561,10 @@ install_python_packages_impl() {
                 # Stream the export directly into uv pip install using process substitution
                 InstallUvCommand="uv export --locked | uv pip install --link-mode copy --target $SITE_PACKAGES_PATH -r -"
                 printf %s " , $InstallUvCommand" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( eval $InstallUvCommand; exit ${PIPESTATUS[0]} ) 2>&1 )
-                uvExitCode=${PIPESTATUS[0]}
+                run_install_command eval $InstallUvCommand
+                uvExitCode=$?
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 set -e
-                echo "${output}"
                 echo "uv pip install done in $ELAPSED_TIME sec(s)."
                 if [[ $uvExitCode != 0 ]]; then
                     LogError "${output} | Exit code: ${uvExitCode} | Please review your uv.lock | ${moreInformation}"
@@ -469,8 +584,8 @@ install_python_packages_impl() {
                 # Try with --only main flag as --no-dev option is depreciated in latest poetry versions
                 InstallPoetryCommand="poetry install --only main"
                 printf %s " , $InstallPoetryCommand" >> "$COMMAND_MANIFEST_FILE"
-                output=$( ( $InstallPoetryCommand; exit ${PIPESTATUS[0]} ) 2>&1)
-                pythonBuildExitCode=${PIPESTATUS[0]}
+                run_install_command $InstallPoetryCommand
+                pythonBuildExitCode=$?
 
                 # Fallback to --no-dev flag
                 if [[ $pythonBuildExitCode != 0 ]]; then
@@ -478,13 +593,12 @@ install_python_packages_impl() {
                     pip install poetry==1.8.5
                     InstallPoetryCommand="poetry install --no-dev"
                     printf %s " , $InstallPoetryCommand" >> "$COMMAND_MANIFEST_FILE"
-                    output=$( ( $InstallPoetryCommand; exit ${PIPESTATUS[0]} ) 2>&1)
-                    pythonBuildExitCode=${PIPESTATUS[0]}
+                    run_install_command $InstallPoetryCommand
+                    pythonBuildExitCode=$?
                     
                     # Final check after fallback
                     if [[ $pythonBuildExitCode != 0 ]]; then
                         set -e
-                        echo "${output}"
                         LogWarning "${output} | Exit code: ${pythonBuildExitCode} | Please review message | ${moreInformation}"
                         exit $pythonBuildExitCode
                     fi
@@ -493,7 +607,6 @@ install_python_packages_impl() {
                 ELAPSED_TIME=$(($SECONDS - $START_TIME))
                 echo "poetry install done in $ELAPSED_TIME sec(s)."
                 set -e
-                echo "${output}"
             fi
         else
             echo $REQS_NOT_FOUND_MSG
@@ -575,6 +688,30 @@ install_python_packages_impl() {
     set -e
 {{ end }}
 
+{{ if PrecompileBytecode }}
+    # Compile the app and its packages ahead of time, so that the runtime neither compiles them on the first
+    # request nor writes pycs to a read-only or shared file system. Unchecked hash-based pycs are used, as the
+    # copy to the destination directory and the compression of the virtual environment change the source mtimes.
+    set +e
+    echo
+    echo "Compiling Python bytecode..."
+    START_TIME=$SECONDS
+    CompileBytecodeCommand=($python -m compileall -q -f -j 0 --invalidation-mode unchecked-hash -x '/(\.git|node_modules)/' "$SOURCE_DIR")
+    # Quote the arguments so that the manifest holds the exact command which is run
+    printf %s " ," >> "$COMMAND_MANIFEST_FILE"
+    printf ' %q' "${CompileBytecodeCommand[@]}" >> "$COMMAND_MANIFEST_FILE"
+    output=$("${CompileBytecodeCommand[@]}" 2>&1)
+    EXIT_CODE=$?
+    if [[ $EXIT_CODE != 0 ]]
+    then
+        # compileall fails if any file has a syntax error, e.g. the Python 2 files of some packages, but it still
+        # compiles all the other files.
+        LogWarning "${output} | Exit code: ${EXIT_CODE} | Some files could not be compiled | ${moreInformation}"
+    fi
+    ELAPSED_TIME=$(($SECONDS - $START_TIME))
+    echo "Bytecode compilation done in $ELAPSED_TIME sec(s)."
+    set -e
+{{ end }}
 
 ReadImageType=$(cat /opt/oryx/.imagetype)
 
@@ -601,6 +738,13 @@ fi
 
 {{ if VirtualEnvironmentName | IsNotBlank }}
     {{ if CompressVirtualEnvCommand | IsNotBlank }}
+        # Takes the same arguments as the other compression commands, the file to create and then the directory.
+        # Files are compressed in 1 MiB blocks with zstd, so that mounting the image and reading a file only
+        # decompresses the blocks of that file.
+        create_squashfs_image() {
+            mksquashfs "$2" "$1" -noappend -quiet -no-progress -comp zstd -b 1M
+        }
+
         if [ "$SOURCE_DIR" != "$DESTINATION_DIR" ]
         then
             if [ -d "$VIRTUALENVIRONMENTNAME" ]
@@ -24,7 +24,10 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
             string pythonPackageWheelProperty = null,
             string customRequirementsTxtPath = null,
             string pipUpgradeFlag = null,
-            string customBuildCommand = null)
+            string customBuildCommand = null,
+            bool streamInstallOutput = false,
+            bool precompileBytecode = false,
+            bool useDependencyLayerCache = false)
         {
             this.VirtualEnvironmentName = virtualEnvironmentName;
             this.VirtualEnvironmentModule = virtualEnvironmentModule;
@@ -40,6 +43,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
             this.CustomRequirementsTxtPath = customRequirementsTxtPath;
             this.PipUpgradeFlag = pipUpgradeFlag;
             this.CustomBuildCommand = customBuildCommand;
+            this.StreamInstallOutput = streamInstallOutput;
+            this.PrecompileBytecode = precompileBytecode;
+            this.UseDependencyLayerCache = useDependencyLayerCache;
         }
 
         public string VirtualEnvironmentName { get; set; }
@@ -75,5 +81,24 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         public string PipUpgradeFlag { get; set; }
 
         public string CustomBuildCommand { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the output of the package installation commands is streamed
+        /// to the console and to a log file while they run, keeping only its last lines for error messages,
+        /// instead of being captured in full and written out once they finish.
+        /// </summary>
+        public bool StreamInstallOutput { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether all the Python files in the source directory, including the
+        /// virtual environment or packages directory, are compiled to unchecked hash-based pycs.
+        /// </summary>
+        public bool PrecompileBytecode { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the virtual environment is restored from the dependency layer
+        /// cache when its requirements did not change since a previous build, and saved to it otherwise.
+        /// </summary>
+        public bool UseDependencyLayerCache { get; set; }
     }
 }
\ No newline at end of file
@@ -19,8 +19,10 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         public const string ZipFileExtension = "tar.gz";
         public const string ZipVirtualEnvFileNameFormat = "{0}.zip";
         public const string TarGzVirtualEnvFileNameFormat = "{0}.tar.gz";
+        public const string SquashfsVirtualEnvFileNameFormat = "{0}.squashfs";
         public const string DefaultTargetPackageDirectory = "__oryx_packages__";
         public const string SetupDotPyFileName = "setup.py";
+        public const string UncheckedHashBytecodeInvalidationMode = "unchecked-hash";
         public const string CondaExecutablePath = "/opt/conda/condabin/conda";
 
         /// <summary>
@@ -11,5 +11,6 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         internal const string VirtualEnvName = "virtualEnvName";
         internal const string PackageDir = "packagedir";
         internal const string PackageWheel = "packagewheel";
+        internal const string BytecodeInvalidationMode = "bytecodeInvalidationMode";
     }
 }
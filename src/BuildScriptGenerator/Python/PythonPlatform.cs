@@ -28,9 +28,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
     [BuildProperty(
         CompressVirtualEnvPropertyKey,
         "Indicates how and if virtual environment folder should be compressed into a single file in the output " +
-        "folder. Options are '" + ZipOption + "', and '" + TarGzOption + "'. Default is to not compress. " +
-        "If this option is used, when running the app the virtual environment folder must be extracted from " +
-        "this file.")]
+        "folder. Options are '" + ZipOption + "', '" + TarGzOption + "', and '" + SquashfsOption + "'. Default is " +
+        "to not compress. If this option is used, when running the app the virtual environment folder must be " +
+        "extracted from this file, or mounted in the case of a '" + SquashfsOption + "' image.")]
     [BuildProperty(
         TargetPackageDirectoryPropertyKey,
         "If provided, packages will be downloaded to the given directory instead of to a virtual environment.")]
@@ -72,6 +72,11 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         /// </summary>
         internal const string TarGzOption = "tar-gz";
 
+        /// <summary>
+        /// The squashfs option.
+        /// </summary>
+        internal const string SquashfsOption = "squashfs";
+
         /// <summary>
         /// The Universal Wheel option.
         /// </summary>
@@ -144,10 +149,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         /// <inheritdoc/>
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -283,6 +285,13 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
                 this.TryLogDependencies(requirementsTxtPath, pythonVersion, context.SourceRepo);
             }
 
+            var precompileBytecode = this.ShouldPrecompileBytecode(pythonVersion);
+            if (precompileBytecode)
+            {
+                manifestFileProperties[PythonManifestFilePropertyKeys.BytecodeInvalidationMode]
+                    = PythonConstants.UncheckedHashBytecodeInvalidationMode;
+            }
+
             var scriptProps = new PythonBashBuildSnippetProperties(
                 virtualEnvironmentName: virtualEnvName,
                 virtualEnvironmentModule: virtualEnvModule,
@@ -297,7 +306,12 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
                 pythonPackageWheelProperty: pythonPackageWheelType,
                 customRequirementsTxtPath: customRequirementsTxtPath,
                 pipUpgradeFlag: pipUpgrade,
-                customBuildCommand: this.pythonScriptGeneratorOptions.CustomBuildCommand);
+                customBuildCommand: this.pythonScriptGeneratorOptions.CustomBuildCommand,
+                streamInstallOutput: this.pythonScriptGeneratorOptions.StreamInstallOutput,
+                precompileBytecode: precompileBytecode,
+                useDependencyLayerCache: !string.IsNullOrEmpty(this.commonOptions.DependencyLayerCacheDir)
+                    && !string.IsNullOrWhiteSpace(virtualEnvName)
+                    && string.IsNullOrEmpty(this.pythonScriptGeneratorOptions.CustomBuildCommand));
 
             string script = TemplateHelper.Render(
                 TemplateHelper.TemplateResource.PythonSnippet,
@@ -538,6 +552,16 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
                     compressVirtualEnvCommand = $"zip -y -q -r";
                     isVirtualEnvPackaged = true;
                 }
+                else if (compressVirtualEnvOption.EqualsIgnoreCase(SquashfsOption))
+                {
+                    // A squashfs image is indexed, so the runtime can mount it and only read the files which are
+                    // imported instead of extracting the whole virtual environment before starting the app.
+                    compressedVirtualEnvFileName = string.Format(
+                        PythonConstants.SquashfsVirtualEnvFileNameFormat,
+                        virtualEnvName);
+                    compressVirtualEnvCommand = "create_squashfs_image";
+                    isVirtualEnvPackaged = true;
+                }
             }
 
             return isVirtualEnvPackaged;
@@ -752,6 +776,27 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
             };
         }
 
+        private bool ShouldPrecompileBytecode(string pythonVersion)
+        {
+            if (!this.pythonScriptGeneratorOptions.PrecompileBytecode)
+            {
+                return false;
+            }
+
+            // Hash-based pycs, and so the '--invalidation-mode' option of compileall, were added in Python 3.7.
+            if (string.IsNullOrEmpty(pythonVersion)
+                || !SemanticVersioning.Version.TryParse(pythonVersion, loose: true, out var version)
+                || version < new SemanticVersioning.Version(3, 7, 0))
+            {
+                this.logger.LogWarning(
+                    "Not precompiling bytecode as it requires Python 3.7 or later, and the version is {pyVer}",
+                    pythonVersion);
+                return false;
+            }
+
+            return true;
+        }
+
         private (string VirtualEnvModule, string VirtualEnvParams) GetVirtualEnvModules(string pythonVersion)
         {
             string virtualEnvModule;
@@ -22,5 +22,17 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Python
         public string CustomBuildCommand { get; set; }
 
         public string CustomRequirementsTxtPath { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the output of pip, uv and poetry is streamed line by line
+        /// instead of being buffered in memory until the installation finishes.
+        /// </summary>
+        public bool StreamInstallOutput { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the bytecode of the app and of its packages is compiled at
+        /// build time, so that it does not have to be compiled when the app starts.
+        /// </summary>
+        public bool PrecompileBytecode { get; set; }
     }
 }
\ No newline at end of file
@@ -12,8 +12,26 @@ namespace Microsoft.Oryx.BuildScriptGenerator
     /// </summary>
     public abstract partial class RepositoryContext
     {
+        private Detector.ISourceRepo detectorSourceRepo;
+
         public ISourceRepo SourceRepo { get; set; }
 
+        /// <summary>
+        /// Gets or sets the source repo handed to the platform detectors. The same instance is shared by all
+        /// the detectors so that the file index built while detecting one platform is reused by the others.
+        /// Defaults to an <see cref="Detector.IndexedSourceRepo"/> over the root of <see cref="SourceRepo"/>.
+        /// </summary>
+        public Detector.ISourceRepo DetectorSourceRepo
+        {
+            get => this.detectorSourceRepo ??= new Detector.IndexedSourceRepo(this.SourceRepo.RootPath);
+            set => this.detectorSourceRepo = value;
+        }
+
+        /// <summary>
+        /// Gets or sets the cache of the results of the platform detectors. If null, the detectors are always run.
+        /// </summary>
+        public Detector.DetectionResultCache DetectionResultCache { get; set; }
+
         /// <summary>
         /// Gets or sets specific properties for the generated script.
         /// </summary>
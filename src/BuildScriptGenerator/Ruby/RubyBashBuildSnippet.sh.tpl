@@ -19,6 +19,9 @@ echo
     gem install bundler
 {{ end }}
 
+# Bundler installs the gems in parallel, using all the available processors.
+bundleJobs=$(nproc 2>/dev/null || echo 1)
+
 {{ if CustomBuildCommand | IsNotBlank }}
 	echo
 	echo "Running '{{ CustomBuildCommand }}'..."
@@ -29,7 +32,7 @@ echo
         {{ if GemfileExists }}
         echo "Running 'bundle install'..."
         echo
-        bundle install
+        bundle install --jobs "$bundleJobs"
         {{ else }}
         echo "Running 'gem install jekyll'..."
         echo
@@ -41,7 +44,7 @@ echo
     {{ else }}
         echo "Running 'bundle install'..."
         echo
-        bundle install
+        bundle install --jobs "$bundleJobs"
     {{ end }}
 {{ end }}
 
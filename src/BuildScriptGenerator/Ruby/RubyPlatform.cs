@@ -27,6 +27,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
         private readonly IRubyPlatformDetector detector;
         private readonly RubyPlatformInstaller rubyInstaller;
         private readonly TelemetryClient telemetryClient;
+        private readonly IStandardOutputWriter outputWriter;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="RubyPlatform"/> class.
@@ -37,6 +38,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
         /// <param name="detector">The detector of Ruby platform.</param>
         /// <param name="commonOptions">The <see cref="BuildScriptGeneratorOptions"/>.</param>
         /// <param name="rubyInstaller">The <see cref="RubyPlatformInstaller"/>.</param>
+        /// <param name="outputWriter">The <see cref="IStandardOutputWriter"/>.</param>
         public RubyPlatform(
             IOptions<RubyScriptGeneratorOptions> rubyScriptGeneratorOptions,
             IOptions<BuildScriptGeneratorOptions> commonOptions,
@@ -44,7 +46,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
             ILogger<RubyPlatform> logger,
             IRubyPlatformDetector detector,
             RubyPlatformInstaller rubyInstaller,
-            TelemetryClient telemetryClient)
+            TelemetryClient telemetryClient,
+            IStandardOutputWriter outputWriter)
         {
             this.rubyScriptGeneratorOptions = rubyScriptGeneratorOptions.Value;
             this.commonOptions = commonOptions.Value;
@@ -53,6 +56,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
             this.detector = detector;
             this.rubyInstaller = rubyInstaller;
             this.telemetryClient = telemetryClient;
+            this.outputWriter = outputWriter;
         }
 
         /// <summary>
@@ -79,10 +83,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
         /// <returns>The results of language detector operations.</returns>
         public PlatformDetectorResult Detect(RepositoryContext context)
         {
-            var detectionResult = this.detector.Detect(new DetectorContext
-            {
-                SourceRepo = new Detector.LocalSourceRepo(context.SourceRepo.RootPath),
-            });
+            var detectionResult = this.detector.Detect(context);
 
             if (detectionResult == null)
             {
@@ -117,7 +118,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
             {
                 buildProperties[ManifestFilePropertyKeys.Frameworks] = "jekyll";
                 this.logger.LogInformation("Detected the following frameworks: jekyll");
-                Console.WriteLine("Detected the following frameworks: jekyll");
+                this.outputWriter.WriteLine("Detected the following frameworks: jekyll");
             }
 
             // Write the platform name and version to the manifest file
@@ -140,10 +141,27 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Ruby
                 this.logger,
                 this.telemetryClient);
 
+            var dependencyCaches = new List<DependencyCache>();
+            if (rubyPlatformDetectorResult.GemfileExists)
+            {
+                // Bundler keeps the gems it downloads in BUNDLE_USER_CACHE only if its global gem cache is enabled
+                dependencyCaches.Add(new DependencyCache
+                {
+                    Name = "bundler",
+                    EnvironmentVariables = new Dictionary<string, string>
+                    {
+                        ["BUNDLE_USER_CACHE"] = DependencyCache.DirectoryVariable,
+                        ["BUNDLE_GLOBAL_GEM_CACHE"] = "true",
+                    },
+                    LockFiles = new[] { RubyConstants.GemFileLockName },
+                });
+            }
+
             return new BuildScriptSnippet
             {
                 BashBuildScriptSnippet = script,
                 BuildProperties = buildProperties,
+                DependencyCaches = dependencyCaches,
             };
         }
 
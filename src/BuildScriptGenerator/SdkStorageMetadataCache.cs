@@ -0,0 +1,263 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading.Tasks;
+using System.Xml.Linq;
+using System.Xml.XPath;
+using Microsoft.Extensions.Logging;
+using Microsoft.Oryx.BuildScriptGenerator.Common;
+using Newtonsoft.Json;
+
+namespace Microsoft.Oryx.BuildScriptGenerator
+{
+    /// <summary>
+    /// A persistent, on-disk cache of the SDK version listings and default version files downloaded from the SDK
+    /// storage account, shared by all builds on a machine. Entries younger than the time to live are used without
+    /// any network request. Older entries are revalidated with a conditional request (If-None-Match or
+    /// If-Modified-Since) when the storage returned a validator for them, and are used as a fallback when the
+    /// storage cannot be reached. In offline mode only the cached entries are used.
+    /// </summary>
+    public class SdkStorageMetadataCache
+    {
+        /// <summary>
+        /// The time to live of the cache entries if none is configured.
+        /// </summary>
+        public const int DefaultTimeToLiveInMinutes = 60;
+
+        /// <summary>
+        /// Bump this version whenever the format of the cache entries changes.
+        /// </summary>
+        private const int CacheFormatVersion = 1;
+
+        private readonly string cacheDirectory;
+        private readonly TimeSpan timeToLive;
+        private readonly bool offline;
+        private readonly ILogger logger;
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="SdkStorageMetadataCache"/> class.
+        /// </summary>
+        /// <param name="cacheDirectory">The directory under which the cache entries are stored.</param>
+        /// <param name="timeToLive">How long an entry is used without revalidating it.</param>
+        /// <param name="offline">Whether to only use cached entries and never make a network request.</param>
+        /// <param name="logger">The <see cref="ILogger"/>.</param>
+        public SdkStorageMetadataCache(string cacheDirectory, TimeSpan timeToLive, bool offline, ILogger logger)
+        {
+            this.cacheDirectory = cacheDirectory;
+            this.timeToLive = timeToLive;
+            this.offline = offline;
+            this.logger = logger;
+        }
+
+        /// <summary>
+        /// Creates the cache configured by the <paramref name="options"/>, or returns null if the cache is disabled.
+        /// </summary>
+        public static SdkStorageMetadataCache Create(BuildScriptGeneratorOptions options, ILogger logger)
+        {
+            if (string.IsNullOrEmpty(options.SdkMetadataCacheDir))
+            {
+                return null;
+            }
+
+            return new SdkStorageMetadataCache(
+                options.SdkMetadataCacheDir,
+                TimeSpan.FromMinutes(Math.Max(0, options.SdkMetadataCacheTtlInMinutes)),
+                options.SdkMetadataOffline,
+                logger);
+        }
+
+        /// <summary>
+        /// Gets the list of all blobs in the storage container of the <paramref name="platformName"/>. Only the name
+        /// and the metadata of the blobs are kept, which is everything the version providers look at.
+        /// </summary>
+        /// <remarks>
+        /// Listing a container does not return a validator, so listings are only refreshed once they expire.
+        /// </remarks>
+        public XDocument GetBlobList(string sdkStorageBaseUrl, string platformName, HttpClient httpClient)
+        {
+            var url = string.Format(
+                SdkStorageConstants.ContainerMetadataUrlFormat,
+                sdkStorageBaseUrl,
+                platformName,
+                string.Empty);
+            var content = this.GetOrRefresh(url, cachedEntry =>
+            {
+                var blobList = CompactBlobList(ListBlobsHelper.GetAllBlobs(sdkStorageBaseUrl, platformName, httpClient));
+                return new CacheEntry { Content = blobList.ToString(SaveOptions.DisableFormatting) };
+            });
+
+            return XDocument.Parse(content);
+        }
+
+        /// <summary>
+        /// Gets the content at the <paramref name="url"/>, revalidating an expired cache entry with a conditional
+        /// request.
+        /// </summary>
+        public string GetString(string url, HttpClient httpClient)
+        {
+            return this.GetOrRefresh(
+                url,
+                cachedEntry => SendConditionalRequestAsync(url, cachedEntry, httpClient).Result);
+        }
+
+        internal static XDocument CompactBlobList(XDocument blobList)
+        {
+            var blobs = blobList
+                .XPathSelectElements("//Blobs/Blob")
+                .Select(blob => new XElement("Blob", blob.Element("Name"), blob.Element("Metadata")));
+            return new XDocument(
+                new XElement(
+                    "EnumerationResults",
+                    new XElement("Blobs", blobs),
+                    new XElement("NextMarker")));
+        }
+
+        private static async Task<CacheEntry> SendConditionalRequestAsync(
+            string url,
+            CacheEntry cachedEntry,
+            HttpClient httpClient)
+        {
+            using (var request = new HttpRequestMessage(HttpMethod.Get, url))
+            {
+                if (!string.IsNullOrEmpty(cachedEntry?.ETag))
+                {
+                    request.Headers.TryAddWithoutValidation("If-None-Match", cachedEntry.ETag);
+                }
+                else if (cachedEntry?.LastModified != null)
+                {
+                    request.Headers.IfModifiedSince = cachedEntry.LastModified;
+                }
+
+                using (var response = await httpClient.SendAsync(request))
+                {
+                    if (response.StatusCode == HttpStatusCode.NotModified && cachedEntry != null)
+                    {
+                        return cachedEntry;
+                    }
+
+                    response.EnsureSuccessStatusCode();
+                    return new CacheEntry
+                    {
+                        ETag = response.Headers.ETag?.ToString(),
+                        LastModified = response.Content.Headers.LastModified,
+                        Content = await response.Content.ReadAsStringAsync(),
+                    };
+                }
+            }
+        }
+
+        private static string ComputeHash(string value)
+        {
+            using (var sha = SHA256.Create())
+            {
+                var hash = sha.ComputeHash(Encoding.UTF8.GetBytes(value));
+                return string.Concat(hash.Select(b => b.ToString("x2")));
+            }
+        }
+
+        private string GetOrRefresh(string url, Func<CacheEntry, CacheEntry> refresh)
+        {
+            var cacheFilePath = Path.Combine(this.cacheDirectory, $"{ComputeHash($"{CacheFormatVersion}\n{url}")}.json");
+            var cachedEntry = this.TryReadEntry(cacheFilePath);
+            if (cachedEntry != null)
+            {
+                var age = DateTime.UtcNow - cachedEntry.FetchedAtUtc;
+                if (this.offline || (age >= TimeSpan.Zero && age < this.timeToLive))
+                {
+                    this.logger.LogDebug("Using cached SDK metadata for {url} fetched at {fetchedAt}", url, cachedEntry.FetchedAtUtc);
+                    return cachedEntry.Content;
+                }
+            }
+            else if (this.offline)
+            {
+                throw new InvalidOperationException(
+                    $"SDK metadata for '{url}' is not cached and network requests are disabled " +
+                    "(via 'ORYX_SDK_METADATA_OFFLINE').");
+            }
+
+            CacheEntry entry;
+            try
+            {
+                entry = refresh(cachedEntry);
+            }
+            catch (Exception ex) when (cachedEntry != null
+                && (ex is AggregateException || ex is HttpRequestException || ex is InvalidOperationException))
+            {
+                this.logger.LogWarning(
+                    ex,
+                    "Could not refresh the SDK metadata for {url}, using the cached copy fetched at {fetchedAt}",
+                    url,
+                    cachedEntry.FetchedAtUtc);
+                return cachedEntry.Content;
+            }
+
+            if (ReferenceEquals(entry, cachedEntry))
+            {
+                this.logger.LogDebug("Cached SDK metadata for {url} was revalidated", url);
+            }
+
+            entry.Url = url;
+            entry.FetchedAtUtc = DateTime.UtcNow;
+            this.TrySaveEntry(cacheFilePath, entry);
+            return entry.Content;
+        }
+
+        private CacheEntry TryReadEntry(string cacheFilePath)
+        {
+            if (!File.Exists(cacheFilePath))
+            {
+                return null;
+            }
+
+            try
+            {
+                return JsonConvert.DeserializeObject<CacheEntry>(File.ReadAllText(cacheFilePath));
+            }
+            catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException || ex is JsonException)
+            {
+                this.logger.LogDebug(ex, "Could not read the cached SDK metadata in {cacheFilePath}", cacheFilePath);
+                return null;
+            }
+        }
+
+        private void TrySaveEntry(string cacheFilePath, CacheEntry entry)
+        {
+            try
+            {
+                Directory.CreateDirectory(this.cacheDirectory);
+
+                // Write to a temporary file first so that concurrent builds never see a partially written entry
+                var tempFilePath = $"{cacheFilePath}.{Guid.NewGuid():N}.tmp";
+                File.WriteAllText(tempFilePath, JsonConvert.SerializeObject(entry));
+                File.Move(tempFilePath, cacheFilePath, overwrite: true);
+            }
+            catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+            {
+                // The cache is an optimization only, so failing to write to it must not fail the build
+                this.logger.LogWarning(ex, "Could not write the SDK metadata to {cacheFilePath}", cacheFilePath);
+            }
+        }
+
+        private class CacheEntry
+        {
+            public string Url { get; set; }
+
+            public DateTime FetchedAtUtc { get; set; }
+
+            public string ETag { get; set; }
+
+            public DateTimeOffset? LastModified { get; set; }
+
+            public string Content { get; set; }
+        }
+    }
+}
@@ -20,6 +20,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
     {
         private readonly ILogger logger;
         private readonly BuildScriptGeneratorOptions commonOptions;
+        private readonly SdkStorageMetadataCache metadataCache;
 
         public SdkStorageVersionProviderBase(
             IOptions<BuildScriptGeneratorOptions> commonOptions,
@@ -29,6 +30,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             this.commonOptions = commonOptions.Value;
             this.HttpClientFactory = httpClientFactory;
             this.logger = loggerFactory.CreateLogger(this.GetType());
+            this.metadataCache = SdkStorageMetadataCache.Create(this.commonOptions, this.logger);
         }
 
         protected IHttpClientFactory HttpClientFactory { get; }
@@ -56,7 +58,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
 
             try
             {
-              xdoc = ListBlobsHelper.GetAllBlobs(sdkStorageBaseUrl, platformName, httpClient);
+              xdoc = this.GetAllBlobs(sdkStorageBaseUrl, platformName, httpClient);
             }
             catch (AggregateException ex)
             {
@@ -64,7 +66,7 @@ namespace Microsoft.Oryx.BuildScriptGenerator
                 var sdkStorageBackupBaseUrl = this.GetPlatformBinariesBackupStorageBaseUrl();
                 if (sdkStorageBackupBaseUrl != null)
                 {
-                    xdoc = ListBlobsHelper.GetAllBlobs(sdkStorageBackupBaseUrl, platformName, httpClient);
+                    xdoc = this.GetAllBlobs(sdkStorageBackupBaseUrl, platformName, httpClient);
                 }
                 else
                 {
@@ -137,9 +139,9 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             string defaultVersionContent;
             try
             {
-                defaultVersionContent = httpClient
-                    .GetStringAsync($"{defaultVersionUrl}")
-                    .Result;
+                defaultVersionContent = this.metadataCache != null
+                    ? this.metadataCache.GetString(defaultVersionUrl, httpClient)
+                    : httpClient.GetStringAsync($"{defaultVersionUrl}").Result;
             }
             catch (AggregateException ae)
             {
@@ -182,6 +184,20 @@ namespace Microsoft.Oryx.BuildScriptGenerator
             return defaultVersion;
         }
 
+        /// <summary>
+        /// Gets the list of all blobs in the <paramref name="platformName"/> storage container, from the
+        /// <see cref="SdkStorageMetadataCache"/> if it is enabled.
+        /// </summary>
+        protected XDocument GetAllBlobs(string sdkStorageBaseUrl, string platformName, HttpClient httpClient)
+        {
+            if (this.metadataCache != null)
+            {
+                return this.metadataCache.GetBlobList(sdkStorageBaseUrl, platformName, httpClient);
+            }
+
+            return ListBlobsHelper.GetAllBlobs(sdkStorageBaseUrl, platformName, httpClient);
+        }
+
         protected string GetPlatformBinariesStorageBaseUrl()
         {
             var platformBinariesStorageBaseUrl = this.commonOptions.OryxSdkStorageBaseUrl;
@@ -12,6 +12,7 @@ using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Options;
 using Microsoft.Oryx.BuildScriptGenerator;
 using Microsoft.Oryx.BuildScriptGenerator.Exceptions;
+using Microsoft.Oryx.Detector;
 
 namespace Microsoft.Oryx.BuildScriptGeneratorCli
 {
@@ -41,11 +42,28 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
             var options = serviceProvider.GetRequiredService<IOptions<BuildScriptGeneratorOptions>>().Value;
             var sourceRepoProvider = serviceProvider.GetRequiredService<ISourceRepoProvider>();
             var envSettings = serviceProvider.GetRequiredService<CliEnvironmentSettings>();
+            var detectorOptions = serviceProvider.GetRequiredService<IOptions<DetectorOptions>>().Value;
+            var loggerFactory = serviceProvider.GetRequiredService<ILoggerFactory>();
+            var sourceRepo = sourceRepoProvider.GetSourceRepo();
+
+            DetectionResultCache detectionResultCache = null;
+            if (!string.IsNullOrEmpty(detectorOptions.DetectionCacheDirectory))
+            {
+                detectionResultCache = new DetectionResultCache(
+                    detectorOptions.DetectionCacheDirectory,
+                    detectorOptions,
+                    loggerFactory.CreateLogger<DetectionResultCache>());
+            }
 
             return new BuildScriptGeneratorContext
             {
                 OperationId = operationId,
-                SourceRepo = sourceRepoProvider.GetSourceRepo(),
+                SourceRepo = sourceRepo,
+                DetectorSourceRepo = new IndexedSourceRepo(
+                    sourceRepo.RootPath,
+                    detectorOptions.ExcludedDirectories,
+                    loggerFactory),
+                DetectionResultCache = detectionResultCache,
                 Properties = options.Properties,
                 ManifestDir = options.ManifestDir,
                 BuildCommandsFileName = options.BuildCommandsFileName,
@@ -0,0 +1,108 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.CommandLine;
+using System.CommandLine.IO;
+using System.IO;
+using System.Text;
+
+namespace Microsoft.Oryx.BuildScriptGeneratorCli
+{
+    /// <summary>
+    /// Console of a build run by a build worker, which sends each line written to the standard output and error
+    /// streams as a separate frame to the build server.
+    /// </summary>
+    internal class BuildWorkerConsole : IConsole
+    {
+        private readonly object syncRoot = new object();
+        private readonly TextWriter connection;
+        private readonly FrameWriter outputWriter;
+        private readonly FrameWriter errorWriter;
+
+        public BuildWorkerConsole(TextWriter connection, string outputFramePrefix, string errorFramePrefix)
+        {
+            this.connection = connection;
+            this.outputWriter = new FrameWriter(this, outputFramePrefix);
+            this.errorWriter = new FrameWriter(this, errorFramePrefix);
+        }
+
+        public IStandardStreamWriter Out => this.outputWriter;
+
+        public bool IsOutputRedirected => true;
+
+        public IStandardStreamWriter Error => this.errorWriter;
+
+        public bool IsErrorRedirected => true;
+
+        public bool IsInputRedirected => true;
+
+        /// <summary>
+        /// Sends the text written after the last line feed, if any.
+        /// </summary>
+        public void Flush()
+        {
+            this.outputWriter.Flush();
+            this.errorWriter.Flush();
+        }
+
+        private void SendFrame(string prefix, string line)
+        {
+            // The output and error streams of the build script are read on different threads.
+            lock (this.syncRoot)
+            {
+                this.connection.WriteLine(prefix + line);
+            }
+        }
+
+        private class FrameWriter : IStandardStreamWriter
+        {
+            private readonly BuildWorkerConsole console;
+            private readonly string prefix;
+            private readonly StringBuilder pendingLine = new StringBuilder();
+
+            public FrameWriter(BuildWorkerConsole console, string prefix)
+            {
+                this.console = console;
+                this.prefix = prefix;
+            }
+
+            public void Write(string value)
+            {
+                if (value == null)
+                {
+                    return;
+                }
+
+                lock (this.pendingLine)
+                {
+                    foreach (var character in value)
+                    {
+                        if (character == '\n')
+                        {
+                            this.console.SendFrame(this.prefix, this.pendingLine.ToString().TrimEnd('\r'));
+                            this.pendingLine.Clear();
+                        }
+                        else
+                        {
+                            this.pendingLine.Append(character);
+                        }
+                    }
+                }
+            }
+
+            public void Flush()
+            {
+                lock (this.pendingLine)
+                {
+                    if (this.pendingLine.Length > 0)
+                    {
+                        this.console.SendFrame(this.prefix, this.pendingLine.ToString());
+                        this.pendingLine.Clear();
+                    }
+                }
+            }
+        }
+    }
+}
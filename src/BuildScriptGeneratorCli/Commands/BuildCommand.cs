@@ -220,6 +220,210 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
         }
 
         internal override int Execute(IServiceProvider serviceProvider, IConsole console)
+        {
+            var options = serviceProvider.GetRequiredService<IOptions<BuildScriptGeneratorOptions>>().Value;
+            if (string.IsNullOrEmpty(options.BuildTraceFile))
+            {
+                return this.ExecuteBuild(serviceProvider, console);
+            }
+
+            var trace = new BuildTrace();
+            BuildTrace.Current = trace;
+            try
+            {
+                return this.ExecuteBuild(serviceProvider, console);
+            }
+            finally
+            {
+                BuildTrace.Current = null;
+                WriteBuildTrace(trace, options.BuildTraceFile, serviceProvider, console);
+            }
+        }
+
+        internal override bool IsValidInput(IServiceProvider serviceProvider, IConsole console)
+        {
+            var options = serviceProvider.GetRequiredService<IOptions<BuildScriptGeneratorOptions>>().Value;
+            var logger = serviceProvider.GetRequiredService<ILogger<BuildCommand>>();
+
+            if (this.languageWasSet)
+            {
+                logger.LogWarning("Deprecated option '--language' used");
+                console.WriteLine("Warning: the deprecated option '--language' was used.");
+            }
+
+            if (this.languageVersionWasSet)
+            {
+                logger.LogWarning("Deprecated option '--language-version' used");
+                console.WriteLine("Warning: the deprecated option '--language-version' was used.");
+            }
+
+            // Invalid to specify platform version without platform name
+            if (string.IsNullOrEmpty(options.PlatformName) && !string.IsNullOrEmpty(options.PlatformVersion))
+            {
+                logger.LogError("Cannot use lang version without lang name");
+                console.WriteErrorLine("Cannot use platform version without specifying platform name also.");
+                return false;
+            }
+
+            // --skip-detection requires --platform to be specified
+            if (options.SkipDetection && string.IsNullOrEmpty(options.PlatformName))
+            {
+                logger.LogError("Cannot use --skip-detection without --platform");
+                console.WriteErrorLine("Cannot use --skip-detection without specifying --platform also.");
+                return false;
+            }
+
+            if (!string.IsNullOrEmpty(options.AppType))
+            {
+                var appType = options.AppType.ToLower();
+                if (!string.Equals(appType, Constants.FunctionApplications)
+                    && !string.Equals(appType, Constants.StaticSiteApplications)
+                    && !string.Equals(appType, Constants.WebApplications))
+                {
+                    logger.LogError($"Invalid value for AppType: '{options.AppType}'.");
+                    console.WriteErrorLine(
+                        $"Invalid value '{options.AppType}' for switch '--apptype'. " +
+                        $"Valid values are '{Constants.StaticSiteApplications}' or " +
+                        $"'{Constants.FunctionApplications}' or '{Constants.WebApplications}'");
+                    return false;
+                }
+            }
+
+            if (!string.IsNullOrEmpty(options.IntermediateDir))
+            {
+                if (DirectoryHelper.AreSameDirectories(options.IntermediateDir, options.SourceDir))
+                {
+                    logger.LogError(
+                        "Intermediate directory cannot be same as the source directory.");
+                    console.WriteErrorLine(
+                        $"Intermediate directory '{options.IntermediateDir}' cannot be " +
+                        $"same as the source directory '{options.SourceDir}'.");
+                    return false;
+                }
+
+                // Intermediate directory cannot be a sub-directory of the source directory
+                if (DirectoryHelper.IsSubDirectory(options.IntermediateDir, options.SourceDir))
+                {
+                    logger.LogError(
+                        "Intermediate directory cannot be a child of the source directory.");
+                    console.WriteErrorLine(
+                        $"Intermediate directory '{options.IntermediateDir}' cannot be a " +
+                        $"sub-directory of source directory '{options.SourceDir}'.");
+                    return false;
+                }
+            }
+
+            return true;
+        }
+
+        internal override IServiceProvider TryGetServiceProvider(IConsole console)
+        {
+            // Gather all the values supplied by the user in command line
+            this.SourceDir = string.IsNullOrEmpty(this.SourceDir) ?
+                Directory.GetCurrentDirectory() : Path.GetFullPath(this.SourceDir);
+            this.ManifestDir = string.IsNullOrEmpty(this.ManifestDir) ? null : Path.GetFullPath(this.ManifestDir);
+            this.IntermediateDir = string.IsNullOrEmpty(this.IntermediateDir) ? null : Path.GetFullPath(this.IntermediateDir);
+            this.DestinationDir = string.IsNullOrEmpty(this.DestinationDir) ? null : Path.GetFullPath(this.DestinationDir);
+            this.BuildCommandsFileName = string.IsNullOrEmpty(this.BuildCommandsFileName) ?
+                FilePaths.BuildCommandsFileName : this.BuildCommandsFileName;
+            var buildProperties = ProcessProperties(this.Properties);
+
+            // NOTE: Order of the following is important. So a command line provided value has higher precedence
+            // than the value provided in a configuration file of the repo.
+            var config = new ConfigurationBuilder()
+                .AddIniFile(Path.Combine(this.SourceDir, Constants.BuildEnvironmentFileName), optional: true)
+                .AddEnvironmentVariables()
+                .Add(this.GetCommandLineConfigSource(buildProperties))
+                .Build();
+
+            // Override the GetServiceProvider() call in CommandBase to pass the IConsole instance to
+            // ServiceProviderBuilder and allow for writing to the console if needed during this command.
+            var serviceProviderBuilder = new ServiceProviderBuilder(this.LogFilePath, console)
+                .ConfigureServices(services =>
+                {
+                    // Configure Options related services
+                    // We first add IConfiguration to DI so that option services like
+                    // `DotNetCoreScriptGeneratorOptionsSetup` services can get it through DI and read from the config
+                    // and set the options.
+                    services
+                        .AddSingleton<IConfiguration>(config)
+                        .AddOptionsServices()
+                        .Configure<BuildScriptGeneratorOptions>(options =>
+                        {
+                            // These values are not retrieved through the 'config' api since we do not expect
+                            // them to be provided by an end user.
+                            options.SourceDir = this.SourceDir;
+                            options.IntermediateDir = this.IntermediateDir;
+                            options.DestinationDir = this.DestinationDir;
+                            options.ManifestDir = this.ManifestDir;
+                            options.Properties = buildProperties;
+                            options.ScriptOnly = false;
+                            options.SkipDetection = options.SkipDetection || this.SkipDetection;
+                            options.DebianFlavor = this.ResolveOsType(options, console);
+                            options.ImageType = this.ResolveImageType(options, console);
+                        });
+                });
+
+            return serviceProviderBuilder.Build();
+        }
+
+        private static string GetSourceRepoCommitId(IEnvironment env, ISourceRepo repo, ILogger<BuildCommand> logger, TelemetryClient telemetryClient)
+        {
+            string commitId = env.GetEnvironmentVariable(ExtVarNames.ScmCommitIdEnvVarName);
+
+            if (string.IsNullOrEmpty(commitId))
+            {
+                using (var timedEvent = telemetryClient.LogTimedEvent("GetGitCommitId"))
+                {
+                    commitId = repo.GetGitCommitId();
+                    timedEvent.AddProperty(nameof(commitId), commitId);
+                }
+            }
+
+            return commitId;
+        }
+
+        private static void WriteBuildTrace(
+            BuildTrace trace,
+            string traceFilePath,
+            IServiceProvider serviceProvider,
+            IConsole console)
+        {
+            var logger = serviceProvider.GetRequiredService<ILogger<BuildCommand>>();
+            try
+            {
+                var scriptEventsFilePath = BuildTrace.GetScriptEventsFilePath(traceFilePath);
+                if (File.Exists(scriptEventsFilePath))
+                {
+                    trace.AddScriptPhases(File.ReadAllLines(scriptEventsFilePath));
+                    File.Delete(scriptEventsFilePath);
+                }
+
+                trace.WriteTo(traceFilePath);
+                console.WriteLine($"Build trace written to '{traceFilePath}'.");
+            }
+            catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+            {
+                // The trace is a diagnostic aid, so failing to write it must not fail the build.
+                logger.LogWarning(ex, "Could not write the build trace to {traceFilePath}", traceFilePath);
+                console.WriteErrorLine($"Could not write the build trace to '{traceFilePath}': {ex.Message}");
+            }
+        }
+
+        private static string[] GetEnvVarNames([CanBeNull] IEnvironment env)
+        {
+            var envVarKeyCollection = env?.GetEnvironmentVariables()?.Keys;
+            if (envVarKeyCollection == null)
+            {
+                return Array.Empty<string>();
+            }
+
+            string[] envVarNames = new string[envVarKeyCollection.Count];
+            envVarKeyCollection.CopyTo(envVarNames, 0);
+            return envVarNames;
+        }
+
+        private int ExecuteBuild(IServiceProvider serviceProvider, IConsole console)
         {
             var environment = serviceProvider.GetRequiredService<IEnvironment>();
             var logger = serviceProvider.GetRequiredService<ILogger<BuildCommand>>();
@@ -332,18 +536,15 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
                 new PipDownloadEventLogger(logger, telemetryClient),
             };
 
-            DataReceivedEventHandler stdOutBaseHandler = (sender, args) =>
+            // npm writes its log, including the time taken by every fetch, to standard error.
+            var stdErrEventLoggers = new ITextStreamProcessor[]
             {
-                string line = args.Data;
-                if (line == null)
-                {
-                    return;
-                }
-
-                console.WriteLine(line);
-                buildScriptOutput.AppendLine(line);
+                new NpmFetchEventLogger(BuildTrace.Current),
+            };
 
-                foreach (var processor in stdOutEventLoggers)
+            void ProcessLine(ITextStreamProcessor[] processors, string line, string streamName)
+            {
+                foreach (var processor in processors)
                 {
                     // Catch any exception and log them instead of failing this build since whatever these processors
                     // do are not really relevant to the actual build of the app.
@@ -356,9 +557,22 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
                         logger.LogError(
                             ex,
                             $"An error occurred when trying to process the line '{line}' from standard " +
-                            $"out using the  '{processor.GetType()}' processor.");
+                            $"{streamName} using the  '{processor.GetType()}' processor.");
                     }
                 }
+            }
+
+            DataReceivedEventHandler stdOutBaseHandler = (sender, args) =>
+            {
+                string line = args.Data;
+                if (line == null)
+                {
+                    return;
+                }
+
+                console.WriteLine(line);
+                buildScriptOutput.AppendLine(line);
+                ProcessLine(stdOutEventLoggers, line, "out");
             };
 
             DataReceivedEventHandler stdErrBaseHandler = (sender, args) =>
@@ -372,6 +586,7 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
                 // Not using IConsole.WriteErrorLine intentionally, to keep the child's error stream intact
                 console.Error.WriteLine(line);
                 buildScriptOutput.AppendLine(line);
+                ProcessLine(stdErrEventLoggers, line, "error");
             };
 
             // Run the generated script
@@ -412,162 +627,6 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
             return ProcessConstants.ExitSuccess;
         }
 
-        internal override bool IsValidInput(IServiceProvider serviceProvider, IConsole console)
-        {
-            var options = serviceProvider.GetRequiredService<IOptions<BuildScriptGeneratorOptions>>().Value;
-            var logger = serviceProvider.GetRequiredService<ILogger<BuildCommand>>();
-
-            if (this.languageWasSet)
-            {
-                logger.LogWarning("Deprecated option '--language' used");
-                console.WriteLine("Warning: the deprecated option '--language' was used.");
-            }
-
-            if (this.languageVersionWasSet)
-            {
-                logger.LogWarning("Deprecated option '--language-version' used");
-                console.WriteLine("Warning: the deprecated option '--language-version' was used.");
-            }
-
-            // Invalid to specify platform version without platform name
-            if (string.IsNullOrEmpty(options.PlatformName) && !string.IsNullOrEmpty(options.PlatformVersion))
-            {
-                logger.LogError("Cannot use lang version without lang name");
-                console.WriteErrorLine("Cannot use platform version without specifying platform name also.");
-                return false;
-            }
-
-            // --skip-detection requires --platform to be specified
-            if (options.SkipDetection && string.IsNullOrEmpty(options.PlatformName))
-            {
-                logger.LogError("Cannot use --skip-detection without --platform");
-                console.WriteErrorLine("Cannot use --skip-detection without specifying --platform also.");
-                return false;
-            }
-
-            if (!string.IsNullOrEmpty(options.AppType))
-            {
-                var appType = options.AppType.ToLower();
-                if (!string.Equals(appType, Constants.FunctionApplications)
-                    && !string.Equals(appType, Constants.StaticSiteApplications)
-                    && !string.Equals(appType, Constants.WebApplications))
-                {
-                    logger.LogError($"Invalid value for AppType: '{options.AppType}'.");
-                    console.WriteErrorLine(
-                        $"Invalid value '{options.AppType}' for switch '--apptype'. " +
-                        $"Valid values are '{Constants.StaticSiteApplications}' or " +
-                        $"'{Constants.FunctionApplications}' or '{Constants.WebApplications}'");
-                    return false;
-                }
-            }
-
-            if (!string.IsNullOrEmpty(options.IntermediateDir))
-            {
-                if (DirectoryHelper.AreSameDirectories(options.IntermediateDir, options.SourceDir))
-                {
-                    logger.LogError(
-                        "Intermediate directory cannot be same as the source directory.");
-                    console.WriteErrorLine(
-                        $"Intermediate directory '{options.IntermediateDir}' cannot be " +
-                        $"same as the source directory '{options.SourceDir}'.");
-                    return false;
-                }
-
-                // Intermediate directory cannot be a sub-directory of the source directory
-                if (DirectoryHelper.IsSubDirectory(options.IntermediateDir, options.SourceDir))
-                {
-                    logger.LogError(
-                        "Intermediate directory cannot be a child of the source directory.");
-                    console.WriteErrorLine(
-                        $"Intermediate directory '{options.IntermediateDir}' cannot be a " +
-                        $"sub-directory of source directory '{options.SourceDir}'.");
-                    return false;
-                }
-            }
-
-            return true;
-        }
-
-        internal override IServiceProvider TryGetServiceProvider(IConsole console)
-        {
-            // Gather all the values supplied by the user in command line
-            this.SourceDir = string.IsNullOrEmpty(this.SourceDir) ?
-                Directory.GetCurrentDirectory() : Path.GetFullPath(this.SourceDir);
-            this.ManifestDir = string.IsNullOrEmpty(this.ManifestDir) ? null : Path.GetFullPath(this.ManifestDir);
-            this.IntermediateDir = string.IsNullOrEmpty(this.IntermediateDir) ? null : Path.GetFullPath(this.IntermediateDir);
-            this.DestinationDir = string.IsNullOrEmpty(this.DestinationDir) ? null : Path.GetFullPath(this.DestinationDir);
-            this.BuildCommandsFileName = string.IsNullOrEmpty(this.BuildCommandsFileName) ?
-                FilePaths.BuildCommandsFileName : this.BuildCommandsFileName;
-            var buildProperties = ProcessProperties(this.Properties);
-
-            // NOTE: Order of the following is important. So a command line provided value has higher precedence
-            // than the value provided in a configuration file of the repo.
-            var config = new ConfigurationBuilder()
-                .AddIniFile(Path.Combine(this.SourceDir, Constants.BuildEnvironmentFileName), optional: true)
-                .AddEnvironmentVariables()
-                .Add(this.GetCommandLineConfigSource(buildProperties))
-                .Build();
-
-            // Override the GetServiceProvider() call in CommandBase to pass the IConsole instance to
-            // ServiceProviderBuilder and allow for writing to the console if needed during this command.
-            var serviceProviderBuilder = new ServiceProviderBuilder(this.LogFilePath, console)
-                .ConfigureServices(services =>
-                {
-                    // Configure Options related services
-                    // We first add IConfiguration to DI so that option services like
-                    // `DotNetCoreScriptGeneratorOptionsSetup` services can get it through DI and read from the config
-                    // and set the options.
-                    services
-                        .AddSingleton<IConfiguration>(config)
-                        .AddOptionsServices()
-                        .Configure<BuildScriptGeneratorOptions>(options =>
-                        {
-                            // These values are not retrieved through the 'config' api since we do not expect
-                            // them to be provided by an end user.
-                            options.SourceDir = this.SourceDir;
-                            options.IntermediateDir = this.IntermediateDir;
-                            options.DestinationDir = this.DestinationDir;
-                            options.ManifestDir = this.ManifestDir;
-                            options.Properties = buildProperties;
-                            options.ScriptOnly = false;
-                            options.SkipDetection = options.SkipDetection || this.SkipDetection;
-                            options.DebianFlavor = this.ResolveOsType(options, console);
-                            options.ImageType = this.ResolveImageType(options, console);
-                        });
-                });
-
-            return serviceProviderBuilder.Build();
-        }
-
-        private static string GetSourceRepoCommitId(IEnvironment env, ISourceRepo repo, ILogger<BuildCommand> logger, TelemetryClient telemetryClient)
-        {
-            string commitId = env.GetEnvironmentVariable(ExtVarNames.ScmCommitIdEnvVarName);
-
-            if (string.IsNullOrEmpty(commitId))
-            {
-                using (var timedEvent = telemetryClient.LogTimedEvent("GetGitCommitId"))
-                {
-                    commitId = repo.GetGitCommitId();
-                    timedEvent.AddProperty(nameof(commitId), commitId);
-                }
-            }
-
-            return commitId;
-        }
-
-        private static string[] GetEnvVarNames([CanBeNull] IEnvironment env)
-        {
-            var envVarKeyCollection = env?.GetEnvironmentVariables()?.Keys;
-            if (envVarKeyCollection == null)
-            {
-                return Array.Empty<string>();
-            }
-
-            string[] envVarNames = new string[envVarKeyCollection.Count];
-            envVarKeyCollection.CopyTo(envVarNames, 0);
-            return envVarNames;
-        }
-
         private CustomConfigurationSource GetCommandLineConfigSource(
             IDictionary<string, string> buildProperties)
         {
@@ -0,0 +1,112 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.CommandLine;
+using System.IO;
+using System.Net.Sockets;
+using System.Threading.Tasks;
+using Microsoft.Oryx.BuildScriptGenerator.Common;
+using Newtonsoft.Json;
+
+namespace Microsoft.Oryx.BuildScriptGeneratorCli
+{
+    /// <summary>
+    /// Runs the builds sent by the build server over a Unix domain socket, one at a time, so that the runtime
+    /// startup and the static caches of the build script generator are shared by all the builds of the worker.
+    /// </summary>
+    /// <remarks>
+    /// A build is requested by connecting to the socket and sending the arguments of the 'build' command as a JSON
+    /// array on a single line. The worker replies with a line per line of output, prefixed with
+    /// <see cref="OutputFramePrefix"/> or <see cref="ErrorFramePrefix"/>, and then with the exit code of the build
+    /// prefixed with <see cref="ExitFramePrefix"/>, and closes the connection.
+    /// </remarks>
+    internal class BuildWorkerCommand
+    {
+        public const string Name = "build-worker";
+        public const string Description = "[INTERNAL ONLY COMMAND]";
+
+        internal const string OutputFramePrefix = "out:";
+        internal const string ErrorFramePrefix = "err:";
+        internal const string ExitFramePrefix = "exit:";
+
+        public static Command Export(IConsole console)
+        {
+            var socketOption = new Option<string>(OptionArgumentTemplates.Socket, OptionArgumentTemplates.SocketDescription)
+            {
+                IsRequired = true,
+            };
+
+            var command = new Command(Name, Description)
+            {
+                socketOption,
+            };
+            command.IsHidden = true;
+
+            command.SetHandler(
+                (socketPath) => RunAsync(socketPath),
+                socketOption);
+            return command;
+        }
+
+        internal static async Task<int> RunAsync(string socketPath)
+        {
+            // The build server keeps the standard input of its workers open, so a worker stops when the server does.
+            _ = Task.Run(() =>
+            {
+                Console.In.ReadToEnd();
+                Environment.Exit(ProcessConstants.ExitSuccess);
+            });
+
+            if (File.Exists(socketPath))
+            {
+                File.Delete(socketPath);
+            }
+
+            using (var listener = new Socket(AddressFamily.Unix, SocketType.Stream, ProtocolType.Unspecified))
+            {
+                listener.Bind(new UnixDomainSocketEndPoint(socketPath));
+                listener.Listen(backlog: 1);
+                while (true)
+                {
+                    var connection = await listener.AcceptAsync();
+                    await RunBuildAsync(connection);
+                }
+            }
+        }
+
+        internal static async Task RunBuildAsync(Socket connection)
+        {
+            using (var stream = new NetworkStream(connection, ownsSocket: true))
+            using (var reader = new StreamReader(stream))
+            using (var writer = new StreamWriter(stream) { AutoFlush = true })
+            {
+                var request = await reader.ReadLineAsync();
+                if (string.IsNullOrEmpty(request))
+                {
+                    return;
+                }
+
+                var console = new BuildWorkerConsole(writer, OutputFramePrefix, ErrorFramePrefix);
+                int exitCode;
+                try
+                {
+                    var args = JsonConvert.DeserializeObject<string[]>(request);
+
+                    // The command is created for each build, as its handler writes to the console of the build.
+                    exitCode = await BuildCommand.Export(console).InvokeAsync(args, console);
+                }
+                catch (Exception ex)
+                {
+                    console.WriteErrorLine(ex.ToString());
+                    exitCode = ProcessConstants.ExitFailure;
+                }
+
+                console.Flush();
+                await writer.WriteLineAsync(ExitFramePrefix + exitCode);
+            }
+        }
+    }
+}
@@ -34,6 +34,8 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
         public int OnExecute(IConsole console)
         {
             ILogger<CommandBase> logger = null;
+
+            // Removed once the command has run, as a build worker runs many commands in one process.
             Console.CancelKeyPress += this.Console_CancelKeyPress;
             TelemetryClient telemetryClient = null;
 
@@ -78,7 +80,7 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
 
                 if (this.DebugMode)
                 {
-                    Console.WriteLine("Debug mode enabled");
+                    console.WriteLine("Debug mode enabled");
                 }
 
                 using (var timedEvent = telemetryClient?.LogTimedEvent(this.GetType().Name))
@@ -106,6 +108,7 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
             }
             finally
             {
+                Console.CancelKeyPress -= this.Console_CancelKeyPress;
                 telemetryClient?.Flush();
                 this.DisposeServiceProvider();
             }
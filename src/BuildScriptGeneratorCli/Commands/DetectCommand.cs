@@ -15,6 +15,7 @@ using System.Threading.Tasks;
 using Microsoft.ApplicationInsights;
 using Microsoft.Extensions.DependencyInjection;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 using Microsoft.Oryx.BuildScriptGenerator.Common;
 using Microsoft.Oryx.BuildScriptGenerator.Common.Extensions;
 using Microsoft.Oryx.BuildScriptGeneratorCli.Commands;
@@ -84,7 +85,8 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
             var loggerFactory = serviceProvider.GetRequiredService<ILoggerFactory>();
             var telemetryClient = serviceProvider.GetRequiredService<TelemetryClient>();
             var logger = loggerFactory.CreateLogger<DetectCommand>();
-            var sourceRepo = new LocalSourceRepo(this.SourceDir, loggerFactory);
+            var detectorOptions = serviceProvider.GetRequiredService<IOptions<DetectorOptions>>().Value;
+            var sourceRepo = new IndexedSourceRepo(this.SourceDir, detectorOptions.ExcludedDirectories, loggerFactory);
             var ctx = new DetectorContext
             {
                 SourceRepo = sourceRepo,
@@ -52,6 +52,8 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
         public static readonly string RuntimePlatformDescription = "The runtime platform to use in the Dockerfile. If not provided, the value for --platform will be used, otherwise the runtime platform will be auto-detected.";
         public static readonly string RuntimePlatformVersion = "--runtime-platform-version";
         public static readonly string RuntimePlatformVersionDescription = "The version of the runtime to use in the Dockerfile. If not provided, an attempt will be made to determine the runtime version to use based on the detected platform version, otherwise the 'dynamic' runtime image will be used.";
+        public static readonly string Socket = "--socket";
+        public static readonly string SocketDescription = "The path of the Unix domain socket to listen on for builds.";
         public static readonly string[] Source = new string[] { "-s", "--src" };
 
         // Shared argument tempaltes
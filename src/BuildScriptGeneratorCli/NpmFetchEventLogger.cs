@@ -0,0 +1,63 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Text.RegularExpressions;
+using Microsoft.Oryx.BuildScriptGenerator.Common;
+using Microsoft.Oryx.Common.Extensions;
+
+namespace Microsoft.Oryx.BuildScriptGenerator
+{
+    /// <summary>
+    /// Adds the package fetches which `npm` logs when its log level is 'http' or lower to the trace of the build.
+    /// </summary>
+    internal class NpmFetchEventLogger : ITextStreamProcessor
+    {
+        private const string EventName = "NpmFetch";
+
+        // Ex: npm http fetch GET 200 https://registry.npmjs.org/express 123ms (cache miss)
+        private static readonly Regex NpmFetchLine = new Regex(
+            @"npm http fetch (?<method>[A-Z]+) (?<status>\d{3}) (?<url>\S+) (?<duration>\d+)ms(?: \((?<cache>[^)]+)\))?",
+            RegexOptions.Compiled);
+
+        private readonly BuildTrace trace;
+
+        public NpmFetchEventLogger(BuildTrace trace)
+        {
+            this.trace = trace;
+        }
+
+        public void ProcessLine(string line)
+        {
+            if (this.trace == null || !line.Contains("npm http fetch"))
+            {
+                return;
+            }
+
+            var match = NpmFetchLine.Match(line);
+            if (!match.Success)
+            {
+                return;
+            }
+
+            // npm logs a fetch once it completes, so it started the given duration before now.
+            var duration = TimeSpan.FromMilliseconds(int.Parse(match.Groups["duration"].Value));
+            var start = this.trace.Elapsed - duration;
+            var args = new Dictionary<string, string>
+            {
+                { "url", match.Groups["url"].Value.ReplaceUrlUserInfo() },
+                { "status", match.Groups["status"].Value },
+            };
+
+            if (match.Groups["cache"].Success)
+            {
+                args["cache"] = match.Groups["cache"].Value;
+            }
+
+            this.trace.AddEvent(EventName, "npm", start < TimeSpan.Zero ? TimeSpan.Zero : start, duration, args);
+        }
+    }
+}
@@ -59,6 +59,23 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
             options.CallerId = this.GetStringValue(SettingsKeys.CallerId);
             options.OryxDisablePipUpgrade = this.GetBooleanValue(SettingsKeys.OryxDisablePipUpgrade);
 
+            // Copying files
+            options.CopyVerify = this.GetBooleanValue(SettingsKeys.CopyVerify);
+            var copyLinkMode = this.GetStringValue(SettingsKeys.CopyLinkMode)?.Trim().ToLowerInvariant();
+            options.CopyLinkMode = copyLinkMode == BuildScriptGeneratorLib.Constants.CopyLinkModeReflink
+                || copyLinkMode == BuildScriptGeneratorLib.Constants.CopyLinkModeHardlink ? copyLinkMode : null;
+            if (int.TryParse(this.GetStringValue(SettingsKeys.CopyParallelism), out var copyParallelism))
+            {
+                options.CopyParallelism = copyParallelism;
+            }
+
+            // Tracing
+            var buildTraceFile = this.GetStringValue(SettingsKeys.BuildTraceFile);
+            if (!string.IsNullOrWhiteSpace(buildTraceFile))
+            {
+                options.BuildTraceFile = Path.GetFullPath(buildTraceFile.Trim());
+            }
+
             // Dynamic install
             options.EnableDynamicInstall = this.GetBooleanValue(SettingsKeys.EnableDynamicInstall);
             options.EnableExternalSdkProvider = this.GetBooleanValue(SettingsKeys.EnableExternalSdkProvider);
@@ -87,9 +104,33 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
                 options.DynamicInstallRootDir = dynamicInstallRootDir;
             }
 
+            if (int.TryParse(this.GetStringValue(SettingsKeys.DynamicInstallParallelism), out var dynamicInstallParallelism))
+            {
+                options.DynamicInstallParallelism = dynamicInstallParallelism;
+            }
+
+            options.SdkMetadataCacheDir = this.GetStringValue(SettingsKeys.SdkMetadataCacheDir);
+            options.SdkMetadataCacheTtlInMinutes = int.TryParse(
+                this.GetStringValue(SettingsKeys.SdkMetadataCacheTtl),
+                out var sdkMetadataCacheTtl) ? sdkMetadataCacheTtl : BuildScriptGeneratorLib.SdkStorageMetadataCache.DefaultTimeToLiveInMinutes;
+            options.SdkMetadataOffline = this.GetBooleanValue(SettingsKeys.SdkMetadataOffline);
+
+            var dependencyCacheDir = this.GetStringValue(SettingsKeys.DependencyCacheDir);
+            if (!string.IsNullOrWhiteSpace(dependencyCacheDir))
+            {
+                options.DependencyCacheDir = Path.GetFullPath(dependencyCacheDir.Trim());
+            }
+
+            var dependencyLayerCacheDir = this.GetStringValue(SettingsKeys.DependencyLayerCacheDir);
+            if (!string.IsNullOrWhiteSpace(dependencyLayerCacheDir))
+            {
+                options.DependencyLayerCacheDir = Path.GetFullPath(dependencyLayerCacheDir.Trim());
+            }
+
             options.OsFlavor = this.GetStringValue(SettingsKeys.OsFlavor);
             options.DebianFlavor = this.GetStringValue(SettingsKeys.DebianFlavor);
             options.SkipDetection = this.GetBooleanValue(SettingsKeys.SkipPlatformDetection);
+            options.EnableParallelDetection = this.GetBooleanValue(SettingsKeys.EnableParallelDetection);
         }
     }
 }
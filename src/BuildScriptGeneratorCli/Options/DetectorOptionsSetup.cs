@@ -3,6 +3,7 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System.Linq;
 using Microsoft.Extensions.Configuration;
 using Microsoft.Extensions.Options;
 using Microsoft.Oryx.Detector;
@@ -22,6 +23,12 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
             options.AppType = this.GetStringValue(SettingsKeys.AppType);
             options.DisableRecursiveLookUp = this.GetBooleanValue(SettingsKeys.DisableRecursiveLookUp);
             options.CustomRequirementsTxtPath = this.GetStringValue(SettingsKeys.CustomRequirementsTxtPath);
+            options.EnableParallelDetection = this.GetBooleanValue(SettingsKeys.EnableParallelDetection);
+            options.DetectionCacheDirectory = this.GetStringValue(SettingsKeys.DetectionCacheDirectory);
+
+            var excludedDirectories = this.GetStringValue(SettingsKeys.DetectorExcludedDirectories);
+            options.ExcludedDirectories = string.IsNullOrWhiteSpace(excludedDirectories)
+                ? null : excludedDirectories.Split(',').Select(dir => dir.Trim()).ToArray();
         }
     }
 }
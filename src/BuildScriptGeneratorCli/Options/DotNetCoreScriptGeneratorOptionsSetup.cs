@@ -27,6 +27,7 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
             options.CustomBuildCommand = this.GetStringValue(SettingsKeys.CustomBuildCommand);
             options.DotNetCoreRuntimeVersion = this.GetStringValue(SettingsKeys.DotNetVersion);
             options.DefaultRuntimeVersion = this.GetStringValue(SettingsKeys.DotNetDefaultVersion);
+            options.PublishReadyToRun = this.GetBooleanValue(SettingsKeys.DotNetPublishReadyToRun);
         }
     }
 }
\ No newline at end of file
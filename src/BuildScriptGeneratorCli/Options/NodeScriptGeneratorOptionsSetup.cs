@@ -26,6 +26,8 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
             options.CustomRunBuildCommand = this.GetStringValue(SettingsKeys.CustomRunBuildCommand);
             options.CustomBuildCommand = this.GetStringValue(SettingsKeys.CustomBuildCommand);
             options.PruneDevDependencies = this.GetBooleanValue(SettingsKeys.PruneDevDependencies);
+            options.PruneDevDependenciesWithHardlinks = this.GetBooleanValue(
+                SettingsKeys.PruneDevDependenciesWithHardlinks);
             options.NpmRegistryUrl = this.GetStringValue(SettingsKeys.NpmRegistryUrl);
             options.EnableNodeMonorepoBuild = this.GetBooleanValue(SettingsKeys.EnableNodeMonorepoBuild);
             options.YarnTimeOutConfig = this.GetStringValue(SettingsKeys.YarnTimeOutConfig);
@@ -24,6 +24,8 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli.Options
             options.VirtualEnvironmentName = this.GetStringValue(SettingsKeys.PythonVirtualEnvironmentName);
             options.CustomBuildCommand = this.GetStringValue(SettingsKeys.CustomBuildCommand);
             options.CustomRequirementsTxtPath = this.GetStringValue(SettingsKeys.CustomRequirementsTxtPath);
+            options.StreamInstallOutput = this.GetBooleanValue(SettingsKeys.PythonStreamInstallOutput);
+            options.PrecompileBytecode = this.GetBooleanValue(SettingsKeys.PythonPrecompileBytecode);
         }
     }
 }
@@ -28,6 +28,7 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
             var infoOption = new Option<bool>(aliases: new[] { "-i", "--info" }, "Print more detailed version information.");
             rootCommand.AddCommand(BuildCommand.Export(console));
             rootCommand.AddCommand(BuildScriptCommand.Export(console));
+            rootCommand.AddCommand(BuildWorkerCommand.Export(console));
             rootCommand.AddCommand(BuildpackBuildCommand.Export(console));
             rootCommand.AddCommand(BuildpackDetectCommand.Export(console));
             rootCommand.AddCommand(DetectCommand.Export(console));
@@ -56,9 +56,11 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
         public const string MavenDefaultVersion = "MAVEN_DEFAULT_VERSION";
         public const string Project = "PROJECT";
         public const string MSBuildConfiguration = "MSBUILD_CONFIGURATION";
+        public const string DotNetPublishReadyToRun = "DOTNET_PUBLISH_READYTORUN";
         public const string DisableCollectStatic = "DISABLE_COLLECTSTATIC";
         public const string RequiredOsPackages = "REQUIRED_OS_PACKAGES";
         public const string PruneDevDependencies = "PRUNE_DEV_DEPENDENCIES";
+        public const string PruneDevDependenciesWithHardlinks = "PRUNE_DEV_DEPENDENCIES_WITH_HARDLINKS";
         public const string NpmRegistryUrl = "NPM_REGISTRY_URL";
         public const string EnableNodeMonorepoBuild = "ENABLE_NODE_MONOREPO_BUILD";
         public const string YarnTimeOutConfig = "YARN_TIMEOUT_CONFIG";
@@ -68,8 +70,16 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
         public const string AppType = "ORYX_APP_TYPE";
         public const string BuildCommandsFileName = "BUILDCOMMANDS_FILE";
         public const string DynamicInstallRootDir = "DYNAMIC_INSTALL_ROOT_DIR";
+        public const string DynamicInstallParallelism = "DYNAMIC_INSTALL_PARALLELISM";
+        public const string SdkMetadataCacheDir = "ORYX_SDK_METADATA_CACHE_DIR";
+        public const string SdkMetadataCacheTtl = "ORYX_SDK_METADATA_CACHE_TTL";
+        public const string SdkMetadataOffline = "ORYX_SDK_METADATA_OFFLINE";
+        public const string DependencyCacheDir = "ORYX_DEPENDENCY_CACHE_DIR";
+        public const string DependencyLayerCacheDir = "ORYX_DEPENDENCY_LAYER_CACHE_DIR";
         public const string DisableRecursiveLookUp = "DISABLE_RECURSIVE_LOOKUP";
         public const string CustomRequirementsTxtPath = "CUSTOM_REQUIREMENTSTXT_PATH";
+        public const string PythonStreamInstallOutput = "PYTHON_STREAM_INSTALL_OUTPUT";
+        public const string PythonPrecompileBytecode = "PYTHON_PRECOMPILE_BYTECODE";
         public const string OsFlavor = "OS_FLAVOR";
         public const string DebianFlavor = "DEBIAN_FLAVOR";
         public const string CallerId = "CALLER_ID";
@@ -85,5 +95,16 @@ namespace Microsoft.Oryx.BuildScriptGeneratorCli
 
         // Detection
         public const string SkipPlatformDetection = "SKIP_PLATFORM_DETECTION";
+        public const string DetectorExcludedDirectories = "DETECTOR_EXCLUDED_DIRS";
+        public const string EnableParallelDetection = "ENABLE_PARALLEL_DETECTION";
+        public const string DetectionCacheDirectory = "DETECTION_CACHE_DIR";
+
+        // Copying files
+        public const string CopyVerify = "ORYX_COPY_VERIFY";
+        public const string CopyLinkMode = "ORYX_COPY_LINK_MODE";
+        public const string CopyParallelism = "ORYX_COPY_PARALLELISM";
+
+        // Tracing
+        public const string BuildTraceFile = "ORYX_BUILD_TRACE_FILE";
     }
 }
@@ -3,9 +3,16 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.Linq;
+using System.Text;
 using System.Threading.Tasks;
 using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Http.Features;
 using Microsoft.AspNetCore.Mvc;
+using Microsoft.Net.Http.Headers;
 using Microsoft.Oryx.BuildServer.Exceptions;
 using Microsoft.Oryx.BuildServer.Models;
 using Microsoft.Oryx.BuildServer.Services;
@@ -16,11 +23,31 @@ namespace Microsoft.Oryx.BuildServer.Controllers
     [ApiController]
     public class BuildController : ControllerBase
     {
+        private const int MaxPageSize = 500;
+
+        private const string EventStreamContentType = "text/event-stream";
+
         private readonly IBuildService buildService;
+        private readonly IBuildLogReader buildLogReader;
 
-        public BuildController(IBuildService buildService)
+        public BuildController(IBuildService buildService, IBuildLogReader buildLogReader)
         {
             this.buildService = buildService;
+            this.buildLogReader = buildLogReader;
+        }
+
+        // GET api/<Builds>?offset=0&limit=50
+        [HttpGet]
+        [ProducesResponseType(typeof(IEnumerable<Build>), StatusCodes.Status200OK)]
+        public async Task<IActionResult> GetAllAsync([FromQuery] int offset = 0, [FromQuery] int limit = 50)
+        {
+            if (offset < 0 || limit < 1 || limit > MaxPageSize)
+            {
+                return this.BadRequest(string.Format(
+                    "'offset' must not be negative and 'limit' must be between 1 and {0}", MaxPageSize));
+            }
+
+            return this.Ok(await this.buildService.GetBuildsAsync(offset, limit));
         }
 
         // GET api/<Builds>/5
@@ -37,6 +64,59 @@ namespace Microsoft.Oryx.BuildServer.Controllers
             return this.Ok(build);
         }
 
+        // GET api/<Builds>/5/logs?offset=0
+        [HttpGet("{id}/logs")]
+        [Produces("text/plain", EventStreamContentType)]
+        public async Task<IActionResult> GetLogsAsync(string id, [FromQuery] long? offset = null)
+        {
+            var build = await this.buildService.GetBuildAsync(id);
+            if (build == null)
+            {
+                return this.NotFound();
+            }
+
+            var resumeOffset = offset ?? this.GetResumeOffset();
+            if (resumeOffset < 0)
+            {
+                return this.BadRequest("'offset' must not be negative");
+            }
+
+            var useServerSentEvents = this.Request.Headers[HeaderNames.Accept]
+                .Any(value => value.Contains(EventStreamContentType, StringComparison.OrdinalIgnoreCase));
+            if (resumeOffset > 0 && !useServerSentEvents)
+            {
+                this.Response.StatusCode = StatusCodes.Status206PartialContent;
+            }
+
+            this.Response.ContentType = useServerSentEvents ? EventStreamContentType : "text/plain; charset=utf-8";
+            this.Response.Headers[HeaderNames.CacheControl] = "no-cache";
+            this.HttpContext.Features.Get<IHttpResponseBodyFeature>()?.DisableBuffering();
+
+            var requestAborted = this.HttpContext.RequestAborted;
+            try
+            {
+                await foreach (var chunk in this.buildLogReader.ReadAsync(id, resumeOffset, requestAborted))
+                {
+                    var text = useServerSentEvents ? FormatServerSentEvent(chunk) : chunk.Text;
+                    await this.Response.WriteAsync(text, requestAborted);
+                    await this.Response.Body.FlushAsync(requestAborted);
+                }
+
+                if (useServerSentEvents)
+                {
+                    // Tells the client that the build has finished, so that it does not reconnect.
+                    var finishedBuild = await this.buildService.GetBuildAsync(id);
+                    await this.Response.WriteAsync($"event: end\ndata: {finishedBuild?.Status}\n\n", requestAborted);
+                }
+            }
+            catch (OperationCanceledException) when (requestAborted.IsCancellationRequested)
+            {
+                // The client has stopped following the log.
+            }
+
+            return new EmptyResult();
+        }
+
         // POST api/<Builds>
         [HttpPost]
         [ProducesResponseType(typeof(Build), StatusCodes.Status201Created)]
@@ -48,10 +128,89 @@ namespace Microsoft.Oryx.BuildServer.Controllers
                 string uri = string.Format("api/builds/{0}", createdBuild.Id);
                 return this.Created(uri, createdBuild);
             }
+            catch (BuildQueueFullException ex)
+            {
+                this.Response.Headers["Retry-After"] =
+                    ((int)ex.RetryAfter.TotalSeconds).ToString(CultureInfo.InvariantCulture);
+                return this.StatusCode(StatusCodes.Status429TooManyRequests, ex.Message);
+            }
             catch (ServiceException ex)
             {
                 return this.BadRequest(ex.Message);
             }
         }
+
+        // DELETE api/<Builds>/5
+        [HttpDelete("{id}")]
+        [ProducesResponseType(typeof(Build), StatusCodes.Status200OK)]
+        public async Task<IActionResult> DeleteAsync(string id)
+        {
+            try
+            {
+                var build = await this.buildService.CancelBuildAsync(id);
+                if (build == null)
+                {
+                    return this.NotFound();
+                }
+
+                return this.Ok(build);
+            }
+            catch (ServiceException ex)
+            {
+                return this.Conflict(ex.Message);
+            }
+        }
+
+        // GET api/<Builds>/metrics
+        [HttpGet("metrics")]
+        [ProducesResponseType(typeof(BuildQueueMetrics), StatusCodes.Status200OK)]
+        public IActionResult GetMetrics()
+        {
+            return this.Ok(this.buildService.GetQueueMetrics());
+        }
+
+        /// <summary>
+        /// Formats a chunk of the log as a server-sent event whose id is the offset to resume from, which clients
+        /// send back in the 'Last-Event-ID' header when reconnecting.
+        /// </summary>
+        private static string FormatServerSentEvent(BuildLogChunk chunk)
+        {
+            var serverSentEvent = new StringBuilder();
+            foreach (var line in chunk.Text.TrimEnd('\n').Split('\n'))
+            {
+                serverSentEvent.Append("data: ").Append(line.TrimEnd('\r')).Append('\n');
+            }
+
+            serverSentEvent.Append("id: ").Append(chunk.NextOffset.ToString(CultureInfo.InvariantCulture)).Append("\n\n");
+            return serverSentEvent.ToString();
+        }
+
+        /// <summary>
+        /// Gets the offset to resume reading the log from, from the 'Last-Event-ID' header of a reconnecting
+        /// server-sent events client or from a 'Range: bytes=N-' header.
+        /// </summary>
+        private long GetResumeOffset()
+        {
+            if (long.TryParse(
+                this.Request.Headers["Last-Event-ID"].ToString(),
+                NumberStyles.None,
+                CultureInfo.InvariantCulture,
+                out var lastEventId))
+            {
+                return lastEventId;
+            }
+
+            var range = this.Request.GetTypedHeaders().Range;
+            if (range != null && range.Unit == "bytes" && range.Ranges.Count == 1)
+            {
+                var byteRange = range.Ranges.First();
+                if (byteRange.From.HasValue && !byteRange.To.HasValue)
+                {
+                    return byteRange.From.Value;
+                }
+            }
+
+            return 0;
+        }
     }
 }
@@ -0,0 +1,20 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+
+namespace Microsoft.Oryx.BuildServer.Exceptions
+{
+    public class BuildQueueFullException : ServiceException
+    {
+        public BuildQueueFullException(string message, TimeSpan retryAfter)
+            : base(message)
+        {
+            this.RetryAfter = retryAfter;
+        }
+
+        public TimeSpan RetryAfter { get; }
+    }
+}
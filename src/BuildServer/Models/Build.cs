@@ -20,5 +20,11 @@ namespace Microsoft.Oryx.BuildServer.Models
         public string OutputPath { get; set; }
 
         public string LogPath { get; set; }
+
+        /// <summary>
+        /// Gets or sets the priority of the build. Queued builds of higher priority run first, and builds of the
+        /// same priority in the order they were queued.
+        /// </summary>
+        public int Priority { get; set; }
     }
 }
@@ -0,0 +1,22 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+namespace Microsoft.Oryx.BuildServer.Models
+{
+    public class BuildLogChunk
+    {
+        /// <summary>
+        /// Gets or sets complete lines of the build log, each ending with a line feed except for the last line of a
+        /// finished build.
+        /// </summary>
+        public string Text { get; set; }
+
+        /// <summary>
+        /// Gets or sets the offset in bytes, from the start of the log, of the end of the chunk, from which reading
+        /// can be resumed.
+        /// </summary>
+        public long NextOffset { get; set; }
+    }
+}
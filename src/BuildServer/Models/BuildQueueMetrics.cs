@@ -0,0 +1,34 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+namespace Microsoft.Oryx.BuildServer.Models
+{
+    public class BuildQueueMetrics
+    {
+        public int MaxConcurrentBuilds { get; set; }
+
+        public int MaxQueueLength { get; set; }
+
+        public int QueueDepth { get; set; }
+
+        public int RunningBuilds { get; set; }
+
+        public long CompletedBuilds { get; set; }
+
+        public long FailedBuilds { get; set; }
+
+        public long CancelledBuilds { get; set; }
+
+        public long RejectedBuilds { get; set; }
+
+        public double AverageWaitTimeInSeconds { get; set; }
+
+        public double MaxWaitTimeInSeconds { get; set; }
+
+        public double AverageRunTimeInSeconds { get; set; }
+
+        public double MaxRunTimeInSeconds { get; set; }
+    }
+}
@@ -3,15 +3,29 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.Diagnostics;
 using System.IO;
+using System.Threading.Channels;
+using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
 
 namespace Microsoft.Oryx.BuildServer.Models
 {
-    public class FileOutputHandler
+    /// <summary>
+    /// Writes the output of a build to its log file. Lines are queued and written in batches by a background task,
+    /// so that the build process is not slowed down by the disk, and flushed at least every
+    /// <see cref="FlushInterval"/> so that the log can be followed while the build runs.
+    /// </summary>
+    public sealed class FileOutputHandler : IDisposable
     {
+        internal const int MaxQueuedLines = 10000;
+
+        internal static readonly TimeSpan FlushInterval = TimeSpan.FromSeconds(1);
+
         private readonly ILogger logger;
+        private readonly Channel<string> lines;
+        private readonly Task writerTask;
 
         private StreamWriter fileStream;
 
@@ -19,14 +33,94 @@ namespace Microsoft.Oryx.BuildServer.Models
         {
             this.fileStream = filestream;
             this.logger = logger;
+            this.lines = Channel.CreateBounded<string>(new BoundedChannelOptions(MaxQueuedLines)
+            {
+                SingleReader = true,
+                FullMode = BoundedChannelFullMode.Wait,
+            });
+            this.writerTask = Task.Run(this.WriteLinesAsync);
         }
 
         public void Handle(object sendingProcess, DataReceivedEventArgs outLine)
         {
-            if (!string.IsNullOrEmpty(outLine.Data))
+            this.WriteLine(outLine.Data);
+        }
+
+        /// <summary>
+        /// Writes the queued lines to the log file and closes it.
+        /// </summary>
+        public void Dispose()
+        {
+            if (this.fileStream == null)
+            {
+                return;
+            }
+
+            this.lines.Writer.TryComplete();
+            this.writerTask.GetAwaiter().GetResult();
+            this.fileStream.Dispose();
+            this.fileStream = null;
+        }
+
+        internal void WriteLine(string line)
+        {
+            if (string.IsNullOrEmpty(line))
+            {
+                return;
+            }
+
+            if (!this.lines.Writer.TryWrite(line))
             {
-                this.fileStream.Write(outLine.Data + "\n");
-                this.logger.LogInformation(outLine.Data);
+                try
+                {
+                    // The queue is full because the disk cannot keep up, so the build waits rather than losing output.
+                    this.lines.Writer.WriteAsync(line).AsTask().GetAwaiter().GetResult();
+                }
+                catch (ChannelClosedException)
+                {
+                    // The log file could not be written, which has already been logged.
+                }
+            }
+        }
+
+        private async Task WriteLinesAsync()
+        {
+            try
+            {
+                await this.WriteQueuedLinesAsync();
+            }
+            catch (IOException ex)
+            {
+                this.logger.LogError(ex, "Failed to write the build log");
+                this.lines.Writer.TryComplete(ex);
+            }
+        }
+
+        private async Task WriteQueuedLinesAsync()
+        {
+            var logLines = this.logger.IsEnabled(LogLevel.Debug);
+            var sinceFlush = Stopwatch.StartNew();
+            var reader = this.lines.Reader;
+            while (await reader.WaitToReadAsync())
+            {
+                while (reader.TryRead(out var line))
+                {
+                    await this.fileStream.WriteAsync(line + "\n");
+                    if (logLines)
+                    {
+                        this.logger.LogDebug(line);
+                    }
+
+                    if (sinceFlush.Elapsed >= FlushInterval)
+                    {
+                        await this.fileStream.FlushAsync();
+                        sinceFlush.Restart();
+                    }
+                }
+
+                // Nothing more to write for now, so the lines written so far are made visible to readers of the log.
+                await this.fileStream.FlushAsync();
+                sinceFlush.Restart();
             }
         }
     }
@@ -0,0 +1,445 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Oryx.BuildServer.Exceptions;
+using Microsoft.Oryx.BuildServer.Models;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace Microsoft.Oryx.BuildServer.Repositories
+{
+    /// <summary>
+    /// Stores builds in an append-only log of JSON lines, each holding the latest state of a build or its deletion,
+    /// and serves them from an in-memory index by id. Inserts and updates append a single line instead of
+    /// rewriting all the builds. The log is rewritten with only the latest state of the retained builds once most
+    /// of its lines are stale.
+    /// </summary>
+    public class AppendLogBuildRepository : IRepository, IDisposable
+    {
+        internal const string LogFileName = "builds.log";
+        internal const string LegacyStoreFileName = "builds.json";
+        internal const string MigratedLegacyStoreFileSuffix = ".migrated";
+
+        private const string PutOperation = "put";
+        private const string DeleteOperation = "delete";
+
+        private static readonly string[] FinishedStatuses = { "COMPLETED", "FAILED", "CANCELLED" };
+
+        private readonly object syncRoot = new object();
+        private readonly Dictionary<string, IndexEntry> index = new Dictionary<string, IndexEntry>();
+
+        // Builds in the order they were inserted, for pagination. Deleted builds are skipped, and removed when the
+        // log is compacted.
+        private readonly List<IndexEntry> insertionOrder = new List<IndexEntry>();
+
+        private readonly string logFilePath;
+        private readonly TimeSpan retentionPeriod;
+        private readonly int compactionThreshold;
+        private readonly ILogger<AppendLogBuildRepository> logger;
+        private readonly Func<DateTime> utcNow;
+        private StreamWriter logWriter;
+        private int logEntryCount;
+
+        // Set when the log has lines which could not be loaded, such as a line torn by a crash while appending it,
+        // so that it is rewritten before the next line is appended after them.
+        private bool hasInvalidLines;
+
+        public AppendLogBuildRepository(BuildRepositoryOptions options, ILogger<AppendLogBuildRepository> logger)
+            : this(options, logger, () => DateTime.UtcNow)
+        {
+        }
+
+        internal AppendLogBuildRepository(
+            BuildRepositoryOptions options,
+            ILogger<AppendLogBuildRepository> logger,
+            Func<DateTime> utcNow)
+        {
+            this.logger = logger;
+            this.utcNow = utcNow;
+            this.logFilePath = Path.Combine(options.StoreDirectory, LogFileName);
+            this.retentionPeriod = options.RetentionDays > 0 ? TimeSpan.FromDays(options.RetentionDays) : TimeSpan.Zero;
+            this.compactionThreshold = options.CompactionThreshold;
+            Directory.CreateDirectory(options.StoreDirectory);
+
+            var legacyStoreFilePath = Path.Combine(options.StoreDirectory, LegacyStoreFileName);
+            if (File.Exists(this.logFilePath))
+            {
+                this.Load();
+            }
+            else if (File.Exists(legacyStoreFilePath))
+            {
+                this.MigrateLegacyStore(legacyStoreFilePath);
+            }
+
+            // Applies the retention period and drops the stale lines left since the last compaction.
+            this.Compact();
+        }
+
+        public Task<Build> InsertAsync(Build build)
+        {
+            lock (this.syncRoot)
+            {
+                if (this.index.ContainsKey(build.Id))
+                {
+                    throw new IntegrityException(string.Format("Build with id {0} already present", build.Id));
+                }
+
+                var entry = new IndexEntry { Build = Clone(build) };
+                this.Append(PutOperation, build.Id, entry.Build);
+                entry.UpdatedAt = this.utcNow();
+                this.index[build.Id] = entry;
+                this.insertionOrder.Add(entry);
+                return Task.FromResult(build);
+            }
+        }
+
+        public Task<IEnumerable<Build>> GetAllAsync()
+        {
+            lock (this.syncRoot)
+            {
+                IEnumerable<Build> builds = this.insertionOrder
+                    .Where(entry => !entry.IsDeleted)
+                    .Select(entry => Clone(entry.Build))
+                    .ToList();
+                return Task.FromResult(builds);
+            }
+        }
+
+        public Task<IEnumerable<Build>> GetPageAsync(int offset, int limit)
+        {
+            lock (this.syncRoot)
+            {
+                // Most recent builds first.
+                var builds = new List<Build>();
+                var skipped = 0;
+                for (var i = this.insertionOrder.Count - 1; i >= 0 && builds.Count < limit; i--)
+                {
+                    var entry = this.insertionOrder[i];
+                    if (entry.IsDeleted)
+                    {
+                        continue;
+                    }
+
+                    if (skipped < offset)
+                    {
+                        skipped++;
+                        continue;
+                    }
+
+                    builds.Add(Clone(entry.Build));
+                }
+
+                return Task.FromResult<IEnumerable<Build>>(builds);
+            }
+        }
+
+        public Task<Build> UpdateAsync(Build build)
+        {
+            lock (this.syncRoot)
+            {
+                if (!this.index.TryGetValue(build.Id, out var entry))
+                {
+                    throw new OperationFailedException("Update Failed");
+                }
+
+                var updatedBuild = Clone(build);
+                this.Append(PutOperation, build.Id, updatedBuild);
+                entry.Build = updatedBuild;
+                entry.UpdatedAt = this.utcNow();
+                this.CompactIfMostlyStale();
+                return Task.FromResult(build);
+            }
+        }
+
+        public Build GetById(string id)
+        {
+            lock (this.syncRoot)
+            {
+                return this.index.TryGetValue(id, out var entry) ? Clone(entry.Build) : null;
+            }
+        }
+
+        public Task DeleteAsync(string id)
+        {
+            lock (this.syncRoot)
+            {
+                if (!this.index.TryGetValue(id, out var entry))
+                {
+                    throw new OperationFailedException("Delete Failed");
+                }
+
+                this.Append(DeleteOperation, id, build: null);
+                entry.IsDeleted = true;
+                this.index.Remove(id);
+                this.CompactIfMostlyStale();
+                return Task.CompletedTask;
+            }
+        }
+
+        public void Dispose()
+        {
+            lock (this.syncRoot)
+            {
+                this.logWriter?.Dispose();
+                this.logWriter = null;
+            }
+        }
+
+        private static Build Clone(Build build)
+        {
+            // Callers change the builds they get, which must not change the stored builds until they are updated.
+            return JsonConvert.DeserializeObject<Build>(JsonConvert.SerializeObject(build));
+        }
+
+        private static bool EndsWithLineFeed(string path)
+        {
+            using (var stream = new FileStream(path, FileMode.Open, FileAccess.Read, FileShare.ReadWrite))
+            {
+                if (stream.Length == 0)
+                {
+                    return true;
+                }
+
+                stream.Seek(-1, SeekOrigin.End);
+                return stream.ReadByte() == '\n';
+            }
+        }
+
+        private void Load()
+        {
+            var lineNumber = 0;
+            foreach (var line in File.ReadLines(this.logFilePath))
+            {
+                lineNumber++;
+                LogEntry logEntry;
+                try
+                {
+                    logEntry = JsonConvert.DeserializeObject<LogEntry>(line);
+                }
+                catch (JsonException ex)
+                {
+                    // The last line is incomplete if the server stopped while appending it.
+                    this.logger.LogWarning(
+                        ex,
+                        "Ignoring invalid line {lineNumber} of build log {logFilePath}",
+                        lineNumber,
+                        this.logFilePath);
+                    this.hasInvalidLines = true;
+                    continue;
+                }
+
+                if (logEntry?.Id == null)
+                {
+                    this.hasInvalidLines = true;
+                    continue;
+                }
+
+                this.logEntryCount++;
+                this.ApplyLoadedEntry(logEntry);
+            }
+
+            if (!this.hasInvalidLines && !EndsWithLineFeed(this.logFilePath))
+            {
+                // The last line is complete, but the line feed after it was not written.
+                this.hasInvalidLines = true;
+            }
+
+            this.logger.LogInformation(
+                "Loaded {buildCount} builds from {logEntryCount} entries of {logFilePath}",
+                this.index.Count,
+                this.logEntryCount,
+                this.logFilePath);
+        }
+
+        private void ApplyLoadedEntry(LogEntry logEntry)
+        {
+            if (logEntry.Operation == DeleteOperation)
+            {
+                if (this.index.TryGetValue(logEntry.Id, out var deletedEntry))
+                {
+                    deletedEntry.IsDeleted = true;
+                    this.index.Remove(logEntry.Id);
+                }
+            }
+            else if (logEntry.Build != null)
+            {
+                if (this.index.TryGetValue(logEntry.Id, out var entry))
+                {
+                    entry.Build = logEntry.Build;
+                    entry.UpdatedAt = logEntry.Timestamp;
+                }
+                else
+                {
+                    entry = new IndexEntry { Build = logEntry.Build, UpdatedAt = logEntry.Timestamp };
+                    this.index[logEntry.Id] = entry;
+                    this.insertionOrder.Add(entry);
+                }
+            }
+        }
+
+        private void MigrateLegacyStore(string legacyStoreFilePath)
+        {
+            // JsonFlatFileDataStore keeps the builds in an array under the name of their collection.
+            var legacyStore = JObject.Parse(File.ReadAllText(legacyStoreFilePath));
+            var migratedBuildCount = 0;
+            var migrationTime = this.utcNow();
+            foreach (var collection in legacyStore.Properties().Select(p => p.Value).OfType<JArray>())
+            {
+                foreach (var item in collection.OfType<JObject>())
+                {
+                    var build = item.ToObject<Build>();
+                    if (build?.Id == null || this.index.ContainsKey(build.Id))
+                    {
+                        continue;
+                    }
+
+                    var entry = new IndexEntry { Build = build, UpdatedAt = migrationTime };
+                    this.index[build.Id] = entry;
+                    this.insertionOrder.Add(entry);
+                    migratedBuildCount++;
+                }
+            }
+
+            // Writes the log before renaming the legacy store, so that a failed migration is retried on the next
+            // start.
+            this.WriteLog();
+            File.Move(legacyStoreFilePath, legacyStoreFilePath + MigratedLegacyStoreFileSuffix, overwrite: true);
+            this.logger.LogInformation(
+                "Migrated {buildCount} builds from {legacyStoreFilePath} to {logFilePath}",
+                migratedBuildCount,
+                legacyStoreFilePath,
+                this.logFilePath);
+        }
+
+        // Must be called while holding the lock.
+        private void Append(string operation, string id, Build build)
+        {
+            if (this.logWriter == null)
+            {
+                this.logWriter = this.OpenLogForAppend();
+            }
+
+            var logEntry = new LogEntry
+            {
+                Operation = operation,
+                Id = id,
+                Timestamp = this.utcNow(),
+                Build = build,
+            };
+            this.logWriter.Write(JsonConvert.SerializeObject(logEntry, Formatting.None) + "\n");
+            this.logEntryCount++;
+        }
+
+        // Must be called while holding the lock.
+        private void CompactIfMostlyStale()
+        {
+            if (this.logEntryCount > this.compactionThreshold && this.logEntryCount > 2 * this.index.Count)
+            {
+                this.Compact();
+            }
+        }
+
+        // Must be called while holding the lock, or from the constructor.
+        private void Compact()
+        {
+            var expiredBuildCount = 0;
+            if (this.retentionPeriod > TimeSpan.Zero)
+            {
+                var expiryTime = this.utcNow() - this.retentionPeriod;
+                foreach (var entry in this.insertionOrder.Where(entry => !entry.IsDeleted))
+                {
+                    if (entry.UpdatedAt < expiryTime && FinishedStatuses.Contains(entry.Build.Status))
+                    {
+                        entry.IsDeleted = true;
+                        this.index.Remove(entry.Build.Id);
+                        expiredBuildCount++;
+                    }
+                }
+            }
+
+            this.insertionOrder.RemoveAll(entry => entry.IsDeleted);
+            if (expiredBuildCount == 0
+                && this.logEntryCount == this.index.Count
+                && !this.hasInvalidLines
+                && File.Exists(this.logFilePath))
+            {
+                return;
+            }
+
+            this.WriteLog();
+            this.logger.LogInformation(
+                "Compacted {logFilePath} to {buildCount} builds, removing {expiredBuildCount} expired builds",
+                this.logFilePath,
+                this.index.Count,
+                expiredBuildCount);
+        }
+
+        // Rewrites the log with the latest state of every build, replacing the current log atomically.
+        private void WriteLog()
+        {
+            this.logWriter?.Dispose();
+            this.logWriter = null;
+
+            var tempFilePath = this.logFilePath + ".tmp";
+            using (var writer = new StreamWriter(tempFilePath, append: false))
+            {
+                foreach (var entry in this.insertionOrder.Where(entry => !entry.IsDeleted))
+                {
+                    var logEntry = new LogEntry
+                    {
+                        Operation = PutOperation,
+                        Id = entry.Build.Id,
+                        Timestamp = entry.UpdatedAt,
+                        Build = entry.Build,
+                    };
+                    writer.Write(JsonConvert.SerializeObject(logEntry, Formatting.None) + "\n");
+                }
+
+                writer.Flush();
+                ((FileStream)writer.BaseStream).Flush(flushToDisk: true);
+            }
+
+            File.Move(tempFilePath, this.logFilePath, overwrite: true);
+            this.logEntryCount = this.index.Count;
+            this.hasInvalidLines = false;
+        }
+
+        private StreamWriter OpenLogForAppend()
+        {
+            var stream = new FileStream(this.logFilePath, FileMode.Append, FileAccess.Write, FileShare.Read);
+            return new StreamWriter(stream) { AutoFlush = true };
+        }
+
+        private class IndexEntry
+        {
+            public Build Build { get; set; }
+
+            public DateTime UpdatedAt { get; set; }
+
+            public bool IsDeleted { get; set; }
+        }
+
+        private class LogEntry
+        {
+            [JsonProperty("op")]
+            public string Operation { get; set; }
+
+            [JsonProperty("id")]
+            public string Id { get; set; }
+
+            [JsonProperty("at")]
+            public DateTime Timestamp { get; set; }
+
+            [JsonProperty("build", NullValueHandling = NullValueHandling.Ignore)]
+            public Build Build { get; set; }
+        }
+    }
+}
@@ -30,6 +30,13 @@ namespace Microsoft.Oryx.BuildServer.Repositories
             return this.collection.Find(x => true);
         }
 
+#pragma warning disable CS1998 // Keep asynchronous for backwards-compatibility
+        public async Task<IEnumerable<Build>> GetPageAsync(int offset, int limit)
+#pragma warning restore CS1998
+        {
+            return this.collection.AsQueryable().Reverse().Skip(offset).Take(limit).ToList();
+        }
+
         public Build GetById(string id)
         {
             var build = this.collection.Find(x => x.Id == id).FirstOrDefault();
@@ -51,6 +58,14 @@ namespace Microsoft.Oryx.BuildServer.Repositories
             throw new OperationFailedException("Insert Failed");
         }
 
+        public async Task DeleteAsync(string id)
+        {
+            if (!await this.collection.DeleteOneAsync(id))
+            {
+                throw new OperationFailedException("Delete Failed");
+            }
+        }
+
         public async Task<Build> UpdateAsync(Build build)
         {
             if (await this.collection.UpdateOneAsync(build.Id, build))
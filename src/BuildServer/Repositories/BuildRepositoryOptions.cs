@@ -0,0 +1,38 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+namespace Microsoft.Oryx.BuildServer.Repositories
+{
+    /// <summary>
+    /// Options of the build repository, read from the 'BuildRepository' configuration section, e.g. from the
+    /// 'BuildRepository__RetentionDays' environment variable.
+    /// </summary>
+    public class BuildRepositoryOptions
+    {
+        public const string AppendLogBackend = "AppendLog";
+
+        public const string JsonFileBackend = "JsonFile";
+
+        /// <summary>
+        /// Gets or sets the backend storing the builds: 'AppendLog', the default, or 'JsonFile', the single JSON
+        /// file used by earlier versions.
+        /// </summary>
+        public string Backend { get; set; } = AppendLogBackend;
+
+        public string StoreDirectory { get; set; } = "/store";
+
+        /// <summary>
+        /// Gets or sets the number of days after which completed, failed and cancelled builds are removed when the
+        /// log is compacted, or 0 to keep them.
+        /// </summary>
+        public int RetentionDays { get; set; } = 30;
+
+        /// <summary>
+        /// Gets or sets the minimum number of entries of the log before it is compacted. The log is compacted once
+        /// it holds more than twice as many entries as there are builds.
+        /// </summary>
+        public int CompactionThreshold { get; set; } = 1000;
+    }
+}
@@ -15,8 +15,16 @@ namespace Microsoft.Oryx.BuildServer.Repositories
 
         public Task<IEnumerable<Build>> GetAllAsync();
 
+        /// <summary>
+        /// Gets up to <paramref name="limit"/> builds, most recently inserted first, skipping the first
+        /// <paramref name="offset"/> ones.
+        /// </summary>
+        public Task<IEnumerable<Build>> GetPageAsync(int offset, int limit);
+
         public Task<Build> UpdateAsync(Build build);
 
         public Build GetById(string id);
+
+        public Task DeleteAsync(string id);
     }
 }
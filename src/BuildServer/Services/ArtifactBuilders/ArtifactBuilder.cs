@@ -3,9 +3,11 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.Diagnostics;
 using System.IO;
 using System.Text.RegularExpressions;
+using System.Threading;
 using Microsoft.Extensions.Logging;
 using Microsoft.Oryx.BuildServer.Models;
 
@@ -22,17 +24,18 @@ namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
 
         public bool Build(Build build)
         {
-            // TODO: improve validation by using semantic versioning,
-            // absolute path regex, platform names in a set.
-            var logFilePath = this.ValidateParameter($"{build.LogPath}/{build.Id}.log");
-            var sourcePath = this.ValidateParameter(build.SourcePath);
-            var outputPath = this.ValidateParameter($"{build.OutputPath}/{build.Id}");
-            var platform = this.ValidateParameter(build.Platform);
-            var version = this.ValidateParameter(build.Version);
-            Directory.CreateDirectory(outputPath);
-            var cmd = $"oryx build {sourcePath} --log-file {logFilePath} " +
-                $"--output {outputPath} --platform {platform} " +
-                $"--platform-version {version}";
+            return this.Build(build, CancellationToken.None);
+        }
+
+        public bool Build(Build build, CancellationToken cancellationToken)
+        {
+            if (cancellationToken.IsCancellationRequested)
+            {
+                return false;
+            }
+
+            var arguments = this.PrepareBuild(build, out var logFilePath);
+            var cmd = $"oryx build {string.Join(" ", arguments)}";
             cmd = cmd.Replace("'", "\\'");
             var process = new Process()
             {
@@ -50,12 +53,18 @@ namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
             {
                 process.Start();
                 this.logger.LogInformation($"Process has started for command: {cmd}");
-                var outputHandler = new FileOutputHandler(new StreamWriter(logFilePath), this.logger);
-                process.OutputDataReceived += outputHandler.Handle;
-                process.ErrorDataReceived += outputHandler.Handle;
-                process.BeginOutputReadLine();
-                process.BeginErrorReadLine();
-                process.WaitForExit();
+                using (var outputHandler = new FileOutputHandler(new StreamWriter(logFilePath), this.logger))
+                {
+                    process.OutputDataReceived += outputHandler.Handle;
+                    process.ErrorDataReceived += outputHandler.Handle;
+                    process.BeginOutputReadLine();
+                    process.BeginErrorReadLine();
+                    using (cancellationToken.Register(() => this.KillProcessTree(process, build)))
+                    {
+                        // Also waits for the end of the output, so that all of it is in the log once it is closed.
+                        process.WaitForExit();
+                    }
+                }
 
                 return process.ExitCode == 0;
             }
@@ -65,6 +74,48 @@ namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
             }
         }
 
+        /// <summary>
+        /// Validates the parameters of the build, creates its output directory, and returns the arguments of the
+        /// 'oryx build' command which runs it.
+        /// </summary>
+        internal string[] PrepareBuild(Build build, out string logFilePath)
+        {
+            // TODO: improve validation by using semantic versioning,
+            // absolute path regex, platform names in a set.
+            logFilePath = this.ValidateParameter(BuildLogReader.GetLogFilePath(build));
+            var sourcePath = this.ValidateParameter(build.SourcePath);
+            var outputPath = this.ValidateParameter($"{build.OutputPath}/{build.Id}");
+            var platform = this.ValidateParameter(build.Platform);
+            var version = this.ValidateParameter(build.Version);
+            Directory.CreateDirectory(outputPath);
+            return new[]
+            {
+                sourcePath,
+                "--log-file",
+                logFilePath,
+                "--output",
+                outputPath,
+                "--platform",
+                platform,
+                "--platform-version",
+                version,
+            };
+        }
+
+        private void KillProcessTree(Process process, Build build)
+        {
+            try
+            {
+                // 'oryx build' runs the build script, which runs the package managers, so all of them are killed.
+                process.Kill(entireProcessTree: true);
+                this.logger.LogInformation($"Killed the processes of cancelled build {build.Id}");
+            }
+            catch (InvalidOperationException)
+            {
+                // The process has already exited.
+            }
+        }
+
         private string ValidateParameter(string parameter)
         {
             Regex regex = new Regex(@"^[a-zA-Z0-9./\-_]*$");
@@ -3,6 +3,7 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System.Threading;
 using Microsoft.Oryx.BuildServer.Models;
 
 namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
@@ -10,5 +11,10 @@ namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
     public interface IArtifactBuilder
     {
         bool Build(Build build);
+
+        /// <summary>
+        /// Runs the build, killing all of its processes if the cancellation token is cancelled.
+        /// </summary>
+        bool Build(Build build, CancellationToken cancellationToken);
     }
 }
@@ -0,0 +1,151 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.Net.Sockets;
+using System.Threading;
+using Newtonsoft.Json;
+
+namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
+{
+    /// <summary>
+    /// A long-lived 'oryx build-worker' process, which runs the builds it is sent over a Unix domain socket one at a
+    /// time. The frames exchanged with it are described in the 'BuildWorkerCommand' class of the Oryx CLI.
+    /// </summary>
+    public sealed class OryxWorker : IDisposable
+    {
+        internal const string OutputFramePrefix = "out:";
+        internal const string ErrorFramePrefix = "err:";
+        internal const string ExitFramePrefix = "exit:";
+
+        private static readonly TimeSpan ConnectRetryInterval = TimeSpan.FromMilliseconds(50);
+
+        private readonly Process process;
+
+        internal OryxWorker(string socketPath, Process process)
+        {
+            this.SocketPath = socketPath;
+            this.process = process;
+        }
+
+        public string SocketPath { get; }
+
+        public int BuildCount { get; private set; }
+
+        public bool IsAlive => this.process == null || !this.process.HasExited;
+
+        public static OryxWorker Start(string socketDirectory)
+        {
+            Directory.CreateDirectory(socketDirectory);
+            var socketPath = Path.Combine(socketDirectory, $"{Guid.NewGuid():N}.sock");
+            var process = new Process
+            {
+                StartInfo = new ProcessStartInfo
+                {
+                    FileName = "oryx",
+                    ArgumentList = { "build-worker", "--socket", socketPath },
+
+                    // The worker stops once its standard input is closed, i.e. once the server stops.
+                    RedirectStandardInput = true,
+                    UseShellExecute = false,
+                    CreateNoWindow = true,
+                },
+            };
+            process.Start();
+            return new OryxWorker(socketPath, process);
+        }
+
+        /// <summary>
+        /// Connects to the worker, waiting for it to listen if it has just been started.
+        /// </summary>
+        public Socket Connect(TimeSpan timeout)
+        {
+            var stopwatch = Stopwatch.StartNew();
+            while (true)
+            {
+                var socket = new Socket(AddressFamily.Unix, SocketType.Stream, ProtocolType.Unspecified);
+                try
+                {
+                    socket.Connect(new UnixDomainSocketEndPoint(this.SocketPath));
+                    return socket;
+                }
+                catch (SocketException) when (stopwatch.Elapsed < timeout && this.IsAlive)
+                {
+                    socket.Dispose();
+                    Thread.Sleep(ConnectRetryInterval);
+                }
+                catch
+                {
+                    socket.Dispose();
+                    throw;
+                }
+            }
+        }
+
+        /// <summary>
+        /// Runs a build with the given arguments of the 'oryx build' command on a connection to the worker, killing
+        /// the worker and all of the processes of the build if the cancellation token is cancelled.
+        /// </summary>
+        /// <returns>The exit code of the build.</returns>
+        /// <exception cref="IOException">If the connection to the worker is lost during the build.</exception>
+        public int RunBuild(
+            Socket connection,
+            IEnumerable<string> arguments,
+            Action<string> onOutputLine,
+            CancellationToken cancellationToken)
+        {
+            using (var stream = new NetworkStream(connection, ownsSocket: true))
+            using (var reader = new StreamReader(stream))
+            using (var writer = new StreamWriter(stream))
+            using (cancellationToken.Register(this.Kill))
+            {
+                writer.WriteLine(JsonConvert.SerializeObject(arguments));
+                writer.Flush();
+
+                string frame;
+                while ((frame = reader.ReadLine()) != null)
+                {
+                    if (frame.StartsWith(OutputFramePrefix, StringComparison.Ordinal))
+                    {
+                        onOutputLine(frame.Substring(OutputFramePrefix.Length));
+                    }
+                    else if (frame.StartsWith(ErrorFramePrefix, StringComparison.Ordinal))
+                    {
+                        onOutputLine(frame.Substring(ErrorFramePrefix.Length));
+                    }
+                    else if (frame.StartsWith(ExitFramePrefix, StringComparison.Ordinal))
+                    {
+                        this.BuildCount++;
+                        return int.Parse(frame.Substring(ExitFramePrefix.Length));
+                    }
+                }
+            }
+
+            throw new IOException($"Build worker '{this.SocketPath}' closed the connection during the build");
+        }
+
+        public void Kill()
+        {
+            try
+            {
+                this.process?.Kill(entireProcessTree: true);
+            }
+            catch (InvalidOperationException)
+            {
+                // The process has already exited.
+            }
+        }
+
+        public void Dispose()
+        {
+            this.Kill();
+            this.process?.Dispose();
+            File.Delete(this.SocketPath);
+        }
+    }
+}
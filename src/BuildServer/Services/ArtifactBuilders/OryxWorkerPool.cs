@@ -0,0 +1,131 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Concurrent;
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+
+namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
+{
+    /// <summary>
+    /// Keeps warm 'oryx build-worker' processes, so that builds do not pay for the startup of the Oryx CLI.
+    /// </summary>
+    public sealed class OryxWorkerPool : IDisposable
+    {
+        private readonly ConcurrentBag<OryxWorker> idleWorkers = new ConcurrentBag<OryxWorker>();
+        private readonly Func<OryxWorker> startWorker;
+        private readonly int poolSize;
+        private readonly int maxBuildsPerWorker;
+        private readonly ILogger<OryxWorkerPool> logger;
+
+        public OryxWorkerPool(IOptions<BuildRunnerOptions> options, ILogger<OryxWorkerPool> logger)
+            : this(
+                  () => OryxWorker.Start(Path.Combine(Path.GetTempPath(), "oryx-workers")),
+                  options.Value.GetMaxConcurrentBuilds(),
+                  options.Value.MaxBuildsPerWorker,
+                  logger)
+        {
+        }
+
+        internal OryxWorkerPool(
+            Func<OryxWorker> startWorker,
+            int poolSize,
+            int maxBuildsPerWorker,
+            ILogger<OryxWorkerPool> logger)
+        {
+            this.startWorker = startWorker;
+            this.poolSize = poolSize;
+            this.maxBuildsPerWorker = maxBuildsPerWorker;
+            this.logger = logger;
+        }
+
+        internal int IdleWorkerCount => this.idleWorkers.Count;
+
+        /// <summary>
+        /// Starts a worker for each build slot in the background, so that the first builds do not wait for them.
+        /// </summary>
+        public void WarmUp()
+        {
+            Task.Run(() =>
+            {
+                for (var i = this.idleWorkers.Count; i < this.poolSize; i++)
+                {
+                    var worker = this.TryStartWorker();
+                    if (worker == null)
+                    {
+                        return;
+                    }
+
+                    this.idleWorkers.Add(worker);
+                }
+            });
+        }
+
+        /// <summary>
+        /// Takes an idle worker, or starts a new one if there is none.
+        /// </summary>
+        public OryxWorker Acquire()
+        {
+            while (this.idleWorkers.TryTake(out var worker))
+            {
+                if (worker.IsAlive)
+                {
+                    return worker;
+                }
+
+                worker.Dispose();
+            }
+
+            return this.startWorker();
+        }
+
+        /// <summary>
+        /// Returns a worker to the pool once its build has completed, or stops it if it cannot run more builds, in
+        /// which case a replacement is started in the background.
+        /// </summary>
+        public void Release(OryxWorker worker, bool isReusable)
+        {
+            if (isReusable && worker.IsAlive && worker.BuildCount < this.maxBuildsPerWorker)
+            {
+                this.idleWorkers.Add(worker);
+                return;
+            }
+
+            worker.Dispose();
+            Task.Run(() =>
+            {
+                var replacement = this.TryStartWorker();
+                if (replacement != null)
+                {
+                    this.idleWorkers.Add(replacement);
+                }
+            });
+        }
+
+        public void Dispose()
+        {
+            while (this.idleWorkers.TryTake(out var worker))
+            {
+                worker.Dispose();
+            }
+        }
+
+        private OryxWorker TryStartWorker()
+        {
+            try
+            {
+                return this.startWorker();
+            }
+            catch (Exception ex)
+            {
+                this.logger.LogWarning(ex, "Failed to start a build worker");
+                return null;
+            }
+        }
+    }
+}
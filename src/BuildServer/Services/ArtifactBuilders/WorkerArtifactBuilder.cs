@@ -0,0 +1,91 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.ComponentModel;
+using System.IO;
+using System.Net.Sockets;
+using System.Threading;
+using Microsoft.Extensions.Logging;
+using Microsoft.Oryx.BuildServer.Models;
+
+namespace Microsoft.Oryx.BuildServer.Services.ArtifactBuilders
+{
+    /// <summary>
+    /// Runs builds on the warm workers of an <see cref="OryxWorkerPool"/>, falling back to a new 'oryx build'
+    /// process if no worker can be reached.
+    /// </summary>
+    public class WorkerArtifactBuilder : IArtifactBuilder
+    {
+        private static readonly TimeSpan ConnectTimeout = TimeSpan.FromSeconds(30);
+
+        private readonly OryxWorkerPool workerPool;
+        private readonly ArtifactBuilder processBuilder;
+        private readonly ILogger<WorkerArtifactBuilder> logger;
+
+        public WorkerArtifactBuilder(
+            OryxWorkerPool workerPool,
+            ArtifactBuilder processBuilder,
+            ILogger<WorkerArtifactBuilder> logger)
+        {
+            this.workerPool = workerPool;
+            this.processBuilder = processBuilder;
+            this.logger = logger;
+        }
+
+        public bool Build(Build build)
+        {
+            return this.Build(build, CancellationToken.None);
+        }
+
+        public bool Build(Build build, CancellationToken cancellationToken)
+        {
+            if (cancellationToken.IsCancellationRequested)
+            {
+                return false;
+            }
+
+            var arguments = this.processBuilder.PrepareBuild(build, out var logFilePath);
+            OryxWorker worker = null;
+            Socket connection;
+            try
+            {
+                worker = this.workerPool.Acquire();
+                connection = worker.Connect(ConnectTimeout);
+            }
+            catch (Exception ex) when (ex is SocketException || ex is Win32Exception || ex is IOException)
+            {
+                this.logger.LogWarning(ex, $"No build worker is available, running build {build.Id} in a new process");
+                if (worker != null)
+                {
+                    this.workerPool.Release(worker, isReusable: false);
+                }
+
+                return this.processBuilder.Build(build, cancellationToken);
+            }
+
+            var isReusable = false;
+            try
+            {
+                this.logger.LogInformation($"Running build {build.Id} on build worker '{worker.SocketPath}'");
+                using (var outputHandler = new FileOutputHandler(new StreamWriter(logFilePath), this.logger))
+                {
+                    var exitCode = worker.RunBuild(connection, arguments, outputHandler.WriteLine, cancellationToken);
+                    isReusable = !cancellationToken.IsCancellationRequested;
+                    return exitCode == 0;
+                }
+            }
+            catch (IOException ex)
+            {
+                this.logger.LogError(ex, $"Build worker '{worker.SocketPath}' failed during build {build.Id}");
+                return false;
+            }
+            finally
+            {
+                this.workerPool.Release(worker, isReusable);
+            }
+        }
+    }
+}
@@ -0,0 +1,156 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Runtime.CompilerServices;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Oryx.BuildServer.Models;
+using Microsoft.Oryx.BuildServer.Repositories;
+
+namespace Microsoft.Oryx.BuildServer.Services
+{
+    public class BuildLogReader : IBuildLogReader
+    {
+        internal const int BufferSize = 64 * 1024;
+
+        private static readonly string[] UnfinishedStatuses = { "QUEUED", "IN_PROGRESS" };
+
+        private readonly IRepository buildRepository;
+        private readonly TimeSpan pollInterval;
+
+        public BuildLogReader(IRepository buildRepository)
+            : this(buildRepository, TimeSpan.FromMilliseconds(250))
+        {
+        }
+
+        internal BuildLogReader(IRepository buildRepository, TimeSpan pollInterval)
+        {
+            this.buildRepository = buildRepository;
+            this.pollInterval = pollInterval;
+        }
+
+        public static string GetLogFilePath(Build build)
+        {
+            return $"{build.LogPath}/{build.Id}.log";
+        }
+
+        public async IAsyncEnumerable<BuildLogChunk> ReadAsync(
+            string buildId,
+            long offset,
+            [EnumeratorCancellation] CancellationToken cancellationToken)
+        {
+            var buffer = new byte[BufferSize];
+            var pending = new MemoryStream();
+            FileStream logStream = null;
+            try
+            {
+                while (true)
+                {
+                    // The status is read before the log, so that all the output of a finished build is read before
+                    // the end of the log is reported.
+                    var build = this.buildRepository.GetById(buildId);
+                    var isFinished = build == null || !UnfinishedStatuses.Contains(build.Status);
+                    if (logStream == null && build != null)
+                    {
+                        logStream = OpenLog(GetLogFilePath(build), offset);
+                    }
+
+                    if (logStream != null)
+                    {
+                        int bytesRead;
+                        while ((bytesRead = await logStream.ReadAsync(buffer, 0, buffer.Length, cancellationToken)) > 0)
+                        {
+                            pending.Write(buffer, 0, bytesRead);
+                            var chunk = TakeCompleteLines(pending, ref offset, includePartialLine: false);
+                            if (chunk != null)
+                            {
+                                yield return chunk;
+                            }
+                        }
+                    }
+
+                    if (isFinished)
+                    {
+                        var lastChunk = TakeCompleteLines(pending, ref offset, includePartialLine: true);
+                        if (lastChunk != null)
+                        {
+                            yield return lastChunk;
+                        }
+
+                        yield break;
+                    }
+
+                    await Task.Delay(this.pollInterval, cancellationToken);
+                }
+            }
+            finally
+            {
+                logStream?.Dispose();
+            }
+        }
+
+        private static FileStream OpenLog(string logFilePath, long offset)
+        {
+            try
+            {
+                var logStream = new FileStream(
+                    logFilePath,
+                    FileMode.Open,
+                    FileAccess.Read,
+                    FileShare.ReadWrite | FileShare.Delete,
+                    BufferSize,
+                    useAsync: true);
+                logStream.Seek(offset, SeekOrigin.Begin);
+                return logStream;
+            }
+            catch (FileNotFoundException)
+            {
+                // The build has not started yet.
+                return null;
+            }
+            catch (DirectoryNotFoundException)
+            {
+                return null;
+            }
+        }
+
+        /// <summary>
+        /// Removes the complete lines from the start of the pending bytes, so that chunks never end in the middle of
+        /// a line or of a multi-byte character.
+        /// </summary>
+        private static BuildLogChunk TakeCompleteLines(MemoryStream pending, ref long offset, bool includePartialLine)
+        {
+            var length = (int)pending.Length;
+            if (length == 0)
+            {
+                return null;
+            }
+
+            var bytes = pending.GetBuffer();
+            var chunkLength = includePartialLine ? length : Array.LastIndexOf(bytes, (byte)'\n', length - 1, length) + 1;
+            if (chunkLength <= 0)
+            {
+                return null;
+            }
+
+            var chunk = new BuildLogChunk
+            {
+                Text = Encoding.UTF8.GetString(bytes, 0, chunkLength),
+                NextOffset = offset + chunkLength,
+            };
+            offset = chunk.NextOffset;
+
+            var remainingLength = length - chunkLength;
+            Buffer.BlockCopy(bytes, chunkLength, bytes, 0, remainingLength);
+            pending.SetLength(remainingLength);
+            return chunk;
+        }
+    }
+}
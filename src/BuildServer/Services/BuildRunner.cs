@@ -4,34 +4,303 @@
 // --------------------------------------------------------------------------------------------
 
 using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
 using System.Threading.Tasks;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
+using Microsoft.Oryx.BuildServer.Exceptions;
 using Microsoft.Oryx.BuildServer.Models;
 using Microsoft.Oryx.BuildServer.Services.ArtifactBuilders;
 
 namespace Microsoft.Oryx.BuildServer.Services
 {
+    /// <summary>
+    /// Runs builds on a bounded number of slots. Builds wait for a free slot in a queue ordered by priority, and
+    /// then by arrival, which is itself bounded so that a burst of requests is rejected instead of piling up.
+    /// </summary>
     public class BuildRunner : IBuildRunner
     {
-        public void RunInBackground(IArtifactBuilder builder, Build build, Callback successCallback, Callback failureCallback)
+        private readonly object syncRoot = new object();
+
+        // Keyed by the negated priority and an arrival sequence number, so that the first entry is the next build.
+        private readonly SortedDictionary<(int Priority, long Sequence), QueuedBuild> queue =
+            new SortedDictionary<(int Priority, long Sequence), QueuedBuild>();
+
+        private readonly Dictionary<string, QueuedBuild> queuedBuilds = new Dictionary<string, QueuedBuild>();
+        private readonly Dictionary<string, CancellationTokenSource> runningBuilds =
+            new Dictionary<string, CancellationTokenSource>();
+
+        // Running builds whose artifact builder has returned, which can no longer be cancelled.
+        private readonly HashSet<string> finishingBuilds = new HashSet<string>();
+
+        private readonly ILogger<BuildRunner> logger;
+        private readonly int maxConcurrentBuilds;
+        private readonly int maxQueueLength;
+        private readonly int defaultRetryAfterSeconds;
+        private readonly BuildQueueMetrics metrics;
+        private long sequence;
+        private long startedBuilds;
+        private double totalWaitTimeInSeconds;
+        private long finishedBuilds;
+        private double totalRunTimeInSeconds;
+
+        public BuildRunner(IOptions<BuildRunnerOptions> options, ILogger<BuildRunner> logger)
+        {
+            this.logger = logger;
+            this.maxConcurrentBuilds = options.Value.GetMaxConcurrentBuilds();
+            this.maxQueueLength = Math.Max(0, options.Value.MaxQueueLength);
+            this.defaultRetryAfterSeconds = Math.Max(1, options.Value.DefaultRetryAfterSeconds);
+            this.metrics = new BuildQueueMetrics
+            {
+                MaxConcurrentBuilds = this.maxConcurrentBuilds,
+                MaxQueueLength = this.maxQueueLength,
+            };
+            this.logger.LogInformation(
+                "Running up to {maxConcurrentBuilds} builds at a time, with up to {maxQueueLength} queued builds",
+                this.maxConcurrentBuilds,
+                this.maxQueueLength);
+        }
+
+        public void RunInBackground(
+            IArtifactBuilder builder,
+            Build build,
+            Callback startCallback,
+            Callback successCallback,
+            Callback failureCallback,
+            Callback cancelCallback)
+        {
+            lock (this.syncRoot)
+            {
+                // Builds only wait in the queue when all the slots are taken.
+                if (this.runningBuilds.Count >= this.maxConcurrentBuilds && this.queue.Count >= this.maxQueueLength)
+                {
+                    this.metrics.RejectedBuilds++;
+                    throw new BuildQueueFullException(
+                        string.Format(
+                            "Build queue is full, {0} builds are running and {1} are queued",
+                            this.runningBuilds.Count,
+                            this.queue.Count),
+                        this.GetRetryAfter());
+                }
+
+                var queuedBuild = new QueuedBuild
+                {
+                    Key = (-build.Priority, this.sequence++),
+                    Builder = builder,
+                    Build = build,
+                    StartCallback = startCallback,
+                    SuccessCallback = successCallback,
+                    FailureCallback = failureCallback,
+                    CancelCallback = cancelCallback,
+                    WaitTime = Stopwatch.StartNew(),
+                };
+                this.queue.Add(queuedBuild.Key, queuedBuild);
+                this.queuedBuilds[build.Id] = queuedBuild;
+                this.StartQueuedBuilds();
+            }
+        }
+
+        public bool Cancel(string buildId)
+        {
+            lock (this.syncRoot)
+            {
+                if (this.queuedBuilds.TryGetValue(buildId, out var queuedBuild))
+                {
+                    this.queue.Remove(queuedBuild.Key);
+                    this.queuedBuilds.Remove(buildId);
+                    this.metrics.CancelledBuilds++;
+                    return true;
+                }
+
+                if (this.runningBuilds.TryGetValue(buildId, out var cancellationTokenSource)
+                    && !this.finishingBuilds.Contains(buildId))
+                {
+                    cancellationTokenSource.Cancel();
+                    return true;
+                }
+
+                return false;
+            }
+        }
+
+        public BuildQueueMetrics GetMetrics()
         {
-            _ = Task.Run(() =>
+            lock (this.syncRoot)
+            {
+                return new BuildQueueMetrics
+                {
+                    MaxConcurrentBuilds = this.metrics.MaxConcurrentBuilds,
+                    MaxQueueLength = this.metrics.MaxQueueLength,
+                    QueueDepth = this.queue.Count,
+                    RunningBuilds = this.runningBuilds.Count,
+                    CompletedBuilds = this.metrics.CompletedBuilds,
+                    FailedBuilds = this.metrics.FailedBuilds,
+                    CancelledBuilds = this.metrics.CancelledBuilds,
+                    RejectedBuilds = this.metrics.RejectedBuilds,
+                    AverageWaitTimeInSeconds = this.startedBuilds > 0
+                        ? this.totalWaitTimeInSeconds / this.startedBuilds : 0,
+                    MaxWaitTimeInSeconds = this.metrics.MaxWaitTimeInSeconds,
+                    AverageRunTimeInSeconds = this.finishedBuilds > 0
+                        ? this.totalRunTimeInSeconds / this.finishedBuilds : 0,
+                    MaxRunTimeInSeconds = this.metrics.MaxRunTimeInSeconds,
+                };
+            }
+        }
+
+        // Must be called while holding the lock.
+        private void StartQueuedBuilds()
+        {
+            while (this.runningBuilds.Count < this.maxConcurrentBuilds && this.queue.Count > 0)
+            {
+                var queuedBuild = this.queue.First().Value;
+                this.queue.Remove(queuedBuild.Key);
+                this.queuedBuilds.Remove(queuedBuild.Build.Id);
+
+                var waitTimeInSeconds = queuedBuild.WaitTime.Elapsed.TotalSeconds;
+                this.startedBuilds++;
+                this.totalWaitTimeInSeconds += waitTimeInSeconds;
+                this.metrics.MaxWaitTimeInSeconds = Math.Max(this.metrics.MaxWaitTimeInSeconds, waitTimeInSeconds);
+
+                var cancellationTokenSource = new CancellationTokenSource();
+                this.runningBuilds[queuedBuild.Build.Id] = cancellationTokenSource;
+                _ = Task.Run(() => this.RunAsync(queuedBuild, cancellationTokenSource.Token));
+            }
+        }
+
+        private async Task RunAsync(QueuedBuild queuedBuild, CancellationToken cancellationToken)
+        {
+            var build = queuedBuild.Build;
+            var runTime = Stopwatch.StartNew();
+            var succeeded = false;
+            try
+            {
+                if (queuedBuild.StartCallback != null && !cancellationToken.IsCancellationRequested)
+                {
+                    await queuedBuild.StartCallback(build);
+                }
+
+                // A build cancelled while it was being started may have had its cancelled status overwritten by
+                // the start callback, so it is marked as cancelled again instead of being run.
+                if (cancellationToken.IsCancellationRequested)
+                {
+                    if (queuedBuild.CancelCallback != null)
+                    {
+                        await this.TryInvokeCallbackAsync(queuedBuild.CancelCallback, build);
+                    }
+
+                    return;
+                }
+
+                succeeded = queuedBuild.Builder.Build(build, cancellationToken);
+                if (this.TryMarkFinishing(build.Id, cancellationToken))
+                {
+                    await (succeeded ? queuedBuild.SuccessCallback : queuedBuild.FailureCallback)(build);
+                }
+            }
+            catch (Exception ex)
+            {
+                succeeded = false;
+                this.logger.LogError(ex, "Build {buildId} failed", build.Id);
+                if (this.TryMarkFinishing(build.Id, cancellationToken))
+                {
+                    await this.TryInvokeCallbackAsync(queuedBuild.FailureCallback, build);
+                }
+            }
+            finally
+            {
+                lock (this.syncRoot)
                 {
-                    try
+                    if (this.runningBuilds.TryGetValue(build.Id, out var cancellationTokenSource))
+                    {
+                        this.runningBuilds.Remove(build.Id);
+                        cancellationTokenSource.Dispose();
+                    }
+
+                    this.finishingBuilds.Remove(build.Id);
+
+                    if (cancellationToken.IsCancellationRequested)
                     {
-                        if (builder.Build(build))
-                        {
-                            _ = successCallback(build);
-                        }
-                        else
-                        {
-                            _ = failureCallback(build);
-                        }
+                        this.metrics.CancelledBuilds++;
                     }
-                    catch (Exception ex)
+                    else if (succeeded)
                     {
-                        Console.WriteLine(ex);
+                        this.metrics.CompletedBuilds++;
                     }
-                });
+                    else
+                    {
+                        this.metrics.FailedBuilds++;
+                    }
+
+                    var runTimeInSeconds = runTime.Elapsed.TotalSeconds;
+                    this.finishedBuilds++;
+                    this.totalRunTimeInSeconds += runTimeInSeconds;
+                    this.metrics.MaxRunTimeInSeconds = Math.Max(this.metrics.MaxRunTimeInSeconds, runTimeInSeconds);
+                    this.StartQueuedBuilds();
+                }
+            }
+        }
+
+        // Marks the build as finishing unless it has been cancelled, so that a later cancel is refused instead of
+        // overwriting the status stored by the success or failure callback.
+        private bool TryMarkFinishing(string buildId, CancellationToken cancellationToken)
+        {
+            lock (this.syncRoot)
+            {
+                if (cancellationToken.IsCancellationRequested)
+                {
+                    return false;
+                }
+
+                this.finishingBuilds.Add(buildId);
+                return true;
+            }
+        }
+
+        private async Task TryInvokeCallbackAsync(Callback callback, Build build)
+        {
+            try
+            {
+                await callback(build);
+            }
+            catch (Exception ex)
+            {
+                this.logger.LogError(ex, "Could not update the status of build {buildId}", build.Id);
+            }
+        }
+
+        // Must be called while holding the lock. A slot is expected to free up after the average run time divided
+        // by the number of slots.
+        private TimeSpan GetRetryAfter()
+        {
+            if (this.finishedBuilds == 0)
+            {
+                return TimeSpan.FromSeconds(this.defaultRetryAfterSeconds);
+            }
+
+            var averageRunTimeInSeconds = this.totalRunTimeInSeconds / this.finishedBuilds;
+            return TimeSpan.FromSeconds(Math.Max(1, Math.Ceiling(averageRunTimeInSeconds / this.maxConcurrentBuilds)));
+        }
+
+        private class QueuedBuild
+        {
+            public (int Priority, long Sequence) Key { get; set; }
+
+            public IArtifactBuilder Builder { get; set; }
+
+            public Build Build { get; set; }
+
+            public Callback StartCallback { get; set; }
+
+            public Callback SuccessCallback { get; set; }
+
+            public Callback FailureCallback { get; set; }
+
+            public Callback CancelCallback { get; set; }
+
+            public Stopwatch WaitTime { get; set; }
         }
     }
 }
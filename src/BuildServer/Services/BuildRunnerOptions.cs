@@ -0,0 +1,68 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+
+namespace Microsoft.Oryx.BuildServer.Services
+{
+    /// <summary>
+    /// Limits of the build queue, read from the 'BuildRunner' configuration section, e.g. from the
+    /// 'BuildRunner__MaxConcurrentBuilds' environment variable.
+    /// </summary>
+    public class BuildRunnerOptions
+    {
+        /// <summary>
+        /// Gets or sets the number of builds which run at the same time. If not set, it is the number of CPUs,
+        /// capped by the number of builds which fit in the memory available to the server.
+        /// </summary>
+        public int MaxConcurrentBuilds { get; set; }
+
+        /// <summary>
+        /// Gets or sets the number of builds which can wait for a free slot. Further builds are rejected.
+        /// </summary>
+        public int MaxQueueLength { get; set; } = 100;
+
+        /// <summary>
+        /// Gets or sets the memory used by a single build, used to size the number of concurrent builds.
+        /// </summary>
+        public int MemoryPerBuildInMB { get; set; } = 1024;
+
+        /// <summary>
+        /// Gets or sets the delay after which a rejected build should be retried, used until the run time of
+        /// builds is known.
+        /// </summary>
+        public int DefaultRetryAfterSeconds { get; set; } = 30;
+
+        /// <summary>
+        /// Gets or sets a value indicating whether builds run in long-lived 'oryx build-worker' processes, which
+        /// are started ahead of time, rather than in a new 'oryx build' process each.
+        /// </summary>
+        public bool UseBuildWorkers { get; set; } = true;
+
+        /// <summary>
+        /// Gets or sets the number of builds after which a build worker is replaced by a new one, which bounds the
+        /// memory held by its caches.
+        /// </summary>
+        public int MaxBuildsPerWorker { get; set; } = 50;
+
+        public int GetMaxConcurrentBuilds()
+        {
+            if (this.MaxConcurrentBuilds > 0)
+            {
+                return this.MaxConcurrentBuilds;
+            }
+
+            // Honors the memory limit of the container.
+            var availableMemoryInMB = GC.GetGCMemoryInfo().TotalAvailableMemoryBytes / (1024 * 1024);
+            var maxConcurrentBuilds = Environment.ProcessorCount;
+            if (availableMemoryInMB > 0 && this.MemoryPerBuildInMB > 0)
+            {
+                maxConcurrentBuilds = (int)Math.Min(maxConcurrentBuilds, availableMemoryInMB / this.MemoryPerBuildInMB);
+            }
+
+            return Math.Max(1, maxConcurrentBuilds);
+        }
+    }
+}
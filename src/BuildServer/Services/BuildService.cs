@@ -3,7 +3,9 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System.Collections.Generic;
 using System.Threading.Tasks;
+using Microsoft.Oryx.BuildServer.Exceptions;
 using Microsoft.Oryx.BuildServer.Models;
 using Microsoft.Oryx.BuildServer.Repositories;
 using Microsoft.Oryx.BuildServer.Services.ArtifactBuilders;
@@ -25,13 +27,50 @@ namespace Microsoft.Oryx.BuildServer.Services
 
         public async Task<Build> StartBuildAsync(Build build)
         {
-            build.Status = "IN_PROGRESS";
+            build.Status = "QUEUED";
             await this.buildRepository.InsertAsync(build);
             var artifactBuilder = this.artifactBuilderFactory.CreateArtifactBuilder(build);
-            this.buildRunner.RunInBackground(artifactBuilder, build, this.MarkCompletedAsync, this.MarkFailedAsync);
+            try
+            {
+                this.buildRunner.RunInBackground(
+                    artifactBuilder,
+                    build,
+                    this.MarkInProgressAsync,
+                    this.MarkCompletedAsync,
+                    this.MarkFailedAsync,
+                    this.MarkCancelledAsync);
+            }
+            catch (BuildQueueFullException)
+            {
+                // Forget the rejected build, so that it can be submitted again with the same id.
+                await this.buildRepository.DeleteAsync(build.Id);
+                throw;
+            }
+
             return build;
         }
 
+        public async Task<Build> CancelBuildAsync(string id)
+        {
+            var build = this.buildRepository.GetById(id);
+            if (build == null)
+            {
+                return null;
+            }
+
+            if (!this.buildRunner.Cancel(id))
+            {
+                throw new ServiceException(string.Format("Build with id {0} is not queued or running", id));
+            }
+
+            return await this.MarkCancelledAsync(build);
+        }
+
+        public BuildQueueMetrics GetQueueMetrics()
+        {
+            return this.buildRunner.GetMetrics();
+        }
+
 #pragma warning disable CS1998 // Keep asynchronous for backwards-compatibility
         public async Task<Build> GetBuildAsync(string id)
 #pragma warning restore CS1998
@@ -40,6 +79,11 @@ namespace Microsoft.Oryx.BuildServer.Services
             return build;
         }
 
+        public Task<IEnumerable<Build>> GetBuildsAsync(int offset, int limit)
+        {
+            return this.buildRepository.GetPageAsync(offset, limit);
+        }
+
         public async Task<Build> MarkCancelledAsync(Build build)
         {
             build.Status = "CANCELLED";
@@ -47,6 +91,13 @@ namespace Microsoft.Oryx.BuildServer.Services
             return build;
         }
 
+        public async Task<Build> MarkInProgressAsync(Build build)
+        {
+            build.Status = "IN_PROGRESS";
+            await this.buildRepository.UpdateAsync(build);
+            return build;
+        }
+
         public async Task<Build> MarkCompletedAsync(Build build)
         {
             build.Status = "COMPLETED";
@@ -0,0 +1,21 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.Collections.Generic;
+using System.Threading;
+using Microsoft.Oryx.BuildServer.Models;
+
+namespace Microsoft.Oryx.BuildServer.Services
+{
+    public interface IBuildLogReader
+    {
+        /// <summary>
+        /// Reads the log of a build from the given offset in bytes, in chunks of complete lines. While the build is
+        /// queued or running, waits for more of its output, and ends once the build has finished and all of its log
+        /// has been read.
+        /// </summary>
+        IAsyncEnumerable<BuildLogChunk> ReadAsync(string buildId, long offset, CancellationToken cancellationToken);
+    }
+}
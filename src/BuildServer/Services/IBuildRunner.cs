@@ -13,6 +13,26 @@ namespace Microsoft.Oryx.BuildServer.Services
 
     public interface IBuildRunner
     {
-        void RunInBackground(IArtifactBuilder builder, Build build, Callback successCallback, Callback failureCallback);
+        /// <summary>
+        /// Queues the build, which runs once a slot is free, builds of higher priority first. The cancel callback
+        /// is called if the build is cancelled before it starts running, after its start callback has returned.
+        /// </summary>
+        /// <exception cref="Exceptions.BuildQueueFullException">If the queue is full.</exception>
+        void RunInBackground(
+            IArtifactBuilder builder,
+            Build build,
+            Callback startCallback,
+            Callback successCallback,
+            Callback failureCallback,
+            Callback cancelCallback);
+
+        /// <summary>
+        /// Removes the build from the queue or, if it is running, kills its processes. The callbacks of a cancelled
+        /// build, other than its cancel callback, are not called once it has been cancelled.
+        /// </summary>
+        /// <returns>False if the build is neither queued nor running, or if it has already finished running.</returns>
+        bool Cancel(string buildId);
+
+        BuildQueueMetrics GetMetrics();
     }
 }
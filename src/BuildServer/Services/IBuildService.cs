@@ -3,6 +3,7 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System.Collections.Generic;
 using System.Threading.Tasks;
 using Microsoft.Oryx.BuildServer.Models;
 
@@ -12,6 +13,17 @@ namespace Microsoft.Oryx.BuildServer.Services
     {
         Task<Build> StartBuildAsync(Build build);
 
+        /// <summary>
+        /// Cancels a queued or running build.
+        /// </summary>
+        /// <returns>The cancelled build, or null if there is no build with the id.</returns>
+        /// <exception cref="Exceptions.ServiceException">If the build is not queued or running.</exception>
+        Task<Build> CancelBuildAsync(string id);
+
+        BuildQueueMetrics GetQueueMetrics();
+
+        Task<Build> MarkInProgressAsync(Build build);
+
         Task<Build> MarkCompletedAsync(Build build);
 
         Task<Build> MarkCancelledAsync(Build build);
@@ -19,5 +31,7 @@ namespace Microsoft.Oryx.BuildServer.Services
         Task<Build> MarkFailedAsync(Build build);
 
         Task<Build> GetBuildAsync(string id);
+
+        Task<IEnumerable<Build>> GetBuildsAsync(int offset, int limit);
     }
 }
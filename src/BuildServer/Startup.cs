@@ -3,6 +3,7 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.IO;
 using JsonFlatFileDataStore;
 using Microsoft.AspNetCore.Builder;
@@ -31,20 +32,52 @@ namespace Microsoft.Oryx.BuildServer
         [System.Diagnostics.CodeAnalysis.SuppressMessage("Reliability", "CA2000:Dispose objects before losing scope", Justification = "Leaving undisposed object for backwards-compatibility.")]
         public void ConfigureServices(IServiceCollection services)
         {
-            string folderName = "/store";
-            if (!Directory.Exists(folderName))
+            var repositoryOptions = this.Configuration.GetSection("BuildRepository").Get<BuildRepositoryOptions>()
+                ?? new BuildRepositoryOptions();
+            if (!Directory.Exists(repositoryOptions.StoreDirectory))
             {
-                Directory.CreateDirectory(folderName);
+                Directory.CreateDirectory(repositoryOptions.StoreDirectory);
             }
 
-            var store = new DataStore("/store/builds.json", keyProperty: "id");
             services.AddHttpContextAccessor();
             services.AddMvc();
-            services.AddSingleton<IRepository>(x => new BuildRepository(store));
-            services.AddScoped<IArtifactBuilder, ArtifactBuilder>();
+            if (string.Equals(
+                repositoryOptions.Backend,
+                BuildRepositoryOptions.JsonFileBackend,
+                StringComparison.OrdinalIgnoreCase))
+            {
+                var store = new DataStore(
+                    Path.Combine(repositoryOptions.StoreDirectory, AppendLogBuildRepository.LegacyStoreFileName),
+                    keyProperty: "id");
+                services.AddSingleton<IRepository>(x => new BuildRepository(store));
+            }
+            else
+            {
+                services.AddSingleton<IRepository>(x => new AppendLogBuildRepository(
+                    repositoryOptions,
+                    x.GetRequiredService<ILogger<AppendLogBuildRepository>>()));
+            }
+
+            var runnerOptions = this.Configuration.GetSection("BuildRunner").Get<BuildRunnerOptions>()
+                ?? new BuildRunnerOptions();
+            if (runnerOptions.UseBuildWorkers)
+            {
+                services.AddSingleton<OryxWorkerPool>();
+                services.AddScoped<ArtifactBuilder>();
+                services.AddScoped<IArtifactBuilder, WorkerArtifactBuilder>();
+            }
+            else
+            {
+                services.AddScoped<IArtifactBuilder, ArtifactBuilder>();
+            }
+
             services.AddScoped<IArtifactBuilderFactory, ArtifactBuilderFactory>();
-            services.AddScoped<IBuildRunner, BuildRunner>();
+            services.Configure<BuildRunnerOptions>(this.Configuration.GetSection("BuildRunner"));
+
+            // A single runner, so that the limits apply to all the builds of the server.
+            services.AddSingleton<IBuildRunner, BuildRunner>();
             services.AddScoped<IBuildService, BuildService>();
+            services.AddSingleton<IBuildLogReader, BuildLogReader>();
             services.AddSingleton<IHttpContextAccessor, HttpContextAccessor>();
             services.AddSingleton<ILoggerFactory, LoggerFactory>();
             services.AddSingleton(typeof(ILogger<>), typeof(Logger<>));
@@ -59,6 +92,9 @@ namespace Microsoft.Oryx.BuildServer
                 app.UseDeveloperExceptionPage();
             }
 
+            // Starts the build workers while the server starts, rather than on the first builds.
+            app.ApplicationServices.GetService<OryxWorkerPool>()?.WarmUp();
+
             app.UseRouting();
 
             app.UseAuthorization();
@@ -4,7 +4,11 @@
 // --------------------------------------------------------------------------------------------
 
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading.Tasks;
 using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Options;
 
 namespace Microsoft.Oryx.Detector
 {
@@ -17,6 +21,8 @@ namespace Microsoft.Oryx.Detector
     {
         private readonly IEnumerable<IPlatformDetector> platformDetectors;
         private readonly ILogger<DefaultPlatformDetector> logger;
+        private readonly DetectorOptions options;
+        private readonly DetectionResultCache detectionResultCache;
 
         /// <summary>
         /// Initializes a new instance of the <see cref="DefaultPlatformDetector"/> class.
@@ -26,9 +32,32 @@ namespace Microsoft.Oryx.Detector
         public DefaultPlatformDetector(
             IEnumerable<IPlatformDetector> platformDetectors,
             ILogger<DefaultPlatformDetector> logger)
+            : this(platformDetectors, logger, Options.Create(new DetectorOptions()))
+        {
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="DefaultPlatformDetector"/> class.
+        /// </summary>
+        /// <param name="platformDetectors">List of <see cref="IPlatformDetector"/>.</param>
+        /// <param name="logger">The <see cref="ILogger{DefaultPlatformDetector}"/>.</param>
+        /// <param name="options">The <see cref="DetectorOptions"/>.</param>
+        public DefaultPlatformDetector(
+            IEnumerable<IPlatformDetector> platformDetectors,
+            ILogger<DefaultPlatformDetector> logger,
+            IOptions<DetectorOptions> options)
         {
             this.platformDetectors = platformDetectors;
             this.logger = logger;
+            this.options = options.Value;
+
+            if (!string.IsNullOrEmpty(this.options.DetectionCacheDirectory))
+            {
+                this.detectionResultCache = new DetectionResultCache(
+                    this.options.DetectionCacheDirectory,
+                    this.options,
+                    logger);
+            }
         }
 
         /// <inheritdoc />
@@ -36,14 +65,16 @@ namespace Microsoft.Oryx.Detector
         {
             var detectedPlatforms = new List<PlatformDetectorResult>();
 
-            foreach (var platformDetector in this.platformDetectors)
-            {
-                this.logger.LogDebug($"Detecting platform using '{platformDetector.GetType()}'...");
+            // The detectors only read the file system and are independent of each other, so when enabled they
+            // are run concurrently. The results are still consumed in the order in which the detectors were
+            // registered so that the output is the same as when running them one after another.
+            var platformResults = this.options.EnableParallelDetection
+                ? this.DetectInParallel(context)
+                : this.platformDetectors.Select(platformDetector => this.Detect(context, platformDetector));
 
-                if (this.IsDetectedPlatform(
-                    context,
-                    platformDetector,
-                    out PlatformDetectorResult platformResult))
+            foreach (var platformResult in platformResults)
+            {
+                if (this.IsDetectedPlatform(platformResult))
                 {
                     detectedPlatforms.Add(platformResult);
                 }
@@ -52,13 +83,36 @@ namespace Microsoft.Oryx.Detector
             return detectedPlatforms;
         }
 
-        private bool IsDetectedPlatform(
-            DetectorContext context,
-            IPlatformDetector platformDetector,
-            out PlatformDetectorResult platformResult)
+        private IEnumerable<PlatformDetectorResult> DetectInParallel(DetectorContext context)
+        {
+            var detectionTasks = this.platformDetectors
+                .Select(platformDetector => Task.Run(() => this.Detect(context, platformDetector)))
+                .ToList();
+
+            // Unwrap the results in order so that the exception, if any, of the first failing detector is
+            // rethrown as is instead of as an AggregateException.
+            return detectionTasks.Select(task => task.GetAwaiter().GetResult()).ToList();
+        }
+
+        private PlatformDetectorResult Detect(DetectorContext context, IPlatformDetector platformDetector)
         {
-            platformResult = platformDetector.Detect(context);
+            this.logger.LogDebug($"Detecting platform using '{platformDetector.GetType()}'...");
+
+            var stopwatch = Stopwatch.StartNew();
+            var platformResult = this.detectionResultCache != null
+                ? this.detectionResultCache.Detect(platformDetector, context)
+                : platformDetector.Detect(context);
+            stopwatch.Stop();
+
+            this.logger.LogInformation(
+                "Detector {detectorName} completed in {elapsedMilliseconds} ms",
+                platformDetector.GetType().Name,
+                stopwatch.Elapsed.TotalMilliseconds);
+            return platformResult;
+        }
 
+        private bool IsDetectedPlatform(PlatformDetectorResult platformResult)
+        {
             if (platformResult == null)
             {
                 this.logger.LogInformation("Could not detect any platform in the given repository.");
@@ -0,0 +1,199 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using Microsoft.Extensions.Logging;
+using Newtonsoft.Json;
+using Newtonsoft.Json.Linq;
+
+namespace Microsoft.Oryx.Detector
+{
+    /// <summary>
+    /// A persistent, on-disk cache of the results of <see cref="IPlatformDetector"/>s.
+    /// Every file read and every file system query a detector makes is recorded along with a fingerprint of its
+    /// outcome (for example the SHA-256 hash of the file content). A cached result is only returned when all of
+    /// these queries still give the same answers, so the cache is invalidated exactly when one of the files the
+    /// detector looked at changes, without re-parsing any of them.
+    /// </summary>
+    public class DetectionResultCache
+    {
+        /// <summary>
+        /// Bump this version whenever the format of the cache entries changes.
+        /// </summary>
+        private const int CacheFormatVersion = 1;
+
+        private readonly string cacheDirectory;
+        private readonly string optionsFingerprint;
+        private readonly ILogger logger;
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="DetectionResultCache"/> class.
+        /// </summary>
+        /// <param name="cacheDirectory">The directory under which the cache entries are stored.</param>
+        /// <param name="options">The <see cref="DetectorOptions"/> the detectors are run with.</param>
+        /// <param name="logger">The <see cref="ILogger"/>.</param>
+        public DetectionResultCache(string cacheDirectory, DetectorOptions options, ILogger logger)
+        {
+            this.cacheDirectory = cacheDirectory;
+            this.logger = logger;
+            this.optionsFingerprint = string.Join(
+                "\n",
+                JsonConvert.SerializeObject(options),
+                Environment.GetEnvironmentVariable(ParserHelper.MaxFileSizeEnvironmentVariable));
+        }
+
+        /// <summary>
+        /// Returns the cached result of running <paramref name="platformDetector"/> against the source repo of
+        /// the <paramref name="context"/> if none of its inputs changed, otherwise runs the detector and caches
+        /// its result.
+        /// </summary>
+        /// <param name="platformDetector">The <see cref="IPlatformDetector"/> to run.</param>
+        /// <param name="context">The <see cref="DetectorContext"/>.</param>
+        /// <returns>The result of the detection, which can be null.</returns>
+        public PlatformDetectorResult Detect(IPlatformDetector platformDetector, DetectorContext context)
+        {
+            var detectorName = platformDetector.GetType().Name;
+            var cacheFilePath = Path.Combine(
+                this.cacheDirectory,
+                $"{detectorName}-{this.GetCacheKey(platformDetector, context.SourceRepo)}.json");
+
+            if (this.TryGetCachedResult(cacheFilePath, platformDetector, context.SourceRepo, out var cachedResult))
+            {
+                this.logger.LogInformation("Using cached detection result for {detectorName}", detectorName);
+                return cachedResult;
+            }
+
+            var recordingSourceRepo = new RecordingSourceRepo(context.SourceRepo);
+            var result = platformDetector.Detect(new DetectorContext { SourceRepo = recordingSourceRepo });
+            this.TrySaveResult(cacheFilePath, result, recordingSourceRepo.Inputs);
+            return result;
+        }
+
+        private static string ComputeHash(string value)
+        {
+            using (var sha = SHA256.Create())
+            {
+                var hash = sha.ComputeHash(Encoding.UTF8.GetBytes(value));
+                return string.Concat(hash.Select(b => b.ToString("x2")));
+            }
+        }
+
+        private string GetCacheKey(IPlatformDetector platformDetector, ISourceRepo sourceRepo)
+        {
+            // The assembly version is part of the key so that upgrading Oryx invalidates the cached results
+            var detectorType = platformDetector.GetType();
+            return ComputeHash(string.Join(
+                "\n",
+                CacheFormatVersion,
+                detectorType.FullName,
+                detectorType.Assembly.GetName().Version,
+                Path.GetFullPath(sourceRepo.RootPath),
+                this.optionsFingerprint));
+        }
+
+        private bool TryGetCachedResult(
+            string cacheFilePath,
+            IPlatformDetector platformDetector,
+            ISourceRepo sourceRepo,
+            out PlatformDetectorResult result)
+        {
+            result = null;
+            if (!File.Exists(cacheFilePath))
+            {
+                return false;
+            }
+
+            try
+            {
+                var entry = JsonConvert.DeserializeObject<CacheEntry>(File.ReadAllText(cacheFilePath));
+                if (entry?.Inputs == null)
+                {
+                    return false;
+                }
+
+                foreach (var input in entry.Inputs)
+                {
+                    if (RecordingSourceRepo.GetFingerprint(sourceRepo, input) != input.Fingerprint)
+                    {
+                        this.logger.LogDebug(
+                            "Cached detection result in {cacheFilePath} is stale as the result of {query} on " +
+                            "{arguments} changed",
+                            cacheFilePath,
+                            input.Query,
+                            string.Join(", ", input.Arguments));
+                        return false;
+                    }
+                }
+
+                if (entry.ResultType != null)
+                {
+                    // Only result types from this assembly or from the assembly of the detector are materialized
+                    var resultType = typeof(PlatformDetectorResult).Assembly.GetType(entry.ResultType)
+                        ?? platformDetector.GetType().Assembly.GetType(entry.ResultType);
+                    if (resultType == null || !typeof(PlatformDetectorResult).IsAssignableFrom(resultType))
+                    {
+                        return false;
+                    }
+
+                    result = (PlatformDetectorResult)entry.Result.ToObject(resultType);
+                }
+
+                return true;
+            }
+            catch (Exception ex) when (ex is IOException
+                || ex is UnauthorizedAccessException
+                || ex is JsonException
+                || ex is FormatException
+                || ex is ArgumentException)
+            {
+                // A missing file, for example, means that the inputs changed
+                this.logger.LogDebug(ex, "Could not use the cached detection result in {cacheFilePath}", cacheFilePath);
+                return false;
+            }
+        }
+
+        private void TrySaveResult(
+            string cacheFilePath,
+            PlatformDetectorResult result,
+            IEnumerable<RecordingSourceRepo.DetectionInput> inputs)
+        {
+            var entry = new CacheEntry
+            {
+                Inputs = inputs.ToList(),
+                ResultType = result?.GetType().FullName,
+                Result = result == null ? null : JObject.FromObject(result),
+            };
+
+            try
+            {
+                Directory.CreateDirectory(this.cacheDirectory);
+
+                // Write to a temporary file first so that concurrent builds never see a partially written entry
+                var tempFilePath = $"{cacheFilePath}.{Guid.NewGuid():N}.tmp";
+                File.WriteAllText(tempFilePath, JsonConvert.SerializeObject(entry));
+                File.Move(tempFilePath, cacheFilePath, overwrite: true);
+            }
+            catch (Exception ex) when (ex is IOException || ex is UnauthorizedAccessException)
+            {
+                // The cache is an optimization only, so failing to write to it must not fail the detection
+                this.logger.LogWarning(ex, "Could not write the detection result to {cacheFilePath}", cacheFilePath);
+            }
+        }
+
+        private class CacheEntry
+        {
+            public List<RecordingSourceRepo.DetectionInput> Inputs { get; set; }
+
+            public string ResultType { get; set; }
+
+            public JObject Result { get; set; }
+        }
+    }
+}
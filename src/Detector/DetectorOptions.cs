@@ -37,5 +37,24 @@ namespace Microsoft.Oryx.Detector
         /// Gets or sets the path where a requirements.txt locates.
         /// </summary>
         public string CustomRequirementsTxtPath { get; set; }
+
+        /// <summary>
+        /// Gets or sets the names of the directories, for example 'node_modules' or '.git', which are skipped
+        /// when indexing the files of the source directory. If null or empty, the
+        /// <see cref="IndexedSourceRepo.DefaultExcludedDirectories"/> are skipped.
+        /// </summary>
+        public string[] ExcludedDirectories { get; set; }
+
+        /// <summary>
+        /// Gets or sets a value indicating whether the platform detectors should be run concurrently.
+        /// The detected platforms are returned in the same order regardless of this setting. Default is <c>false</c>.
+        /// </summary>
+        public bool EnableParallelDetection { get; set; }
+
+        /// <summary>
+        /// Gets or sets the directory in which the results of the detectors are cached across runs.
+        /// If null or empty, the results are not cached.
+        /// </summary>
+        public string DetectionCacheDirectory { get; set; }
     }
 }
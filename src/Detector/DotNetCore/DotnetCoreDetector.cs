@@ -4,8 +4,6 @@
 // --------------------------------------------------------------------------------------------
 
 using System.IO;
-using System.Xml.Linq;
-using System.Xml.XPath;
 using Microsoft.Extensions.Logging;
 
 namespace Microsoft.Oryx.Detector.DotNetCore
@@ -43,10 +41,8 @@ namespace Microsoft.Oryx.Detector.DotNetCore
             var sourceRepo = context.SourceRepo;
             var appDirectory = Path.GetDirectoryName(projectFile);
             var installAOTWorkloads = false;
-            var projectFileDoc = XDocument.Load(new StringReader(sourceRepo.ReadFile(projectFile)));
-            var targetFrameworkElement = projectFileDoc.XPathSelectElement(
-                DotNetCoreConstants.TargetFrameworkElementXPathExpression);
-            var targetFramework = targetFrameworkElement?.Value;
+            var projectFileMetadata = ProjectFileHelpers.GetProjectFileMetadata(sourceRepo, projectFile);
+            var targetFramework = projectFileMetadata.TargetFramework;
             if (string.IsNullOrEmpty(targetFramework))
             {
                 this.logger.LogDebug(
@@ -54,15 +50,13 @@ namespace Microsoft.Oryx.Detector.DotNetCore
                 return null;
             }
 
-            var outputTypeElement = projectFileDoc.XPathSelectElement(
-                DotNetCoreConstants.OutputTypeXPathExpression);
-            var outputType = GetOutputType(outputTypeElement);
+            var outputType = GetOutputType(projectFileMetadata.OutputType);
 
             var version = this.GetVersion(targetFramework);
 
             // Any Blazor WebAssembly app should have the workload installed.
             // https://github.com/microsoft/Oryx/issues/1026
-            if (ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileDoc))
+            if (ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileMetadata))
             {
                 installAOTWorkloads = true;
             }
@@ -105,10 +99,8 @@ namespace Microsoft.Oryx.Detector.DotNetCore
             return null;
         }
 
-        private static string GetOutputType(XElement outputTypeElement)
+        private static string GetOutputType(string outputType)
         {
-            string outputType = outputTypeElement?.Value;
-
             // default OutputType is "Library"
             string outputTypeResult = string.IsNullOrEmpty(outputType) ? DotNetCoreConstants.DefaultOutputType : outputType;
             return outputTypeResult;
@@ -63,15 +63,16 @@ namespace Microsoft.Oryx.Detector.DotNetCore
             foreach (var file in projectFiles)
             {
                 allProjects.Add(file);
-                if (ProjectFileHelpers.IsAzureBlazorWebAssemblyProject(sourceRepo, file))
+                var projectFileMetadata = ProjectFileHelpers.GetProjectFileMetadata(sourceRepo, file);
+                if (ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileMetadata))
                 {
                     blazorWasmProjects.Add(file);
                 }
-                else if (ProjectFileHelpers.IsAzureFunctionsProject(sourceRepo, file))
+                else if (ProjectFileHelpers.IsAzureFunctionsProject(projectFileMetadata))
                 {
                     azureFunctionsProjects.Add(file);
                 }
-                else if (ProjectFileHelpers.IsAspNetCoreWebApplicationProject(sourceRepo, file))
+                else if (ProjectFileHelpers.IsAspNetCoreWebApplicationProject(projectFileMetadata))
                 {
                     webAppProjects.Add(file);
                 }
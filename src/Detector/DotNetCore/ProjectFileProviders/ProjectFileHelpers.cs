@@ -4,34 +4,21 @@
 // --------------------------------------------------------------------------------------------
 
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
 using System.IO;
 using System.Linq;
-using System.Xml.Linq;
-using System.Xml.XPath;
 using Microsoft.Oryx.Common.Extensions;
 
 namespace Microsoft.Oryx.Detector.DotNetCore
 {
     internal static class ProjectFileHelpers
     {
-        public static bool IsAspNetCoreWebApplicationProject(ISourceRepo sourceRepo, string projectFile)
-        {
-            var projFileDoc = GetXmlDocument(sourceRepo, projectFile);
-            return IsAspNetCoreWebApplicationProject(projFileDoc);
-        }
-
-        public static bool IsAzureFunctionsProject(ISourceRepo sourceRepo, string projectFile)
-        {
-            var projFileDoc = GetXmlDocument(sourceRepo, projectFile);
-            return IsAzureFunctionsProject(projFileDoc);
-        }
+        // Bounds the memory used by a long running process (ex: a build server) which detects many repos
+        private const int MaxCachedProjectFiles = 4096;
 
-        public static bool IsAzureBlazorWebAssemblyProject(ISourceRepo sourceRepo, string projectFile)
-        {
-            var projFileDoc = GetXmlDocument(sourceRepo, projectFile);
-            return IsBlazorWebAssemblyProject(projFileDoc);
-        }
+        private static readonly ConcurrentDictionary<string, CachedProjectFileMetadata> ProjectFileMetadataCache =
+            new ConcurrentDictionary<string, CachedProjectFileMetadata>(StringComparer.Ordinal);
 
         public static string GetRelativePathToRoot(string projectFilePath, string repoRoot)
         {
@@ -51,44 +38,77 @@ namespace Microsoft.Oryx.Detector.DotNetCore
             return Path.Combine(parts.ToArray());
         }
 
-        public static bool IsAspNetCoreWebApplicationProject(XDocument projectFileDoc)
+        /// <summary>
+        /// Gets the <see cref="ProjectFileMetadata"/> of a project file, which is parsed only once as long as the
+        /// path, last write time and size of the file do not change, so that classifying the projects of a repo
+        /// and detecting the version of the selected one do not parse the same file over and over. Reads through
+        /// a <see cref="RecordingSourceRepo"/> are still recorded.
+        /// </summary>
+        public static ProjectFileMetadata GetProjectFileMetadata(ISourceRepo sourceRepo, string projectFile)
+        {
+            if (sourceRepo is RecordingSourceRepo recordingSourceRepo)
+            {
+                recordingSourceRepo.RecordRead(new[] { projectFile });
+                sourceRepo = recordingSourceRepo.InnerSourceRepo;
+            }
+
+            var fileInfo = new FileInfo(Path.Combine(sourceRepo.RootPath, projectFile));
+            if (!fileInfo.Exists)
+            {
+                // Ex: a source repo which is not backed by the file system
+                return ProjectFileMetadata.Parse(sourceRepo.ReadFile(projectFile));
+            }
+
+            if (ProjectFileMetadataCache.TryGetValue(fileInfo.FullName, out var cached)
+                && cached.LastWriteTimeUtc == fileInfo.LastWriteTimeUtc
+                && cached.Length == fileInfo.Length)
+            {
+                return cached.Metadata;
+            }
+
+            var metadata = ProjectFileMetadata.Parse(sourceRepo.ReadFile(projectFile));
+            if (ProjectFileMetadataCache.Count >= MaxCachedProjectFiles)
+            {
+                ProjectFileMetadataCache.Clear();
+            }
+
+            ProjectFileMetadataCache[fileInfo.FullName] = new CachedProjectFileMetadata
+            {
+                LastWriteTimeUtc = fileInfo.LastWriteTimeUtc,
+                Length = fileInfo.Length,
+                Metadata = metadata,
+            };
+            return metadata;
+        }
+
+        public static bool IsAspNetCoreWebApplicationProject(ProjectFileMetadata projectFileMetadata)
         {
-            return !IsBlazorWebAssemblyProject(projectFileDoc)
+            return !IsBlazorWebAssemblyProject(projectFileMetadata)
                 && IsOfSdkProjectType(
-                projectFileDoc,
+                projectFileMetadata,
                 DotNetCoreConstants.DotNetWebSdkName.ToLowerInvariant());
         }
 
-        public static bool IsAzureFunctionsProject(XDocument projectFileDoc)
+        public static bool IsAzureFunctionsProject(ProjectFileMetadata projectFileMetadata)
         {
-            var azureFunctionsVersionElement = projectFileDoc.XPathSelectElement(
-                DotNetCoreConstants.AzureFunctionsVersionElementXPathExpression);
-            var azureFunctionsVersion = azureFunctionsVersionElement?.Value;
-            if (!string.IsNullOrEmpty(azureFunctionsVersion))
+            if (!string.IsNullOrEmpty(projectFileMetadata.AzureFunctionsVersion))
             {
                 return true;
             }
 
-            return HasPackageReference(projectFileDoc, DotNetCoreConstants.AzureFunctionsPackageReference);
-        }
-
-        public static bool IsBlazorWebAssemblyProject(XDocument projectFileDoc)
-        {
-            return HasPackageReference(projectFileDoc, DotNetCoreConstants.AzureBlazorWasmPackageReference);
+            return HasPackageReference(projectFileMetadata, DotNetCoreConstants.AzureFunctionsPackageReference);
         }
 
-        private static XDocument GetXmlDocument(ISourceRepo sourceRepo, string projectFile)
+        public static bool IsBlazorWebAssemblyProject(ProjectFileMetadata projectFileMetadata)
         {
-            return XDocument.Load(new StringReader(sourceRepo.ReadFile(projectFile)));
+            return HasPackageReference(projectFileMetadata, DotNetCoreConstants.AzureBlazorWasmPackageReference);
         }
 
-        private static bool IsOfSdkProjectType(XDocument projectFileDoc, string expectedSdkName)
+        private static bool IsOfSdkProjectType(ProjectFileMetadata projectFileMetadata, string expectedSdkName)
         {
             // Look for the attribute value on Project element first as that is more common
             // Example: <Project Sdk="Microsoft.NET.Sdk/1.0.0">
-            var sdkAttributeValue = projectFileDoc.XPathEvaluate(
-                DotNetCoreConstants.ProjectSdkAttributeValueXPathExpression);
-            var sdkName = sdkAttributeValue as string;
+            var sdkName = projectFileMetadata.ProjectSdk;
             if (!string.IsNullOrEmpty(sdkName) &&
                 sdkName.StartsWith(expectedSdkName, StringComparison.OrdinalIgnoreCase))
             {
@@ -98,40 +118,23 @@ namespace Microsoft.Oryx.Detector.DotNetCore
             // Example:
             // <Project>
             //    <Sdk Name="Microsoft.NET.Sdk" Version="1.0.0" />
-            var sdkNameAttributeValue = projectFileDoc.XPathEvaluate(
-                DotNetCoreConstants.ProjectSdkElementNameAttributeValueXPathExpression);
-            sdkName = sdkNameAttributeValue as string;
+            sdkName = projectFileMetadata.SdkName;
             return sdkName.EqualsIgnoreCase(expectedSdkName);
         }
 
-        private static bool HasPackageReference(XDocument projectFileDoc, string packageName)
+        private static bool HasPackageReference(ProjectFileMetadata projectFileMetadata, string packageName)
         {
-            var packageReferenceElements = projectFileDoc.XPathSelectElements(
-                DotNetCoreConstants.PackageReferenceXPathExpression);
-            if (packageReferenceElements == null || !packageReferenceElements.Any())
-            {
-                return false;
-            }
+            return projectFileMetadata.PackageReferences.Any(
+                packageReference => packageReference.EqualsIgnoreCase(packageName));
+        }
+
+        private class CachedProjectFileMetadata
+        {
+            public DateTime LastWriteTimeUtc { get; set; }
+
+            public long Length { get; set; }
 
-            var packageReferences = packageReferenceElements
-                .Where(packageRefElement =>
-                {
-                    if (!packageRefElement.HasAttributes)
-                    {
-                        return false;
-                    }
-
-                    var includeAttribute = packageRefElement.Attributes()
-                    .Where(attr => string.Equals(attr.Name.LocalName, "Include"))
-                    .FirstOrDefault();
-                    if (includeAttribute == null)
-                    {
-                        return false;
-                    }
-
-                    return includeAttribute.Value.EqualsIgnoreCase(packageName);
-                });
-            return packageReferences.Any();
+            public ProjectFileMetadata Metadata { get; set; }
         }
     }
 }
@@ -0,0 +1,168 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Xml;
+
+namespace Microsoft.Oryx.Detector.DotNetCore
+{
+    /// <summary>
+    /// The parts of a project file (ex: '.csproj') which are used to classify the project and to detect the
+    /// version of .NET it targets, read in a single pass over the file. Only elements without a namespace are
+    /// considered, i.e. SDK-style project files.
+    /// </summary>
+    internal class ProjectFileMetadata
+    {
+        private const string ProjectElementName = "Project";
+        private const string SdkElementName = "Sdk";
+        private const string PropertyGroupElementName = "PropertyGroup";
+        private const string ItemGroupElementName = "ItemGroup";
+        private const string PackageReferenceElementName = "PackageReference";
+        private const string TargetFrameworkElementName = "TargetFramework";
+        private const string OutputTypeElementName = "OutputType";
+        private const string AzureFunctionsVersionElementName = "AzureFunctionsVersion";
+
+        private static readonly XmlReaderSettings ReaderSettings = new XmlReaderSettings
+        {
+            DtdProcessing = DtdProcessing.Ignore,
+            IgnoreComments = true,
+            IgnoreProcessingInstructions = true,
+            IgnoreWhitespace = true,
+        };
+
+        /// <summary>
+        /// Gets the value of the 'Sdk' attribute of the 'Project' element, ex: 'Microsoft.NET.Sdk.Web'.
+        /// </summary>
+        public string ProjectSdk { get; private set; }
+
+        /// <summary>
+        /// Gets the value of the 'Name' attribute of the first 'Sdk' element of the project.
+        /// </summary>
+        public string SdkName { get; private set; }
+
+        /// <summary>
+        /// Gets the value of the first 'TargetFramework' property of the project.
+        /// </summary>
+        public string TargetFramework { get; private set; }
+
+        /// <summary>
+        /// Gets the value of the first 'OutputType' property of the project.
+        /// </summary>
+        public string OutputType { get; private set; }
+
+        /// <summary>
+        /// Gets the value of the first 'AzureFunctionsVersion' property of the project.
+        /// </summary>
+        public string AzureFunctionsVersion { get; private set; }
+
+        /// <summary>
+        /// Gets the 'Include' attribute values of the package references of the project, in file order.
+        /// </summary>
+        public IReadOnlyList<string> PackageReferences { get; private set; }
+
+        /// <summary>
+        /// Reads the metadata of the project file with the given content.
+        /// </summary>
+        /// <param name="content">The content of the project file.</param>
+        /// <returns>The <see cref="ProjectFileMetadata"/> of the project file.</returns>
+        /// <exception cref="XmlException">The project file is not well-formed XML.</exception>
+        public static ProjectFileMetadata Parse(string content)
+        {
+            var metadata = new ProjectFileMetadata();
+            var packageReferences = new List<string>();
+            var isProject = false;
+            string section = null;
+
+            using (var reader = XmlReader.Create(new StringReader(content), ReaderSettings))
+            {
+                while (reader.Read())
+                {
+                    if (reader.NodeType != XmlNodeType.Element)
+                    {
+                        continue;
+                    }
+
+                    if (reader.Depth == 0)
+                    {
+                        isProject = IsElement(reader, ProjectElementName);
+                        if (isProject)
+                        {
+                            metadata.ProjectSdk = reader.GetAttribute(SdkElementName);
+                        }
+                    }
+                    else if (!isProject)
+                    {
+                        continue;
+                    }
+                    else if (reader.Depth == 1)
+                    {
+                        section = string.IsNullOrEmpty(reader.NamespaceURI) ? reader.LocalName : null;
+                        if (section == SdkElementName && metadata.SdkName == null)
+                        {
+                            metadata.SdkName = reader.GetAttribute("Name");
+                        }
+                    }
+                    else if (reader.Depth == 2 && section == PropertyGroupElementName)
+                    {
+                        if (IsElement(reader, TargetFrameworkElementName) && metadata.TargetFramework == null)
+                        {
+                            metadata.TargetFramework = ReadElementValue(reader);
+                        }
+                        else if (IsElement(reader, OutputTypeElementName) && metadata.OutputType == null)
+                        {
+                            metadata.OutputType = ReadElementValue(reader);
+                        }
+                        else if (IsElement(reader, AzureFunctionsVersionElementName)
+                            && metadata.AzureFunctionsVersion == null)
+                        {
+                            metadata.AzureFunctionsVersion = ReadElementValue(reader);
+                        }
+                    }
+                    else if (reader.Depth == 2
+                        && section == ItemGroupElementName
+                        && IsElement(reader, PackageReferenceElementName))
+                    {
+                        var include = reader.GetAttribute("Include");
+                        if (include != null)
+                        {
+                            packageReferences.Add(include);
+                        }
+                    }
+                }
+            }
+
+            metadata.PackageReferences = packageReferences;
+            return metadata;
+        }
+
+        private static bool IsElement(XmlReader reader, string localName)
+        {
+            return string.IsNullOrEmpty(reader.NamespaceURI) && reader.LocalName == localName;
+        }
+
+        private static string ReadElementValue(XmlReader reader)
+        {
+            if (reader.IsEmptyElement)
+            {
+                return string.Empty;
+            }
+
+            // Like XElement.Value, concatenates the text of all the descendants of the element
+            var depth = reader.Depth;
+            var value = new StringBuilder();
+            while (reader.Read() && reader.Depth > depth)
+            {
+                if (reader.NodeType == XmlNodeType.Text || reader.NodeType == XmlNodeType.CDATA)
+                {
+                    value.Append(reader.Value);
+                }
+            }
+
+            return value.ToString();
+        }
+    }
+}
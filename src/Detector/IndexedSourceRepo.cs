@@ -0,0 +1,353 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.IO.Enumeration;
+using System.Linq;
+using System.Threading;
+using Microsoft.Extensions.Logging;
+using Microsoft.Extensions.Logging.Abstractions;
+
+namespace Microsoft.Oryx.Detector
+{
+    /// <summary>
+    /// An implementation of <see cref="ISourceRepo"/> backed by the local file system which walks the
+    /// repository only once. The first recursive file query builds an in-memory index of every file under
+    /// the root (skipping the excluded directories), and all later <see cref="EnumerateFiles"/>,
+    /// <see cref="FileExists"/>, <see cref="DirExists"/> and <see cref="GetFileSize"/> queries are
+    /// answered from that index. Queries for paths inside an excluded directory fall back to the file system.
+    /// </summary>
+    public class IndexedSourceRepo : ISourceRepo
+    {
+        /// <summary>
+        /// The names of the directories which are not indexed unless specified otherwise.
+        /// </summary>
+        public static readonly IReadOnlyList<string> DefaultExcludedDirectories = new[]
+        {
+            ".git",
+            ".hg",
+            ".svn",
+            ".venv",
+            "__pycache__",
+            "node_modules",
+        };
+
+        private readonly ILogger<IndexedSourceRepo> logger;
+        private readonly HashSet<string> excludedDirectories;
+        private readonly Lazy<SourceFileIndex> index;
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="IndexedSourceRepo"/> class which excludes the
+        /// <see cref="DefaultExcludedDirectories"/>.
+        /// </summary>
+        /// <param name="sourceDirectory">The directory containing the source code of the application.</param>
+        public IndexedSourceRepo(string sourceDirectory)
+            : this(sourceDirectory, excludedDirectories: null, NullLoggerFactory.Instance)
+        {
+        }
+
+        /// <summary>
+        /// Initializes a new instance of the <see cref="IndexedSourceRepo"/> class.
+        /// </summary>
+        /// <param name="sourceDirectory">The directory containing the source code of the application.</param>
+        /// <param name="excludedDirectories">
+        /// Names of the directories which should not be indexed. If null or empty, the
+        /// <see cref="DefaultExcludedDirectories"/> are used.
+        /// </param>
+        /// <param name="loggerFactory">The <see cref="ILoggerFactory"/>.</param>
+        public IndexedSourceRepo(
+            string sourceDirectory,
+            IEnumerable<string> excludedDirectories,
+            ILoggerFactory loggerFactory)
+        {
+            this.RootPath = sourceDirectory;
+            this.logger = loggerFactory.CreateLogger<IndexedSourceRepo>();
+
+            if (excludedDirectories == null || !excludedDirectories.Any())
+            {
+                excludedDirectories = DefaultExcludedDirectories;
+            }
+
+            this.excludedDirectories = new HashSet<string>(excludedDirectories, StringComparer.Ordinal);
+            this.index = new Lazy<SourceFileIndex>(this.BuildIndex, LazyThreadSafetyMode.ExecutionAndPublication);
+        }
+
+        /// <inheritdoc/>
+        public string RootPath { get; }
+
+        /// <summary>
+        /// Gets a value indicating whether the file index has already been built.
+        /// </summary>
+        public bool IsIndexBuilt => this.index.IsValueCreated;
+
+        /// <inheritdoc/>
+        public bool FileExists(params string[] paths)
+        {
+            var path = this.ResolvePath(paths);
+            if (this.IsIndexBuilt && this.TryGetIndexedRelativePath(path, out var relativePath))
+            {
+                return this.index.Value.FilesByRelativePath.ContainsKey(relativePath);
+            }
+
+            return File.Exists(path);
+        }
+
+        /// <inheritdoc/>
+        public bool DirExists(params string[] paths)
+        {
+            var path = this.ResolvePath(paths);
+            if (this.IsIndexBuilt && this.TryGetIndexedRelativePath(path, out var relativePath))
+            {
+                return this.index.Value.Directories.Contains(relativePath);
+            }
+
+            return Directory.Exists(path);
+        }
+
+        /// <inheritdoc/>
+        public IEnumerable<string> EnumerateFiles(
+            string searchPattern,
+            bool searchSubDirectories,
+            params string[] subDirectoryToSearchUnder)
+        {
+            var directoryToSearchUnder = this.RootPath;
+            if (subDirectoryToSearchUnder != null && subDirectoryToSearchUnder.Any())
+            {
+                directoryToSearchUnder = Path.Combine(directoryToSearchUnder, Path.Combine(subDirectoryToSearchUnder));
+            }
+
+            if (!this.TryGetIndexedRelativePath(directoryToSearchUnder, out var relativeDirectory))
+            {
+                return new LocalSourceRepo(this.RootPath)
+                    .EnumerateFiles(searchPattern, searchSubDirectories, subDirectoryToSearchUnder);
+            }
+
+            // Non-recursive lookups of a directory which has not been indexed yet are cheaper to answer
+            // from the file system than by walking the whole tree.
+            if (!searchSubDirectories && !this.IsIndexBuilt)
+            {
+                return Directory.EnumerateFiles(directoryToSearchUnder, searchPattern);
+            }
+
+            var index = this.index.Value;
+            if (!index.Directories.Contains(relativeDirectory))
+            {
+                // Keep the behavior of Directory.EnumerateFiles for directories which do not exist.
+                throw new DirectoryNotFoundException($"Could not find a part of the path '{directoryToSearchUnder}'.");
+            }
+
+            var candidates = index.Files;
+            if (TryGetExtensionFromSearchPattern(searchPattern, out var extension))
+            {
+                if (!index.FilesByExtension.TryGetValue(extension, out candidates))
+                {
+                    return Enumerable.Empty<string>();
+                }
+            }
+
+            return candidates
+                .Where(file => IsUnderDirectory(file, relativeDirectory, searchSubDirectories))
+                .Where(file => FileSystemName.MatchesWin32Expression(
+                    searchPattern,
+                    file.Name,
+                    ignoreCase: OperatingSystem.IsWindows()))
+                .Select(file => file.FullPath)
+                .ToList();
+        }
+
+        /// <inheritdoc/>
+        public string ReadFile(params string[] paths)
+        {
+            var path = this.ResolvePath(paths);
+            return File.ReadAllText(path);
+        }
+
+        /// <inheritdoc/>
+        public string[] ReadAllLines(params string[] paths)
+        {
+            var path = this.ResolvePath(paths);
+            return File.ReadAllLines(path);
+        }
+
+        /// <inheritdoc/>
+        public long? GetFileSize(params string[] paths)
+        {
+            var path = this.ResolvePath(paths);
+            if (this.IsIndexBuilt && this.TryGetIndexedRelativePath(path, out var relativePath))
+            {
+                return this.index.Value.FilesByRelativePath.TryGetValue(relativePath, out var file)
+                    ? (long?)file.Size
+                    : null;
+            }
+
+            var fileInfo = new FileInfo(path);
+            return fileInfo.Exists ? (long?)fileInfo.Length : null;
+        }
+
+        private static bool TryGetExtensionFromSearchPattern(string searchPattern, out string extension)
+        {
+            // Fast path for the most common patterns used by the detectors, for example '*.py' or '*.csproj'
+            extension = null;
+            if (searchPattern == null
+                || !searchPattern.StartsWith("*.", StringComparison.Ordinal)
+                || searchPattern.IndexOfAny(new[] { '*', '?' }, 2) >= 0)
+            {
+                return false;
+            }
+
+            extension = searchPattern.Substring(1);
+            return true;
+        }
+
+        private static bool IsUnderDirectory(IndexedFile file, string relativeDirectory, bool searchSubDirectories)
+        {
+            if (searchSubDirectories)
+            {
+                return relativeDirectory.Length == 0
+                    || string.Equals(file.RelativeDirectory, relativeDirectory, StringComparison.Ordinal)
+                    || file.RelativeDirectory.StartsWith(relativeDirectory + '/', StringComparison.Ordinal);
+            }
+
+            return string.Equals(file.RelativeDirectory, relativeDirectory, StringComparison.Ordinal);
+        }
+
+        private SourceFileIndex BuildIndex()
+        {
+            var stopwatch = Stopwatch.StartNew();
+            var index = new SourceFileIndex();
+            index.Directories.Add(string.Empty);
+            this.IndexDirectory(index, this.RootPath, relativeDirectory: string.Empty, depth: 0);
+            stopwatch.Stop();
+
+            this.logger.LogDebug(
+                "Indexed {fileCount} files in {directoryCount} directories under {rootPath} in {elapsedMs} ms",
+                index.Files.Count,
+                index.Directories.Count,
+                this.RootPath,
+                stopwatch.ElapsedMilliseconds);
+            return index;
+        }
+
+        private void IndexDirectory(SourceFileIndex index, string directory, string relativeDirectory, int depth)
+        {
+            // Files of a directory are indexed before its sub-directories to preserve the order in which
+            // the files were returned by a recursive Directory.EnumerateFiles based search.
+            foreach (var filePath in Directory.EnumerateFiles(directory))
+            {
+                var fileInfo = new FileInfo(filePath);
+                var file = new IndexedFile(
+                    fullPath: filePath,
+                    relativeDirectory: relativeDirectory,
+                    name: fileInfo.Name,
+                    extension: fileInfo.Extension,
+                    size: fileInfo.Exists ? fileInfo.Length : 0,
+                    depth: depth);
+                index.Add(file);
+            }
+
+            foreach (var subDirectory in Directory.EnumerateDirectories(directory).Where(Directory.Exists))
+            {
+                var name = Path.GetFileName(subDirectory);
+                if (this.excludedDirectories.Contains(name))
+                {
+                    continue;
+                }
+
+                var relativeSubDirectory = relativeDirectory.Length == 0 ? name : relativeDirectory + '/' + name;
+                index.Directories.Add(relativeSubDirectory);
+                this.IndexDirectory(index, subDirectory, relativeSubDirectory, depth + 1);
+            }
+        }
+
+        private bool TryGetIndexedRelativePath(string fullPath, out string relativePath)
+        {
+            relativePath = Path.GetRelativePath(this.RootPath, fullPath).Replace('\\', '/');
+            if (relativePath == ".")
+            {
+                relativePath = string.Empty;
+                return true;
+            }
+
+            if (Path.IsPathRooted(relativePath) || relativePath == ".." || relativePath.StartsWith("../"))
+            {
+                return false;
+            }
+
+            var segments = relativePath.Split('/', StringSplitOptions.RemoveEmptyEntries);
+            return !segments.Any(segment => this.excludedDirectories.Contains(segment));
+        }
+
+        private string ResolvePath(params string[] paths)
+        {
+            var filePathInRepo = Path.Combine(paths);
+            return Path.Combine(this.RootPath, filePathInRepo);
+        }
+
+        private class IndexedFile
+        {
+            public IndexedFile(
+                string fullPath,
+                string relativeDirectory,
+                string name,
+                string extension,
+                long size,
+                int depth)
+            {
+                this.FullPath = fullPath;
+                this.RelativeDirectory = relativeDirectory;
+                this.Name = name;
+                this.Extension = extension;
+                this.Size = size;
+                this.Depth = depth;
+            }
+
+            public string FullPath { get; }
+
+            public string RelativeDirectory { get; }
+
+            public string RelativePath => this.RelativeDirectory.Length == 0
+                ? this.Name
+                : this.RelativeDirectory + '/' + this.Name;
+
+            public string Name { get; }
+
+            public string Extension { get; }
+
+            public long Size { get; }
+
+            public int Depth { get; }
+        }
+
+        private class SourceFileIndex
+        {
+            public List<IndexedFile> Files { get; } = new List<IndexedFile>();
+
+            public Dictionary<string, IndexedFile> FilesByRelativePath { get; }
+                = new Dictionary<string, IndexedFile>(StringComparer.Ordinal);
+
+            public Dictionary<string, List<IndexedFile>> FilesByExtension { get; }
+                = new Dictionary<string, List<IndexedFile>>(StringComparer.OrdinalIgnoreCase);
+
+            public HashSet<string> Directories { get; } = new HashSet<string>(StringComparer.Ordinal);
+
+            public void Add(IndexedFile file)
+            {
+                this.Files.Add(file);
+                this.FilesByRelativePath[file.RelativePath] = file;
+
+                if (!this.FilesByExtension.TryGetValue(file.Extension, out var filesWithExtension))
+                {
+                    filesWithExtension = new List<IndexedFile>();
+                    this.FilesByExtension[file.Extension] = filesWithExtension;
+                }
+
+                filesWithExtension.Add(file);
+            }
+        }
+    }
+}
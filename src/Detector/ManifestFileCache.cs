@@ -0,0 +1,93 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Concurrent;
+using System.Runtime.CompilerServices;
+using System.Threading;
+using Microsoft.Extensions.Logging;
+using Microsoft.Oryx.Common.Extensions;
+
+namespace Microsoft.Oryx.Detector
+{
+    /// <summary>
+    /// Parses the manifest files of a source repo (ex: 'package.json', 'composer.json') at most once per source
+    /// repo instance, so that the detectors, platforms and checkers which all look at the same manifest share a
+    /// single immutable model of it. Like the file index of <see cref="IndexedSourceRepo"/>, the models are not
+    /// invalidated if the files change during the lifetime of the source repo.
+    /// </summary>
+    public static class ManifestFileCache
+    {
+        private static readonly ConditionalWeakTable<object, ConcurrentDictionary<string, Lazy<object>>> Caches =
+            new ConditionalWeakTable<object, ConcurrentDictionary<string, Lazy<object>>>();
+
+        /// <summary>
+        /// Gets the model of the manifest file <paramref name="fileName"/> of <paramref name="sourceRepo"/>,
+        /// parsing it with <paramref name="parse"/> the first time it is requested. A file which cannot be read
+        /// or parsed is reported once as a warning and its model is null, leaving malformed manifests for the
+        /// package manager itself to report.
+        /// </summary>
+        /// <typeparam name="T">The type of the model of the manifest file.</typeparam>
+        /// <param name="sourceRepo">The source repo the manifest file belongs to.</param>
+        /// <param name="fileName">The path of the manifest file, relative to the root of the source repo.</param>
+        /// <param name="readFile">Reads the content of the manifest file.</param>
+        /// <param name="parse">Parses the content of the manifest file into its model.</param>
+        /// <param name="logger">The <see cref="ILogger"/>, which can be null.</param>
+        /// <returns>The model of the manifest file, or null if it could not be read or parsed.</returns>
+        public static T GetOrAdd<T>(
+            object sourceRepo,
+            string fileName,
+            Func<string> readFile,
+            Func<string, T> parse,
+            ILogger logger)
+            where T : class
+        {
+            var manifests = Caches.GetValue(
+                sourceRepo,
+                _ => new ConcurrentDictionary<string, Lazy<object>>(StringComparer.Ordinal));
+            var manifest = manifests.GetOrAdd(
+                fileName,
+                _ => new Lazy<object>(
+                    () => Parse(fileName, readFile, parse, logger),
+                    LazyThreadSafetyMode.ExecutionAndPublication));
+            return manifest.Value as T;
+        }
+
+        /// <summary>
+        /// Gets the model of the manifest file <paramref name="fileName"/> of <paramref name="sourceRepo"/>,
+        /// or null if the file does not exist. Reads through a <see cref="RecordingSourceRepo"/> are still
+        /// recorded, so that a cached detection result is invalidated when the manifest file changes.
+        /// </summary>
+        internal static T GetOrAdd<T>(ISourceRepo sourceRepo, string fileName, Func<string, T> parse, ILogger logger)
+            where T : class
+        {
+            if (!sourceRepo.FileExists(fileName))
+            {
+                return null;
+            }
+
+            if (sourceRepo is RecordingSourceRepo recordingSourceRepo)
+            {
+                recordingSourceRepo.RecordRead(new[] { fileName });
+                sourceRepo = recordingSourceRepo.InnerSourceRepo;
+            }
+
+            return GetOrAdd(sourceRepo, fileName, () => sourceRepo.ReadFile(fileName), parse, logger);
+        }
+
+        private static object Parse<T>(string fileName, Func<string> readFile, Func<string, T> parse, ILogger logger)
+        {
+            try
+            {
+                return parse(readFile());
+            }
+            catch (Exception ex)
+            {
+                logger?.LogWarning(ex, $"Exception caught while trying to deserialize {fileName.Hash()}");
+                return null;
+            }
+        }
+    }
+}
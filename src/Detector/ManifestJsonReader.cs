@@ -0,0 +1,114 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.Collections.ObjectModel;
+using System.Globalization;
+using System.IO;
+using Newtonsoft.Json;
+
+namespace Microsoft.Oryx.Detector
+{
+    /// <summary>
+    /// Reads the parts of a JSON manifest file a model needs in a single forward-only pass, without building a
+    /// tree of the whole document.
+    /// </summary>
+    internal static class ManifestJsonReader
+    {
+        /// <summary>
+        /// Reads the top-level object of <paramref name="json"/> and calls <paramref name="readProperty"/> for
+        /// each of its properties with the reader positioned on the value. The value is skipped if
+        /// <paramref name="readProperty"/> returns false.
+        /// </summary>
+        /// <exception cref="JsonReaderException">The content is not a well-formed JSON object.</exception>
+        public static void ReadObject(string json, Func<string, JsonReader, bool> readProperty)
+        {
+            using (var reader = new JsonTextReader(new StringReader(json)))
+            {
+                reader.DateParseHandling = DateParseHandling.None;
+                if (!ReadSkippingComments(reader) || reader.TokenType != JsonToken.StartObject)
+                {
+                    throw new JsonReaderException("The manifest file does not contain a JSON object.");
+                }
+
+                while (ReadSkippingComments(reader) && reader.TokenType == JsonToken.PropertyName)
+                {
+                    var propertyName = (string)reader.Value;
+                    ReadSkippingComments(reader);
+                    if (!readProperty(propertyName, reader))
+                    {
+                        reader.Skip();
+                    }
+                }
+
+                if (reader.TokenType != JsonToken.EndObject)
+                {
+                    throw new JsonReaderException("The manifest file does not contain a well-formed JSON object.");
+                }
+
+                // Same as JsonConvert.DeserializeObject, which does not allow anything after the object.
+                if (ReadSkippingComments(reader))
+                {
+                    throw new JsonReaderException("Additional text found in the manifest file after the JSON object.");
+                }
+            }
+        }
+
+        /// <summary>
+        /// Reads the object the reader is positioned on as a map of names to string values. Numbers and booleans
+        /// are kept in their JSON form, while null values and nested objects or arrays are left out.
+        /// </summary>
+        /// <returns>The map, or null if the value is not an object.</returns>
+        public static IReadOnlyDictionary<string, string> ReadStringMap(JsonReader reader)
+        {
+            if (reader.TokenType != JsonToken.StartObject)
+            {
+                reader.Skip();
+                return null;
+            }
+
+            // Dictionary keeps the order in which the entries were added, which is the order in the file.
+            var map = new Dictionary<string, string>();
+            while (ReadSkippingComments(reader) && reader.TokenType == JsonToken.PropertyName)
+            {
+                var name = (string)reader.Value;
+                ReadSkippingComments(reader);
+                switch (reader.TokenType)
+                {
+                    case JsonToken.String:
+                        map[name] = (string)reader.Value;
+                        break;
+                    case JsonToken.Integer:
+                    case JsonToken.Float:
+                        map[name] = Convert.ToString(reader.Value, CultureInfo.InvariantCulture);
+                        break;
+                    case JsonToken.Boolean:
+                        map[name] = (bool)reader.Value ? "true" : "false";
+                        break;
+                    default:
+                        map.Remove(name);
+                        reader.Skip();
+                        break;
+                }
+            }
+
+            return new ReadOnlyDictionary<string, string>(map);
+        }
+
+        private static bool ReadSkippingComments(JsonReader reader)
+        {
+            while (reader.Read())
+            {
+                if (reader.TokenType != JsonToken.Comment)
+                {
+                    return true;
+                }
+            }
+
+            return false;
+        }
+    }
+}
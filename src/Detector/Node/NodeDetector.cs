@@ -19,6 +19,8 @@ namespace Microsoft.Oryx.Detector.Node
     /// </summary>
     public class NodeDetector : INodePlatformDetector
     {
+        private static readonly IReadOnlyDictionary<string, string> EmptyDependencies = new Dictionary<string, string>();
+
         private readonly ILogger<NodeDetector> logger;
         private readonly DetectorOptions options;
 
@@ -160,23 +162,14 @@ namespace Microsoft.Oryx.Detector.Node
             }
         }
 
-        private static dynamic GetPackageJsonObject(ISourceRepo sourceRepo, ILogger logger)
+        private static PackageJson GetPackageJson(ISourceRepo sourceRepo, ILogger logger)
         {
-            dynamic packageJson = null;
-            try
-            {
-                packageJson = ReadJsonObjectFromFile(sourceRepo, NodeConstants.PackageJsonFileName);
-            }
-            catch (Exception exc)
-            {
-                // Leave malformed package.json files for Node.js to handle.
-                // This prevents Oryx from erroring out when Node.js itself might be able to tolerate the file.
-                logger.LogWarning(
-                    exc,
-                    $"Exception caught while trying to deserialize {NodeConstants.PackageJsonFileName.Hash()}");
-            }
-
-            return packageJson;
+            // Malformed package.json files are left for Node.js to handle, as it might be able to tolerate them.
+            return ManifestFileCache.GetOrAdd(
+                sourceRepo,
+                NodeConstants.PackageJsonFileName,
+                PackageJson.Parse,
+                logger);
         }
 
         private static dynamic ReadJsonObjectFromFile(ISourceRepo sourceRepo, string fileName)
@@ -217,8 +210,8 @@ namespace Microsoft.Oryx.Detector.Node
 
         private string GetVersionFromPackageJson(DetectorContext context)
         {
-            var packageJson = GetPackageJsonObject(context.SourceRepo, this.logger);
-            return packageJson?.engines?.node?.Value as string;
+            var packageJson = GetPackageJson(context.SourceRepo, this.logger);
+            return packageJson?.Engines?.GetValueOrDefault("node");
         }
 
         private IEnumerable<FrameworkInfo> DetectFrameworkInfos(DetectorContext context)
@@ -226,17 +219,17 @@ namespace Microsoft.Oryx.Detector.Node
             // TODO: consolidate dependency & dev-dependency logic
             //       work-item 1493329
             var detectedFrameworkResult = new List<FrameworkInfo>();
-            var packageJson = GetPackageJsonObject(context.SourceRepo, this.logger);
+            var packageJson = GetPackageJson(context.SourceRepo, this.logger);
             var monitoredDevDependencies = NodeConstants.DevDependencyFrameworkKeyWordToName;
 
             // frameworksSet is for preventing duplicates
             var frameworksSet = new HashSet<string>();
 
             // dev-dependencies
-            var devDependencies = packageJson?.devDependencies != null ? packageJson.devDependencies : Array.Empty<string>();
+            var devDependencies = packageJson?.DevDependencies ?? EmptyDependencies;
             foreach (var dependency in devDependencies)
             {
-                string dependencyName = dependency.Name;
+                string dependencyName = dependency.Key;
 
                 // wild-card dependency
                 (bool isWildCardDependency, string wildCardDependencyName) = GetWildCardDependency(dependencyName);
@@ -252,7 +245,7 @@ namespace Microsoft.Oryx.Detector.Node
                     var frameworkInfo = new FrameworkInfo
                     {
                         Framework = frameworkName,
-                        FrameworkVersion = dependency.Value.Value,
+                        FrameworkVersion = dependency.Value,
                     };
                     detectedFrameworkResult.Add(frameworkInfo);
                     frameworksSet.Add(frameworkName);
@@ -262,10 +255,10 @@ namespace Microsoft.Oryx.Detector.Node
             var monitoredDependencies = NodeConstants.DependencyFrameworkKeyWordToName;
 
             // dependencies
-            var dependencies = packageJson?.dependencies != null ? packageJson.dependencies : Array.Empty<string>();
+            var dependencies = packageJson?.Dependencies ?? EmptyDependencies;
             foreach (var dependency in dependencies)
             {
-                string dependencyName = dependency.Name;
+                string dependencyName = dependency.Key;
 
                 // wild-card dependency
                 (bool isWildCardDependency, string wildCardDependencyName) = GetWildCardDependency(dependencyName);
@@ -281,7 +274,7 @@ namespace Microsoft.Oryx.Detector.Node
                     var frameworkInfo = new FrameworkInfo
                     {
                         Framework = frameworkName,
-                        FrameworkVersion = dependency.Value.Value,
+                        FrameworkVersion = dependency.Value,
                     };
                     detectedFrameworkResult.Add(frameworkInfo);
                     frameworksSet.Add(frameworkName);
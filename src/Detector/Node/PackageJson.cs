@@ -0,0 +1,73 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.Collections.Generic;
+
+namespace Microsoft.Oryx.Detector.Node
+{
+    /// <summary>
+    /// The parts of a 'package.json' file Oryx looks at. Get it through
+    /// <see cref="ManifestFileCache"/> so that the file is parsed only once per source repo.
+    /// </summary>
+    public class PackageJson
+    {
+        private PackageJson()
+        {
+        }
+
+        /// <summary>
+        /// Gets the 'dependencies' of the package, or null if there are none.
+        /// </summary>
+        public IReadOnlyDictionary<string, string> Dependencies { get; private set; }
+
+        /// <summary>
+        /// Gets the 'devDependencies' of the package, or null if there are none.
+        /// </summary>
+        public IReadOnlyDictionary<string, string> DevDependencies { get; private set; }
+
+        /// <summary>
+        /// Gets the 'scripts' of the package, or null if there are none.
+        /// </summary>
+        public IReadOnlyDictionary<string, string> Scripts { get; private set; }
+
+        /// <summary>
+        /// Gets the 'engines' of the package, ex: 'node', 'npm' or 'yarn', or null if there are none.
+        /// </summary>
+        public IReadOnlyDictionary<string, string> Engines { get; private set; }
+
+        /// <summary>
+        /// Parses the content of a 'package.json' file.
+        /// </summary>
+        /// <param name="json">The content of the file.</param>
+        /// <returns>The <see cref="PackageJson"/>.</returns>
+        /// <exception cref="Newtonsoft.Json.JsonReaderException">The content is not a well-formed JSON object.</exception>
+        public static PackageJson Parse(string json)
+        {
+            var packageJson = new PackageJson();
+            ManifestJsonReader.ReadObject(json, (propertyName, reader) =>
+            {
+                switch (propertyName)
+                {
+                    case "dependencies":
+                        packageJson.Dependencies = ManifestJsonReader.ReadStringMap(reader);
+                        return true;
+                    case "devDependencies":
+                        packageJson.DevDependencies = ManifestJsonReader.ReadStringMap(reader);
+                        return true;
+                    case "scripts":
+                        packageJson.Scripts = ManifestJsonReader.ReadStringMap(reader);
+                        return true;
+                    case "engines":
+                        packageJson.Engines = ManifestJsonReader.ReadStringMap(reader);
+                        return true;
+                    default:
+                        return false;
+                }
+            });
+
+            return packageJson;
+        }
+    }
+}
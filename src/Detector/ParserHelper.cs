@@ -27,7 +27,7 @@ namespace Microsoft.Oryx.Detector
         /// <summary>
         /// Environment variable name to override the maximum configuration file size.
         /// </summary>
-        private const string MaxFileSizeEnvironmentVariable = "ORYX_MAX_CONFIG_FILE_SIZE_MB";
+        internal const string MaxFileSizeEnvironmentVariable = "ORYX_MAX_CONFIG_FILE_SIZE_MB";
 
         /// <summary>
         /// Gets the maximum allowed file size for configuration files in MB.
@@ -0,0 +1,48 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System.Collections.Generic;
+
+namespace Microsoft.Oryx.Detector.Php
+{
+    /// <summary>
+    /// The parts of a 'composer.json' file Oryx looks at. Get it through
+    /// <see cref="ManifestFileCache"/> so that the file is parsed only once per source repo.
+    /// </summary>
+    public class ComposerJson
+    {
+        private ComposerJson()
+        {
+        }
+
+        /// <summary>
+        /// Gets the packages the project 'require's, including the 'php' version, or null if there are none.
+        /// </summary>
+        public IReadOnlyDictionary<string, string> Require { get; private set; }
+
+        /// <summary>
+        /// Parses the content of a 'composer.json' file.
+        /// </summary>
+        /// <param name="json">The content of the file.</param>
+        /// <returns>The <see cref="ComposerJson"/>.</returns>
+        /// <exception cref="Newtonsoft.Json.JsonReaderException">The content is not a well-formed JSON object.</exception>
+        public static ComposerJson Parse(string json)
+        {
+            var composerJson = new ComposerJson();
+            ManifestJsonReader.ReadObject(json, (propertyName, reader) =>
+            {
+                if (propertyName == "require")
+                {
+                    composerJson.Require = ManifestJsonReader.ReadStringMap(reader);
+                    return true;
+                }
+
+                return false;
+            });
+
+            return composerJson;
+        }
+    }
+}
@@ -3,11 +3,9 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
-using System;
+using System.Collections.Generic;
 using System.Linq;
 using Microsoft.Extensions.Logging;
-using Microsoft.Oryx.Common.Extensions;
-using Newtonsoft.Json;
 
 namespace Microsoft.Oryx.Detector.Php
 {
@@ -83,23 +81,15 @@ namespace Microsoft.Oryx.Detector.Php
 
         private string GetVersionFromComposerFile(DetectorContext context)
         {
-            dynamic composerFile = null;
-            try
-            {
-                var jsonContent = context.SourceRepo.ReadFile(PhpConstants.ComposerFileName);
-                composerFile = JsonConvert.DeserializeObject(jsonContent);
-            }
-            catch (Exception ex)
-            {
-                // We just ignore errors, so we leave malformed composer.json files for Composer to handle,
-                // not us. This prevents us from erroring out when Composer itself might be able to tolerate
-                // some errors in the composer.json file.
-                this.logger.LogWarning(
-                    ex,
-                    $"Exception caught while trying to deserialize {PhpConstants.ComposerFileName.Hash()}");
-            }
-
-            return composerFile?.require?.php?.Value as string;
+            // Errors are ignored, so that malformed composer.json files are left for Composer to handle, not us.
+            // This prevents us from erroring out when Composer itself might be able to tolerate some errors in the
+            // composer.json file.
+            var composerFile = ManifestFileCache.GetOrAdd(
+                context.SourceRepo,
+                PhpConstants.ComposerFileName,
+                ComposerJson.Parse,
+                this.logger);
+            return composerFile?.Require?.GetValueOrDefault("php");
         }
     }
 }
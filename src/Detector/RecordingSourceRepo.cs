@@ -0,0 +1,174 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace Microsoft.Oryx.Detector
+{
+    /// <summary>
+    /// An <see cref="ISourceRepo"/> which forwards all calls to another <see cref="ISourceRepo"/> and records
+    /// every query made against it together with a fingerprint of its outcome, so that it can later be verified
+    /// whether the answers a detector got are still the same.
+    /// </summary>
+    internal class RecordingSourceRepo : ISourceRepo
+    {
+        internal const string FileExistsQuery = "FileExists";
+        internal const string DirExistsQuery = "DirExists";
+        internal const string ReadFileQuery = "ReadFile";
+        internal const string GetFileSizeQuery = "GetFileSize";
+        internal const string EnumerateFilesQuery = "EnumerateFiles";
+
+        private readonly ISourceRepo sourceRepo;
+        private readonly Dictionary<string, DetectionInput> inputs = new Dictionary<string, DetectionInput>();
+
+        public RecordingSourceRepo(ISourceRepo sourceRepo)
+        {
+            this.sourceRepo = sourceRepo;
+        }
+
+        public string RootPath => this.sourceRepo.RootPath;
+
+        /// <summary>
+        /// Gets the source repo the calls are forwarded to.
+        /// </summary>
+        public ISourceRepo InnerSourceRepo => this.sourceRepo;
+
+        /// <summary>
+        /// Gets the queries made against the source repo so far.
+        /// </summary>
+        public IEnumerable<DetectionInput> Inputs => this.inputs.Values;
+
+        /// <summary>
+        /// Runs the query described by <paramref name="input"/> against the <paramref name="sourceRepo"/> and
+        /// returns the fingerprint of its outcome.
+        /// </summary>
+        public static string GetFingerprint(ISourceRepo sourceRepo, DetectionInput input)
+        {
+            switch (input.Query)
+            {
+                case FileExistsQuery:
+                    return sourceRepo.FileExists(input.Arguments).ToString();
+                case DirExistsQuery:
+                    return sourceRepo.DirExists(input.Arguments).ToString();
+                case GetFileSizeQuery:
+                    return sourceRepo.GetFileSize(input.Arguments)?.ToString() ?? string.Empty;
+                case ReadFileQuery:
+                    var path = Path.Combine(sourceRepo.RootPath, Path.Combine(input.Arguments));
+                    using (var stream = File.OpenRead(path))
+                    using (var sha = SHA256.Create())
+                    {
+                        return Convert.ToBase64String(sha.ComputeHash(stream));
+                    }
+
+                case EnumerateFilesQuery:
+                    var files = sourceRepo.EnumerateFiles(
+                        input.Arguments[0],
+                        bool.Parse(input.Arguments[1]),
+                        input.Arguments.Skip(2).ToArray());
+                    return GetFingerprint(files);
+                default:
+                    throw new ArgumentException($"Unknown source repo query '{input.Query}'.", nameof(input));
+            }
+        }
+
+        public bool FileExists(params string[] paths)
+        {
+            var exists = this.sourceRepo.FileExists(paths);
+            this.Record(FileExistsQuery, paths, exists.ToString());
+            return exists;
+        }
+
+        public bool DirExists(params string[] paths)
+        {
+            var exists = this.sourceRepo.DirExists(paths);
+            this.Record(DirExistsQuery, paths, exists.ToString());
+            return exists;
+        }
+
+        public string ReadFile(params string[] paths)
+        {
+            var content = this.sourceRepo.ReadFile(paths);
+            this.RecordRead(paths);
+            return content;
+        }
+
+        public string[] ReadAllLines(params string[] paths)
+        {
+            var lines = this.sourceRepo.ReadAllLines(paths);
+            this.RecordRead(paths);
+            return lines;
+        }
+
+        public long? GetFileSize(params string[] paths)
+        {
+            var size = this.sourceRepo.GetFileSize(paths);
+            this.Record(GetFileSizeQuery, paths, size?.ToString() ?? string.Empty);
+            return size;
+        }
+
+        public IEnumerable<string> EnumerateFiles(
+            string searchPattern,
+            bool searchSubDirectories,
+            params string[] subDirectoryToSearchUnder)
+        {
+            // Materialize the result so that its fingerprint covers exactly what the detector sees
+            var files = this.sourceRepo
+                .EnumerateFiles(searchPattern, searchSubDirectories, subDirectoryToSearchUnder)
+                .ToList();
+            var arguments = new[] { searchPattern, searchSubDirectories.ToString() }
+                .Concat(subDirectoryToSearchUnder ?? Array.Empty<string>())
+                .ToArray();
+            this.Record(EnumerateFilesQuery, arguments, GetFingerprint(files));
+            return files;
+        }
+
+        /// <summary>
+        /// Records a read of the file at <paramref name="paths"/> which was not made through this source repo,
+        /// ex: because the content was already parsed by <see cref="ManifestFileCache"/>.
+        /// </summary>
+        internal void RecordRead(string[] paths)
+        {
+            var input = new DetectionInput { Query = ReadFileQuery, Arguments = paths };
+            this.Record(ReadFileQuery, paths, GetFingerprint(this.sourceRepo, input));
+        }
+
+        private static string GetFingerprint(IEnumerable<string> files)
+        {
+            using (var sha = SHA256.Create())
+            {
+                var bytes = Encoding.UTF8.GetBytes(string.Join("\n", files));
+                return Convert.ToBase64String(sha.ComputeHash(bytes));
+            }
+        }
+
+        private void Record(string query, string[] arguments, string fingerprint)
+        {
+            var key = query + "\0" + string.Join("\0", arguments);
+            this.inputs[key] = new DetectionInput
+            {
+                Query = query,
+                Arguments = arguments,
+                Fingerprint = fingerprint,
+            };
+        }
+
+        /// <summary>
+        /// A query made against a source repo by a detector and the fingerprint of its outcome.
+        /// </summary>
+        internal class DetectionInput
+        {
+            public string Query { get; set; }
+
+            public string[] Arguments { get; set; }
+
+            public string Fingerprint { get; set; }
+        }
+    }
+}
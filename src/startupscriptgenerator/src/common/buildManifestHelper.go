@@ -31,6 +31,7 @@ type BuildManifest struct {
 	GolangVersion                   string
 	SourceDirectoryInBuildContainer string
 	CompressDestinationDir          string
+	BytecodeInvalidationMode        string
 }
 
 var _buildManifest BuildManifest
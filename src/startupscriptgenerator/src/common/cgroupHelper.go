@@ -0,0 +1,100 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package common
+
+import (
+	"io/ioutil"
+	"math"
+	"path/filepath"
+	"runtime"
+	"strconv"
+	"strings"
+)
+
+// Root of the cgroup file system, which is the container's own cgroup when running in a container.
+var cgroupRootDir = "/sys/fs/cgroup"
+
+// cgroup v1 reports the absence of a memory limit as a very large number rounded down to the page size.
+const cgroupV1UnlimitedMemoryThreshold = int64(1) << 60
+
+// Resource limits of the cgroup the startup script generator runs in, and so of the app it starts.
+type CgroupLimits struct {
+	// Number of CPUs the processes of the cgroup can use in total, e.g. 1.5, or 0 if there is no quota.
+	CpuQuota float64
+	// Maximum amount of memory the processes of the cgroup can use, or 0 if there is no limit.
+	MemoryLimitInBytes int64
+	// Description of where the limits were read from.
+	Source string
+}
+
+// Reads the CPU quota and memory limit from cgroup v2 ('cpu.max', 'memory.max') or, if not available, from
+// cgroup v1 ('cpu.cfs_quota_us', 'memory.limit_in_bytes').
+func GetCgroupLimits() CgroupLimits {
+	if PathExists(filepath.Join(cgroupRootDir, "cgroup.controllers")) {
+		limits := CgroupLimits{Source: "cgroup v2"}
+		if fields := strings.Fields(readCgroupFile("cpu.max")); len(fields) == 2 && fields[0] != "max" {
+			limits.CpuQuota = getCpuQuota(fields[0], fields[1])
+		}
+
+		if value := readCgroupFile("memory.max"); value != "max" {
+			limits.MemoryLimitInBytes, _ = strconv.ParseInt(value, 10, 64)
+		}
+
+		return limits
+	}
+
+	limits := CgroupLimits{Source: "cgroup v1"}
+	for _, cpuController := range []string{"cpu", "cpu,cpuacct"} {
+		quota := readCgroupFile(filepath.Join(cpuController, "cpu.cfs_quota_us"))
+		if quota != "" {
+			if quota != "-1" {
+				limits.CpuQuota = getCpuQuota(quota, readCgroupFile(filepath.Join(cpuController, "cpu.cfs_period_us")))
+			}
+
+			break
+		}
+	}
+
+	memoryLimit, err := strconv.ParseInt(readCgroupFile(filepath.Join("memory", "memory.limit_in_bytes")), 10, 64)
+	if err == nil && memoryLimit < cgroupV1UnlimitedMemoryThreshold {
+		limits.MemoryLimitInBytes = memoryLimit
+	}
+
+	return limits
+}
+
+// Returns the number of CPUs available to the app, which is the number of CPUs of the host capped by the CPU
+// quota of the cgroup, rounded up.
+func (limits CgroupLimits) GetEffectiveCpuCount() int {
+	cpuCount := runtime.NumCPU()
+	if limits.CpuQuota > 0 {
+		quotaCpuCount := int(math.Ceil(limits.CpuQuota))
+		if quotaCpuCount < cpuCount {
+			cpuCount = quotaCpuCount
+		}
+	}
+
+	return cpuCount
+}
+
+func getCpuQuota(quota string, period string) float64 {
+	quotaValue, quotaErr := strconv.ParseFloat(quota, 64)
+	periodValue, periodErr := strconv.ParseFloat(period, 64)
+	if quotaErr != nil || periodErr != nil || quotaValue <= 0 || periodValue <= 0 {
+		return 0
+	}
+
+	return quotaValue / periodValue
+}
+
+func readCgroupFile(relativePath string) string {
+	content, err := ioutil.ReadFile(filepath.Join(cgroupRootDir, relativePath))
+	if err != nil {
+		return ""
+	}
+
+	return strings.TrimSpace(string(content))
+}
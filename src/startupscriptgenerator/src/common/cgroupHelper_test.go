@@ -0,0 +1,77 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package common
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func Test_GetCgroupLimits_ReadsCgroupV2Limits(t *testing.T) {
+	// Arrange
+	setCgroupRootDir(t, map[string]string{
+		"cgroup.controllers": "cpu memory",
+		"cpu.max":            "150000 100000",
+		"memory.max":         "536870912",
+	})
+
+	// Act
+	limits := GetCgroupLimits()
+
+	// Assert
+	assert.Equal(t, 1.5, limits.CpuQuota)
+	assert.Equal(t, int64(536870912), limits.MemoryLimitInBytes)
+	assert.LessOrEqual(t, limits.GetEffectiveCpuCount(), 2)
+}
+
+func Test_GetCgroupLimits_ReturnsNoLimits_ForUnlimitedCgroupV2(t *testing.T) {
+	// Arrange
+	setCgroupRootDir(t, map[string]string{
+		"cgroup.controllers": "cpu memory",
+		"cpu.max":            "max 100000",
+		"memory.max":         "max",
+	})
+
+	// Act
+	limits := GetCgroupLimits()
+
+	// Assert
+	assert.Equal(t, 0.0, limits.CpuQuota)
+	assert.Equal(t, int64(0), limits.MemoryLimitInBytes)
+}
+
+func Test_GetCgroupLimits_ReadsCgroupV1Limits(t *testing.T) {
+	// Arrange
+	setCgroupRootDir(t, map[string]string{
+		"cpu,cpuacct/cpu.cfs_quota_us":  "200000",
+		"cpu,cpuacct/cpu.cfs_period_us": "100000",
+		"memory/memory.limit_in_bytes":  "9223372036854771712",
+	})
+
+	// Act
+	limits := GetCgroupLimits()
+
+	// Assert
+	assert.Equal(t, 2.0, limits.CpuQuota)
+	assert.Equal(t, int64(0), limits.MemoryLimitInBytes)
+	assert.Equal(t, "cgroup v1", limits.Source)
+}
+
+func setCgroupRootDir(t *testing.T, files map[string]string) {
+	rootDir := t.TempDir()
+	for name, content := range files {
+		path := filepath.Join(rootDir, name)
+		os.MkdirAll(filepath.Dir(path), 0755)
+		os.WriteFile(path, []byte(content+"\n"), 0644)
+	}
+
+	originalRootDir := cgroupRootDir
+	cgroupRootDir = rootDir
+	t.Cleanup(func() { cgroupRootDir = originalRootDir })
+}
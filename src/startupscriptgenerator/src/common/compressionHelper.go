@@ -7,6 +7,9 @@ package common
 
 import (
 	"archive/tar"
+	"archive/zip"
+	"bufio"
+	"common/consts"
 	"compress/gzip"
 	"fmt"
 	"io"
@@ -14,9 +17,30 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"runtime"
 	"strings"
+	"sync"
+	"time"
 )
 
+// Files up to this size are read into a pooled buffer and written by the worker pool, bigger files are
+// streamed to disk directly. Virtual environments and node_modules are mostly made of small files, for which
+// the cost of the open/write/chmod/close syscalls outweighs the cost of copying their content.
+const extractionBufferSize = 512 * 1024
+
+// Size of the blocks in which the decompressed stream is read ahead of the tar reader.
+const readAheadBlockSize = 1024 * 1024
+const readAheadBlockCount = 8
+
+const maxExtractionWorkers = 16
+
+var extractionBufferPool = sync.Pool{
+	New: func() interface{} {
+		buffer := make([]byte, extractionBufferSize)
+		return &buffer
+	},
+}
+
 // Untar the output file to the provided destination directory
 func ExtractTarball(tarballFile string, destinationDir string) {
 	if tarballFile == "" {
@@ -45,112 +69,623 @@ func ExtractTarball(tarballFile string, destinationDir string) {
 	}
 
 	println(fmt.Sprintf("Extracting '%s' to directory '%s'...", tarballFile, destinationDir))
-	err = untar(destinationDir, tarballFile)
+	err = ExtractArchive(tarballFile, destinationDir)
 	if err != nil {
-		panic(fmt.Sprintf("An error occurred when trying to extract tarball '%s'.", tarballFile))
-	}
-}
-
-func untar(dst string, tarballFile string) error {
-    // Detect compression format based on file extension
-	if strings.HasSuffix(tarballFile, ".tar.zst") {
-        // Use zstd for decompression
-		println(fmt.Sprintf("Using zstd for decompression of file: %s", tarballFile))
-        return untarWithZstd(dst, tarballFile)
-    } else if strings.HasSuffix(tarballFile, ".tar.gz") {
-        // Use native Go gzip decompression
-		println(fmt.Sprintf("Using gzip for decompression of file: %s", tarballFile))
-        return untarWithGzip(dst, tarballFile)
-    } else {
-        errMsg := fmt.Errorf("unsupported compression format for file: %s", tarballFile)
-        println(errMsg)
-        return errMsg
-	}
-}
-
-// This extracts a zstd-compressed tarball using the system tar command.
-// Unlike untarWithGzip, we use the external tar binary because
-// Go's standard library doesn't include zstd support, avoiding the need for third-party dependencies.
-func untarWithZstd(dst string, tarballFile string) error {
-    cmd := exec.Command("tar", "-I", "zstd", "-xf", tarballFile, "-C", dst)
-    output, err := cmd.CombinedOutput()
-    if err != nil {
-        errMsg := fmt.Errorf("zstd tar extraction failed: %v, output: %s", err, output)
-        println(errMsg)
-        return errMsg
-    }
-    println(fmt.Sprintf("zstd tar Successfully extracted '%s' to '%s'", tarballFile, dst))
-    return nil
-}
-
-// Credit to https://medium.com/@skdomino/taring-untaring-files-in-go-6b07cf56bc07
-// Untar takes a destination path and a reader; a tar reader loops over the tarfile
-// creating the file structure at 'dst' along the way, and writing any files
-func untarWithGzip(dst string, tarballFile string) error {
-	r, err := os.Open(tarballFile)
+		panic(fmt.Sprintf("An error occurred when trying to extract tarball '%s': %v", tarballFile, err))
+	}
+}
+
+// Returns the command which extracts the archive into the destination directory when run from a generated
+// startup script. The archive can be any of the formats supported by ExtractArchive.
+func GetExtractionCommand(archiveFile string, destinationDir string) string {
+	return fmt.Sprintf(
+		"oryx %s -archive %s -destination %s",
+		consts.ExtractCommandName,
+		archiveFile,
+		destinationDir)
+}
+
+// Returns the script which mounts a squashfs image read-only at the mount directory, so that only the blocks of
+// the files which are read are decompressed, instead of extracting all of it before the app starts. The image is
+// mounted with squashfuse, which does not need any privilege, or else with a loop device. If neither works the
+// image is extracted with unsquashfs.
+func GetSquashfsMountScript(imageFile string, mountDir string) string {
+	scriptBuilder := strings.Builder{}
+	scriptBuilder.WriteString(fmt.Sprintf("if mountpoint -q %s; then\n", mountDir))
+	scriptBuilder.WriteString(fmt.Sprintf("    fusermount -u %s 2> /dev/null || umount %s\n", mountDir, mountDir))
+	scriptBuilder.WriteString("fi\n")
+	scriptBuilder.WriteString("rm -fr " + mountDir + "\n")
+	scriptBuilder.WriteString("mkdir -p " + mountDir + "\n")
+	scriptBuilder.WriteString(fmt.Sprintf(
+		"if command -v squashfuse > /dev/null 2>&1 && squashfuse -o ro %s %s 2> /dev/null; then\n",
+		imageFile,
+		mountDir))
+	scriptBuilder.WriteString(fmt.Sprintf("    echo \"Mounted '%s' at '%s' with squashfuse.\"\n", imageFile, mountDir))
+	scriptBuilder.WriteString(fmt.Sprintf(
+		"elif mount -t squashfs -o loop,ro %s %s 2> /dev/null; then\n",
+		imageFile,
+		mountDir))
+	scriptBuilder.WriteString(fmt.Sprintf("    echo \"Mounted '%s' at '%s' with a loop device.\"\n", imageFile, mountDir))
+	scriptBuilder.WriteString("elif command -v unsquashfs > /dev/null 2>&1; then\n")
+	scriptBuilder.WriteString(fmt.Sprintf(
+		"    echo \"Could not mount '%s', extracting it to '%s'...\"\n",
+		imageFile,
+		mountDir))
+	scriptBuilder.WriteString(fmt.Sprintf("    unsquashfs -f -no-progress -d %s %s > /dev/null\n", mountDir, imageFile))
+	scriptBuilder.WriteString("else\n")
+	scriptBuilder.WriteString(fmt.Sprintf(
+		"    echo \"Error: Could not mount or extract '%s', squashfuse or unsquashfs is required.\"\n",
+		imageFile))
+	scriptBuilder.WriteString(fmt.Sprintf("    exit %d\n", consts.FAILURE_EXIT_CODE))
+	scriptBuilder.WriteString("fi\n")
+	return scriptBuilder.String()
+}
+
+// Runs the extract command of the startup script generators, exiting with a failure code if the extraction fails.
+func RunExtractCommand(archiveFile string, destinationDir string) {
+	if archiveFile == "" || destinationDir == "" {
+		fmt.Println("Error: Both '-archive' and '-destination' are required.")
+		os.Exit(consts.FAILURE_EXIT_CODE)
+	}
+
+	if err := os.MkdirAll(destinationDir, 0755); err != nil {
+		fmt.Println(fmt.Sprintf("Error: Could not create directory '%s': %v", destinationDir, err))
+		os.Exit(consts.FAILURE_EXIT_CODE)
+	}
+
+	if err := ExtractArchive(archiveFile, destinationDir); err != nil {
+		fmt.Println(fmt.Sprintf("Error: Could not extract '%s' to '%s': %v", archiveFile, destinationDir, err))
+		os.Exit(consts.FAILURE_EXIT_CODE)
+	}
+}
+
+// Extracts a '.tar.zst', '.tar.gz' or '.zip' archive into the destination directory, which must exist.
+// Regular files are written by a bounded pool of workers while the archive is being decompressed, symbolic and
+// hard links are created once all regular files have been written, and the extraction throughput is reported.
+func ExtractArchive(archiveFile string, destinationDir string) error {
+	extractor := newArchiveExtractor(destinationDir)
+	startTime := time.Now()
+
+	var err error
+	if strings.HasSuffix(archiveFile, ".tar.zst") {
+		println(fmt.Sprintf("Using zstd for decompression of file: %s", archiveFile))
+		err = extractor.extractTarWithCommand(archiveFile, "zstd", "-d", "-c", "-q", archiveFile)
+	} else if strings.HasSuffix(archiveFile, ".tar.gz") || strings.HasSuffix(archiveFile, ".tgz") {
+		if _, lookErr := exec.LookPath("pigz"); lookErr == nil {
+			// pigz decompresses on one thread, but reads, writes and verifies the checksum on separate threads
+			println(fmt.Sprintf("Using pigz for decompression of file: %s", archiveFile))
+			err = extractor.extractTarWithCommand(archiveFile, "pigz", "-d", "-c", archiveFile)
+		} else {
+			println(fmt.Sprintf("Using gzip for decompression of file: %s", archiveFile))
+			err = extractor.extractTarWithGzip(archiveFile)
+		}
+	} else if strings.HasSuffix(archiveFile, ".zip") {
+		println(fmt.Sprintf("Using zip for decompression of file: %s", archiveFile))
+		err = extractor.extractZip(archiveFile)
+	} else {
+		err = fmt.Errorf("unsupported compression format for file: %s", archiveFile)
+	}
+
 	if err != nil {
+		println(err.Error())
 		return err
 	}
 
-	gzr, err := gzip.NewReader(r)
+	elapsed := time.Since(startTime)
+	megabytes := float64(extractor.extractedBytes) / (1024 * 1024)
+	println(fmt.Sprintf(
+		"Extracted %d files (%.1f MB) from '%s' to '%s' in %.2f sec(s), %.1f MB/s using %d workers.",
+		extractor.extractedFiles,
+		megabytes,
+		archiveFile,
+		destinationDir,
+		elapsed.Seconds(),
+		megabytes/max(elapsed.Seconds(), 0.001),
+		extractor.workerCount))
+	return nil
+}
+
+type extractionJob struct {
+	target  string
+	mode    os.FileMode
+	modTime time.Time
+	// Content of the file, which is returned to the buffer pool once written.
+	buffer  *[]byte
+	size    int
+	zipFile *zip.File
+}
+
+type deferredLink struct {
+	target   string
+	linkName string
+	hardLink bool
+}
+
+type deferredDirectory struct {
+	path    string
+	mode    os.FileMode
+	modTime time.Time
+}
+
+type archiveExtractor struct {
+	destinationDir string
+	workerCount    int
+	jobs           chan extractionJob
+	workers        sync.WaitGroup
+
+	errorLock sync.Mutex
+	firstErr  error
+
+	createdDirs    map[string]bool
+	links          []deferredLink
+	directories    []deferredDirectory
+	extractedFiles int
+	extractedBytes int64
+}
+
+func newArchiveExtractor(destinationDir string) *archiveExtractor {
+	workerCount := runtime.NumCPU() * 2
+	if workerCount > maxExtractionWorkers {
+		workerCount = maxExtractionWorkers
+	}
+
+	return &archiveExtractor{
+		destinationDir: filepath.Clean(destinationDir),
+		workerCount:    workerCount,
+		createdDirs:    map[string]bool{},
+	}
+}
+
+func (extractor *archiveExtractor) extractTarWithCommand(archiveFile string, name string, args ...string) error {
+	cmd := exec.Command(name, args...)
+	stderr := &strings.Builder{}
+	cmd.Stderr = stderr
+	stdout, err := cmd.StdoutPipe()
 	if err != nil {
 		return err
 	}
-	defer gzr.Close()
 
-	tr := tar.NewReader(gzr)
+	if err := cmd.Start(); err != nil {
+		return fmt.Errorf("could not start '%s' to decompress '%s': %v", name, archiveFile, err)
+	}
+
+	if err := extractor.extractTar(bufio.NewReaderSize(stdout, readAheadBlockSize)); err != nil {
+		cmd.Process.Kill()
+		cmd.Wait()
+		return err
+	}
 
-	for {
-		header, err := tr.Next()
+	// Drain the padding after the end of the tar stream, so that the decompressor does not block on a full pipe
+	io.Copy(io.Discard, stdout)
+	if err := cmd.Wait(); err != nil {
+		return fmt.Errorf("'%s' failed to decompress '%s': %v, output: %s", name, archiveFile, err, stderr.String())
+	}
+
+	return nil
+}
+
+func (extractor *archiveExtractor) extractTarWithGzip(archiveFile string) error {
+	file, err := os.Open(archiveFile)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	gzr, err := gzip.NewReader(bufio.NewReaderSize(file, readAheadBlockSize))
+	if err != nil {
+		return err
+	}
+	defer gzr.Close()
 
-		switch {
+	// Decompress on a separate goroutine so that inflating the stream overlaps with parsing the tar headers
+	readAhead := newReadAheadReader(gzr)
+	defer readAhead.Close()
+	return extractor.extractTar(readAhead)
+}
 
-		// if no more files are found return
-		case err == io.EOF:
+func (extractor *archiveExtractor) extractTar(reader io.Reader) error {
+	extractor.startWorkers()
+	tr := tar.NewReader(reader)
+	readErr := extractor.readTarEntries(tr)
+	return extractor.finish(readErr)
+}
+
+func (extractor *archiveExtractor) readTarEntries(tr *tar.Reader) error {
+	for !extractor.failed() {
+		header, err := tr.Next()
+		if err == io.EOF {
 			return nil
+		}
 
-		// return any other error
-		case err != nil:
+		if err != nil {
 			return err
+		}
 
-		// if the header is nil, just skip it (not sure how this happens)
-		case header == nil:
-			continue
+		target, err := extractor.resolvePath(header.Name)
+		if err != nil {
+			return err
 		}
 
-		// the target location where the dir/file should be created
-		target := filepath.Join(dst, header.Name)
+		mode := header.FileInfo().Mode() & (os.ModePerm | os.ModeSetuid | os.ModeSetgid | os.ModeSticky)
+		switch header.Typeflag {
+		case tar.TypeDir:
+			if err := extractor.createDir(target); err != nil {
+				return err
+			}
 
-		// the following switch could also be done using fi.Mode(), not sure if there
-		// a benefit of using one vs. the other.
-		// fi := header.FileInfo()
+			extractor.directories = append(
+				extractor.directories,
+				deferredDirectory{path: target, mode: mode, modTime: header.ModTime})
 
-		// check the file type
-		switch header.Typeflag {
+		case tar.TypeReg, tar.TypeRegA:
+			if err := extractor.createDir(filepath.Dir(target)); err != nil {
+				return err
+			}
 
-		// if its a dir and it doesn't exist create it
-		case tar.TypeDir:
-			if _, err := os.Stat(target); err != nil {
-				if err := os.MkdirAll(target, 0755); err != nil {
+			extractor.extractedFiles++
+			extractor.extractedBytes += header.Size
+			if header.Size > extractionBufferSize {
+				if err := writeFile(target, mode, header.ModTime, tr); err != nil {
 					return err
 				}
+
+				continue
+			}
+
+			buffer := extractionBufferPool.Get().(*[]byte)
+			if _, err := io.ReadFull(tr, (*buffer)[:header.Size]); err != nil {
+				extractionBufferPool.Put(buffer)
+				return err
+			}
+
+			extractor.jobs <- extractionJob{
+				target:  target,
+				mode:    mode,
+				modTime: header.ModTime,
+				buffer:  buffer,
+				size:    int(header.Size),
+			}
+
+		case tar.TypeSymlink:
+			if err := extractor.createDir(filepath.Dir(target)); err != nil {
+				return err
 			}
 
-		// if it's a file create it
-		case tar.TypeReg:
-			f, err := os.OpenFile(target, os.O_CREATE|os.O_RDWR, os.FileMode(header.Mode))
+			extractor.links = append(extractor.links, deferredLink{target: target, linkName: header.Linkname})
+
+		case tar.TypeLink:
+			linkTarget, err := extractor.resolvePath(header.Linkname)
 			if err != nil {
 				return err
 			}
 
-			// copy over contents
-			if _, err := io.Copy(f, tr); err != nil {
+			if err := extractor.createDir(filepath.Dir(target)); err != nil {
 				return err
 			}
 
-			// manually close here after each file operation; defering would cause each file close
-			// to wait until all operations have completed.
-			f.Close()
+			extractor.links = append(
+				extractor.links,
+				deferredLink{target: target, linkName: linkTarget, hardLink: true})
 		}
 	}
+
+	return nil
+}
+
+func (extractor *archiveExtractor) extractZip(archiveFile string) error {
+	zipReader, err := zip.OpenReader(archiveFile)
+	if err != nil {
+		return err
+	}
+	defer zipReader.Close()
+
+	// The entries of a zip file can be read independently, so the workers also decompress them in parallel
+	extractor.startWorkers()
+	readErr := func() error {
+		for _, zipFile := range zipReader.File {
+			if extractor.failed() {
+				return nil
+			}
+
+			target, err := extractor.resolvePath(zipFile.Name)
+			if err != nil {
+				return err
+			}
+
+			fileInfo := zipFile.FileInfo()
+			mode := fileInfo.Mode()
+			switch {
+			case mode.IsDir():
+				if err := extractor.createDir(target); err != nil {
+					return err
+				}
+
+				extractor.directories = append(
+					extractor.directories,
+					deferredDirectory{path: target, mode: mode.Perm(), modTime: zipFile.Modified})
+
+			case mode&os.ModeSymlink != 0:
+				if err := extractor.createDir(filepath.Dir(target)); err != nil {
+					return err
+				}
+
+				linkName, err := readZipSymlink(zipFile)
+				if err != nil {
+					return err
+				}
+
+				extractor.links = append(extractor.links, deferredLink{target: target, linkName: linkName})
+
+			default:
+				if err := extractor.createDir(filepath.Dir(target)); err != nil {
+					return err
+				}
+
+				extractor.extractedFiles++
+				extractor.extractedBytes += int64(zipFile.UncompressedSize64)
+				extractor.jobs <- extractionJob{
+					target:  target,
+					mode:    mode.Perm(),
+					modTime: zipFile.Modified,
+					zipFile: zipFile,
+				}
+			}
+		}
+
+		return nil
+	}()
+
+	return extractor.finish(readErr)
+}
+
+func readZipSymlink(zipFile *zip.File) (string, error) {
+	reader, err := zipFile.Open()
+	if err != nil {
+		return "", err
+	}
+	defer reader.Close()
+
+	linkName, err := io.ReadAll(reader)
+	return string(linkName), err
+}
+
+func (extractor *archiveExtractor) startWorkers() {
+	extractor.jobs = make(chan extractionJob, extractor.workerCount)
+	for i := 0; i < extractor.workerCount; i++ {
+		extractor.workers.Add(1)
+		go func() {
+			defer extractor.workers.Done()
+			for job := range extractor.jobs {
+				if extractor.failed() {
+					releaseBuffer(job.buffer)
+					continue
+				}
+
+				if err := runExtractionJob(job); err != nil {
+					extractor.setError(err)
+				}
+			}
+		}()
+	}
+}
+
+// Waits for the workers to write all regular files, then creates the links and applies the modes and
+// modification times of the directories, whose content is final at that point.
+func (extractor *archiveExtractor) finish(readErr error) error {
+	close(extractor.jobs)
+	extractor.workers.Wait()
+	if readErr != nil {
+		return readErr
+	}
+
+	if extractor.firstErr != nil {
+		return extractor.firstErr
+	}
+
+	for _, link := range extractor.links {
+		if err := os.Remove(link.target); err != nil && !os.IsNotExist(err) {
+			return err
+		}
+
+		if link.hardLink {
+			if err := os.Link(link.linkName, link.target); err != nil {
+				return err
+			}
+		} else if err := os.Symlink(link.linkName, link.target); err != nil {
+			return err
+		}
+	}
+
+	// Deepest directories first, so that setting the modification time of a directory is not undone by a change
+	// to one of its children
+	for i := len(extractor.directories) - 1; i >= 0; i-- {
+		directory := extractor.directories[i]
+		if err := os.Chmod(directory.path, directory.mode); err != nil {
+			return err
+		}
+
+		if !directory.modTime.IsZero() {
+			os.Chtimes(directory.path, directory.modTime, directory.modTime)
+		}
+	}
+
+	return nil
+}
+
+func runExtractionJob(job extractionJob) error {
+	if job.zipFile != nil {
+		reader, err := job.zipFile.Open()
+		if err != nil {
+			return err
+		}
+		defer reader.Close()
+		return writeFile(job.target, job.mode, job.modTime, reader)
+	}
+
+	defer releaseBuffer(job.buffer)
+	return writeFile(job.target, job.mode, job.modTime, nil, (*job.buffer)[:job.size]...)
+}
+
+// Writes the content to the file at the target path, truncating any existing file. The content is either taken
+// from the reader, or, if the reader is nil, from the given bytes.
+func writeFile(target string, mode os.FileMode, modTime time.Time, reader io.Reader, content ...byte) error {
+	file, err := os.OpenFile(target, os.O_CREATE|os.O_WRONLY|os.O_TRUNC, mode)
+	if err != nil {
+		return err
+	}
+
+	if reader != nil {
+		buffer := extractionBufferPool.Get().(*[]byte)
+		_, err = io.CopyBuffer(file, reader, *buffer)
+		extractionBufferPool.Put(buffer)
+	} else {
+		_, err = file.Write(content)
+	}
+
+	// The mode passed to OpenFile is subject to the umask, unlike the modes restored by tar
+	if err == nil {
+		err = file.Chmod(mode)
+	}
+
+	if closeErr := file.Close(); err == nil {
+		err = closeErr
+	}
+
+	if err == nil && !modTime.IsZero() {
+		err = os.Chtimes(target, modTime, modTime)
+	}
+
+	return err
+}
+
+func releaseBuffer(buffer *[]byte) {
+	if buffer != nil {
+		extractionBufferPool.Put(buffer)
+	}
+}
+
+// Returns the path in the destination directory for the name of an archive entry, rejecting names which would
+// be extracted outside of the destination directory.
+func (extractor *archiveExtractor) resolvePath(name string) (string, error) {
+	target := filepath.Join(extractor.destinationDir, name)
+	if target != extractor.destinationDir &&
+		!strings.HasPrefix(target, extractor.destinationDir+string(os.PathSeparator)) {
+		return "", fmt.Errorf("archive entry '%s' is outside of the destination directory", name)
+	}
+
+	return target, nil
+}
+
+func (extractor *archiveExtractor) createDir(dir string) error {
+	if extractor.createdDirs[dir] {
+		return nil
+	}
+
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return err
+	}
+
+	extractor.createdDirs[dir] = true
+	return nil
+}
+
+func (extractor *archiveExtractor) failed() bool {
+	extractor.errorLock.Lock()
+	defer extractor.errorLock.Unlock()
+	return extractor.firstErr != nil
+}
+
+func (extractor *archiveExtractor) setError(err error) {
+	extractor.errorLock.Lock()
+	defer extractor.errorLock.Unlock()
+	if extractor.firstErr == nil {
+		extractor.firstErr = err
+	}
+}
+
+// An io.Reader which reads the underlying reader on a separate goroutine, up to a fixed number of blocks ahead
+// of the consumer.
+type readAheadReader struct {
+	blocks  chan []byte
+	free    chan []byte
+	done    chan struct{}
+	current []byte
+	block   []byte
+	err     error
+}
+
+func newReadAheadReader(reader io.Reader) *readAheadReader {
+	readAhead := &readAheadReader{
+		blocks: make(chan []byte, readAheadBlockCount),
+		free:   make(chan []byte, readAheadBlockCount+1),
+		done:   make(chan struct{}),
+	}
+
+	for i := 0; i <= readAheadBlockCount; i++ {
+		readAhead.free <- make([]byte, readAheadBlockSize)
+	}
+
+	go func() {
+		defer close(readAhead.blocks)
+		for {
+			var block []byte
+			select {
+			case block = <-readAhead.free:
+			case <-readAhead.done:
+				return
+			}
+
+			n, err := io.ReadFull(reader, block)
+			if n > 0 {
+				readAhead.blocks <- block[:n]
+			}
+
+			if err == io.EOF || err == io.ErrUnexpectedEOF {
+				return
+			}
+
+			if err != nil {
+				readAhead.err = err
+				return
+			}
+		}
+	}()
+
+	return readAhead
+}
+
+func (readAhead *readAheadReader) Read(p []byte) (int, error) {
+	for len(readAhead.current) == 0 {
+		if readAhead.block != nil {
+			readAhead.free <- readAhead.block[:cap(readAhead.block)]
+			readAhead.block = nil
+		}
+
+		block, ok := <-readAhead.blocks
+		if !ok {
+			// The error is written before the channel is closed
+			if readAhead.err != nil {
+				return 0, readAhead.err
+			}
+
+			return 0, io.EOF
+		}
+
+		readAhead.block = block
+		readAhead.current = block
+	}
+
+	n := copy(p, readAhead.current)
+	readAhead.current = readAhead.current[n:]
+	return n, nil
+}
+
+func (readAhead *readAheadReader) Close() error {
+	close(readAhead.done)
+
+	// Unblock the producer if it is waiting to hand over a block
+	for range readAhead.blocks {
+	}
+
+	return nil
 }
@@ -0,0 +1,128 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package common
+
+import (
+	"archive/tar"
+	"archive/zip"
+	"bytes"
+	"compress/gzip"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func Test_ExtractArchive_TarGz_ExtractsFilesDirectoriesAndLinks(t *testing.T) {
+	// Arrange
+	tempDir := t.TempDir()
+	largeContent := strings.Repeat("0123456789", extractionBufferSize/5)
+	archiveFile := filepath.Join(tempDir, "antenv.tar.gz")
+	writeTarGz(t, archiveFile, []*tar.Header{
+		{Name: "bin/", Typeflag: tar.TypeDir, Mode: 0755},
+		{Name: "bin/python3", Typeflag: tar.TypeReg, Mode: 0755, Size: 6},
+		{Name: "bin/python", Typeflag: tar.TypeSymlink, Linkname: "python3"},
+		{Name: "lib/site-packages/large.bin", Typeflag: tar.TypeReg, Mode: 0644, Size: int64(len(largeContent))},
+		{Name: "lib/site-packages/copy.bin", Typeflag: tar.TypeLink, Linkname: "lib/site-packages/large.bin"},
+	}, []string{"", "python", "", largeContent, ""})
+	destinationDir := filepath.Join(tempDir, "antenv")
+	os.MkdirAll(destinationDir, 0755)
+
+	// Act
+	err := ExtractArchive(archiveFile, destinationDir)
+
+	// Assert
+	assert.NoError(t, err)
+	content, _ := os.ReadFile(filepath.Join(destinationDir, "bin", "python3"))
+	assert.Equal(t, "python", string(content))
+	fileInfo, _ := os.Stat(filepath.Join(destinationDir, "bin", "python3"))
+	assert.Equal(t, os.FileMode(0755), fileInfo.Mode().Perm())
+	linkName, _ := os.Readlink(filepath.Join(destinationDir, "bin", "python"))
+	assert.Equal(t, "python3", linkName)
+	content, _ = os.ReadFile(filepath.Join(destinationDir, "lib", "site-packages", "copy.bin"))
+	assert.Equal(t, largeContent, string(content))
+}
+
+func Test_ExtractArchive_Zip_ExtractsFiles(t *testing.T) {
+	// Arrange
+	tempDir := t.TempDir()
+	archiveFile := filepath.Join(tempDir, "node_modules.zip")
+	buffer := &bytes.Buffer{}
+	zipWriter := zip.NewWriter(buffer)
+	for _, name := range []string{"express/package.json", "express/index.js"} {
+		fileWriter, _ := zipWriter.Create(name)
+		fileWriter.Write([]byte(name))
+	}
+	zipWriter.Close()
+	os.WriteFile(archiveFile, buffer.Bytes(), 0644)
+	destinationDir := filepath.Join(tempDir, "node_modules")
+	os.MkdirAll(destinationDir, 0755)
+
+	// Act
+	err := ExtractArchive(archiveFile, destinationDir)
+
+	// Assert
+	assert.NoError(t, err)
+	content, _ := os.ReadFile(filepath.Join(destinationDir, "express", "index.js"))
+	assert.Equal(t, "express/index.js", string(content))
+}
+
+func Test_ExtractArchive_RejectsEntriesOutsideOfDestination(t *testing.T) {
+	// Arrange
+	tempDir := t.TempDir()
+	archiveFile := filepath.Join(tempDir, "output.tar.gz")
+	writeTarGz(t, archiveFile, []*tar.Header{
+		{Name: "../evil.sh", Typeflag: tar.TypeReg, Mode: 0755, Size: 4},
+	}, []string{"evil"})
+	destinationDir := filepath.Join(tempDir, "output")
+	os.MkdirAll(destinationDir, 0755)
+
+	// Act
+	err := ExtractArchive(archiveFile, destinationDir)
+
+	// Assert
+	assert.Error(t, err)
+	assert.False(t, PathExists(filepath.Join(tempDir, "evil.sh")))
+}
+
+func Test_ExtractArchive_UnsupportedFormat_ReturnsError(t *testing.T) {
+	err := ExtractArchive("output.rar", t.TempDir())
+	assert.Error(t, err)
+}
+
+func writeTarGz(t *testing.T, archiveFile string, headers []*tar.Header, contents []string) {
+	buffer := &bytes.Buffer{}
+	gzipWriter := gzip.NewWriter(buffer)
+	tarWriter := tar.NewWriter(gzipWriter)
+	for i, header := range headers {
+		if err := tarWriter.WriteHeader(header); err != nil {
+			t.Fatal(err)
+		}
+
+		tarWriter.Write([]byte(contents[i]))
+	}
+
+	tarWriter.Close()
+	gzipWriter.Close()
+	if err := os.WriteFile(archiveFile, buffer.Bytes(), 0644); err != nil {
+		t.Fatal(err)
+	}
+}
+
+func Test_GetSquashfsMountScript_FallsBackFromSquashfuseToLoopMountToExtraction(t *testing.T) {
+	// Act
+	script := GetSquashfsMountScript("antenv.squashfs", "/antenv")
+
+	// Assert
+	squashfuseIndex := strings.Index(script, "squashfuse -o ro antenv.squashfs /antenv")
+	loopMountIndex := strings.Index(script, "mount -t squashfs -o loop,ro antenv.squashfs /antenv")
+	extractionIndex := strings.Index(script, "unsquashfs -f -no-progress -d /antenv antenv.squashfs")
+	assert.True(t, squashfuseIndex >= 0)
+	assert.True(t, loopMountIndex > squashfuseIndex)
+	assert.True(t, extractionIndex > loopMountIndex)
+}
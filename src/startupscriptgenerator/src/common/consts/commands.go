@@ -8,3 +8,4 @@ package consts
 const SetupEnvCommandName string = "setupEnv"
 const CreateScriptCommandName string = "create-script"
 const VersionCommandName string = "version"
+const ExtractCommandName string = "extract"
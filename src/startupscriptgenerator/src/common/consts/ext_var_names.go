@@ -24,8 +24,12 @@ const UserDotnetAiVersion string = "2.8.42"
 const UserDotnetStartupHooks string = "/DotNetCoreAgent/2.8.42/StartupHook/Microsoft.ApplicationInsights.StartupHook.dll"
 const UserNetcoreHostingstartupAssemblies string = "Microsoft.ApplicationInsights.StartupBootstrapper"
 const PythonEnableGunicornMultiWorkersEnvVarName string = "PYTHON_ENABLE_GUNICORN_MULTIWORKERS"
+const PythonEnableGunicornPreloadEnvVarName string = "PYTHON_ENABLE_GUNICORN_PRELOAD"
 const PythonGunicornConfigPathEnvVarName string = "PYTHON_USE_GUNICORN_CONFIG_FROM_PATH"
 const PythonGunicornCustomWorkerNum string = "PYTHON_GUNICORN_CUSTOM_WORKER_NUM"
 const PythonGunicornCustomThreadNum string = "PYTHON_GUNICORN_CUSTOM_THREAD_NUM"
+const PythonGunicornAutoSizeWorkersEnvVarName string = "PYTHON_GUNICORN_AUTO_SIZE_WORKERS"
+const PythonGunicornWorkerMemoryInMBEnvVarName string = "PYTHON_GUNICORN_WORKER_MEMORY_MB"
+const PythonGunicornWorkerPeakRssFileEnvVarName string = "PYTHON_GUNICORN_WORKER_PEAK_RSS_FILE"
 const PythonDisableFastAPIDetectionEnvVarName string = "DISABLE_FASTAPI_DETECTION"
 const NginxConfFile string = "NGINX_CONF_FILE"
@@ -61,13 +61,22 @@ func main() {
 		false,
 		"Disables the extraction of node_modules file. If used, some external tool will have to extract it - "+
 			"otherwise the application might not work.")
+	extractCommand := flag.NewFlagSet(consts.ExtractCommandName, flag.ExitOnError)
+	extractArchivePtr := extractCommand.String(
+		"archive",
+		"",
+		"Path to the '.tar.zst', '.tar.gz' or '.zip' archive to extract.")
+	extractDestinationPtr := extractCommand.String(
+		"destination",
+		"",
+		"Path to the directory to extract the archive to.")
 	flag.Parse()
 
 	logger := common.GetLogger("node.main")
 	defer logger.Shutdown()
 	logger.StartupScriptRequested()
 
-	commands := []*flag.FlagSet{versionCommand, scriptCommand, setupEnvCommand}
+	commands := []*flag.FlagSet{versionCommand, scriptCommand, setupEnvCommand, extractCommand}
 	common.ValidateCommands(commands)
 
 	if scriptCommand.Parsed() {
@@ -127,6 +136,10 @@ func main() {
 			buildManifest.NodeVersion))
 		common.SetupEnv(finalScript)
 	}
+
+	if extractCommand.Parsed() {
+		common.RunExtractCommand(*extractArchivePtr, *extractDestinationPtr)
+	}
 }
 
 // Checks if the legacy debugger should be used for the current node image
@@ -93,20 +93,20 @@ func (gen *NodeStartupScriptGenerator) GenerateEntrypointScript() string {
 		if strings.HasSuffix(gen.Manifest.CompressedNodeModulesFile, ".tar.zst") {
 			scriptBuilder.WriteString("echo Found tar.zst based node_modules.\n")
 			scriptBuilder.WriteString(
-				"extractionCommand=\"tar -I zstd -xf " + gen.Manifest.CompressedNodeModulesFile +
-					" -C " + targetNodeModulesDir + "\"\n")
+				"extractionCommand=\"" +
+					common.GetExtractionCommand(gen.Manifest.CompressedNodeModulesFile, targetNodeModulesDir) + "\"\n")
 
 		} else if strings.HasSuffix(gen.Manifest.CompressedNodeModulesFile, ".zip") {
 			scriptBuilder.WriteString("echo Found zip-based node_modules.\n")
 			scriptBuilder.WriteString(
-				"extractionCommand=\"unzip -q " + gen.Manifest.CompressedNodeModulesFile +
-					" -d " + targetNodeModulesDir + "\"\n")
+				"extractionCommand=\"" +
+					common.GetExtractionCommand(gen.Manifest.CompressedNodeModulesFile, targetNodeModulesDir) + "\"\n")
 
 		} else if strings.HasSuffix(gen.Manifest.CompressedNodeModulesFile, ".tar.gz") {
 			scriptBuilder.WriteString("echo Found tar.gz based node_modules.\n")
 			scriptBuilder.WriteString(
-				"extractionCommand=\"tar -xzf " + gen.Manifest.CompressedNodeModulesFile +
-					" -C " + targetNodeModulesDir + "\"\n")
+				"extractionCommand=\"" +
+					common.GetExtractionCommand(gen.Manifest.CompressedNodeModulesFile, targetNodeModulesDir) + "\"\n")
 		} else {
 			fmt.Printf(
 				"Error: Unrecognizable file '%s'. Expected a file with an extension '.zip', '.tar.zst' or '.tar.gz'\n",
@@ -27,7 +27,7 @@ func TestNodeStartupScriptGenerator_GeneratesZstdExtractionCommand_WhenNodeModul
 
 	// Assert
 	assert.Contains(t, script, "echo Found tar.zst based node_modules.")
-	assert.Contains(t, script, "extractionCommand=\"tar -I zstd -xf node_modules.tar.zst -C /node_modules\"")
+	assert.Contains(t, script, "extractionCommand=\"oryx extract -archive node_modules.tar.zst -destination /node_modules\"")
 }
 
 func ExampleNodeStartupScriptGenerator_getPackageJsonStartCommand_subDir() {
@@ -0,0 +1,118 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package main
+
+import (
+	"fmt"
+	"path/filepath"
+	"strings"
+)
+
+// Path of the gunicorn configuration file written by the startup script.
+const generatedGunicornConfigFile = "/tmp/oryx/gunicorn.conf.py"
+
+// Gunicorn only loads one configuration file, so once it is given the generated one it no longer loads the
+// 'gunicorn.conf.py' of the working directory. The generated configuration loads that file itself, before its own
+// sections, whose hooks then call the ones of the app.
+const appGunicornConfigLoader = `import os
+
+_oryx_app_config_file = os.path.join(os.getcwd(), "gunicorn.conf.py")
+if os.path.isfile(_oryx_app_config_file):
+    print("Loading the gunicorn configuration of the app from '%s'." % _oryx_app_config_file)
+    with open(_oryx_app_config_file) as _oryx_app_config:
+        exec(compile(_oryx_app_config.read(), _oryx_app_config_file, "exec"))
+`
+
+// A part of the gunicorn configuration file generated for the app, e.g. a set of server hooks.
+type gunicornConfigSection struct {
+	Description string
+	Content     string
+}
+
+// Returns the script which writes the gunicorn configuration made of the given sections.
+func getGunicornConfigScript(sections []gunicornConfigSection) string {
+	contents := []string{appGunicornConfigLoader}
+	for _, section := range sections {
+		contents = append(contents, section.Content)
+	}
+
+	return fmt.Sprintf(
+		"mkdir -p \"%s\"\ncat > \"%s\" <<'ORYX_GUNICORN_CONFIG'\n%sORYX_GUNICORN_CONFIG\n",
+		filepath.Dir(generatedGunicornConfigFile),
+		generatedGunicornConfigFile,
+		strings.Join(contents, "\n\n"))
+}
+
+// Returns the gunicorn configuration which keeps the objects created while preloading the app out of the garbage
+// collector, so that the memory pages holding them are not written to, and stay shared with the forked workers.
+func getPreloadGunicornConfig() gunicornConfigSection {
+	return gunicornConfigSection{
+		Description: "garbage collector freeze",
+		Content: `import gc
+
+# The configuration is loaded before the app is preloaded
+gc.disable()
+
+_oryx_app_when_ready = globals().get("when_ready")
+_oryx_app_pre_fork = globals().get("pre_fork")
+_oryx_app_post_fork = globals().get("post_fork")
+
+
+def when_ready(server):
+    # The app is preloaded by now. Its objects are frozen and the arbiter collects the ones it creates later.
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+    gc.enable()
+    if _oryx_app_when_ready is not None:
+        _oryx_app_when_ready(server)
+
+
+def pre_fork(server, worker):
+    if _oryx_app_pre_fork is not None:
+        _oryx_app_pre_fork(server, worker)
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.enable()
+    if _oryx_app_post_fork is not None:
+        _oryx_app_post_fork(server, worker)
+`,
+	}
+}
+
+// Returns the gunicorn configuration which records the peak resident memory of the workers in the given file, in
+// KB, keeping the highest value seen across runs.
+func getPeakRssRecordingGunicornConfig(peakRssFile string) gunicornConfigSection {
+	content := fmt.Sprintf(`import os
+import resource
+
+_oryx_peak_rss_file = %q
+_oryx_app_worker_exit = globals().get("worker_exit")
+
+
+def worker_exit(server, worker):
+    if _oryx_app_worker_exit is not None:
+        _oryx_app_worker_exit(server, worker)
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        with open(_oryx_peak_rss_file) as f:
+            if int(f.read().strip() or 0) >= peak_rss_kb:
+                return
+    except (OSError, ValueError):
+        pass
+    try:
+        os.makedirs(os.path.dirname(_oryx_peak_rss_file) or ".", exist_ok=True)
+        temp_file = "%%s.%%d" %% (_oryx_peak_rss_file, os.getpid())
+        with open(temp_file, "w") as f:
+            f.write(str(peak_rss_kb))
+        os.replace(temp_file, _oryx_peak_rss_file)
+    except OSError:
+        pass
+`, peakRssFile)
+	return gunicornConfigSection{Description: "worker peak memory recording", Content: content}
+}
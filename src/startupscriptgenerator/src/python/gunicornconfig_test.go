@@ -0,0 +1,75 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package main
+
+import (
+	"common/consts"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func Test_buildGunicornCommandForModule_PreloadsDetectedFramework_WithGcFreezeHooks(t *testing.T) {
+	// Arrange
+	t.Setenv(consts.PythonEnableGunicornPreloadEnvVarName, "true")
+	gen := PythonStartupScriptGenerator{appFramework: &djangoDetector{}}
+
+	// Act
+	actual := gen.buildGunicornCommandForModule("mysite.wsgi", "/a/b/c")
+
+	// Assert
+	assert.Contains(t, actual, "cat > \"/tmp/oryx/gunicorn.conf.py\" <<'ORYX_GUNICORN_CONFIG'\n")
+	assert.Contains(t, actual, "gc.freeze()")
+	assert.Contains(t, actual, "def when_ready(server):\n    # The app is preloaded by now.")
+	assert.Contains(t, actual, "--preload")
+	assert.Contains(t, actual, "-c /tmp/oryx/gunicorn.conf.py")
+}
+
+func Test_buildGunicornCommandForModule_LoadsConfigOfApp_BeforeGeneratedHooks(t *testing.T) {
+	// Arrange
+	t.Setenv(consts.PythonEnableGunicornPreloadEnvVarName, "true")
+	gen := PythonStartupScriptGenerator{appFramework: &flaskDetector{}}
+
+	// Act
+	actual := gen.buildGunicornCommandForModule("app:app", "")
+
+	// Assert
+	loaderIndex := strings.Index(actual, "exec(compile(_oryx_app_config.read(), _oryx_app_config_file, \"exec\"))")
+	hooksIndex := strings.Index(actual, "_oryx_app_post_fork = globals().get(\"post_fork\")")
+	assert.True(t, loaderIndex >= 0)
+	assert.True(t, hooksIndex > loaderIndex)
+	assert.Contains(t, actual, "os.path.join(os.getcwd(), \"gunicorn.conf.py\")")
+	assert.Contains(t, actual, "        _oryx_app_post_fork(server, worker)")
+}
+
+func Test_buildGunicornCommandForModule_DoesNotPreload_WhenFrameworkIsNotDetected(t *testing.T) {
+	// Arrange
+	t.Setenv(consts.PythonEnableGunicornPreloadEnvVarName, "true")
+	gen := PythonStartupScriptGenerator{}
+
+	// Act
+	actual := gen.buildGunicornCommandForModule("application:app", "/opt/defaultsite")
+
+	// Assert
+	assert.NotContains(t, actual, "--preload")
+	assert.NotContains(t, actual, "gunicorn.conf.py")
+}
+
+func Test_buildGunicornCommandForModule_DoesNotAddHooks_WhenUserConfigIsUsed(t *testing.T) {
+	// Arrange
+	t.Setenv(consts.PythonEnableGunicornPreloadEnvVarName, "true")
+	t.Setenv(consts.PythonGunicornConfigPathEnvVarName, "/home/site/gunicorn.conf.py")
+	gen := PythonStartupScriptGenerator{appFramework: &flaskDetector{}}
+
+	// Act
+	actual := gen.buildGunicornCommandForModule("app:app", "/a/b/c")
+
+	// Assert
+	assert.Contains(t, actual, "--preload")
+	assert.Contains(t, actual, "-c /home/site/gunicorn.conf.py")
+	assert.NotContains(t, actual, "/tmp/oryx/gunicorn.conf.py")
+}
@@ -0,0 +1,158 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package main
+
+import (
+	"common"
+	"common/consts"
+	"fmt"
+	"io/ioutil"
+	"math"
+	"os"
+	"strconv"
+	"strings"
+)
+
+// Estimated resident memory of a single worker, by framework, used when neither a configured value nor a
+// recorded peak is available.
+var defaultWorkerMemoryInMB = map[string]int64{
+	"Django":  150,
+	"Flask":   80,
+	"FastAPI": 120,
+}
+
+const defaultWorkerMemoryForUnknownFrameworkInMB = 100
+
+// Memory used by the gunicorn arbiter process, which does not import the app unless it is preloaded.
+const gunicornArbiterMemoryInMB = 50
+
+// Share of the memory limit left for the page cache and memory spikes.
+const memoryHeadroomPercent = 10
+
+// Added to a recorded peak, which may have been measured under a lighter load.
+const recordedPeakHeadroomPercent = 25
+
+const maxGunicornThreads = 8
+
+const gthreadWorkerClass = "gthread"
+
+type gunicornSizing struct {
+	Workers int
+	// Number of threads per worker, or 0 to use the gunicorn default.
+	Threads int
+	// Worker class to use, or empty to use the one of the module argument or the gunicorn default.
+	WorkerClass string
+	Reasons     []string
+}
+
+// Picks the number of workers and threads which make use of the CPUs available to the app without exceeding its
+// memory limit. Sync workers are sized as recommended by gunicorn, 2N+1 for N CPUs. When that many workers do
+// not fit in memory, fewer gthread workers are used, with enough threads to keep the same concurrency. ASGI
+// workers are asynchronous, so one per CPU is enough.
+func computeGunicornSizing(
+	limits common.CgroupLimits,
+	cpuCount int,
+	workerMemoryInBytes int64,
+	isAsgi bool) gunicornSizing {
+	sizing := gunicornSizing{}
+	cpuWorkers := 2*cpuCount + 1
+	if isAsgi {
+		cpuWorkers = cpuCount
+	}
+
+	if limits.CpuQuota > 0 {
+		sizing.Reasons = append(sizing.Reasons, fmt.Sprintf(
+			"%d CPU(s) available (%s CPU quota of %.2f)", cpuCount, limits.Source, limits.CpuQuota))
+	} else {
+		sizing.Reasons = append(sizing.Reasons, fmt.Sprintf("%d CPU(s) available (no CPU quota)", cpuCount))
+	}
+
+	memoryWorkers := math.MaxInt32
+	if limits.MemoryLimitInBytes > 0 && workerMemoryInBytes > 0 {
+		usableMemory := limits.MemoryLimitInBytes*(100-memoryHeadroomPercent)/100 - gunicornArbiterMemoryInMB*1024*1024
+		memoryWorkers = int(usableMemory / workerMemoryInBytes)
+		if memoryWorkers < 1 {
+			memoryWorkers = 1
+		}
+
+		sizing.Reasons = append(sizing.Reasons, fmt.Sprintf(
+			"%d MB memory limit (%s) fits %d worker(s) of %d MB",
+			limits.MemoryLimitInBytes/(1024*1024),
+			limits.Source,
+			memoryWorkers,
+			workerMemoryInBytes/(1024*1024)))
+	}
+
+	if memoryWorkers >= cpuWorkers {
+		sizing.Workers = cpuWorkers
+		if isAsgi {
+			sizing.Reasons = append(sizing.Reasons, fmt.Sprintf("using one ASGI worker per CPU: %d", cpuWorkers))
+		} else {
+			sizing.Reasons = append(sizing.Reasons, fmt.Sprintf("using 2N+1 sync workers: %d", cpuWorkers))
+		}
+
+		return sizing
+	}
+
+	sizing.Workers = memoryWorkers
+	if isAsgi {
+		sizing.Reasons = append(sizing.Reasons, fmt.Sprintf(
+			"memory bound, using %d ASGI worker(s) instead of %d", memoryWorkers, cpuWorkers))
+		return sizing
+	}
+
+	sizing.WorkerClass = gthreadWorkerClass
+	sizing.Threads = (cpuWorkers + memoryWorkers - 1) / memoryWorkers * 2
+	if sizing.Threads > maxGunicornThreads {
+		sizing.Threads = maxGunicornThreads
+	}
+
+	sizing.Reasons = append(sizing.Reasons, fmt.Sprintf(
+		"memory bound, using %d gthread worker(s) with %d threads each instead of %d sync workers",
+		memoryWorkers,
+		sizing.Threads,
+		cpuWorkers))
+	return sizing
+}
+
+// Returns the estimated resident memory of a worker of the app, and where the estimate comes from.
+func (gen *PythonStartupScriptGenerator) getWorkerMemoryEstimate() (int64, string) {
+	configuredValue := os.Getenv(consts.PythonGunicornWorkerMemoryInMBEnvVarName)
+	if configuredValue != "" {
+		workerMemoryInMB, err := strconv.ParseInt(configuredValue, 10, 64)
+		if err == nil && workerMemoryInMB > 0 {
+			return workerMemoryInMB * 1024 * 1024, "configured via " + consts.PythonGunicornWorkerMemoryInMBEnvVarName
+		}
+
+		println(fmt.Sprintf(
+			"WARNING: Ignoring invalid value '%s' for '%s'.",
+			configuredValue,
+			consts.PythonGunicornWorkerMemoryInMBEnvVarName))
+	}
+
+	peakRssFile := os.Getenv(consts.PythonGunicornWorkerPeakRssFileEnvVarName)
+	if peakRssFile != "" {
+		content, err := ioutil.ReadFile(peakRssFile)
+		if err == nil {
+			peakRssInKB, err := strconv.ParseInt(strings.TrimSpace(string(content)), 10, 64)
+			if err == nil && peakRssInKB > 0 {
+				return peakRssInKB * 1024 * (100 + recordedPeakHeadroomPercent) / 100,
+					fmt.Sprintf("recorded peak of %d MB in '%s'", peakRssInKB/1024, peakRssFile)
+			}
+		}
+	}
+
+	frameworkName := "unknown framework"
+	workerMemoryInMB := int64(defaultWorkerMemoryForUnknownFrameworkInMB)
+	if gen.appFramework != nil {
+		frameworkName = gen.appFramework.Name()
+		if value, ok := defaultWorkerMemoryInMB[frameworkName]; ok {
+			workerMemoryInMB = value
+		}
+	}
+
+	return workerMemoryInMB * 1024 * 1024, "default for " + frameworkName
+}
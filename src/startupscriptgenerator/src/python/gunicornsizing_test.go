@@ -0,0 +1,96 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+package main
+
+import (
+	"common"
+	"common/consts"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+const megabyte = 1024 * 1024
+
+func Test_computeGunicornSizing_UsesTwoNPlusOneSyncWorkers_WhenTheyFitInMemory(t *testing.T) {
+	// Arrange
+	limits := common.CgroupLimits{CpuQuota: 2, MemoryLimitInBytes: 4096 * megabyte, Source: "cgroup v2"}
+
+	// Act
+	sizing := computeGunicornSizing(limits, 2, 150*megabyte, false)
+
+	// Assert
+	assert.Equal(t, 5, sizing.Workers)
+	assert.Equal(t, 0, sizing.Threads)
+	assert.Equal(t, "", sizing.WorkerClass)
+}
+
+func Test_computeGunicornSizing_UsesFewerGthreadWorkers_WhenMemoryBound(t *testing.T) {
+	// Arrange
+	limits := common.CgroupLimits{CpuQuota: 2, MemoryLimitInBytes: 512 * megabyte, Source: "cgroup v2"}
+
+	// Act
+	sizing := computeGunicornSizing(limits, 2, 150*megabyte, false)
+
+	// Assert
+	assert.Equal(t, 2, sizing.Workers)
+	assert.Equal(t, 6, sizing.Threads)
+	assert.Equal(t, "gthread", sizing.WorkerClass)
+}
+
+func Test_computeGunicornSizing_UsesAtLeastOneWorker(t *testing.T) {
+	// Arrange
+	limits := common.CgroupLimits{CpuQuota: 1, MemoryLimitInBytes: 128 * megabyte, Source: "cgroup v1"}
+
+	// Act
+	sizing := computeGunicornSizing(limits, 1, 150*megabyte, false)
+
+	// Assert
+	assert.Equal(t, 1, sizing.Workers)
+	assert.Equal(t, 6, sizing.Threads)
+}
+
+func Test_computeGunicornSizing_UsesOneAsgiWorkerPerCpu_WithoutThreads(t *testing.T) {
+	// Arrange
+	limits := common.CgroupLimits{CpuQuota: 4, MemoryLimitInBytes: 4096 * megabyte, Source: "cgroup v2"}
+
+	// Act
+	sizing := computeGunicornSizing(limits, 4, 120*megabyte, true)
+
+	// Assert
+	assert.Equal(t, 4, sizing.Workers)
+	assert.Equal(t, 0, sizing.Threads)
+	assert.Equal(t, "", sizing.WorkerClass)
+}
+
+func Test_getWorkerMemoryEstimate_UsesRecordedPeakWithHeadroom(t *testing.T) {
+	// Arrange
+	peakRssFile := filepath.Join(t.TempDir(), "peak-rss")
+	os.WriteFile(peakRssFile, []byte("204800\n"), 0644)
+	t.Setenv(consts.PythonGunicornWorkerPeakRssFileEnvVarName, peakRssFile)
+	gen := PythonStartupScriptGenerator{appFramework: &djangoDetector{}}
+
+	// Act
+	workerMemory, source := gen.getWorkerMemoryEstimate()
+
+	// Assert
+	assert.Equal(t, int64(250*megabyte), workerMemory)
+	assert.Contains(t, source, "recorded peak of 200 MB")
+}
+
+func Test_getWorkerMemoryEstimate_UsesFrameworkDefault(t *testing.T) {
+	// Arrange
+	gen := PythonStartupScriptGenerator{appFramework: &flaskDetector{}}
+
+	// Act
+	workerMemory, source := gen.getWorkerMemoryEstimate()
+
+	// Assert
+	assert.Equal(t, int64(80*megabyte), workerMemory)
+	assert.Equal(t, "default for Flask", source)
+}
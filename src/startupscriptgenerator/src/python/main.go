@@ -50,11 +50,21 @@ func main() {
 		"Disables the extraction of the compressed virtual environment file. If used, some external tool will "+
 			"have to extract it - otherwise the application might not work.")
 
+	extractCommand := flag.NewFlagSet(consts.ExtractCommandName, flag.ExitOnError)
+	extractArchivePtr := extractCommand.String(
+		"archive",
+		"",
+		"Path to the '.tar.zst', '.tar.gz' or '.zip' archive to extract.")
+	extractDestinationPtr := extractCommand.String(
+		"destination",
+		"",
+		"Path to the directory to extract the archive to.")
+
 	logger := common.GetLogger("python.main")
 	defer logger.Shutdown()
 	logger.StartupScriptRequested()
 
-	commands := []*flag.FlagSet{versionCommand, scriptCommand, setupEnvCommand}
+	commands := []*flag.FlagSet{versionCommand, scriptCommand, setupEnvCommand, extractCommand}
 	common.ValidateCommands(commands)
 
 	if scriptCommand.Parsed() {
@@ -133,4 +143,8 @@ func main() {
 			buildManifest.PythonVersion))
 		common.SetupEnv(finalScript)
 	}
+
+	if extractCommand.Parsed() {
+		common.RunExtractCommand(*extractArchivePtr, *extractDestinationPtr)
+	}
 }
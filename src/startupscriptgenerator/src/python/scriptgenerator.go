@@ -11,7 +11,6 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
-	"runtime"
 	"strconv"
 	"strings"
 )
@@ -32,6 +31,7 @@ type PythonStartupScriptGenerator struct {
 	SkipVirtualEnvExtraction bool
 	Manifest                 common.BuildManifest
 	Configuration            Configuration
+	appFramework             PyAppFramework
 }
 
 const GeneratingCommandMessage = "Generating `%s` command for '%s'"
@@ -100,6 +100,15 @@ func (gen *PythonStartupScriptGenerator) GenerateEntrypointScript() string {
 	common.SetEnvironmentVariableInScript(&scriptBuilder, "HOST", "", DefaultHost)
 	common.SetEnvironmentVariableInScript(&scriptBuilder, "PORT", gen.BindPort, DefaultBindPort)
 
+	if gen.Manifest.BytecodeInvalidationMode != "" {
+		// The bytecode was compiled at build time, so writing it again would only fail on read-only file systems
+		// or add writes to shared ones.
+		println(fmt.Sprintf(
+			"Bytecode was precompiled with the '%s' invalidation mode, not writing bytecode.",
+			gen.Manifest.BytecodeInvalidationMode))
+		common.SetEnvironmentVariableInScript(&scriptBuilder, "PYTHONDONTWRITEBYTECODE", "", "1")
+	}
+
 	scriptBuilder.WriteString(fmt.Sprintf("export PATH=\"%s/bin:${PATH}\"\n", pythonInstallationRoot))
 
 	packageSetupBlock := gen.getPackageSetupCommand()
@@ -122,6 +131,7 @@ func (gen *PythonStartupScriptGenerator) GenerateEntrypointScript() string {
 		if appFw != nil {
 			println("Detected an app based on " + appFw.Name())
 			appType = appFw.Name()
+			gen.appFramework = appFw
 			appDirectory = gen.getAppPath()
 			appModule = appFw.GetGunicornModuleArg()
 			appDebugModule = appFw.GetDebuggableModule()
@@ -212,33 +222,44 @@ func (gen *PythonStartupScriptGenerator) getPackageSetupCommand() string {
 			virtualEnvDir := "/" + virtualEnvironmentName
 			scriptBuilder.WriteString(fmt.Sprintf("echo 'if [ -f %s/bin/activate ]; then . %s/bin/activate; fi' >> ~/.bashrc\n", virtualEnvDir, virtualEnvDir))
 			compressedFile := gen.Manifest.CompressedVirtualEnvFile
-			if strings.HasSuffix(compressedFile, ".zip") {
+			isSquashfsImage := false
+			if strings.HasSuffix(compressedFile, ".squashfs") {
+				scriptBuilder.WriteString("echo Found virtual environment .squashfs image.\n")
+				isSquashfsImage = true
+
+			} else if strings.HasSuffix(compressedFile, ".zip") {
 				scriptBuilder.WriteString("echo Found virtual environment .zip archive.\n")
 				scriptBuilder.WriteString(
-					"extractionCommand=\"unzip -q " + compressedFile + " -d " + virtualEnvDir + "\"\n")
+					"extractionCommand=\"" + common.GetExtractionCommand(compressedFile, virtualEnvDir) + "\"\n")
 
 			} else if strings.HasSuffix(compressedFile, ".tar.zst") {
 				scriptBuilder.WriteString("echo Found virtual environment .tar.zst archive.\n")
 				scriptBuilder.WriteString(
-					"extractionCommand=\"tar -I zstd -xf " + compressedFile + " -C " + virtualEnvDir + "\"\n")
+					"extractionCommand=\"" + common.GetExtractionCommand(compressedFile, virtualEnvDir) + "\"\n")
 
 			} else if strings.HasSuffix(compressedFile, ".tar.gz") {
 				scriptBuilder.WriteString("echo Found virtual environment .tar.gz archive.\n")
 				scriptBuilder.WriteString(
-					"extractionCommand=\"tar -xzf " + compressedFile + " -C " + virtualEnvDir + "\"\n")
+					"extractionCommand=\"" + common.GetExtractionCommand(compressedFile, virtualEnvDir) + "\"\n")
 			} else {
 				fmt.Printf(
-					"Error: Unrecognizable file '%s'. Expected a file with a '.zip', '.tar.zst' or '.tar.gz' extension.\n",
+					"Error: Unrecognizable file '%s'. Expected a file with a '.zip', '.tar.zst', '.tar.gz' or "+
+						"'.squashfs' extension.\n",
 					compressedFile)
 				os.Exit(consts.FAILURE_EXIT_CODE)
 			}
 
-			scriptBuilder.WriteString(
-				"echo Removing existing virtual environment directory '" + virtualEnvDir + "'...\n")
-			scriptBuilder.WriteString("rm -fr " + virtualEnvDir + "\n")
-			scriptBuilder.WriteString("mkdir -p " + virtualEnvDir + "\n")
-			scriptBuilder.WriteString("echo Extracting to directory '" + virtualEnvDir + "'...\n")
-			scriptBuilder.WriteString("$extractionCommand\n")
+			if isSquashfsImage {
+				scriptBuilder.WriteString(common.GetSquashfsMountScript(compressedFile, virtualEnvDir))
+			} else {
+				scriptBuilder.WriteString(
+					"echo Removing existing virtual environment directory '" + virtualEnvDir + "'...\n")
+				scriptBuilder.WriteString("rm -fr " + virtualEnvDir + "\n")
+				scriptBuilder.WriteString("mkdir -p " + virtualEnvDir + "\n")
+				scriptBuilder.WriteString("echo Extracting to directory '" + virtualEnvDir + "'...\n")
+				scriptBuilder.WriteString("$extractionCommand\n")
+			}
+
 			venvSubScript := gen.getHandleVenvPresentInRootScript(virtualEnvDir, virtualEnvironmentName)
 			scriptBuilder.WriteString(venvSubScript)
 			venvHandlingScript := gen.getVenvHandlingScript(virtualEnvironmentName, virtualEnvDir)
@@ -315,8 +336,29 @@ func (gen *PythonStartupScriptGenerator) buildGunicornCommandForModule(module st
 	}
 
 	pythonEnableGunicornMultiWorkers := common.GetBooleanEnvironmentVariable(consts.PythonEnableGunicornMultiWorkersEnvVarName)
+	pythonGunicornAutoSizeWorkers := common.GetBooleanEnvironmentVariable(consts.PythonGunicornAutoSizeWorkersEnvVarName)
+	pythonEnableGunicornPreload := common.GetBooleanEnvironmentVariable(consts.PythonEnableGunicornPreloadEnvVarName)
+	configSections := []gunicornConfigSection{}
+
+	if pythonEnableGunicornPreload {
+		if gen.appFramework != nil {
+			// Import the app once in the arbiter instead of in every worker
+			println(fmt.Sprintf("Preloading the %s app before forking the gunicorn workers.", gen.appFramework.Name()))
+			args = appendArgs(args, "--preload")
+			configSections = append(configSections, getPreloadGunicornConfig())
+		} else {
+			println("Not preloading the app since its framework could not be detected.")
+		}
+	}
+
+	if pythonGunicornAutoSizeWorkers {
+		args = gen.appendAutoSizedWorkerArgs(args, module)
 
-	if pythonEnableGunicornMultiWorkers {
+		peakRssFile := os.Getenv(consts.PythonGunicornWorkerPeakRssFileEnvVarName)
+		if peakRssFile != "" {
+			configSections = append(configSections, getPeakRssRecordingGunicornConfig(peakRssFile))
+		}
+	} else if pythonEnableGunicornMultiWorkers {
 		// One worker will be reading or writing from the socket while the other worker is processing a request.
 		// For MWMT (Multi Worker Multi Thread), user specifies two environment variables to enable MWMT.
 		// Otherwise, this script will use the recommended setting by Gunicorn.
@@ -326,9 +368,9 @@ func (gen *PythonStartupScriptGenerator) buildGunicornCommandForModule(module st
 		if pythonCustomWorkerNum != "" {
 			workers = pythonCustomWorkerNum
 		} else {
-			workers = strconv.Itoa((2 * runtime.NumCPU()) + 1)
+			workers = strconv.Itoa((2 * common.GetCgroupLimits().GetEffectiveCpuCount()) + 1)
 			// 2N+1 number of workers is recommended by Gunicorn docs.
-			// Where N is the number of CPU threads.
+			// Where N is the number of CPU threads available to the container.
 		}
 		args = appendArgs(args, "--workers="+workers)
 		if pythonCustomThreadNum != "" {
@@ -344,11 +386,86 @@ func (gen *PythonStartupScriptGenerator) buildGunicornCommandForModule(module st
 		args = appendArgs(args, "--chdir="+appDir)
 	}
 
+	// Only one configuration file can be passed to gunicorn, and the one of the user takes precedence
+	commandPrefix := ""
+	if len(configSections) > 0 {
+		if pythonUseGunicornConfigFromPath != "" {
+			descriptions := []string{}
+			for _, section := range configSections {
+				descriptions = append(descriptions, section.Description)
+			}
+
+			println(fmt.Sprintf(
+				"Not adding the gunicorn hooks for %s since the configuration file '%s' is used.",
+				strings.Join(descriptions, ", "),
+				pythonUseGunicornConfigFromPath))
+		} else {
+			commandPrefix = getGunicornConfigScript(configSections)
+			args = appendArgs(args, "-c "+generatedGunicornConfigFile)
+		}
+	}
+
 	if args != "" {
-		return "GUNICORN_CMD_ARGS=\"" + args + "\" gunicorn " + module
+		return commandPrefix + "GUNICORN_CMD_ARGS=\"" + args + "\" gunicorn " + module
 	}
 
-	return "gunicorn " + module
+	return commandPrefix + "gunicorn " + module
+}
+
+// Appends the number of workers and threads, and the worker class, which fit the CPU quota and memory limit of
+// the container, unless they are set explicitly, and logs how they were chosen.
+func (gen *PythonStartupScriptGenerator) appendAutoSizedWorkerArgs(args string, module string) string {
+	logger := common.GetLogger("python.scriptgenerator.appendAutoSizedWorkerArgs")
+	defer logger.Shutdown()
+
+	limits := common.GetCgroupLimits()
+	workerMemory, workerMemorySource := gen.getWorkerMemoryEstimate()
+	isAsgi := strings.Contains(module, "uvicorn")
+	sizing := computeGunicornSizing(limits, limits.GetEffectiveCpuCount(), workerMemory, isAsgi)
+	sizing.Reasons = append(
+		[]string{fmt.Sprintf("estimated worker memory %d MB (%s)", workerMemory/(1024*1024), workerMemorySource)},
+		sizing.Reasons...)
+
+	workers := strconv.Itoa(sizing.Workers)
+	if pythonCustomWorkerNum := os.Getenv(consts.PythonGunicornCustomWorkerNum); pythonCustomWorkerNum != "" {
+		workers = pythonCustomWorkerNum
+		sizing.Reasons = append(sizing.Reasons, "workers set via "+consts.PythonGunicornCustomWorkerNum)
+	}
+
+	threads := ""
+	if sizing.Threads > 0 {
+		threads = strconv.Itoa(sizing.Threads)
+	}
+
+	if pythonCustomThreadNum := os.Getenv(consts.PythonGunicornCustomThreadNum); pythonCustomThreadNum != "" {
+		threads = pythonCustomThreadNum
+		sizing.Reasons = append(sizing.Reasons, "threads set via "+consts.PythonGunicornCustomThreadNum)
+	}
+
+	args = appendArgs(args, "--workers="+workers)
+	if threads != "" {
+		args = appendArgs(args, "--threads="+threads)
+	}
+
+	if sizing.WorkerClass != "" {
+		args = appendArgs(args, "--worker-class="+sizing.WorkerClass)
+	}
+
+	threadsMessage := ""
+	if threads != "" {
+		threadsMessage = " with " + threads + " thread(s) each"
+	}
+
+	println(fmt.Sprintf(
+		"Auto-sized gunicorn to %s worker(s)%s: %s.",
+		workers,
+		threadsMessage,
+		strings.Join(sizing.Reasons, "; ")))
+	logger.LogProperties(
+		"Auto-sized gunicorn workers",
+		map[string]string{"workers": workers, "threads": threads, "workerClass": sizing.WorkerClass,
+			"reasons": strings.Join(sizing.Reasons, "; ")})
+	return args
 }
 
 func (gen *PythonStartupScriptGenerator) shouldStartAppInDebugMode() bool {
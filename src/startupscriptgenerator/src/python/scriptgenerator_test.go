@@ -28,7 +28,26 @@ func TestPythonStartupScriptGenerator_GeneratesZstdExtractionCommand_WhenVirtual
 
 	// Assert
 	assert.Contains(t, command, "echo Found virtual environment .tar.zst archive.")
-	assert.Contains(t, command, "extractionCommand=\"tar -I zstd -xf antenv.tar.zst -C /antenv\"")
+	assert.Contains(t, command, "extractionCommand=\"oryx extract -archive antenv.tar.zst -destination /antenv\"")
+}
+
+func TestPythonStartupScriptGenerator_MountsVirtualEnv_WhenVirtualEnvIsSquashfsImage(t *testing.T) {
+	// Arrange
+	gen := PythonStartupScriptGenerator{
+		AppPath:        "/app",
+		VirtualEnvName: "antenv",
+		Manifest: common.BuildManifest{
+			CompressedVirtualEnvFile: "antenv.squashfs",
+		},
+	}
+
+	// Act
+	command := gen.getPackageSetupCommand()
+
+	// Assert
+	assert.Contains(t, command, "echo Found virtual environment .squashfs image.")
+	assert.Contains(t, command, "squashfuse -o ro antenv.squashfs /antenv")
+	assert.NotContains(t, command, "$extractionCommand")
 }
 
 func Test_ExamplePythonStartupScriptGenerator_buildGunicornCommandForModule_onlyModule(t *testing.T) {
@@ -0,0 +1,126 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using System.Linq;
+using Microsoft.Oryx.Tests.Common;
+using Newtonsoft.Json.Linq;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildScriptGenerator.Common.Tests
+{
+    public class BuildTraceTest : IClassFixture<TestTempDirTestFixture>
+    {
+        private readonly string _tempDirRoot;
+
+        public BuildTraceTest(TestTempDirTestFixture testFixture)
+        {
+            _tempDirRoot = testFixture.RootDirPath;
+        }
+
+        [Fact]
+        public void EventStopwatch_AddsEventToCurrentTrace()
+        {
+            // Arrange
+            var trace = new BuildTrace();
+            BuildTrace.Current = trace;
+
+            // Act
+            try
+            {
+                using (var stopwatch = new EventStopwatch(telemetryClient: null, "DetectPlatform", eventProperties: null))
+                {
+                    stopwatch.AddProperty("platformName", "nodejs");
+                }
+            }
+            finally
+            {
+                BuildTrace.Current = null;
+            }
+
+            // Assert
+            var traceEvent = Assert.Single(WriteAndReadEvents(trace));
+            Assert.Equal("DetectPlatform", (string)traceEvent["name"]);
+            Assert.Equal("X", (string)traceEvent["ph"]);
+            Assert.Equal("nodejs", (string)traceEvent["args"]["platformName"]);
+        }
+
+        [Fact]
+        public void AddScriptPhases_PairsBeginAndEndMarkers_InMicroseconds()
+        {
+            // Arrange
+            var trace = new BuildTrace();
+
+            // Act
+            trace.AddScriptPhases(new[]
+            {
+                "B|Build script snippets|1700000000000000",
+                "B|Platform installation|1700000000001000",
+                "E|Platform installation|1700000000251000",
+                "not a marker",
+                "E|Build script snippets|1700000001500000",
+            });
+
+            // Assert
+            var events = WriteAndReadEvents(trace);
+            Assert.Equal(2, events.Length);
+            Assert.Equal("Build script snippets", (string)events[0]["name"]);
+            Assert.Equal(1700000000000000, (long)events[0]["ts"]);
+            Assert.Equal(1500000, (long)events[0]["dur"]);
+            Assert.Equal("Platform installation", (string)events[1]["name"]);
+            Assert.Equal(250000, (long)events[1]["dur"]);
+            Assert.All(events, e => Assert.Equal(BuildTrace.ScriptPhasesThreadId, (int)e["tid"]));
+        }
+
+        [Fact]
+        public void AddScriptPhases_EndsUnterminatedPhase_AtTheTimeOfTheCall()
+        {
+            // Arrange
+            var trace = new BuildTrace();
+            var begin = GetUnixTimeInMicroseconds() - 2000000;
+
+            // Act
+            trace.AddScriptPhases(new[] { $"B|Post-build command|{begin}" });
+
+            // Assert
+            var traceEvent = Assert.Single(WriteAndReadEvents(trace));
+            Assert.InRange((long)traceEvent["dur"], 2000000, 60000000);
+        }
+
+        [Fact]
+        public void AddEvent_AndAddScriptPhases_RecordSpansOnTheSameClock()
+        {
+            // Arrange
+            var trace = new BuildTrace();
+            var now = GetUnixTimeInMicroseconds();
+
+            // Act
+            trace.AddEvent("DetectPlatform", "oryx", trace.Elapsed, TimeSpan.FromMilliseconds(1));
+            trace.AddScriptPhases(new[] { $"B|Build script snippets|{now}", $"E|Build script snippets|{now + 1000}" });
+
+            // Assert
+            var events = WriteAndReadEvents(trace);
+            var dotNetSpan = events.Single(e => (string)e["name"] == "DetectPlatform");
+            var scriptPhase = events.Single(e => (string)e["name"] == "Build script snippets");
+            Assert.InRange(Math.Abs((long)dotNetSpan["ts"] - (long)scriptPhase["ts"]), 0, 10000000);
+        }
+
+        // Microseconds since the unix epoch, as the build script records them from EPOCHREALTIME.
+        private static long GetUnixTimeInMicroseconds()
+        {
+            return DateTimeOffset.UtcNow.ToUnixTimeMilliseconds() * 1000;
+        }
+
+        private JToken[] WriteAndReadEvents(BuildTrace trace)
+        {
+            var traceFilePath = Path.Combine(_tempDirRoot, Guid.NewGuid().ToString(), "trace.json");
+            trace.WriteTo(traceFilePath);
+            var traceFile = JObject.Parse(File.ReadAllText(traceFilePath));
+            Assert.Equal("ms", (string)traceFile["displayTimeUnit"]);
+            return traceFile["traceEvents"].ToArray();
+        }
+    }
+}
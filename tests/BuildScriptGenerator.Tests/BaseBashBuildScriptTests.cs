@@ -54,5 +54,110 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             Assert.Contains("Executing post-build command", script);
             Assert.Contains(script2, script);
         }
+
+        [Fact]
+        public void CopySettings_DefaultToSizeAndModificationTimeComparison()
+        {
+            // Arrange
+            var scriptProps = new BaseBashBuildScriptProperties();
+
+            // Act
+            var script = TemplateHelper.Render(TemplateHelper.TemplateResource.BaseBashScript, scriptProps);
+
+            // Assert
+            Assert.Contains("SYNC_TREE_VERIFY=\"false\"", script);
+            Assert.Contains("SYNC_TREE_LINK_MODE=\"\"", script);
+            Assert.Contains("SYNC_TREE_PARALLELISM=\"0\"", script);
+            Assert.Contains("sync_tree \"$SOURCE_DIR\" \"$INTERMEDIATE_DIR\" --delete $excludedDirectories", script);
+            Assert.DoesNotContain("rsync -rcE", script);
+        }
+
+        [Fact]
+        public void CopySettings_AreIncluded_IfSupplied()
+        {
+            // Arrange
+            var scriptProps = new BaseBashBuildScriptProperties
+            {
+                CopyVerify = true,
+                CopyLinkMode = Constants.CopyLinkModeReflink,
+                CopyParallelism = 4,
+            };
+
+            // Act
+            var script = TemplateHelper.Render(TemplateHelper.TemplateResource.BaseBashScript, scriptProps);
+
+            // Assert
+            Assert.Contains("SYNC_TREE_VERIFY=\"true\"", script);
+            Assert.Contains("SYNC_TREE_LINK_MODE=\"reflink\"", script);
+            Assert.Contains("SYNC_TREE_PARALLELISM=\"4\"", script);
+        }
+
+        [Fact]
+        public void DependencyCaches_AreSetUp_IfDependencyCacheDirIsSupplied()
+        {
+            // Arrange
+            var scriptProps = new BaseBashBuildScriptProperties
+            {
+                DependencyCacheDir = "/var/cache/oryx",
+                DependencyCaches = new[]
+                {
+                    new DependencyCache
+                    {
+                        Name = "composer",
+                        EnvironmentVariables = new Dictionary<string, string>
+                        {
+                            { "COMPOSER_CACHE_DIR", DependencyCache.DirectoryVariable },
+                        },
+                        LockFiles = new[] { "composer.lock" },
+                    },
+                },
+            };
+
+            // Act
+            var script = TemplateHelper.Render(TemplateHelper.TemplateResource.BaseBashScript, scriptProps);
+
+            // Assert
+            Assert.Contains("DEPENDENCY_CACHE_DIR=\"/var/cache/oryx\"", script);
+            Assert.Contains("dependencyCacheDir=\"$DEPENDENCY_CACHE_DIR/composer\"", script);
+            Assert.Contains("export COMPOSER_CACHE_DIR=\"$dependencyCacheDir\"", script);
+            Assert.Contains("DEPENDENCY_CACHE_KEYS[composer]=$(dependency_cache_key \"composer.lock\")", script);
+            Assert.True(
+                script.IndexOf("export COMPOSER_CACHE_DIR") < script.IndexOf("Running build script snippets"));
+        }
+
+        [Fact]
+        public void DependencyCaches_AreNotSetUp_IfDependencyCacheDirIsNotSupplied()
+        {
+            // Arrange
+            var scriptProps = new BaseBashBuildScriptProperties();
+
+            // Act
+            var script = TemplateHelper.Render(TemplateHelper.TemplateResource.BaseBashScript, scriptProps);
+
+            // Assert
+            Assert.DoesNotContain("DEPENDENCY_CACHE_DIR", script);
+            Assert.DoesNotContain(ManifestFilePropertyKeys.DependencyCacheHitRate, script);
+            Assert.DoesNotContain("DEPENDENCY_LAYER_CACHE_DIR", script);
+        }
+
+        [Fact]
+        public void DependencyLayerFunctions_AreDefinedBeforeBuildSnippets_IfDependencyLayerCacheDirIsSupplied()
+        {
+            // Arrange
+            var scriptProps = new BaseBashBuildScriptProperties
+            {
+                DependencyLayerCacheDir = "/var/cache/oryx-layers",
+                BuildScriptSnippets = new List<string> { "restore_dependency_layer \"$key\" node_modules" },
+            };
+
+            // Act
+            var script = TemplateHelper.Render(TemplateHelper.TemplateResource.BaseBashScript, scriptProps);
+
+            // Assert
+            Assert.Contains("DEPENDENCY_LAYER_CACHE_DIR=\"/var/cache/oryx-layers\"", script);
+            Assert.True(
+                script.IndexOf("restore_dependency_layer() {") < script.IndexOf("restore_dependency_layer \"$key\""));
+            Assert.Contains("save_dependency_layer() {", script);
+        }
     }
 }
\ No newline at end of file
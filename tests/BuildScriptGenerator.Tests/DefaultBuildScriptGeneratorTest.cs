@@ -625,7 +625,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             var envScriptProvider = new BuildScriptGenerator.PlatformsInstallationScriptProvider(
                 platforms,
                 defaultPlatformDetector,
-                new DefaultStandardOutputWriter());
+                new DefaultStandardOutputWriter(),
+                Options.Create(commonOptions));
             return new DefaultBuildScriptGenerator(
                 defaultPlatformDetector,
                 envScriptProvider,
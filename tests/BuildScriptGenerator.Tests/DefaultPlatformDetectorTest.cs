@@ -50,6 +50,49 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             Assert.Equal("1.0.0", actualDetectedResults.ElementAt(1).PlatformVersion);
         }
 
+        [Fact]
+        public void ParallelDetection_ReturnsResultsInPlatformOrder()
+        {
+            // Arrange
+            var platform1 = new Mock<IProgrammingPlatform>();
+            platform1
+                .Setup(p => p.Detect(It.IsAny<RepositoryContext>()))
+                .Returns(() =>
+                {
+                    // Make the first platform finish last
+                    System.Threading.Thread.Sleep(200);
+                    return new PlatformDetectorResult { Platform = "platform1", PlatformVersion = "1.0.0" };
+                });
+            platform1
+                .Setup(p => p.IsEnabled(It.IsAny<RepositoryContext>()))
+                .Returns(true);
+            var platform2 = new Mock<IProgrammingPlatform>();
+            platform2
+                .Setup(p => p.Detect(It.IsAny<RepositoryContext>()))
+                .Returns(new PlatformDetectorResult { Platform = "platform2", PlatformVersion = "2.0.0" });
+            platform2
+                .Setup(p => p.IsEnabled(It.IsAny<RepositoryContext>()))
+                .Returns(true);
+            var platform3 = new Mock<IProgrammingPlatform>();
+            platform3
+                .Setup(p => p.Detect(It.IsAny<RepositoryContext>()))
+                .Returns((PlatformDetectorResult)null);
+            platform3
+                .Setup(p => p.IsEnabled(It.IsAny<RepositoryContext>()))
+                .Returns(true);
+            var detector = CreatePlatformDetector(
+                new[] { platform1.Object, platform2.Object, platform3.Object },
+                new BuildScriptGeneratorOptions { EnableParallelDetection = true });
+            var context = CreateScriptGeneratorContext();
+
+            // Act
+            var actualResults = detector.GetPlatformsInfo(context);
+
+            // Assert
+            var actualDetectedResults = actualResults.Select(pi => pi.DetectorResult);
+            Assert.Equal(new[] { "platform1", "platform2" }, actualDetectedResults.Select(r => r.Platform));
+        }
+
         [Fact]
         public void RunsDetectionOnEnabledPlatformsOnly()
         {
@@ -31,6 +31,14 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.DotNetCore
         </Project>
         ";
 
+        private const string WebProjectFile = @"
+        <Project Sdk=""Microsoft.NET.Sdk.Web"">
+          <PropertyGroup>
+            <TargetFramework>net8.0</TargetFramework>
+          </PropertyGroup>
+        </Project>
+        ";
+
         [Fact]
         public void GeneratedBuildSnippet_AOTCompilationInstallCommandWillExecute_WhenBlazorWasmDotNet6App()
         {
@@ -172,6 +180,106 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.DotNetCore
             Assert.DoesNotContain("Running custom build command", buildScriptSnippet.BashBuildScriptSnippet);
         }
 
+        [Fact]
+        public void GeneratedBuildSnippet_RestoresOnce_IntoPersistentNuGetPackagesCache()
+        {
+            // Arrange
+            var dotNetCorePlatform = CreateDotNetCorePlatform(
+                isDotNetCoreVersionAlreadyInstalled: true);
+            var repo = new MemorySourceRepo();
+            repo.AddFile(ProjectFileAzureBlazorWasmClientWithTargetFramework6, "test.csproj");
+            var context = CreateContext(repo);
+            var detectedResult = new DotNetCorePlatformDetectorResult
+            {
+                Platform = DotNetCoreConstants.PlatformName,
+                PlatformVersion = "10.0",
+                ProjectFile = "test.csproj",
+            };
+
+            // Act
+            var buildScriptSnippet = dotNetCorePlatform.GenerateBashBuildScriptSnippet(context, detectedResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.Contains(
+                "export NUGET_PACKAGES=\"${NUGET_PACKAGES:-/usr/local/share/nuget-packages}\"",
+                buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.Contains("publishArgs=\"--no-restore\"", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.Contains("-c Release $publishArgs", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.DoesNotContain("PublishReadyToRun", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.False(buildScriptSnippet.BuildProperties.ContainsKey("PublishReadyToRun"));
+        }
+
+        [Theory]
+        [InlineData("10.0", true)]
+        [InlineData("3.1.32", true)]
+        [InlineData("2.1", false)]
+        public void GeneratedBuildSnippet_PublishesReadyToRun_WhenEnabled_ForNetCore30AndLater(
+            string runtimeVersion,
+            bool expectedReadyToRun)
+        {
+            // Arrange
+            var dotNetCorePlatform = CreateDotNetCorePlatform(
+                DotNetCoreScriptGeneratorOptions: new DotNetCoreScriptGeneratorOptions
+                {
+                    PublishReadyToRun = true,
+                },
+                isDotNetCoreVersionAlreadyInstalled: true);
+            var repo = new MemorySourceRepo();
+            repo.AddFile(WebProjectFile, "test.csproj");
+            var context = CreateContext(repo);
+            var detectedResult = new DotNetCorePlatformDetectorResult
+            {
+                Platform = DotNetCoreConstants.PlatformName,
+                PlatformVersion = runtimeVersion,
+                ProjectFile = "test.csproj",
+            };
+
+            // Act
+            var buildScriptSnippet = dotNetCorePlatform.GenerateBashBuildScriptSnippet(context, detectedResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.Equal(
+                expectedReadyToRun,
+                buildScriptSnippet.BashBuildScriptSnippet.Contains("-p:PublishReadyToRun=true -p:TieredPGO=true"));
+            Assert.Equal(expectedReadyToRun, buildScriptSnippet.BuildProperties.ContainsKey("PublishReadyToRun"));
+        }
+
+        [Fact]
+        public void GeneratedBuildSnippet_DoesNotPublishReadyToRun_ForBlazorWasmApp()
+        {
+            // Arrange
+            var dotNetCorePlatform = CreateDotNetCorePlatform(
+                DotNetCoreScriptGeneratorOptions: new DotNetCoreScriptGeneratorOptions
+                {
+                    PublishReadyToRun = true,
+                },
+                isDotNetCoreVersionAlreadyInstalled: true);
+            var repo = new MemorySourceRepo();
+            repo.AddFile(ProjectFileAzureBlazorWasmClientWithTargetFramework6, "test.csproj");
+            var context = CreateContext(repo);
+            var detectedResult = new DotNetCorePlatformDetectorResult
+            {
+                Platform = DotNetCoreConstants.PlatformName,
+                PlatformVersion = "10.0",
+                InstallAOTWorkloads = true,
+                ProjectFile = "test.csproj",
+            };
+
+            // Act
+            var buildScriptSnippet = dotNetCorePlatform.GenerateBashBuildScriptSnippet(context, detectedResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.Contains(
+                DotNetCoreConstants.InstallBlazorWebAssemblyAOTWorkloadCommand,
+                buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.DoesNotContain("PublishReadyToRun", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.DoesNotContain("runtimeIdentifier", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.False(buildScriptSnippet.BuildProperties.ContainsKey("PublishReadyToRun"));
+        }
+
         [Fact]
         public void GeneratedBuildSnippet_AOTWorkloadIsPreserved_WithCustomBuildCommand()
         {
@@ -299,6 +299,137 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.Node
             Assert.Contains("yarn config set network-timeout 60000 -g", buildScriptSnippet.BashBuildScriptSnippet);
         }
 
+        [Fact]
+        public void GeneratedBuildSnippet_LinksProdDependencies_IfEnabled_AndPackageLockJsonExists()
+        {
+            // Arrange
+            var nodePlatform = CreateNodePlatform(
+                nodeScriptGeneratorOptions: new NodeScriptGeneratorOptions { PruneDevDependenciesWithHardlinks = true });
+            var repo = new MemorySourceRepo();
+            repo.AddFile(SamplePackageJsonContents.PackageJsonWithNoVersions, NodeConstants.PackageJsonFileName);
+            repo.AddFile("{}", NodeConstants.PackageLockJsonFileName);
+            var context = CreateContext(repo);
+            context.Properties[NodePlatform.PruneDevDependenciesPropertyKey] = "true";
+            var detectorResult = new NodePlatformDetectorResult
+            {
+                Platform = NodeConstants.PlatformName,
+                PlatformVersion = "10.10",
+            };
+
+            // Act
+            var buildScriptSnippet = nodePlatform.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.Contains("link_prod_node_modules", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.DoesNotContain("Installing production dependencies in", buildScriptSnippet.BashBuildScriptSnippet);
+        }
+
+        [Fact]
+        public void GeneratedBuildSnippet_InstallsProdDependenciesSeparately_IfYarnLockExists()
+        {
+            // Arrange
+            var nodePlatform = CreateNodePlatform(
+                nodeScriptGeneratorOptions: new NodeScriptGeneratorOptions { PruneDevDependenciesWithHardlinks = true });
+            var repo = new MemorySourceRepo();
+            repo.AddFile(SamplePackageJsonContents.PackageJsonWithNoVersions, NodeConstants.PackageJsonFileName);
+            repo.AddFile(string.Empty, NodeConstants.YarnLockFileName);
+            var context = CreateContext(repo);
+            context.Properties[NodePlatform.PruneDevDependenciesPropertyKey] = "true";
+            var detectorResult = new NodePlatformDetectorResult
+            {
+                Platform = NodeConstants.PlatformName,
+                PlatformVersion = "10.10",
+            };
+
+            // Act
+            var buildScriptSnippet = nodePlatform.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.DoesNotContain("link_prod_node_modules", buildScriptSnippet.BashBuildScriptSnippet);
+            Assert.Contains("Installing production dependencies in", buildScriptSnippet.BashBuildScriptSnippet);
+        }
+
+        [Fact]
+        public void GeneratedBuildSnippet_UsesDependencyLayerCache_IfEnabled_AndLockFileExists()
+        {
+            // Arrange
+            var nodePlatform = CreateNodePlatform(
+                commonOptions: new BuildScriptGeneratorOptions { DependencyLayerCacheDir = "/var/cache/oryx-layers" });
+            var repo = new MemorySourceRepo();
+            repo.AddFile(SamplePackageJsonContents.PackageJsonWithNoVersions, NodeConstants.PackageJsonFileName);
+            repo.AddFile("{}", NodeConstants.PackageLockJsonFileName);
+            var context = CreateContext(repo);
+            var detectorResult = new NodePlatformDetectorResult
+            {
+                Platform = NodeConstants.PlatformName,
+                PlatformVersion = "10.10",
+            };
+
+            // Act
+            var buildScriptSnippet = nodePlatform.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            var script = buildScriptSnippet.BashBuildScriptSnippet;
+            Assert.Contains("if restore_dependency_layer \"$dependencyLayerKey\" node_modules; then", script);
+            Assert.Contains("save_dependency_layer \"$dependencyLayerKey\" node_modules", script);
+            Assert.True(script.IndexOf("Package install done") < script.IndexOf("save_dependency_layer"));
+        }
+
+        [Fact]
+        public void GeneratedBuildSnippet_DoesNotUseDependencyLayerCache_IfNoLockFileExists()
+        {
+            // Arrange
+            var nodePlatform = CreateNodePlatform(
+                commonOptions: new BuildScriptGeneratorOptions { DependencyLayerCacheDir = "/var/cache/oryx-layers" });
+            var repo = new MemorySourceRepo();
+            repo.AddFile(SamplePackageJsonContents.PackageJsonWithNoVersions, NodeConstants.PackageJsonFileName);
+            var context = CreateContext(repo);
+            var detectorResult = new NodePlatformDetectorResult
+            {
+                Platform = NodeConstants.PlatformName,
+                PlatformVersion = "10.10",
+            };
+
+            // Act
+            var buildScriptSnippet = nodePlatform.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.DoesNotContain("dependency_layer", buildScriptSnippet.BashBuildScriptSnippet);
+        }
+
+        [Theory]
+        [InlineData("preinstall")]
+        [InlineData("install")]
+        [InlineData("postinstall")]
+        [InlineData("prepare")]
+        public void GeneratedBuildSnippet_DoesNotUseDependencyLayerCache_IfAppHasInstallScript(string scriptName)
+        {
+            // Arrange
+            var packageJson = "{ \"name\": \"mynodeapp\", \"scripts\": { \"" + scriptName + "\": \"node setup.js\" } }";
+            var nodePlatform = CreateNodePlatform(
+                commonOptions: new BuildScriptGeneratorOptions { DependencyLayerCacheDir = "/var/cache/oryx-layers" });
+            var repo = new MemorySourceRepo();
+            repo.AddFile(packageJson, NodeConstants.PackageJsonFileName);
+            repo.AddFile("{}", NodeConstants.PackageLockJsonFileName);
+            var context = CreateContext(repo);
+            var detectorResult = new NodePlatformDetectorResult
+            {
+                Platform = NodeConstants.PlatformName,
+                PlatformVersion = "10.10",
+            };
+
+            // Act
+            var buildScriptSnippet = nodePlatform.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(buildScriptSnippet);
+            Assert.DoesNotContain("dependency_layer", buildScriptSnippet.BashBuildScriptSnippet);
+        }
+
         [Fact]
         public void GeneratedBuildSnippet_WillNotBuildMonorepo_IfNodeMonorepoOptionNotEnabled()
         {
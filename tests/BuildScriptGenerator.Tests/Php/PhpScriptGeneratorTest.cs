@@ -73,6 +73,10 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.Php
             // Assert
             Assert.NotNull(snippet);
             Assert.Contains("$composer install", snippet.BashBuildScriptSnippet);
+            var dependencyCache = Assert.Single(snippet.DependencyCaches);
+            Assert.Equal("composer", dependencyCache.Name);
+            Assert.Equal(DependencyCache.DirectoryVariable, dependencyCache.EnvironmentVariables["COMPOSER_CACHE_DIR"]);
+            Assert.Equal(new[] { PhpConstants.ComposerLockFileName }, dependencyCache.LockFiles);
         }
 
         //[Fact]
@@ -161,6 +161,33 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             Assert.DoesNotContain("Could not find cached tarball", snippet);
         }
 
+        [Fact]
+        public void GetInstallerScriptSnippet_WhenNotSkipDownload_StreamsTarballIntoChecksumAndTar()
+        {
+            var installer = CreateInstaller(debianFlavor: "bookworm");
+
+            var snippet = installer.GetInstallerScriptSnippet("20.0.0", skipSdkBinaryDownload: false);
+
+            // The tarball is never written to disk
+            Assert.Contains("sha512sum < \"$checksumFifo\"", snippet);
+            Assert.Contains("| tar -xzf - -C \"$sdkStagingDir\"", snippet);
+            Assert.DoesNotContain("--output", snippet);
+        }
+
+        [Fact]
+        public void GetInstallerScriptSnippet_WhenNotSkipDownload_RenamesStagingDirIntoPlace_AfterVerification()
+        {
+            var installer = CreateInstaller(debianFlavor: "bookworm", dynamicInstallRootDir: "/opt/oryx-dynamic");
+
+            var snippet = installer.GetInstallerScriptSnippet("20.0.0", skipSdkBinaryDownload: false);
+
+            Assert.Contains("sdkStagingDir=\"/opt/oryx-dynamic/nodejs/.20.0.0.download\"", snippet);
+            var verifyIndex = snippet.IndexOf("Verifying checksum...");
+            var renameIndex = snippet.IndexOf("mv -T \"$sdkStagingDir\" /opt/oryx-dynamic/nodejs/20.0.0");
+            Assert.True(verifyIndex >= 0);
+            Assert.True(renameIndex > verifyIndex);
+        }
+
         [Fact]
         public void GetInstallerScriptSnippet_WritesSentinelFile()
         {
@@ -3,6 +3,7 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.Collections.Generic;
 using Microsoft.Extensions.Logging;
 using Microsoft.Extensions.Logging.Abstractions;
@@ -114,6 +115,63 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             Assert.True(detector2.DetectInvoked);
         }
 
+        [Fact]
+        public void InstallsMultiplePlatformsConcurrently_IfDynamicInstallParallelismIsGreaterThanOne()
+        {
+            // Arrange
+            var platform1 = new TestProgrammingPlatform(
+                "test1",
+                new[] { "1.0.0" },
+                canGenerateScript: true,
+                scriptContent: "script1-content",
+                installationScriptContent: "install1-content",
+                detector: new TestPlatformDetectorUsingPlatformName("test1", "1.0.0"));
+            var platform2 = new TestProgrammingPlatform(
+                "test2",
+                new[] { "2.0.0" },
+                canGenerateScript: true,
+                scriptContent: "script2-content",
+                installationScriptContent: "install2-content",
+                detector: new TestPlatformDetectorUsingPlatformName("test2", "2.0.0"));
+            var commonOptions = new BuildScriptGeneratorOptions { DynamicInstallParallelism = 2 };
+            var envScriptProvider = CreateEnvironmentSetupScriptProvider(new[] { platform1, platform2 }, commonOptions);
+            var context = CreateScriptGeneratorContext();
+
+            // Act
+            var setupScript = envScriptProvider.GetBashScriptSnippet(context);
+
+            // Assert
+            Assert.Contains($"install_platform_0() {{{Environment.NewLine}install1-content", setupScript);
+            Assert.Contains($"install_platform_1() {{{Environment.NewLine}install2-content", setupScript);
+            Assert.Contains("PLATFORM_INSTALLATION_PARALLELISM=2", setupScript);
+            Assert.Contains("run_platform_installation $installationId &", setupScript);
+            Assert.Contains("\"test1 1.0.0\"", setupScript);
+            Assert.Contains("\"test2 2.0.0\"", setupScript);
+        }
+
+        [Fact]
+        public void DoesNotInstallConcurrently_IfOnlyOnePlatformNeedsToBeInstalled()
+        {
+            // Arrange
+            var platform = new TestProgrammingPlatform(
+                "test",
+                new[] { "1.0.0" },
+                canGenerateScript: true,
+                scriptContent: "script-content",
+                installationScriptContent: "install-content",
+                detector: new TestPlatformDetectorUsingPlatformName("test", "1.0.0"));
+            var commonOptions = new BuildScriptGeneratorOptions { DynamicInstallParallelism = 2 };
+            var envScriptProvider = CreateEnvironmentSetupScriptProvider(new[] { platform }, commonOptions);
+            var context = CreateScriptGeneratorContext();
+
+            // Act
+            var setupScript = envScriptProvider.GetBashScriptSnippet(context);
+
+            // Assert
+            Assert.Contains("install-content", setupScript);
+            Assert.DoesNotContain("install_platform_0", setupScript);
+        }
+
         [Theory]
         [InlineData(null)]
         [InlineData("")]
@@ -143,7 +201,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
         }
 
         private PlatformsInstallationScriptProvider CreateEnvironmentSetupScriptProvider(
-            IEnumerable<IProgrammingPlatform> platforms)
+            IEnumerable<IProgrammingPlatform> platforms,
+            BuildScriptGeneratorOptions commonOptions = null)
         {
             var platformDetector = new DefaultPlatformsInformationProvider(
                 platforms,
@@ -153,7 +212,8 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
             return new PlatformsInstallationScriptProvider(
                 platforms,
                 platformDetector,
-                new DefaultStandardOutputWriter());
+                new DefaultStandardOutputWriter(),
+                Options.Create(commonOptions ?? new BuildScriptGeneratorOptions()));
         }
 
         private static BuildScriptGeneratorContext CreateScriptGeneratorContext()
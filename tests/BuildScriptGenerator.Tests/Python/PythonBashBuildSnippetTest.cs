@@ -776,5 +776,126 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.Python
             }
             Assert.Equal(3, findLinksCount);
         }
+
+        [Fact]
+        public void GeneratedSnippet_BuffersInstallOutput_IfStreamInstallOutput_IsFalse()
+        {
+            // Arrange
+            var snippetProps = new PythonBashBuildSnippetProperties(
+                virtualEnvironmentName: "venv",
+                virtualEnvironmentModule: "venv",
+                virtualEnvironmentParameters: null,
+                packagesDirectory: null,
+                enableCollectStatic: false,
+                compressVirtualEnvCommand: null,
+                compressedVirtualEnvFileName: null,
+                runPythonPackageCommand: false,
+                pythonVersion: null,
+                pythonBuildCommandsFileName: FilePaths.BuildCommandsFileName);
+
+            // Act
+            var text = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, snippetProps);
+
+            // Assert
+            Assert.Contains("output=$( ( \"$@\" ) 2>&1 )", text);
+            Assert.Contains("run_install_command timestamp_output $InstallCommand", text);
+            Assert.DoesNotContain("stream_install_output", text);
+        }
+
+        [Fact]
+        public void GeneratedSnippet_StreamsInstallOutput_IfStreamInstallOutput_IsTrue()
+        {
+            // Arrange
+            var snippetProps = new PythonBashBuildSnippetProperties(
+                virtualEnvironmentName: "venv",
+                virtualEnvironmentModule: "venv",
+                virtualEnvironmentParameters: null,
+                packagesDirectory: null,
+                enableCollectStatic: false,
+                compressVirtualEnvCommand: null,
+                compressedVirtualEnvFileName: null,
+                runPythonPackageCommand: false,
+                pythonVersion: null,
+                pythonBuildCommandsFileName: FilePaths.BuildCommandsFileName,
+                streamInstallOutput: true);
+
+            // Act
+            var text = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, snippetProps);
+
+            // Assert
+            Assert.Contains("stream_install_output() {", text);
+            Assert.Contains("( \"$@\" ) 2>&1 | stream_install_output \"$tail_file\"", text);
+            Assert.Contains("INSTALL_OUTPUT_TAIL_LINES=${PYTHON_INSTALL_OUTPUT_TAIL_LINES:-100}", text);
+            Assert.Contains("Ignoring invalid value '$INSTALL_OUTPUT_TAIL_LINES'", text);
+            Assert.Contains("run_install_command timestamp_output $InstallCommand", text);
+            Assert.DoesNotContain("output=$( ( \"$@\" ) 2>&1 )", text);
+        }
+
+        [Theory]
+        [InlineData(true)]
+        [InlineData(false)]
+        public void GeneratedSnippet_CompilesBytecode_OnlyIfPrecompileBytecode_IsTrue(bool precompileBytecode)
+        {
+            // Arrange
+            var snippetProps = new PythonBashBuildSnippetProperties(
+                virtualEnvironmentName: "venv",
+                virtualEnvironmentModule: "venv",
+                virtualEnvironmentParameters: null,
+                packagesDirectory: null,
+                enableCollectStatic: false,
+                compressVirtualEnvCommand: null,
+                compressedVirtualEnvFileName: null,
+                runPythonPackageCommand: false,
+                pythonVersion: null,
+                pythonBuildCommandsFileName: FilePaths.BuildCommandsFileName,
+                precompileBytecode: precompileBytecode);
+
+            // Act
+            var text = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, snippetProps);
+
+            // Assert
+            Assert.Equal(precompileBytecode, text.Contains("Compiling Python bytecode..."));
+            Assert.Equal(
+                precompileBytecode,
+                text.Contains("-m compileall -q -f -j 0 --invalidation-mode unchecked-hash"));
+            Assert.Equal(precompileBytecode, text.Contains("output=$(\"${CompileBytecodeCommand[@]}\" 2>&1)"));
+        }
+
+        [Theory]
+        [InlineData(true)]
+        [InlineData(false)]
+        public void GeneratedSnippet_UsesDependencyLayerCache_OnlyIfUseDependencyLayerCache_IsTrue(
+            bool useDependencyLayerCache)
+        {
+            // Arrange
+            var snippetProps = new PythonBashBuildSnippetProperties(
+                virtualEnvironmentName: "venv",
+                virtualEnvironmentModule: "venv",
+                virtualEnvironmentParameters: null,
+                packagesDirectory: null,
+                enableCollectStatic: false,
+                compressVirtualEnvCommand: null,
+                compressedVirtualEnvFileName: null,
+                runPythonPackageCommand: false,
+                pythonVersion: "3.11.4",
+                pythonBuildCommandsFileName: FilePaths.BuildCommandsFileName,
+                useDependencyLayerCache: useDependencyLayerCache);
+
+            // Act
+            var text = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, snippetProps);
+
+            // Assert
+            Assert.Equal(
+                useDependencyLayerCache,
+                text.Contains("restore_dependency_layer \"$dependencyLayerKey\" \"$VIRTUALENVIRONMENTNAME\""));
+            Assert.Equal(
+                useDependencyLayerCache,
+                text.Contains("save_dependency_layer \"$dependencyLayerKey\" \"$VIRTUALENVIRONMENTNAME\""));
+            Assert.Equal(useDependencyLayerCache, text.Contains("dependencyLayerDescription=\"python 3.11.4 "));
+            Assert.Equal(
+                useDependencyLayerCache,
+                text.Contains("echo \"Not using the dependency layer cache as the app is installed from setup.py.\""));
+            Assert.Contains("echo \"BuildCommands=$CreateVenvCommand\"", text);
+        }
     }
 }
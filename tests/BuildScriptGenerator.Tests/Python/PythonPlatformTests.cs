@@ -496,10 +496,45 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.Python
             Assert.DoesNotContain("UpgradeCommand=\"pip install --upgrade pip\"", snippet.BashBuildScriptSnippet);
         }
 
+        [Theory]
+        [InlineData("3.7.5", true)]
+        [InlineData("3.6.9", false)]
+        public void GeneratedBuildSnippet_PrecompilesBytecode_OnlyForPythonVersionsSupportingHashBasedPycs(
+            string pythonVersion,
+            bool expectPrecompile)
+        {
+            // Arrange
+            var pythonScriptGeneratorOptions = new PythonScriptGeneratorOptions
+            {
+                PrecompileBytecode = true,
+            };
+            var scriptGenerator = CreatePlatform(pythonScriptGeneratorOptions: pythonScriptGeneratorOptions);
+            var repo = new MemorySourceRepo();
+            repo.AddFile("", PythonConstants.RequirementsFileName);
+            repo.AddFile("print(1)", "bla.py");
+            var context = new BuildScriptGeneratorContext { SourceRepo = repo };
+            var detectorResult = new PythonPlatformDetectorResult
+            {
+                Platform = PythonConstants.PlatformName,
+                PlatformVersion = pythonVersion,
+            };
+
+            // Act
+            var snippet = scriptGenerator.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(snippet);
+            Assert.Equal(expectPrecompile, snippet.BashBuildScriptSnippet.Contains("--invalidation-mode unchecked-hash"));
+            Assert.Equal(
+                expectPrecompile,
+                snippet.BuildProperties.ContainsKey(PythonManifestFilePropertyKeys.BytecodeInvalidationMode));
+        }
+
         [Theory]
         [InlineData(null, "bla.tar.gz")]
         [InlineData("tar-gz", "bla.tar.gz")]
         [InlineData("zip", "bla.zip")]
+        [InlineData("squashfs", "bla.squashfs")]
         public void ExlcudedDirs_DoesNotContainVirtualEnvDir_IfCompressVirtualEnv_IsEnabled(
             string compressOption,
             string compressedVirtualEnvFileName)
@@ -527,6 +562,38 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests.Python
             Assert.DoesNotContain(compressedVirtualEnvFileName, excludedDirs);
         }
 
+        [Fact]
+        public void GeneratedBuildSnippet_CreatesSquashfsImage_IfCompressVirtualEnv_IsSquashfs()
+        {
+            // Arrange
+            var scriptGenerator = CreatePlatform();
+            var repo = new MemorySourceRepo();
+            repo.AddFile("", PythonConstants.RequirementsFileName);
+            var context = new BuildScriptGeneratorContext
+            {
+                SourceRepo = repo,
+                Properties = new Dictionary<string, string> {
+                    { "virtualenv_name", "bla" },
+                    { "compress_virtualenv", "squashfs" }
+                }
+            };
+            var detectorResult = new PythonPlatformDetectorResult
+            {
+                Platform = PythonConstants.PlatformName,
+                PlatformVersion = "3.7.5",
+            };
+
+            // Act
+            var snippet = scriptGenerator.GenerateBashBuildScriptSnippet(context, detectorResult);
+
+            // Assert
+            Assert.NotNull(snippet);
+            Assert.Contains("create_squashfs_image ../$zippedVirtualEnvFileName .", snippet.BashBuildScriptSnippet);
+            Assert.Equal(
+                "bla.squashfs",
+                snippet.BuildProperties[PythonManifestFilePropertyKeys.CompressedVirtualEnvFile]);
+        }
+
         [Fact]
         public void Detect_ReturnsDefaultVersion_IfNoVersionFoundFromApp_OrOptions()
         {
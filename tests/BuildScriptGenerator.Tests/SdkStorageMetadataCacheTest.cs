@@ -0,0 +1,200 @@
+// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Net;
+using System.Net.Http;
+using System.Net.Http.Headers;
+using System.Threading;
+using System.Threading.Tasks;
+using System.Xml.Linq;
+using System.Xml.XPath;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Oryx.Tests.Common;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildScriptGenerator.Tests
+{
+    public class SdkStorageMetadataCacheTest : IClassFixture<TestTempDirTestFixture>
+    {
+        private const string DefaultVersionUrl = "https://sdks.example.com/nodejs/defaultVersion.bookworm.txt";
+
+        private readonly string _tempDirRoot;
+
+        public SdkStorageMetadataCacheTest(TestTempDirTestFixture testFixture)
+        {
+            _tempDirRoot = testFixture.RootDirPath;
+        }
+
+        [Fact]
+        public void GetString_ReturnsCachedContent_WithoutRequest_WithinTimeToLive()
+        {
+            // Arrange
+            var handler = new TestHttpMessageHandler(request => CreateResponse("20.0.0", etag: "\"v1\""));
+            var cacheDir = CreateCacheDir();
+            var cache1 = new SdkStorageMetadataCache(cacheDir, TimeSpan.FromHours(1), offline: false, NullLogger.Instance);
+            var cache2 = new SdkStorageMetadataCache(cacheDir, TimeSpan.FromHours(1), offline: false, NullLogger.Instance);
+
+            // Act
+            var content1 = cache1.GetString(DefaultVersionUrl, new HttpClient(handler));
+            var content2 = cache2.GetString(DefaultVersionUrl, new HttpClient(handler));
+
+            // Assert
+            Assert.Equal("20.0.0", content1);
+            Assert.Equal("20.0.0", content2);
+            Assert.Single(handler.Requests);
+        }
+
+        [Fact]
+        public void GetString_RevalidatesExpiredEntry_WithETag()
+        {
+            // Arrange
+            var handler = new TestHttpMessageHandler(request =>
+            {
+                if (request.Headers.IfNoneMatch.Any(etag => etag.Tag == "\"v1\""))
+                {
+                    return new HttpResponseMessage(HttpStatusCode.NotModified);
+                }
+
+                return CreateResponse("20.0.0", etag: "\"v1\"");
+            });
+            var cache = new SdkStorageMetadataCache(CreateCacheDir(), TimeSpan.Zero, offline: false, NullLogger.Instance);
+
+            // Act
+            cache.GetString(DefaultVersionUrl, new HttpClient(handler));
+            var content = cache.GetString(DefaultVersionUrl, new HttpClient(handler));
+
+            // Assert
+            Assert.Equal("20.0.0", content);
+            Assert.Equal(2, handler.Requests.Count);
+            Assert.Contains(handler.Requests[1].Headers.IfNoneMatch, etag => etag.Tag == "\"v1\"");
+        }
+
+        [Fact]
+        public void GetString_ReturnsCachedContent_IfStorageCannotBeReached()
+        {
+            // Arrange
+            var failRequests = false;
+            var handler = new TestHttpMessageHandler(request =>
+            {
+                if (failRequests)
+                {
+                    throw new HttpRequestException("Network is unreachable");
+                }
+
+                return CreateResponse("20.0.0", etag: null);
+            });
+            var cache = new SdkStorageMetadataCache(CreateCacheDir(), TimeSpan.Zero, offline: false, NullLogger.Instance);
+
+            // Act
+            cache.GetString(DefaultVersionUrl, new HttpClient(handler));
+            failRequests = true;
+            var content = cache.GetString(DefaultVersionUrl, new HttpClient(handler));
+
+            // Assert
+            Assert.Equal("20.0.0", content);
+            Assert.Equal(2, handler.Requests.Count);
+        }
+
+        [Fact]
+        public void GetString_InOfflineMode_UsesExpiredEntry_WithoutRequest()
+        {
+            // Arrange
+            var handler = new TestHttpMessageHandler(request => CreateResponse("20.0.0", etag: "\"v1\""));
+            var cacheDir = CreateCacheDir();
+            new SdkStorageMetadataCache(cacheDir, TimeSpan.Zero, offline: false, NullLogger.Instance)
+                .GetString(DefaultVersionUrl, new HttpClient(handler));
+            var offlineCache = new SdkStorageMetadataCache(cacheDir, TimeSpan.Zero, offline: true, NullLogger.Instance);
+
+            // Act
+            var content = offlineCache.GetString(DefaultVersionUrl, new HttpClient(handler));
+
+            // Assert
+            Assert.Equal("20.0.0", content);
+            Assert.Single(handler.Requests);
+        }
+
+        [Fact]
+        public void GetString_InOfflineMode_Throws_IfNothingIsCached()
+        {
+            // Arrange
+            var handler = new TestHttpMessageHandler(request => CreateResponse("20.0.0", etag: null));
+            var cache = new SdkStorageMetadataCache(CreateCacheDir(), TimeSpan.Zero, offline: true, NullLogger.Instance);
+
+            // Act & Assert
+            var exception = Assert.Throws<InvalidOperationException>(
+                () => cache.GetString(DefaultVersionUrl, new HttpClient(handler)));
+            Assert.Contains("ORYX_SDK_METADATA_OFFLINE", exception.Message);
+            Assert.Empty(handler.Requests);
+        }
+
+        [Fact]
+        public void CompactBlobList_KeepsOnlyNamesAndMetadata_OfBlobsFromAllPages()
+        {
+            // Arrange
+            var blobList = XDocument.Parse(
+                "<EnumerationResults>" +
+                "<Blobs><Blob><Name>nodejs-bookworm-20.0.0.tar.gz</Name><Properties><Etag>0x1</Etag></Properties>" +
+                "<Metadata><Sdk_version>20.0.0</Sdk_version><Os_type>bookworm</Os_type></Metadata></Blob></Blobs>" +
+                "<Blobs><Blob><Name>nodejs-bookworm-22.0.0.tar.gz</Name><Properties><Etag>0x2</Etag></Properties>" +
+                "<Metadata><Sdk_version>22.0.0</Sdk_version><Os_type>bookworm</Os_type></Metadata></Blob></Blobs>" +
+                "<NextMarker /></EnumerationResults>");
+
+            // Act
+            var compacted = SdkStorageMetadataCache.CompactBlobList(blobList);
+
+            // Assert
+            var versions = compacted
+                .XPathSelectElements("//Blobs/Blob/Metadata/Sdk_version")
+                .Select(e => e.Value);
+            Assert.Equal(new[] { "20.0.0", "22.0.0" }, versions);
+            Assert.NotNull(compacted.XPathSelectElement("//Blobs/Blob[Name='nodejs-bookworm-22.0.0.tar.gz']"));
+            Assert.Empty(compacted.Descendants("Properties"));
+        }
+
+        private static HttpResponseMessage CreateResponse(string content, string etag)
+        {
+            var response = new HttpResponseMessage(HttpStatusCode.OK)
+            {
+                Content = new StringContent(content),
+            };
+
+            if (etag != null)
+            {
+                response.Headers.ETag = new EntityTagHeaderValue(etag);
+            }
+
+            return response;
+        }
+
+        private string CreateCacheDir()
+        {
+            return Path.Combine(_tempDirRoot, Guid.NewGuid().ToString());
+        }
+
+        private class TestHttpMessageHandler : HttpMessageHandler
+        {
+            private readonly Func<HttpRequestMessage, HttpResponseMessage> _respond;
+
+            public TestHttpMessageHandler(Func<HttpRequestMessage, HttpResponseMessage> respond)
+            {
+                _respond = respond;
+            }
+
+            public List<HttpRequestMessage> Requests { get; } = new List<HttpRequestMessage>();
+
+            protected override Task<HttpResponseMessage> SendAsync(
+                HttpRequestMessage request,
+                CancellationToken cancellationToken)
+            {
+                Requests.Add(request);
+                return Task.FromResult(_respond(request));
+            }
+        }
+    }
+}
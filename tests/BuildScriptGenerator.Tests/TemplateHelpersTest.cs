@@ -4,6 +4,9 @@
 // --------------------------------------------------------------------------------------------
 
 using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.Oryx.BuildScriptGenerator.Common;
+using Microsoft.Oryx.BuildScriptGenerator.Python;
 using Scriban.Syntax;
 using Xunit;
 
@@ -56,5 +59,69 @@ namespace Microsoft.Oryx.BuildScriptGenerator.Tests
         {
             Assert.Equal("Hello\nWorld!", TemplateHelper.RenderString("Hello\r\nWorld!", null));
         }
+
+        [Fact]
+        public void Render_ReusesParsedTemplate_ForDifferentModels()
+        {
+            // Act
+            var withCollectStatic = TemplateHelper.Render(
+                TemplateHelper.TemplateResource.PythonSnippet,
+                CreatePythonSnippetProperties(enableCollectStatic: true));
+            var withoutCollectStatic = TemplateHelper.Render(
+                TemplateHelper.TemplateResource.PythonSnippet,
+                CreatePythonSnippetProperties(enableCollectStatic: false));
+
+            // Assert
+            Assert.Contains("collectstatic", withCollectStatic);
+            Assert.DoesNotContain("collectstatic", withoutCollectStatic);
+        }
+
+        [Fact]
+        public void Render_ProducesSameOutput_WhenRenderingConcurrently()
+        {
+            // Arrange
+            var model = CreatePythonSnippetProperties(enableCollectStatic: true);
+            var expected = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, model);
+
+            // Act
+            var results = new string[64];
+            Parallel.For(0, results.Length, i =>
+            {
+                results[i] = TemplateHelper.Render(TemplateHelper.TemplateResource.PythonSnippet, model);
+            });
+
+            // Assert
+            Assert.All(results, result => Assert.Equal(expected, result));
+        }
+
+        [Fact]
+        public void GetTemplate_ReturnsSameParsedTemplate_ForEveryRender()
+        {
+            // Act
+            var template1 = TemplateHelper.GetTemplate(TemplateHelper.TemplateResource.PythonSnippet);
+            TemplateHelper.Render(
+                TemplateHelper.TemplateResource.PythonSnippet,
+                CreatePythonSnippetProperties(enableCollectStatic: true));
+            var template2 = TemplateHelper.GetTemplate(TemplateHelper.TemplateResource.PythonSnippet);
+
+            // Assert
+            Assert.Same(template1, template2);
+            Assert.NotSame(template1, TemplateHelper.GetTemplate(TemplateHelper.TemplateResource.NodeBuildSnippet));
+        }
+
+        private static PythonBashBuildSnippetProperties CreatePythonSnippetProperties(bool enableCollectStatic)
+        {
+            return new PythonBashBuildSnippetProperties(
+                virtualEnvironmentName: "venv",
+                virtualEnvironmentModule: "venv",
+                virtualEnvironmentParameters: null,
+                packagesDirectory: null,
+                enableCollectStatic: enableCollectStatic,
+                compressVirtualEnvCommand: null,
+                compressedVirtualEnvFileName: null,
+                runPythonPackageCommand: false,
+                pythonVersion: "3.8",
+                pythonBuildCommandsFileName: FilePaths.BuildCommandsFileName);
+        }
     }
 }
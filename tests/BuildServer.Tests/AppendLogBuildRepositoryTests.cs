@@ -0,0 +1,234 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using System.Linq;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Oryx.BuildServer.Exceptions;
+using Microsoft.Oryx.BuildServer.Models;
+using Microsoft.Oryx.BuildServer.Repositories;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildServer.Tests
+{
+    public class AppendLogBuildRepositoryTests : IDisposable
+    {
+        private readonly string storeDirectory;
+
+        public AppendLogBuildRepositoryTests()
+        {
+            this.storeDirectory = Path.Combine(Path.GetTempPath(), "oryx-buildserver-tests", Guid.NewGuid().ToString());
+        }
+
+        public void Dispose()
+        {
+            if (Directory.Exists(this.storeDirectory))
+            {
+                Directory.Delete(this.storeDirectory, recursive: true);
+            }
+        }
+
+        [Fact]
+        public async Task Test_InsertAndUpdate_ArePersisted_AcrossRestarts()
+        {
+            // Arrange
+            using (var repository = this.CreateRepository())
+            {
+                await repository.InsertAsync(TestBuild("1", "QUEUED"));
+                await repository.InsertAsync(TestBuild("2", "QUEUED"));
+                await repository.UpdateAsync(TestBuild("1", "COMPLETED"));
+                await repository.DeleteAsync("2");
+            }
+
+            // Act
+            using var reopenedRepository = this.CreateRepository();
+
+            // Assert
+            Assert.Equal("COMPLETED", reopenedRepository.GetById("1").Status);
+            Assert.Null(reopenedRepository.GetById("2"));
+            Assert.Single(await reopenedRepository.GetAllAsync());
+        }
+
+        [Fact]
+        public async Task Test_InsertAsync_Throws_ForDuplicateId()
+        {
+            // Arrange
+            using var repository = this.CreateRepository();
+            await repository.InsertAsync(TestBuild("1", "QUEUED"));
+
+            // Act & Assert
+            await Assert.ThrowsAsync<IntegrityException>(() => repository.InsertAsync(TestBuild("1", "QUEUED")));
+        }
+
+        [Fact]
+        public async Task Test_GetById_ReturnsCopy_WhichDoesNotChangeStoredBuild()
+        {
+            // Arrange
+            using var repository = this.CreateRepository();
+            await repository.InsertAsync(TestBuild("1", "QUEUED"));
+
+            // Act
+            repository.GetById("1").Status = "FAILED";
+
+            // Assert
+            Assert.Equal("QUEUED", repository.GetById("1").Status);
+        }
+
+        [Fact]
+        public async Task Test_GetPageAsync_ReturnsMostRecentBuildsFirst()
+        {
+            // Arrange
+            using var repository = this.CreateRepository();
+            for (var i = 1; i <= 5; i++)
+            {
+                await repository.InsertAsync(TestBuild(i.ToString(), "QUEUED"));
+            }
+
+            // Act
+            var page = await repository.GetPageAsync(offset: 1, limit: 2);
+
+            // Assert
+            Assert.Equal(new[] { "4", "3" }, page.Select(build => build.Id));
+        }
+
+        [Fact]
+        public async Task Test_Compaction_RemovesFinishedBuilds_OlderThanRetentionPeriod()
+        {
+            // Arrange
+            var now = new DateTime(2024, 1, 1, 0, 0, 0, DateTimeKind.Utc);
+            using (var repository = this.CreateRepository(() => now))
+            {
+                await repository.InsertAsync(TestBuild("completed", "COMPLETED"));
+                await repository.InsertAsync(TestBuild("in-progress", "IN_PROGRESS"));
+            }
+
+            // Act
+            now = now.AddDays(31);
+            using var reopenedRepository = this.CreateRepository(() => now);
+
+            // Assert
+            Assert.Null(reopenedRepository.GetById("completed"));
+            Assert.NotNull(reopenedRepository.GetById("in-progress"));
+            Assert.Single(File.ReadAllLines(Path.Combine(this.storeDirectory, AppendLogBuildRepository.LogFileName)));
+        }
+
+        [Fact]
+        public async Task Test_Compaction_DropsSupersededEntries_WhenLogExceedsThreshold()
+        {
+            // Arrange
+            using var repository = this.CreateRepository(compactionThreshold: 10);
+            await repository.InsertAsync(TestBuild("1", "QUEUED"));
+
+            // Act
+            for (var i = 0; i < 20; i++)
+            {
+                await repository.UpdateAsync(TestBuild("1", "IN_PROGRESS"));
+            }
+
+            // Assert
+            var logFilePath = Path.Combine(this.storeDirectory, AppendLogBuildRepository.LogFileName);
+            Assert.True(File.ReadLines(logFilePath).Count() <= 10);
+            Assert.Equal("IN_PROGRESS", repository.GetById("1").Status);
+        }
+
+        [Fact]
+        public void Test_MigratesLegacyJsonStore()
+        {
+            // Arrange
+            Directory.CreateDirectory(this.storeDirectory);
+            var legacyStoreFilePath = Path.Combine(this.storeDirectory, AppendLogBuildRepository.LegacyStoreFileName);
+            File.WriteAllText(
+                legacyStoreFilePath,
+                "{\"build\":[{\"id\":\"1\",\"status\":\"COMPLETED\",\"platform\":\"python\"}," +
+                "{\"id\":\"2\",\"status\":\"FAILED\"}]}");
+
+            // Act
+            using var repository = this.CreateRepository();
+
+            // Assert
+            Assert.Equal("python", repository.GetById("1").Platform);
+            Assert.Equal("FAILED", repository.GetById("2").Status);
+            Assert.False(File.Exists(legacyStoreFilePath));
+            Assert.True(File.Exists(legacyStoreFilePath + AppendLogBuildRepository.MigratedLegacyStoreFileSuffix));
+        }
+
+        [Fact]
+        public async Task Test_IgnoresTornLastLine_AfterCrash()
+        {
+            // Arrange
+            using (var repository = this.CreateRepository())
+            {
+                await repository.InsertAsync(TestBuild("1", "QUEUED"));
+            }
+
+            File.AppendAllText(
+                Path.Combine(this.storeDirectory, AppendLogBuildRepository.LogFileName),
+                "{\"op\":\"put\",\"id\":\"2\",\"bu");
+
+            // Act
+            using var reopenedRepository = this.CreateRepository();
+
+            // Assert
+            Assert.NotNull(reopenedRepository.GetById("1"));
+            Assert.Null(reopenedRepository.GetById("2"));
+        }
+
+        [Fact]
+        public async Task Test_KeepsBuildsAppendedAfterTornLastLine_AcrossRestarts()
+        {
+            // Arrange
+            using (var repository = this.CreateRepository())
+            {
+                await repository.InsertAsync(TestBuild("1", "QUEUED"));
+            }
+
+            File.AppendAllText(
+                Path.Combine(this.storeDirectory, AppendLogBuildRepository.LogFileName),
+                "{\"op\":\"put\",\"id\":\"2\",\"bu");
+            using (var repository = this.CreateRepository())
+            {
+                await repository.InsertAsync(TestBuild("3", "QUEUED"));
+            }
+
+            // Act
+            using var reopenedRepository = this.CreateRepository();
+
+            // Assert
+            Assert.NotNull(reopenedRepository.GetById("1"));
+            Assert.Null(reopenedRepository.GetById("2"));
+            Assert.Equal("QUEUED", reopenedRepository.GetById("3")?.Status);
+        }
+
+        private static Build TestBuild(string id, string status)
+        {
+            return new Build
+            {
+                Id = id,
+                Status = status,
+                Platform = "python",
+                Version = "3.11",
+            };
+        }
+
+        private AppendLogBuildRepository CreateRepository(
+            Func<DateTime> utcNow = null,
+            int compactionThreshold = 1000)
+        {
+            var options = new BuildRepositoryOptions
+            {
+                StoreDirectory = this.storeDirectory,
+                RetentionDays = 30,
+                CompactionThreshold = compactionThreshold,
+            };
+
+            return new AppendLogBuildRepository(
+                options,
+                NullLogger<AppendLogBuildRepository>.Instance,
+                utcNow ?? (() => DateTime.UtcNow));
+        }
+    }
+}
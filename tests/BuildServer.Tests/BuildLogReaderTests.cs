@@ -0,0 +1,131 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Oryx.BuildServer.Models;
+using Microsoft.Oryx.BuildServer.Repositories;
+using Microsoft.Oryx.BuildServer.Services;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildServer.Tests
+{
+    public class BuildLogReaderTests : IDisposable
+    {
+        private static readonly TimeSpan Timeout = TimeSpan.FromSeconds(30);
+
+        private readonly string tempDir;
+        private readonly AppendLogBuildRepository repository;
+        private readonly BuildLogReader reader;
+
+        public BuildLogReaderTests()
+        {
+            this.tempDir = Path.Combine(Path.GetTempPath(), "oryx-buildserver-tests", Guid.NewGuid().ToString());
+            this.repository = new AppendLogBuildRepository(
+                new BuildRepositoryOptions { StoreDirectory = Path.Combine(this.tempDir, "store") },
+                NullLogger<AppendLogBuildRepository>.Instance);
+            this.reader = new BuildLogReader(this.repository, TimeSpan.FromMilliseconds(10));
+        }
+
+        public void Dispose()
+        {
+            this.repository.Dispose();
+            Directory.Delete(this.tempDir, recursive: true);
+        }
+
+        [Fact]
+        public async Task Test_ReadAsync_ReadsLogOfFinishedBuild_FromOffset()
+        {
+            // Arrange
+            var build = await this.InsertBuildAsync("COMPLETED");
+            File.WriteAllText(BuildLogReader.GetLogFilePath(build), "first\nsecond\nlast");
+
+            // Act
+            var chunks = await this.ReadAllAsync(build.Id, offset: 6);
+
+            // Assert
+            Assert.Equal("second\nlast", string.Concat(chunks.Select(chunk => chunk.Text)));
+            Assert.Equal(17, chunks.Last().NextOffset);
+        }
+
+        [Fact]
+        public async Task Test_ReadAsync_EndsImmediately_IfFinishedBuildHasNoLog()
+        {
+            // Arrange
+            var build = await this.InsertBuildAsync("FAILED");
+
+            // Act
+            var chunks = await this.ReadAllAsync(build.Id, offset: 0);
+
+            // Assert
+            Assert.Empty(chunks);
+        }
+
+        [Fact]
+        public async Task Test_ReadAsync_FollowsLogOfRunningBuild_UntilItFinishes()
+        {
+            // Arrange
+            var build = await this.InsertBuildAsync("IN_PROGRESS");
+            var outputHandler = new FileOutputHandler(
+                new StreamWriter(BuildLogReader.GetLogFilePath(build)),
+                NullLogger.Instance);
+            var chunks = new List<BuildLogChunk>();
+            var firstChunkRead = new TaskCompletionSource<bool>();
+            var reading = Task.Run(async () =>
+            {
+                await foreach (var chunk in this.reader.ReadAsync(build.Id, 0, CancellationToken.None))
+                {
+                    chunks.Add(chunk);
+                    firstChunkRead.TrySetResult(true);
+                }
+            });
+
+            // Act
+            outputHandler.WriteLine("Restoring packages");
+
+            // The line is read while the log is still open, as it is flushed once nothing more is queued.
+            await firstChunkRead.Task.WaitAsync(Timeout);
+            outputHandler.WriteLine("Done");
+            outputHandler.Dispose();
+            build.Status = "COMPLETED";
+            await this.repository.UpdateAsync(build);
+            await reading.WaitAsync(Timeout);
+
+            // Assert
+            Assert.Equal("Restoring packages\n", chunks.First().Text);
+            Assert.Equal("Restoring packages\nDone\n", string.Concat(chunks.Select(chunk => chunk.Text)));
+        }
+
+        private async Task<Build> InsertBuildAsync(string status)
+        {
+            var logPath = Path.Combine(this.tempDir, "logs");
+            Directory.CreateDirectory(logPath);
+            var build = new Build
+            {
+                Id = Guid.NewGuid().ToString(),
+                Status = status,
+                LogPath = logPath,
+            };
+            await this.repository.InsertAsync(build);
+            return build;
+        }
+
+        private async Task<List<BuildLogChunk>> ReadAllAsync(string buildId, long offset)
+        {
+            var chunks = new List<BuildLogChunk>();
+            await foreach (var chunk in this.reader.ReadAsync(buildId, offset, CancellationToken.None))
+            {
+                chunks.Add(chunk);
+            }
+
+            return chunks;
+        }
+    }
+}
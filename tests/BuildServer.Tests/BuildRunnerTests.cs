@@ -0,0 +1,269 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using Microsoft.Oryx.BuildServer.Exceptions;
+using Microsoft.Oryx.BuildServer.Models;
+using Microsoft.Oryx.BuildServer.Services;
+using Microsoft.Oryx.BuildServer.Services.ArtifactBuilders;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildServer.Tests
+{
+    public class BuildRunnerTests
+    {
+        private static readonly TimeSpan Timeout = TimeSpan.FromSeconds(30);
+
+        [Fact]
+        public async Task Test_RunInBackground_RunsAtMostMaxConcurrentBuilds_AndRejectsBuildsBeyondQueueLength()
+        {
+            // Arrange
+            var builder = new BlockingArtifactBuilder();
+            var runner = TestBuildRunner(maxConcurrentBuilds: 2, maxQueueLength: 1);
+            var builds = new[]
+            {
+                RunBuild(runner, builder, "1"),
+                RunBuild(runner, builder, "2"),
+                RunBuild(runner, builder, "3"),
+            };
+            await builder.WaitForStartedBuildsAsync(2);
+
+            // Act
+            var exception = Assert.Throws<BuildQueueFullException>(() => RunBuild(runner, builder, "4"));
+            var metrics = runner.GetMetrics();
+            builder.Release(3);
+            await Task.WhenAll(builds).WaitAsync(Timeout);
+            await WaitForIdleAsync(runner);
+
+            // Assert
+            Assert.Equal(TimeSpan.FromSeconds(30), exception.RetryAfter);
+            Assert.Equal(2, metrics.RunningBuilds);
+            Assert.Equal(1, metrics.QueueDepth);
+            Assert.Equal(2, builder.MaxRunningBuilds);
+            Assert.Equal(3, runner.GetMetrics().CompletedBuilds);
+            Assert.Equal(1, runner.GetMetrics().RejectedBuilds);
+        }
+
+        [Fact]
+        public async Task Test_RunInBackground_StartsQueuedBuildsByPriority_ThenInArrivalOrder()
+        {
+            // Arrange
+            var builder = new BlockingArtifactBuilder();
+            var runner = TestBuildRunner(maxConcurrentBuilds: 1, maxQueueLength: 10);
+            var running = RunBuild(runner, builder, "running");
+            await builder.WaitForStartedBuildsAsync(1);
+
+            // Act
+            var builds = new[]
+            {
+                running,
+                RunBuild(runner, builder, "low1", priority: 0),
+                RunBuild(runner, builder, "high", priority: 5),
+                RunBuild(runner, builder, "low2", priority: 0),
+            };
+            builder.Release(4);
+            await Task.WhenAll(builds).WaitAsync(Timeout);
+
+            // Assert
+            Assert.Equal(new[] { "running", "high", "low1", "low2" }, builder.StartedBuilds.ToArray());
+        }
+
+        [Fact]
+        public async Task Test_Cancel_RemovesQueuedBuild_AndKillsRunningBuild()
+        {
+            // Arrange
+            var builder = new BlockingArtifactBuilder();
+            var runner = TestBuildRunner(maxConcurrentBuilds: 1, maxQueueLength: 10);
+            var running = RunBuild(runner, builder, "running");
+            var queued = RunBuild(runner, builder, "queued");
+            await builder.WaitForStartedBuildsAsync(1);
+
+            // Act
+            var cancelledQueued = runner.Cancel("queued");
+            var cancelledRunning = runner.Cancel("running");
+            await WaitForIdleAsync(runner);
+
+            // Assert
+            Assert.True(cancelledQueued);
+            Assert.True(cancelledRunning);
+            Assert.False(runner.Cancel("unknown"));
+            Assert.Equal(new[] { "running" }, builder.StartedBuilds.ToArray());
+            Assert.False(running.IsCompleted);
+            Assert.False(queued.IsCompleted);
+            var metrics = runner.GetMetrics();
+            Assert.Equal(2, metrics.CancelledBuilds);
+            Assert.Equal(0, metrics.FailedBuilds);
+        }
+
+        [Fact]
+        public async Task Test_Cancel_WhileBuildIsStarting_LeavesBuildCancelled_AndDoesNotRunIt()
+        {
+            // Arrange
+            var builder = new BlockingArtifactBuilder();
+            var runner = TestBuildRunner(maxConcurrentBuilds: 1, maxQueueLength: 10);
+            var build = new Build { Id = "starting" };
+            var statuses = new ConcurrentQueue<string>();
+            var starting = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+            var start = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+            Callback startCallback = async b =>
+            {
+                starting.TrySetResult(true);
+                await start.Task;
+                statuses.Enqueue("IN_PROGRESS");
+                return b;
+            };
+            Callback cancelCallback = b =>
+            {
+                statuses.Enqueue("CANCELLED");
+                return Task.FromResult(b);
+            };
+            runner.RunInBackground(builder, build, startCallback, null, null, cancelCallback);
+            await starting.Task.WaitAsync(Timeout);
+
+            // Act
+            var cancelled = runner.Cancel(build.Id);
+            start.SetResult(true);
+            await WaitForIdleAsync(runner);
+
+            // Assert
+            Assert.True(cancelled);
+            Assert.Equal(new[] { "IN_PROGRESS", "CANCELLED" }, statuses.ToArray());
+            Assert.Empty(builder.StartedBuilds);
+            Assert.Equal(1, runner.GetMetrics().CancelledBuilds);
+        }
+
+        [Fact]
+        public async Task Test_Cancel_IsRefused_AfterBuildHasFinished()
+        {
+            // Arrange
+            var builder = new BlockingArtifactBuilder();
+            var runner = TestBuildRunner(maxConcurrentBuilds: 1, maxQueueLength: 10);
+            var build = new Build { Id = "finished" };
+            var completing = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+            var complete = new TaskCompletionSource<bool>(TaskCreationOptions.RunContinuationsAsynchronously);
+            Callback successCallback = async b =>
+            {
+                completing.TrySetResult(true);
+                await complete.Task;
+                return b;
+            };
+            runner.RunInBackground(builder, build, b => Task.FromResult(b), successCallback, null, null);
+            builder.Release(1);
+            await completing.Task.WaitAsync(Timeout);
+
+            // Act
+            var cancelled = runner.Cancel(build.Id);
+            complete.SetResult(true);
+            await WaitForIdleAsync(runner);
+
+            // Assert
+            Assert.False(cancelled);
+            var metrics = runner.GetMetrics();
+            Assert.Equal(1, metrics.CompletedBuilds);
+            Assert.Equal(0, metrics.CancelledBuilds);
+        }
+
+        private static BuildRunner TestBuildRunner(int maxConcurrentBuilds, int maxQueueLength)
+        {
+            var options = new BuildRunnerOptions
+            {
+                MaxConcurrentBuilds = maxConcurrentBuilds,
+                MaxQueueLength = maxQueueLength,
+                DefaultRetryAfterSeconds = 30,
+            };
+            return new BuildRunner(Options.Create(options), NullLogger<BuildRunner>.Instance);
+        }
+
+        // The counters of a build are updated after its callbacks have been called.
+        private static async Task WaitForIdleAsync(BuildRunner runner)
+        {
+            var deadline = DateTime.UtcNow + Timeout;
+            while (runner.GetMetrics().RunningBuilds > 0)
+            {
+                Assert.True(DateTime.UtcNow < deadline, "Builds are still running.");
+                await Task.Delay(10);
+            }
+        }
+
+        // Returns a task which completes when the success or failure callback of the build is called.
+        private static Task<Build> RunBuild(BuildRunner runner, IArtifactBuilder builder, string id, int priority = 0)
+        {
+            var completion = new TaskCompletionSource<Build>(TaskCreationOptions.RunContinuationsAsynchronously);
+            var build = new Build { Id = id, Priority = priority };
+            Callback complete = b =>
+            {
+                completion.TrySetResult(b);
+                return Task.FromResult(b);
+            };
+            runner.RunInBackground(builder, build, b => Task.FromResult(b), complete, complete, null);
+            return completion.Task;
+        }
+
+        private class BlockingArtifactBuilder : IArtifactBuilder
+        {
+            private readonly SemaphoreSlim release = new SemaphoreSlim(0);
+            private readonly SemaphoreSlim started = new SemaphoreSlim(0);
+            private int runningBuilds;
+            private int maxRunningBuilds;
+
+            public ConcurrentQueue<string> StartedBuilds { get; } = new ConcurrentQueue<string>();
+
+            public int MaxRunningBuilds => this.maxRunningBuilds;
+
+            public bool Build(Build build)
+            {
+                return this.Build(build, CancellationToken.None);
+            }
+
+            public bool Build(Build build, CancellationToken cancellationToken)
+            {
+                this.StartedBuilds.Enqueue(build.Id);
+                var running = Interlocked.Increment(ref this.runningBuilds);
+                InterlockedMax(ref this.maxRunningBuilds, running);
+                this.started.Release();
+                try
+                {
+                    this.release.Wait(cancellationToken);
+                    return true;
+                }
+                catch (OperationCanceledException)
+                {
+                    return false;
+                }
+                finally
+                {
+                    Interlocked.Decrement(ref this.runningBuilds);
+                }
+            }
+
+            public void Release(int count)
+            {
+                this.release.Release(count);
+            }
+
+            public async Task WaitForStartedBuildsAsync(int count)
+            {
+                for (var i = 0; i < count; i++)
+                {
+                    Assert.True(await this.started.WaitAsync(Timeout));
+                }
+            }
+
+            private static void InterlockedMax(ref int location, int value)
+            {
+                int current;
+                while ((current = Volatile.Read(ref location)) < value
+                    && Interlocked.CompareExchange(ref location, value, current) != current)
+                {
+                }
+            }
+        }
+    }
+}
@@ -3,7 +3,9 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.Threading.Tasks;
+using Microsoft.Oryx.BuildServer.Exceptions;
 using Microsoft.Oryx.BuildServer.Models;
 using Microsoft.Oryx.BuildServer.Repositories;
 using Microsoft.Oryx.BuildServer.Services;
@@ -26,7 +28,7 @@ namespace Microsoft.Oryx.BuildServer.Tests
             var mockedBuildRunner = new Mock<IBuildRunner>();
             mockedArtifactBuilder.Setup(x => x.Build(build)).Returns(true);
             mockedArtifactBuilderFactory.Setup(x => x.CreateArtifactBuilder(build)).Returns(mockedArtifactBuilder.Object);
-            mockedBuildRunner.Setup(x => x.RunInBackground(mockedArtifactBuilder.Object, build, null, null));
+            mockedBuildRunner.Setup(x => x.RunInBackground(mockedArtifactBuilder.Object, build, null, null, null, null));
             var testBuildService = TestBuildService(
                 mockedBuildRepository.Object, mockedArtifactBuilderFactory.Object, mockedBuildRunner.Object);
 
@@ -35,7 +37,70 @@ namespace Microsoft.Oryx.BuildServer.Tests
 
             // Assert
             Assert.NotNull(buildTest);
-            Assert.Equal("IN_PROGRESS", buildTest.Status);
+            Assert.Equal("QUEUED", buildTest.Status);
+        }
+
+        [Fact]
+        public async Task Test_StartBuildAsync_DeletesRejectedBuild_WhenQueueIsFull()
+        {
+            // Arrange
+            var build = TestBuild();
+            var mockedBuildRepository = new Mock<IRepository>();
+            var mockedArtifactBuilderFactory = new Mock<IArtifactBuilderFactory>();
+            var mockedBuildRunner = new Mock<IBuildRunner>();
+            mockedBuildRunner
+                .Setup(x => x.RunInBackground(
+                    It.IsAny<IArtifactBuilder>(),
+                    build,
+                    It.IsAny<Callback>(),
+                    It.IsAny<Callback>(),
+                    It.IsAny<Callback>(),
+                    It.IsAny<Callback>()))
+                .Throws(new BuildQueueFullException("Build queue is full", TimeSpan.FromSeconds(10)));
+            var testBuildService = TestBuildService(
+                mockedBuildRepository.Object, mockedArtifactBuilderFactory.Object, mockedBuildRunner.Object);
+
+            // Act & Assert
+            await Assert.ThrowsAsync<BuildQueueFullException>(() => testBuildService.StartBuildAsync(build));
+            mockedBuildRepository.Verify(x => x.DeleteAsync(build.Id), Times.Once);
+        }
+
+        [Fact]
+        public async Task Test_CancelBuildAsync_MarksBuildCancelled_WhenRunnerCancelsIt()
+        {
+            // Arrange
+            var build = TestBuild();
+            var mockedBuildRepository = new Mock<IRepository>();
+            mockedBuildRepository.Setup(x => x.GetById(build.Id)).Returns(build);
+            var mockedArtifactBuilderFactory = new Mock<IArtifactBuilderFactory>();
+            var mockedBuildRunner = new Mock<IBuildRunner>();
+            mockedBuildRunner.Setup(x => x.Cancel(build.Id)).Returns(true);
+            var testBuildService = TestBuildService(
+                mockedBuildRepository.Object, mockedArtifactBuilderFactory.Object, mockedBuildRunner.Object);
+
+            // Act
+            var buildTest = await testBuildService.CancelBuildAsync(build.Id);
+
+            // Assert
+            Assert.Equal("CANCELLED", buildTest.Status);
+        }
+
+        [Fact]
+        public async Task Test_CancelBuildAsync_Throws_WhenBuildIsNotQueuedOrRunning()
+        {
+            // Arrange
+            var build = TestBuild();
+            var mockedBuildRepository = new Mock<IRepository>();
+            mockedBuildRepository.Setup(x => x.GetById(build.Id)).Returns(build);
+            var mockedArtifactBuilderFactory = new Mock<IArtifactBuilderFactory>();
+            var mockedBuildRunner = new Mock<IBuildRunner>();
+            mockedBuildRunner.Setup(x => x.Cancel(build.Id)).Returns(false);
+            var testBuildService = TestBuildService(
+                mockedBuildRepository.Object, mockedArtifactBuilderFactory.Object, mockedBuildRunner.Object);
+
+            // Act & Assert
+            await Assert.ThrowsAsync<ServiceException>(() => testBuildService.CancelBuildAsync(build.Id));
+            Assert.Equal("testStatus", build.Status);
         }
 
         [Fact]
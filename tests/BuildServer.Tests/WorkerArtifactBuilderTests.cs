@@ -0,0 +1,164 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.Collections.Concurrent;
+using System.IO;
+using System.Linq;
+using System.Net.Sockets;
+using System.Threading;
+using System.Threading.Tasks;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Oryx.BuildServer.Models;
+using Microsoft.Oryx.BuildServer.Services.ArtifactBuilders;
+using Xunit;
+
+namespace Microsoft.Oryx.BuildServer.Tests
+{
+    public class WorkerArtifactBuilderTests : IDisposable
+    {
+        private static readonly TimeSpan Timeout = TimeSpan.FromSeconds(30);
+
+        private readonly string tempDir;
+        private readonly string socketPath;
+        private readonly Socket listener;
+        private readonly ConcurrentQueue<string> requests = new ConcurrentQueue<string>();
+        private int startedWorkers;
+
+        public WorkerArtifactBuilderTests()
+        {
+            this.tempDir = Path.Combine(Path.GetTempPath(), "oryx-buildserver-tests", Guid.NewGuid().ToString("N"));
+            Directory.CreateDirectory(this.tempDir);
+            this.socketPath = Path.Combine(this.tempDir, "worker.sock");
+            this.listener = new Socket(AddressFamily.Unix, SocketType.Stream, ProtocolType.Unspecified);
+            this.listener.Bind(new UnixDomainSocketEndPoint(this.socketPath));
+            this.listener.Listen(1);
+        }
+
+        public void Dispose()
+        {
+            this.listener.Dispose();
+            Directory.Delete(this.tempDir, recursive: true);
+        }
+
+        [Fact]
+        public void Test_Build_RunsBuildsOnWarmWorker_AndWritesTheirOutputToTheLog()
+        {
+            // Arrange
+            this.ServeBuilds("out:Restoring packages", "err:npm WARN deprecated", "exit:0");
+            var builder = this.CreateBuilder(out var pool);
+            var builds = new[] { this.TestBuild(), this.TestBuild() };
+
+            // Act
+            var results = builds.Select(build => builder.Build(build)).ToList();
+
+            // Assert
+            Assert.Equal(new[] { true, true }, results);
+            Assert.Equal(1, this.startedWorkers);
+            Assert.Equal(1, pool.IdleWorkerCount);
+            Assert.Equal(
+                "Restoring packages\nnpm WARN deprecated\n",
+                File.ReadAllText(Path.Combine(this.tempDir, builds[0].Id + ".log")));
+            Assert.True(this.requests.TryPeek(out var request));
+            Assert.Contains("\"--platform\",\"nodejs\"", request);
+        }
+
+        [Fact]
+        public void Test_Build_ReturnsFalse_AndKeepsWorker_IfBuildFails()
+        {
+            // Arrange
+            this.ServeBuilds("err:Error: Couldn't detect a version for the platform", "exit:1");
+            var builder = this.CreateBuilder(out var pool);
+
+            // Act
+            var result = builder.Build(this.TestBuild());
+
+            // Assert
+            Assert.False(result);
+            Assert.Equal(1, pool.IdleWorkerCount);
+        }
+
+        [Fact]
+        public async Task Test_Build_ReturnsFalse_AndReplacesWorker_IfWorkerIsLostDuringBuild()
+        {
+            // Arrange
+            this.ServeBuilds("out:Restoring packages");
+            var builder = this.CreateBuilder(out var pool);
+
+            // Act
+            var result = builder.Build(this.TestBuild());
+
+            // Assert
+            Assert.False(result);
+            var stopwatch = System.Diagnostics.Stopwatch.StartNew();
+            while (Volatile.Read(ref this.startedWorkers) < 2 && stopwatch.Elapsed < Timeout)
+            {
+                await Task.Delay(10);
+            }
+
+            Assert.Equal(2, this.startedWorkers);
+        }
+
+        private void ServeBuilds(params string[] frames)
+        {
+            Task.Run(() =>
+            {
+                while (true)
+                {
+                    Socket connection;
+                    try
+                    {
+                        connection = this.listener.Accept();
+                    }
+                    catch (Exception ex) when (ex is SocketException || ex is ObjectDisposedException)
+                    {
+                        return;
+                    }
+
+                    using (var stream = new NetworkStream(connection, ownsSocket: true))
+                    using (var reader = new StreamReader(stream))
+                    using (var writer = new StreamWriter(stream))
+                    {
+                        this.requests.Enqueue(reader.ReadLine());
+                        foreach (var frame in frames)
+                        {
+                            writer.WriteLine(frame);
+                        }
+                    }
+                }
+            });
+        }
+
+        private WorkerArtifactBuilder CreateBuilder(out OryxWorkerPool pool)
+        {
+            pool = new OryxWorkerPool(
+                () =>
+                {
+                    Interlocked.Increment(ref this.startedWorkers);
+                    return new OryxWorker(this.socketPath, process: null);
+                },
+                poolSize: 1,
+                maxBuildsPerWorker: 10,
+                NullLogger<OryxWorkerPool>.Instance);
+            return new WorkerArtifactBuilder(
+                pool,
+                new ArtifactBuilder(NullLogger<ArtifactBuilder>.Instance),
+                NullLogger<WorkerArtifactBuilder>.Instance);
+        }
+
+        private Build TestBuild()
+        {
+            return new Build
+            {
+                Id = Guid.NewGuid().ToString("N"),
+                Platform = "nodejs",
+                Version = "20",
+                SourcePath = this.tempDir,
+                OutputPath = this.tempDir,
+                LogPath = this.tempDir,
+            };
+        }
+    }
+}
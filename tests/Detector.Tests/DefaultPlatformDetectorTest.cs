@@ -52,6 +52,44 @@ namespace Microsoft.Oryx.Detector.Tests
             Assert.Equal(2, detectionResults.Count());
         }
 
+        [Fact]
+        public void Detect_InParallel_ReturnsResultsInDetectorOrder()
+        {
+            // Arrange
+            var mockNodePlatformDetector = new Mock<IPlatformDetector>();
+            var mockDotnetcorePlatformDetector = new Mock<IPlatformDetector>();
+            var platformDetectors = new List<IPlatformDetector>
+            {
+                mockNodePlatformDetector.Object,
+                mockDotnetcorePlatformDetector.Object,
+            };
+            var detector = new DefaultPlatformDetector(
+                platformDetectors,
+                NullLogger<DefaultPlatformDetector>.Instance,
+                Options.Create(new DetectorOptions { EnableParallelDetection = true }));
+            var context = CreateContext(new MemorySourceRepo());
+
+            mockNodePlatformDetector
+                .Setup(x => x.Detect(context))
+                .Returns(() =>
+                {
+                    // Make the first detector finish last
+                    System.Threading.Thread.Sleep(200);
+                    return new PlatformDetectorResult { Platform = NodeConstants.PlatformName, PlatformVersion = "12.16.1" };
+                });
+            mockDotnetcorePlatformDetector
+                .Setup(x => x.Detect(context))
+                .Returns(new PlatformDetectorResult { Platform = DotNetCoreConstants.PlatformName, PlatformVersion = "3.1" });
+
+            // Act
+            var detectionResults = detector.GetAllDetectedPlatforms(context);
+
+            // Assert
+            Assert.Equal(
+                new[] { NodeConstants.PlatformName, DotNetCoreConstants.PlatformName },
+                detectionResults.Select(r => r.Platform));
+        }
+
         private DetectorContext CreateContext(ISourceRepo sourceRepo)
         {
             return new DetectorContext
@@ -0,0 +1,148 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using Microsoft.Oryx.Detector.Golang;
+using Microsoft.Oryx.Tests.Common;
+using Moq;
+using Xunit;
+
+namespace Microsoft.Oryx.Detector.Tests
+{
+    public class DetectionResultCacheTest : IClassFixture<TestTempDirTestFixture>
+    {
+        private readonly string _tempDirRoot;
+
+        public DetectionResultCacheTest(TestTempDirTestFixture testFixture)
+        {
+            _tempDirRoot = testFixture.RootDirPath;
+        }
+
+        [Fact]
+        public void Detect_ReturnsCachedResult_WithoutRunningDetector_WhenInputsAreUnchanged()
+        {
+            // Arrange
+            var sourceDir = CreateSourceDir();
+            File.WriteAllText(Path.Combine(sourceDir, "version.txt"), "1.0.0");
+            var detector = CreateVersionFileDetector();
+            var cache = CreateCache();
+
+            // Act
+            var result1 = cache.Detect(detector.Object, CreateContext(sourceDir));
+            var result2 = cache.Detect(detector.Object, CreateContext(sourceDir));
+
+            // Assert
+            Assert.Equal("1.0.0", result1.PlatformVersion);
+            Assert.Equal("1.0.0", result2.PlatformVersion);
+            detector.Verify(d => d.Detect(It.IsAny<DetectorContext>()), Times.Once);
+        }
+
+        [Fact]
+        public void Detect_RunsDetectorAgain_WhenAFileItReadChanged()
+        {
+            // Arrange
+            var sourceDir = CreateSourceDir();
+            var versionFile = Path.Combine(sourceDir, "version.txt");
+            File.WriteAllText(versionFile, "1.0.0");
+            var detector = CreateVersionFileDetector();
+            var cache = CreateCache();
+
+            // Act
+            cache.Detect(detector.Object, CreateContext(sourceDir));
+            File.WriteAllText(versionFile, "2.0.0");
+            var result = cache.Detect(detector.Object, CreateContext(sourceDir));
+
+            // Assert
+            Assert.Equal("2.0.0", result.PlatformVersion);
+            detector.Verify(d => d.Detect(It.IsAny<DetectorContext>()), Times.Exactly(2));
+        }
+
+        [Fact]
+        public void Detect_RunsDetectorAgain_WhenAFileItLookedForIsAdded()
+        {
+            // Arrange
+            var sourceDir = CreateSourceDir();
+            var detector = CreateVersionFileDetector();
+            var cache = CreateCache();
+
+            // Act
+            var result1 = cache.Detect(detector.Object, CreateContext(sourceDir));
+            File.WriteAllText(Path.Combine(sourceDir, "version.txt"), "1.0.0");
+            var result2 = cache.Detect(detector.Object, CreateContext(sourceDir));
+
+            // Assert
+            Assert.Null(result1);
+            Assert.Equal("1.0.0", result2.PlatformVersion);
+            detector.Verify(d => d.Detect(It.IsAny<DetectorContext>()), Times.Exactly(2));
+        }
+
+        [Fact]
+        public void Detect_RestoresDetectorSpecificResultType()
+        {
+            // Arrange
+            var sourceDir = CreateSourceDir();
+            File.WriteAllText(Path.Combine(sourceDir, GolangConstants.GoModFileName), "module foo\n\ngo 1.21");
+            var detector = new GolangDetector(
+                NullLogger<GolangDetector>.Instance,
+                Options.Create(new DetectorOptions()));
+            var cache = CreateCache();
+
+            // Act
+            cache.Detect(detector, CreateContext(sourceDir));
+            var result = cache.Detect(detector, CreateContext(sourceDir));
+
+            // Assert
+            var golangResult = Assert.IsType<GolangPlatformDetectorResult>(result);
+            Assert.Equal(GolangConstants.PlatformName, golangResult.Platform);
+            Assert.Equal("1.21", golangResult.PlatformVersion);
+            Assert.True(golangResult.GoModExists);
+        }
+
+        private static Mock<IPlatformDetector> CreateVersionFileDetector()
+        {
+            var detector = new Mock<IPlatformDetector>();
+            detector
+                .Setup(d => d.Detect(It.IsAny<DetectorContext>()))
+                .Returns<DetectorContext>(ctx =>
+                {
+                    if (!ctx.SourceRepo.FileExists("version.txt"))
+                    {
+                        return null;
+                    }
+
+                    return new PlatformDetectorResult
+                    {
+                        Platform = "test",
+                        PlatformVersion = ctx.SourceRepo.ReadFile("version.txt"),
+                    };
+                });
+            return detector;
+        }
+
+        private static DetectorContext CreateContext(string sourceDir)
+        {
+            return new DetectorContext
+            {
+                SourceRepo = new LocalSourceRepo(sourceDir),
+            };
+        }
+
+        private string CreateSourceDir()
+        {
+            return Directory.CreateDirectory(Path.Combine(_tempDirRoot, Guid.NewGuid().ToString())).FullName;
+        }
+
+        private DetectionResultCache CreateCache()
+        {
+            return new DetectionResultCache(
+                Path.Combine(_tempDirRoot, Guid.NewGuid().ToString()),
+                new DetectorOptions(),
+                NullLogger.Instance);
+        }
+    }
+}
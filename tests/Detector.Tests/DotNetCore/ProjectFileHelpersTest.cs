@@ -3,8 +3,8 @@
 // Licensed under the MIT license.
 // --------------------------------------------------------------------------------------------
 
+using System;
 using System.IO;
-using System.Xml.Linq;
 using Microsoft.Oryx.Detector.DotNetCore;
 using Microsoft.Oryx.Tests.Common;
 using Xunit;
@@ -23,10 +23,10 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         public void IsAspNetCoreWebApplicationProject_ReturnsFalse_WhenProject_IsNotWebSdkProject(string projectFile)
         {
             // Arrange
-            var xdoc = XDocument.Load(new StringReader(projectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsAspNetCoreWebApplicationProject(xdoc);
+            var actual = ProjectFileHelpers.IsAspNetCoreWebApplicationProject(projectFileMetadata);
 
             // Assert
             Assert.False(actual);
@@ -36,10 +36,10 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         public void IsAspNetCoreWebApplicationProject_ReturnsTrue_WhenProject_IsWebSdkProject()
         {
             // Arrange
-            var xdoc = XDocument.Load(new StringReader(WebSdkProjectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(WebSdkProjectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsAspNetCoreWebApplicationProject(xdoc);
+            var actual = ProjectFileHelpers.IsAspNetCoreWebApplicationProject(projectFileMetadata);
 
             // Assert
             Assert.True(actual);
@@ -51,10 +51,10 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         public void IsAzureFunctionsProject_ReturnsTrue_WhenProject_IsAzureFunctionsProject(string projectFile)
         {
             // Arrange
-            var xdoc = XDocument.Load(new StringReader(projectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsAzureFunctionsProject(xdoc);
+            var actual = ProjectFileHelpers.IsAzureFunctionsProject(projectFileMetadata);
 
             // Assert
             Assert.True(actual);
@@ -65,10 +65,10 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         {
             // Arrange
             var projectFile = ProjectFileProviderTestBase.AzureBlazorWasmClientNetStandardProjectFile;
-            var xdoc = XDocument.Load(new StringReader(projectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(xdoc);
+            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileMetadata);
 
             // Assert
             Assert.True(actual);
@@ -79,10 +79,10 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         {
             // Arrange0
             var projectFile = ProjectFileProviderTestBase.AzureBlazorWasmClientNet5ProjectFile;
-            var xdoc = XDocument.Load(new StringReader(projectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(xdoc);
+            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileMetadata);
 
             // Assert
             Assert.True(actual);
@@ -93,15 +93,91 @@ namespace Microsoft.Oryx.Detector.Tests.DotNetCore
         {
             // Arrange
             var projectFile = ProjectFileProviderTestBase.AzureNonBlazorWasmProjectFile;
-            var xdoc = XDocument.Load(new StringReader(projectFile));
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
 
             // Act
-            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(xdoc);
+            var actual = ProjectFileHelpers.IsBlazorWebAssemblyProject(projectFileMetadata);
 
             // Assert
             Assert.False(actual);
         }
 
+        [Fact]
+        public void ProjectFileMetadata_Parse_ReadsSdkPropertiesAndPackageReferences()
+        {
+            // Arrange
+            const string projectFile = @"
+            <Project>
+              <Sdk Name=""Microsoft.NET.Sdk.Web"" Version=""1.0.0"" />
+              <PropertyGroup>
+                <TargetFramework>net8.0</TargetFramework>
+                <OutputType>Exe</OutputType>
+              </PropertyGroup>
+              <PropertyGroup>
+                <TargetFramework>net6.0</TargetFramework>
+                <AzureFunctionsVersion>v4</AzureFunctionsVersion>
+              </PropertyGroup>
+              <ItemGroup>
+                <PackageReference Include=""Microsoft.NET.Sdk.Functions"" Version=""4.2.0"" />
+                <PackageReference Update=""Newtonsoft.Json"" />
+                <PackageReference Include=""Newtonsoft.Json"" Version=""13.0.1"" />
+              </ItemGroup>
+            </Project>";
+
+            // Act
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
+
+            // Assert
+            Assert.Null(projectFileMetadata.ProjectSdk);
+            Assert.Equal("Microsoft.NET.Sdk.Web", projectFileMetadata.SdkName);
+            Assert.Equal("net8.0", projectFileMetadata.TargetFramework);
+            Assert.Equal("Exe", projectFileMetadata.OutputType);
+            Assert.Equal("v4", projectFileMetadata.AzureFunctionsVersion);
+            Assert.Equal(
+                new[] { "Microsoft.NET.Sdk.Functions", "Newtonsoft.Json" },
+                projectFileMetadata.PackageReferences);
+        }
+
+        [Fact]
+        public void ProjectFileMetadata_Parse_IgnoresElementsWithNamespace()
+        {
+            // Arrange
+            const string projectFile = @"
+            <Project xmlns=""http://schemas.microsoft.com/developer/msbuild/2003"">
+              <PropertyGroup>
+                <TargetFramework>net48</TargetFramework>
+              </PropertyGroup>
+            </Project>";
+
+            // Act
+            var projectFileMetadata = ProjectFileMetadata.Parse(projectFile);
+
+            // Assert
+            Assert.Null(projectFileMetadata.TargetFramework);
+        }
+
+        [Fact]
+        public void GetProjectFileMetadata_ParsesFileAgain_OnlyWhenItChanged()
+        {
+            // Arrange
+            var sourceRepoDir = CreateSourceRepoDir();
+            var projectFile = Path.Combine(sourceRepoDir, "WebApp1.csproj");
+            File.WriteAllText(projectFile, WebSdkProjectFile);
+            var sourceRepo = CreateSourceRepo(sourceRepoDir);
+
+            // Act
+            var metadata1 = ProjectFileHelpers.GetProjectFileMetadata(sourceRepo, projectFile);
+            var metadata2 = ProjectFileHelpers.GetProjectFileMetadata(sourceRepo, projectFile);
+            File.WriteAllText(projectFile, AzureFunctionsProjectFile);
+            File.SetLastWriteTimeUtc(projectFile, DateTime.UtcNow.AddMinutes(1));
+            var metadata3 = ProjectFileHelpers.GetProjectFileMetadata(sourceRepo, projectFile);
+
+            // Assert
+            Assert.Same(metadata1, metadata2);
+            Assert.True(ProjectFileHelpers.IsAspNetCoreWebApplicationProject(metadata1));
+            Assert.True(ProjectFileHelpers.IsAzureFunctionsProject(metadata3));
+        }
+
         public static TheoryData<string, string, string> GetRelativePathToRootData
         {
             get
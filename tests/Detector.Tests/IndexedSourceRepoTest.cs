@@ -0,0 +1,206 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using System.Linq;
+using Microsoft.Extensions.Logging.Abstractions;
+using Xunit;
+
+namespace Microsoft.Oryx.Detector.Tests
+{
+    public class IndexedSourceRepoTest : IClassFixture<IndexedSourceRepoTest.SourceRepoTestFixture>
+    {
+        private readonly string _rootDirPath;
+
+        public IndexedSourceRepoTest(SourceRepoTestFixture fixture)
+        {
+            _rootDirPath = fixture.RootDirPath;
+        }
+
+        [Fact]
+        public void EnumerateFiles_ReturnsSameFilesInSameOrder_AsLocalSourceRepo()
+        {
+            // Arrange
+            var localSourceRepo = new LocalSourceRepo(_rootDirPath, NullLoggerFactory.Instance);
+            var indexedSourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+
+            // Act
+            var expected = localSourceRepo.EnumerateFiles("*.txt", searchSubDirectories: true)
+                .Where(f => !f.Contains($"{Path.DirectorySeparatorChar}excluded{Path.DirectorySeparatorChar}"));
+            var actual = indexedSourceRepo.EnumerateFiles("*.txt", searchSubDirectories: true);
+
+            // Assert
+            Assert.Equal(expected, actual);
+        }
+
+        [Fact]
+        public void EnumerateFiles_SkipsExcludedDirectories()
+        {
+            // Arrange
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+
+            // Act
+            var files = sourceRepo.EnumerateFiles("*.txt", searchSubDirectories: true);
+
+            // Assert
+            Assert.Equal(5, files.Count());
+            Assert.DoesNotContain(Path.Combine(_rootDirPath, "excluded", "ex1.txt"), files);
+        }
+
+        [Fact]
+        public void EnumerateFiles_SearchesFileSystem_IfSubDirectoryIsExcluded()
+        {
+            // Arrange
+            var expected = Path.Combine(_rootDirPath, "excluded", "ex1.txt");
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+
+            // Act
+            var files = sourceRepo.EnumerateFiles(
+                "*.txt",
+                searchSubDirectories: true,
+                subDirectoryToSearchUnder: "excluded");
+
+            // Assert
+            var file = Assert.Single(files);
+            Assert.Equal(expected, file);
+        }
+
+        [Fact]
+        public void EnumerateFiles_ReturnsFilesAtSpecifiedSubDirectoryOnly_AndSubDirectorySearchIsFalse()
+        {
+            // Arrange
+            var expected = Path.Combine(_rootDirPath, "a", "a1.txt");
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+
+            // Build the index first so that the query is answered from it
+            sourceRepo.EnumerateFiles("*.xml", searchSubDirectories: true);
+
+            // Act
+            var files = sourceRepo.EnumerateFiles(
+                "*.txt",
+                searchSubDirectories: false,
+                subDirectoryToSearchUnder: "a");
+
+            // Assert
+            Assert.True(sourceRepo.IsIndexBuilt);
+            var file = Assert.Single(files);
+            Assert.Equal(expected, file);
+        }
+
+        [Fact]
+        public void NonRecursiveQueries_DoNotBuildTheIndex()
+        {
+            // Arrange
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+
+            // Act
+            var exists = sourceRepo.FileExists("a", "a1.txt");
+            var files = sourceRepo.EnumerateFiles("*.txt", searchSubDirectories: false);
+
+            // Assert
+            Assert.True(exists);
+            Assert.Single(files);
+            Assert.False(sourceRepo.IsIndexBuilt);
+        }
+
+        [Theory]
+        [InlineData(true, "root1.txt")]
+        [InlineData(true, "a", "aa", "aa1.txt")]
+        [InlineData(true, "excluded", "ex1.txt")]
+        [InlineData(false, "a", "doesnotexist.txt")]
+        public void FileExists_AfterIndexIsBuilt_ReturnsExpectedResult(bool expected, params string[] paths)
+        {
+            // Arrange
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+            sourceRepo.EnumerateFiles("*.txt", searchSubDirectories: true);
+
+            // Act
+            var exists = sourceRepo.FileExists(paths);
+
+            // Assert
+            Assert.Equal(expected, exists);
+        }
+
+        [Fact]
+        public void GetFileSize_AfterIndexIsBuilt_ReturnsSizeOfTheFile()
+        {
+            // Arrange
+            var sourceRepo = new IndexedSourceRepo(_rootDirPath, new[] { "excluded" }, NullLoggerFactory.Instance);
+            sourceRepo.EnumerateFiles("*.txt", searchSubDirectories: true);
+
+            // Act
+            var size = sourceRepo.GetFileSize("root1.txt");
+
+            // Assert
+            Assert.Equal("file content".Length, size);
+            Assert.Null(sourceRepo.GetFileSize("doesnotexist.txt"));
+        }
+
+        public class SourceRepoTestFixture : IDisposable
+        {
+            public SourceRepoTestFixture()
+            {
+                RootDirPath = Path.Combine(Path.GetTempPath(), "oryxtests", Guid.NewGuid().ToString());
+
+                // /root/
+                //      root1.txt
+                //      root1.xml
+                //      a/
+                //          a1.txt
+                //          a1.xml
+                //          aa/
+                //              aa1.txt
+                //      b/
+                //          b1.txt
+                //          bb/
+                //              bb1.txt
+                //      excluded/
+                //          ex1.txt
+                Directory.CreateDirectory(RootDirPath);
+                File.WriteAllText(Path.Combine(RootDirPath, "root1.txt"), "file content");
+                File.WriteAllText(Path.Combine(RootDirPath, "root1.xml"), "file content");
+
+                var aDir = Path.Combine(RootDirPath, "a");
+                Directory.CreateDirectory(aDir);
+                File.WriteAllText(Path.Combine(aDir, "a1.txt"), $"file in {aDir}");
+                File.WriteAllText(Path.Combine(aDir, "a1.xml"), $"file in {aDir}");
+
+                var aaDir = Path.Combine(aDir, "aa");
+                Directory.CreateDirectory(aaDir);
+                File.WriteAllText(Path.Combine(aaDir, "aa1.txt"), $"file in {aaDir}");
+
+                var bDir = Path.Combine(RootDirPath, "b");
+                Directory.CreateDirectory(bDir);
+                File.WriteAllText(Path.Combine(bDir, "b1.txt"), $"file in {bDir}");
+
+                var bbDir = Path.Combine(bDir, "bb");
+                Directory.CreateDirectory(bbDir);
+                File.WriteAllText(Path.Combine(bbDir, "bb1.txt"), $"file in {bbDir}");
+
+                var excludedDir = Path.Combine(RootDirPath, "excluded");
+                Directory.CreateDirectory(excludedDir);
+                File.WriteAllText(Path.Combine(excludedDir, "ex1.txt"), $"file in {excludedDir}");
+            }
+
+            public string RootDirPath { get; }
+
+            public void Dispose()
+            {
+                if (Directory.Exists(RootDirPath))
+                {
+                    try
+                    {
+                        Directory.Delete(RootDirPath, recursive: true);
+                    }
+                    catch
+                    {
+                        // Do not throw in dispose
+                    }
+                }
+            }
+        }
+    }
+}
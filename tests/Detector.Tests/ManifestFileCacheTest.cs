@@ -0,0 +1,156 @@
+﻿// --------------------------------------------------------------------------------------------
+// Copyright (c) Microsoft Corporation. All rights reserved.
+// Licensed under the MIT license.
+// --------------------------------------------------------------------------------------------
+
+using System;
+using System.IO;
+using Microsoft.Extensions.Logging.Abstractions;
+using Microsoft.Extensions.Options;
+using Microsoft.Oryx.Detector.Node;
+using Microsoft.Oryx.Detector.Php;
+using Microsoft.Oryx.Tests.Common;
+using Newtonsoft.Json;
+using Xunit;
+
+namespace Microsoft.Oryx.Detector.Tests
+{
+    public class ManifestFileCacheTest : IClassFixture<TestTempDirTestFixture>
+    {
+        private const string PackageJsonContent = @"{
+          ""name"": ""mynodeapp"",
+          ""version"": ""1.0.0"",
+          ""main"": ""server.js"",
+          ""scripts"": {
+            ""build"": ""ng build"",
+            ""start"": ""node server.js"",
+            ""lint"": null
+          },
+          ""engines"": { ""node"": ""20.x"", ""npm"": 10 },
+          ""dependencies"": {
+            ""express"": ""^4.18.2"",
+            ""@angular/core"": ""^17.0.0""
+          },
+          ""devDependencies"": { ""typescript"": ""^5.0.0"" },
+          ""repository"": { ""type"": ""git"", ""url"": ""https://github.com/example/mynodeapp"" },
+          ""keywords"": [ ""node"", ""oryx"" ]
+        }";
+
+        private readonly string _tempDirRoot;
+
+        public ManifestFileCacheTest(TestTempDirTestFixture testFixture)
+        {
+            _tempDirRoot = testFixture.RootDirPath;
+        }
+
+        [Fact]
+        public void PackageJson_Parse_ReadsOnlyTheSectionsOryxUses_InFileOrder()
+        {
+            // Act
+            var packageJson = PackageJson.Parse(PackageJsonContent);
+
+            // Assert
+            Assert.Equal(new[] { "express", "@angular/core" }, packageJson.Dependencies.Keys);
+            Assert.Equal("^4.18.2", packageJson.Dependencies["express"]);
+            Assert.Equal("^5.0.0", packageJson.DevDependencies["typescript"]);
+            Assert.Equal(new[] { "build", "start" }, packageJson.Scripts.Keys);
+            Assert.Equal("20.x", packageJson.Engines["node"]);
+            Assert.Equal("10", packageJson.Engines["npm"]);
+        }
+
+        [Theory]
+        [InlineData("invalid json")]
+        [InlineData("[ \"not\", \"an\", \"object\" ]")]
+        [InlineData("{ \"require\": { \"php\": \"8.2\" } } trailing")]
+        public void ComposerJson_Parse_Throws_ForMalformedFiles(string content)
+        {
+            Assert.ThrowsAny<JsonException>(() => ComposerJson.Parse(content));
+        }
+
+        [Fact]
+        public void GetOrAdd_ParsesFileOncePerSourceRepo()
+        {
+            // Arrange
+            var repo1 = new MemorySourceRepo();
+            repo1.AddFile(PackageJsonContent, NodeConstants.PackageJsonFileName);
+            var repo2 = new MemorySourceRepo();
+            repo2.AddFile(PackageJsonContent, NodeConstants.PackageJsonFileName);
+            var parseCount = 0;
+            PackageJson Parse(string json)
+            {
+                parseCount++;
+                return PackageJson.Parse(json);
+            }
+
+            // Act
+            var packageJson1 = ManifestFileCache.GetOrAdd(repo1, NodeConstants.PackageJsonFileName, Parse, logger: null);
+            var packageJson2 = ManifestFileCache.GetOrAdd(repo1, NodeConstants.PackageJsonFileName, Parse, logger: null);
+            var packageJson3 = ManifestFileCache.GetOrAdd(repo2, NodeConstants.PackageJsonFileName, Parse, logger: null);
+
+            // Assert
+            Assert.Same(packageJson1, packageJson2);
+            Assert.NotSame(packageJson1, packageJson3);
+            Assert.Equal(2, parseCount);
+        }
+
+        [Fact]
+        public void GetOrAdd_ReturnsNull_ForMissingAndMalformedFiles()
+        {
+            // Arrange
+            var repo = new MemorySourceRepo();
+            repo.AddFile("{ \"require\": ", PhpConstants.ComposerFileName);
+
+            // Act & Assert
+            Assert.Null(ManifestFileCache.GetOrAdd(
+                repo, NodeConstants.PackageJsonFileName, PackageJson.Parse, NullLogger.Instance));
+            Assert.Null(ManifestFileCache.GetOrAdd(
+                repo, PhpConstants.ComposerFileName, ComposerJson.Parse, NullLogger.Instance));
+        }
+
+        [Fact]
+        public void DetectionResultCache_RunsDetectorAgain_WhenCachedManifestChanged()
+        {
+            // Arrange
+            var sourceDir = Directory.CreateDirectory(Path.Combine(_tempDirRoot, Guid.NewGuid().ToString())).FullName;
+            var packageJsonPath = Path.Combine(sourceDir, NodeConstants.PackageJsonFileName);
+            File.WriteAllText(packageJsonPath, "{ \"engines\": { \"node\": \"18.x\" } }");
+            var detector = new NodeDetector(NullLogger<NodeDetector>.Instance, Options.Create(new DetectorOptions()));
+            var cache = new DetectionResultCache(
+                Path.Combine(_tempDirRoot, Guid.NewGuid().ToString()),
+                new DetectorOptions(),
+                NullLogger.Instance);
+
+            // Act
+            var result1 = cache.Detect(detector, new DetectorContext { SourceRepo = new LocalSourceRepo(sourceDir) });
+            File.WriteAllText(packageJsonPath, "{ \"engines\": { \"node\": \"20.x\" } }");
+            var result2 = cache.Detect(detector, new DetectorContext { SourceRepo = new LocalSourceRepo(sourceDir) });
+
+            // Assert
+            Assert.Equal("18.x", result1.PlatformVersion);
+            Assert.Equal("20.x", result2.PlatformVersion);
+        }
+
+        [Fact]
+        public void GetOrAdd_ReturnsModelParsedByDetector_WithoutParsingAgain()
+        {
+            // Arrange
+            var repo = new MemorySourceRepo();
+            repo.AddFile(PackageJsonContent, NodeConstants.PackageJsonFileName);
+            var detector = new NodeDetector(NullLogger<NodeDetector>.Instance, Options.Create(new DetectorOptions()));
+            detector.Detect(new DetectorContext { SourceRepo = repo });
+            var parseCount = 0;
+            PackageJson Parse(string json)
+            {
+                parseCount++;
+                return PackageJson.Parse(json);
+            }
+
+            // Act
+            var packageJson = ManifestFileCache.GetOrAdd(repo, NodeConstants.PackageJsonFileName, Parse, logger: null);
+
+            // Assert
+            Assert.Equal(0, parseCount);
+            Assert.Equal("20.x", packageJson.Engines["node"]);
+        }
+    }
+}
@@ -136,7 +136,8 @@ namespace Oryx.Integration.Tests.BuildConfigurationFile
             var envScriptProvider = new PlatformsInstallationScriptProvider(
                 platforms,
                 defaultPlatformDetector,
-                new DefaultStandardOutputWriter());
+                new DefaultStandardOutputWriter(),
+                Options.Create(commonOptions));
             return new DefaultBuildScriptGenerator(
                 defaultPlatformDetector,
                 envScriptProvider,